@@ -15,7 +15,9 @@ from tools.common.visual_formatter import (
     format_agent_name,
     print_aipos_greeting,
     print_contextual_comment,
+    print_request_stats,
 )
+from tools.common import get_request_stats, reset_request_stats, snapshot_run
 
 
 def handle_chat(user_input: str) -> str:
@@ -27,7 +29,8 @@ def handle_chat(user_input: str) -> str:
     Returns:
         Agent's response as string
     """
-    response = orchestrator_team.run(user_input)
+    with snapshot_run():
+        response = orchestrator_team.run(user_input)
     return response.content
 
 
@@ -49,18 +52,27 @@ def get_multiline_input() -> str:
 def get_greeting_context() -> dict:
     """Gather context for startup greeting - task counts and status."""
     try:
-        from task_management.tools.task_manager_agent.get_tasks_by_status import get_tasks_by_status
-        from task_management.tools.task_manager_agent import get_overdue_tasks
+        from tools.common import count_database, TASKS_DATA_SOURCE_ID
         from datetime import date
         
-        # Get task counts
-        inbox_tasks = get_tasks_by_status("Inbox")
-        overdue_tasks = get_overdue_tasks()
-        
-        # Get tasks completed today
-        from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID
+        # Only counts are needed, so don't materialize the task pages
         today = date.today().isoformat()
-        completed_today = query_database_complete(
+        unread_tasks = count_database(
+            TASKS_DATA_SOURCE_ID,
+            filter_dict={"property": "Status", "status": {"equals": "Inbox"}},
+            use_data_source=True
+        )
+        overdue_tasks = count_database(
+            TASKS_DATA_SOURCE_ID,
+            filter_dict={
+                "and": [
+                    {"property": "Status", "status": {"does_not_equal": "Done"}},
+                    {"property": "Due", "date": {"before": today}}
+                ]
+            },
+            use_data_source=True
+        )
+        completed_today = count_database(
             TASKS_DATA_SOURCE_ID,
             filter_dict={
                 "and": [
@@ -72,9 +84,9 @@ def get_greeting_context() -> dict:
         )
         
         return {
-            "unread_tasks": len(inbox_tasks),
-            "overdue_tasks": len(overdue_tasks),
-            "completed_today": len(completed_today),
+            "unread_tasks": unread_tasks,
+            "overdue_tasks": overdue_tasks,
+            "completed_today": completed_today,
         }
     except Exception:
         # If we can't get context, return empty dict - greeting will use fallback
@@ -184,70 +196,75 @@ def interactive_cli():
             if not user_input:
                 continue
             
+            reset_request_stats()
+            
             # Stream response from orchestrator team
             # With respond_directly=True, members respond directly when delegated.
             # However, the team leader can also respond directly (e.g., for meta questions).
             # Strategy: Track if we've seen member responses. If yes, only print member content.
             # If no member responses, print team leader content (direct response without delegation).
             # Use stream_events=True to capture tool call events
-            try:
-                stream = orchestrator_team.run(user_input, stream=True, stream_events=True)
-            except TypeError:
-                # Fallback if stream_events parameter doesn't exist
-                stream = orchestrator_team.run(user_input, stream=True)
-            has_member_response = False
-            current_agent_name = None
-            thinking_shown = False
-            tool_calls_shown = set()
+            # One task snapshot is shared by every tool called during this turn
+            with snapshot_run():
+                try:
+                    stream = orchestrator_team.run(user_input, stream=True, stream_events=True)
+                except TypeError:
+                    # Fallback if stream_events parameter doesn't exist
+                    stream = orchestrator_team.run(user_input, stream=True)
+                has_member_response = False
+                current_agent_name = None
+                thinking_shown = False
+                tool_calls_shown = set()
             
-            for chunk in stream:
-                # Handle team run started
-                if chunk.event == TeamRunEvent.run_started:
-                    thinking_shown = True
-                    print_thinking()
+                for chunk in stream:
+                    # Handle team run started
+                    if chunk.event == TeamRunEvent.run_started:
+                        thinking_shown = True
+                        print_thinking()
                 
-                # Handle tool call started (both team and agent level)
-                if chunk.event in [TeamRunEvent.tool_call_started, RunEvent.tool_call_started]:
-                    tool_name = _extract_tool_name(chunk)
-                    if tool_name and tool_name not in tool_calls_shown:
-                        print_tool_call(tool_name)
-                        tool_calls_shown.add(tool_name)
+                    # Handle tool call started (both team and agent level)
+                    if chunk.event in [TeamRunEvent.tool_call_started, RunEvent.tool_call_started]:
+                        tool_name = _extract_tool_name(chunk)
+                        if tool_name and tool_name not in tool_calls_shown:
+                            print_tool_call(tool_name)
+                            tool_calls_shown.add(tool_name)
                 
-                # Handle tool call completed
-                if chunk.event in [TeamRunEvent.tool_call_completed, RunEvent.tool_call_completed]:
-                    tool_name = _extract_tool_name(chunk)
-                    if tool_name:
-                        print_tool_success(tool_name)
-                    else:
-                        print_tool_success()
+                    # Handle tool call completed
+                    if chunk.event in [TeamRunEvent.tool_call_completed, RunEvent.tool_call_completed]:
+                        tool_name = _extract_tool_name(chunk)
+                        if tool_name:
+                            print_tool_success(tool_name)
+                        else:
+                            print_tool_success()
                 
-                # Handle agent name and content when we detect an agent is responding
-                if chunk.event == RunEvent.run_content:
-                    agent_name = _extract_agent_name(chunk, orchestrator_team.members)
+                    # Handle agent name and content when we detect an agent is responding
+                    if chunk.event == RunEvent.run_content:
+                        agent_name = _extract_agent_name(chunk, orchestrator_team.members)
                     
-                    # Show agent header if this is a new agent responding
-                    if agent_name and agent_name != current_agent_name:
-                        current_agent_name = agent_name
-                        if not has_member_response:
-                            print_separator()
-                            print_agent_header(agent_name)
+                        # Show agent header if this is a new agent responding
+                        if agent_name and agent_name != current_agent_name:
+                            current_agent_name = agent_name
+                            if not has_member_response:
+                                print_separator()
+                                print_agent_header(agent_name)
                     
-                    # Mark that we have a member response and print content
-                    has_member_response = True
-                    if chunk.content:
-                        console.print(chunk.content, end='', markup=False)
+                        # Mark that we have a member response and print content
+                        has_member_response = True
+                        if chunk.content:
+                            console.print(chunk.content, end='', markup=False)
                 
-                # Only print team leader content if no member has responded
-                # (team leader responding directly, e.g., for meta questions)
-                elif chunk.event == TeamRunEvent.run_content and not has_member_response:
-                    if chunk.content:
-                        console.print(chunk.content, end='', markup=False)
+                    # Only print team leader content if no member has responded
+                    # (team leader responding directly, e.g., for meta questions)
+                    elif chunk.event == TeamRunEvent.run_content and not has_member_response:
+                        if chunk.content:
+                            console.print(chunk.content, end='', markup=False)
                 
-                # Handle team run completed
-                if chunk.event == TeamRunEvent.run_completed:
-                    pass  # Completion handled by content display
+                    # Handle team run completed
+                    if chunk.event == TeamRunEvent.run_completed:
+                        pass  # Completion handled by content display
             
             print_separator()
+            print_request_stats(get_request_stats())
             
         except KeyboardInterrupt:
             console.print("\n")
@@ -3,14 +3,7 @@
 import os
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
-from tools.common import get_session_storage, get_rajiv_context
-from tools.notion import (
-    search_transcripts,
-    get_transcript,
-    get_transcript_content,
-    extract_action_items_from_transcript,
-    extract_action_items_from_notes,
-)
+from tools.common import get_session_storage, lazy_tools
 
 
 def load_instructions() -> str:
@@ -19,6 +12,27 @@ def load_instructions() -> str:
     return load_agent_instructions('context_gathering_agent')
 
 
+def load_tools() -> list:
+    """Import the agent's tool modules and return its tools (called on first run)."""
+    from tools.common import get_rajiv_context
+    from tools.notion import (
+        search_transcripts,
+        get_transcript,
+        get_transcript_content,
+        extract_action_items_from_transcript,
+        extract_action_items_from_notes,
+    )
+
+    return [
+        search_transcripts,
+        get_transcript,
+        get_transcript_content,
+        extract_action_items_from_transcript,
+        extract_action_items_from_notes,
+        get_rajiv_context,
+    ]
+
+
 context_gathering_agent = Agent(
     name="Context Gathering Agent",
     model=OpenAIChat(id="gpt-4o"),
@@ -26,13 +40,6 @@ context_gathering_agent = Agent(
     add_history_to_context=True,
     num_history_runs=3,
     instructions=load_instructions(),
-    tools=[
-        search_transcripts,
-        get_transcript,
-        get_transcript_content,
-        extract_action_items_from_transcript,
-        extract_action_items_from_notes,
-        get_rajiv_context,
-    ],
+    tools=lazy_tools(load_tools),
     markdown=True,
 )
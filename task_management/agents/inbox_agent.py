@@ -2,17 +2,7 @@
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
-from tools.common import get_session_storage, load_agent_instructions, get_rajiv_context
-from task_management.tools.inbox_agent import (
-    create_task,
-    create_resource,
-    create_idea,
-    search_projects,
-    fetch_url_metadata,
-    infer_resource_type,
-    classify_input,
-    extract_metadata,
-)
+from tools.common import get_session_storage, load_agent_instructions, lazy_tools
 
 
 def load_instructions() -> str:
@@ -20,23 +10,44 @@ def load_instructions() -> str:
     return load_agent_instructions('inbox_agent')
 
 
-inbox_agent = Agent(
-    name="Inbox Agent",
-    model=OpenAIChat(id="gpt-4o"),
-    db=get_session_storage(table_name="inbox_agent_sessions"),
-    add_history_to_context=True,
-    num_history_runs=3,
-    instructions=load_instructions(),
-    tools=[
+def load_tools() -> list:
+    """Import the agent's tool modules and return its tools (called on first run)."""
+    from tools.common import get_rajiv_context
+    from task_management.tools.inbox_agent import (
+        create_task,
+        create_resource,
+        create_idea,
+        create_entries,
+        search_projects,
+        fetch_url_metadata,
+        fetch_url_metadata_batch,
+        infer_resource_type,
+        classify_input,
+        extract_metadata,
+    )
+
+    return [
         create_task,
         create_resource,
         create_idea,
+        create_entries,
         search_projects,
         fetch_url_metadata,
+        fetch_url_metadata_batch,
         infer_resource_type,
         classify_input,
         extract_metadata,
         get_rajiv_context,
-    ],
+    ]
+
+
+inbox_agent = Agent(
+    name="Inbox Agent",
+    model=OpenAIChat(id="gpt-4o"),
+    db=get_session_storage(table_name="inbox_agent_sessions"),
+    add_history_to_context=True,
+    num_history_runs=3,
+    instructions=load_instructions(),
+    tools=lazy_tools(load_tools),
     markdown=True,
 )
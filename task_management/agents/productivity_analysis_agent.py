@@ -2,17 +2,7 @@
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
-from tools.common import get_session_storage, load_agent_instructions, get_rajiv_context
-from task_management.tools.productivity_analysis_agent import (
-    get_task_history,
-    get_project_history,
-    calculate_productivity_metrics,
-    analyze_time_patterns,
-    analyze_project_productivity,
-    identify_bottlenecks,
-    generate_productivity_report,
-    compare_periods,
-)
+from tools.common import get_session_storage, load_agent_instructions, lazy_tools
 
 
 def load_instructions() -> str:
@@ -20,14 +10,21 @@ def load_instructions() -> str:
     return load_agent_instructions('productivity_analysis_agent')
 
 
-productivity_analysis_agent = Agent(
-    name="Productivity Analysis Agent",
-    model=OpenAIChat(id="gpt-4o"),
-    db=get_session_storage(table_name="productivity_analysis_agent_sessions"),
-    add_history_to_context=True,
-    num_history_runs=3,
-    instructions=load_instructions(),
-    tools=[
+def load_tools() -> list:
+    """Import the agent's tool modules and return its tools (called on first run)."""
+    from tools.common import get_rajiv_context
+    from task_management.tools.productivity_analysis_agent import (
+        get_task_history,
+        get_project_history,
+        calculate_productivity_metrics,
+        analyze_time_patterns,
+        analyze_project_productivity,
+        identify_bottlenecks,
+        generate_productivity_report,
+        compare_periods,
+    )
+
+    return [
         get_task_history,
         get_project_history,
         calculate_productivity_metrics,
@@ -37,6 +34,16 @@ productivity_analysis_agent = Agent(
         generate_productivity_report,
         compare_periods,
         get_rajiv_context,
-    ],
+    ]
+
+
+productivity_analysis_agent = Agent(
+    name="Productivity Analysis Agent",
+    model=OpenAIChat(id="gpt-4o"),
+    db=get_session_storage(table_name="productivity_analysis_agent_sessions"),
+    add_history_to_context=True,
+    num_history_runs=3,
+    instructions=load_instructions(),
+    tools=lazy_tools(load_tools),
     markdown=True,
 )
@@ -2,19 +2,7 @@
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
-from tools.common import get_session_storage, load_agent_instructions, get_rajiv_context
-from task_management.tools.slack_inbox_agent import (
-    get_unread_messages,
-    get_conversation_history,
-    classify_slack_message,
-    process_slack_messages,
-)
-from task_management.tools.inbox_agent import (
-    create_task,
-    create_resource,
-    create_idea,
-    search_projects,
-)
+from tools.common import get_session_storage, load_agent_instructions, lazy_tools
 
 
 def load_instructions() -> str:
@@ -22,23 +10,44 @@ def load_instructions() -> str:
     return load_agent_instructions('slack_inbox_agent')
 
 
-slack_inbox_agent = Agent(
-    name="Slack Inbox Agent",
-    model=OpenAIChat(id="gpt-4o"),
-    db=get_session_storage(table_name="slack_inbox_agent_sessions"),
-    add_history_to_context=True,
-    num_history_runs=3,
-    instructions=load_instructions(),
-    tools=[
+def load_tools() -> list:
+    """Import the agent's tool modules and return its tools (called on first run)."""
+    from tools.common import get_rajiv_context
+    from task_management.tools.slack_inbox_agent import (
         get_unread_messages,
         get_conversation_history,
         classify_slack_message,
         process_slack_messages,
+        reset_channel_sync,
+    )
+    from task_management.tools.inbox_agent import (
+        create_task,
+        create_resource,
+        create_idea,
+        search_projects,
+    )
+
+    return [
+        get_unread_messages,
+        get_conversation_history,
+        classify_slack_message,
+        process_slack_messages,
+        reset_channel_sync,
         create_task,
         create_resource,
         create_idea,
         search_projects,
         get_rajiv_context,
-    ],
+    ]
+
+
+slack_inbox_agent = Agent(
+    name="Slack Inbox Agent",
+    model=OpenAIChat(id="gpt-4o"),
+    db=get_session_storage(table_name="slack_inbox_agent_sessions"),
+    add_history_to_context=True,
+    num_history_runs=3,
+    instructions=load_instructions(),
+    tools=lazy_tools(load_tools),
     markdown=True,
 )
@@ -2,16 +2,7 @@
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
-from tools.common import get_session_storage, load_agent_instructions, get_rajiv_context
-from task_management.tools.weekly_exec_update_agent import (
-    get_weekly_exec_data,
-    search_recent_decisions,
-)
-from task_management.tools.context_gathering_agent import (
-    search_transcripts,
-    get_transcript_content,
-    extract_action_items,
-)
+from tools.common import get_session_storage, load_agent_instructions, lazy_tools
 
 
 def load_instructions() -> str:
@@ -19,6 +10,29 @@ def load_instructions() -> str:
     return load_agent_instructions('weekly_exec_update_agent')
 
 
+def load_tools() -> list:
+    """Import the agent's tool modules and return its tools (called on first run)."""
+    from tools.common import get_rajiv_context
+    from task_management.tools.weekly_exec_update_agent import (
+        get_weekly_exec_data,
+        search_recent_decisions,
+    )
+    from task_management.tools.context_gathering_agent import (
+        search_transcripts,
+        get_transcript_content,
+        extract_action_items,
+    )
+
+    return [
+        get_weekly_exec_data,
+        search_recent_decisions,
+        search_transcripts,
+        get_transcript_content,
+        extract_action_items,
+        get_rajiv_context,
+    ]
+
+
 weekly_exec_update_agent = Agent(
     name="Weekly Exec Update Agent",
     model=OpenAIChat(id="gpt-4o"),
@@ -26,13 +40,6 @@ weekly_exec_update_agent = Agent(
     add_history_to_context=True,
     num_history_runs=3,
     instructions=load_instructions(),
-    tools=[
-        get_weekly_exec_data,
-        search_recent_decisions,
-        search_transcripts,
-        get_transcript_content,
-        extract_action_items,
-        get_rajiv_context,
-    ],
+    tools=lazy_tools(load_tools),
     markdown=True,
 )
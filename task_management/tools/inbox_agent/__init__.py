@@ -4,10 +4,12 @@ from .create_task import create_task
 from .create_resource import create_resource
 from .create_idea import create_idea
 from .search_projects import search_projects
-from .fetch_url_metadata import fetch_url_metadata
+from .fetch_url_metadata import fetch_url_metadata, fetch_url_metadata_batch
 from .infer_resource_type import infer_resource_type
 from .classify_input import classify_input
+from .classification_engine import classify_batch
 from .extract_metadata import extract_metadata
+from .notion_write_queue import NotionWriteQueue, create_entries
 
 __all__ = [
     "create_task",
@@ -15,7 +17,11 @@ __all__ = [
     "create_idea",
     "search_projects",
     "fetch_url_metadata",
+    "fetch_url_metadata_batch",
     "infer_resource_type",
     "classify_input",
+    "classify_batch",
     "extract_metadata",
+    "NotionWriteQueue",
+    "create_entries",
 ]
@@ -1,7 +1,7 @@
 """Create a new task in Notion."""
 
 from typing import List, Dict, Any, Optional
-from tools.common import get_notion_client, TASKS_DB_ID
+from tools.common import create_page, paragraph_block, write_through, TASKS_DB_ID, TASKS_DATA_SOURCE_ID
 
 
 def create_task(
@@ -25,8 +25,6 @@ def create_task(
     Returns:
         Created task page object with id and url
     """
-    client = get_notion_client()
-    
     properties = {
         "Task": {
             "title": [{"text": {"content": name}}]
@@ -51,22 +49,14 @@ def create_task(
             "multi_select": [{"name": w} for w in waiting]
         }
     
-    page = client.pages.create(
+    # Details go in the create request's body rather than a separate append
+    page = create_page(
         parent={"database_id": TASKS_DB_ID},
-        properties=properties
+        properties=properties,
+        children=[paragraph_block(details)] if details else None
     )
     
-    # Add details/content if provided (requires separate update)
-    if details:
-        client.blocks.children.append(
-            block_id=page["id"],
-            children=[{
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": details}}]
-                }
-            }]
-        )
+    # Keep the local replica current without waiting for the next sync
+    write_through(TASKS_DATA_SOURCE_ID, page)
     
     return page
\ No newline at end of file
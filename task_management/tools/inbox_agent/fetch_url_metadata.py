@@ -1,9 +1,204 @@
-"""Fetch metadata from a URL (title, description, etc.)."""
+"""Fetch metadata from a URL (title, description, etc.).
 
-import re
-from typing import Dict, Any
+Requests share one pooled httpx.Client so connections are kept alive between
+lookups. Only the document head is read: the body is streamed and parsed
+incrementally, stopping at </head> or after MAX_HTML_BYTES. Results are
+cached in data/url_metadata.db keyed by normalized URL - successes for
+URL_METADATA_TTL_SECONDS, failures for URL_METADATA_NEGATIVE_TTL_SECONDS so a
+dead link isn't retried on every message that shares it.
+"""
+
+import codecs
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Dict, Any, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import httpx
 
+# Bytes of HTML read before giving up on finding the metadata
+MAX_HTML_BYTES = 64 * 1024
+
+# Cache lifetimes for fetched metadata and for failures
+URL_METADATA_TTL_SECONDS = int(os.getenv("URL_METADATA_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+URL_METADATA_NEGATIVE_TTL_SECONDS = int(os.getenv("URL_METADATA_NEGATIVE_TTL_SECONDS", str(60 * 60)))
+
+# Concurrent fetches in fetch_url_metadata_batch
+METADATA_FETCH_WORKERS = 8
+
+REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# Query parameters that only track clicks; dropped when normalizing cache keys
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref_src"}
+
+_http_client: Optional[httpx.Client] = None
+_http_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+
+def get_db_path() -> str:
+    """Get the path to the URL metadata cache SQLite database file."""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    data_dir = os.path.join(project_root, "data")
+    
+    # Create data directory if it doesn't exist
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir, exist_ok=True)
+    
+    return os.path.join(data_dir, "url_metadata.db")
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared cache connection, creating the table on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS url_metadata (
+                url_key TEXT PRIMARY KEY,
+                metadata TEXT NOT NULL,
+                ok INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def get_http_client() -> httpx.Client:
+    """Get the shared keep-alive HTTP client."""
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                timeout=REQUEST_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                headers={"User-Agent": "Mozilla/5.0 (compatible; AIPOS link preview)"}
+            )
+        return _http_client
+
+
+def normalize_url(url: str) -> str:
+    """Cache key for a URL: lowercased scheme/host, no fragment, default port or tracking params.
+    
+    Args:
+        url: URL as found in a message
+    
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (scheme == "http" and parts.port == 80) and not (scheme == "https" and parts.port == 443):
+        host = f"{host}:{parts.port}"
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ])
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+class _HeadMetadataParser(HTMLParser):
+    """Collects <title>, meta description and OpenGraph tags; done at </head> or <body>."""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title: Optional[str] = None
+        self.meta: Dict[str, str] = {}
+        self.done = False
+        self._in_title = False
+        self._title_parts = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == "title" and self.title is None:
+            self._in_title = True
+        elif tag == "meta":
+            attributes = dict(attrs)
+            key = (attributes.get("property") or attributes.get("name") or "").lower()
+            content = attributes.get("content")
+            if key and content and key not in self.meta:
+                self.meta[key] = content.strip()
+        elif tag == "body":
+            self.done = True
+    
+    def handle_endtag(self, tag):
+        if tag == "title" and self._in_title:
+            self._in_title = False
+            self.title = " ".join("".join(self._title_parts).split())
+        elif tag == "head":
+            self.done = True
+    
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+
+
+def _fetch(url: str) -> Dict[str, Any]:
+    """Fetch and parse a page's head (no caching)."""
+    parser = _HeadMetadataParser()
+    with get_http_client().stream("GET", url) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "")
+        if content_type and "html" not in content_type:
+            return {"title": url, "description": None, "url": url, "content_type": content_type.split(";")[0]}
+        
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # Small pages are read to the end so the connection goes back to the
+        # pool; larger ones are abandoned once the head has been parsed
+        content_length = int(response.headers.get("content-length") or 0)
+        drain = 0 < content_length <= MAX_HTML_BYTES
+        read = 0
+        for chunk in response.iter_bytes():
+            read += len(chunk)
+            if not parser.done:
+                parser.feed(decoder.decode(chunk))
+            if (parser.done and not drain) or read >= MAX_HTML_BYTES:
+                break
+    
+    meta = parser.meta
+    return {
+        "title": meta.get("og:title") or parser.title or url,
+        "description": meta.get("og:description") or meta.get("description"),
+        "url": url,
+        "image": meta.get("og:image"),
+        "site_name": meta.get("og:site_name"),
+    }
+
+
+def _cached(url_key: str) -> Optional[Dict[str, Any]]:
+    with _lock:
+        row = _get_connection().execute(
+            "SELECT metadata, ok, fetched_at FROM url_metadata WHERE url_key = ?", (url_key,)
+        ).fetchone()
+    if row is None:
+        return None
+    metadata, ok, fetched_at = row
+    ttl = URL_METADATA_TTL_SECONDS if ok else URL_METADATA_NEGATIVE_TTL_SECONDS
+    if time.time() - fetched_at >= ttl:
+        return None
+    return json.loads(metadata)
+
+
+def _store(url_key: str, metadata: Dict[str, Any], ok: bool) -> None:
+    with _lock:
+        conn = _get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO url_metadata (url_key, metadata, ok, fetched_at) VALUES (?, ?, ?, ?)",
+            (url_key, json.dumps(metadata), int(ok), time.time())
+        )
+        conn.commit()
+
 
 def fetch_url_metadata(url: str) -> Dict[str, Any]:
     """Fetch metadata from a URL (title, description, etc.).
@@ -13,31 +208,40 @@ def fetch_url_metadata(url: str) -> Dict[str, Any]:
     
     Returns:
         Dictionary with title, description, and other metadata
+        (OpenGraph image and site_name when the page has them)
     """
+    url_key = normalize_url(url)
+    cached = _cached(url_key)
+    if cached is not None:
+        return {**cached, "url": url}
+    
     try:
-        # Simple implementation - fetch HTML and extract title
-        # In production, you might want to use a library like beautifulsoup4
-        response = httpx.get(url, timeout=10, follow_redirects=True)
-        html = response.text
-        
-        # Extract title from HTML
-        title_match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE | re.DOTALL)
-        title = title_match.group(1).strip() if title_match else None
-        
-        # Extract meta description
-        desc_match = re.search(r'<meta\s+name=["\']description["\']\s+content=["\'](.*?)["\']', html, re.IGNORECASE)
-        description = desc_match.group(1).strip() if desc_match else None
-        
-        return {
-            "title": title or url,
-            "description": description,
-            "url": url
-        }
+        metadata = _fetch(url)
+        _store(url_key, metadata, ok=True)
+        return metadata
     except Exception as e:
         # Return minimal metadata on error
-        return {
+        metadata = {
             "title": url,
             "description": None,
             "url": url,
             "error": str(e)
         }
+        _store(url_key, metadata, ok=False)
+        return metadata
+
+
+def fetch_url_metadata_batch(urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch metadata for several URLs concurrently.
+    
+    Args:
+        urls: URLs to fetch (duplicates are fetched once)
+    
+    Returns:
+        Dict mapping each URL to its metadata (see fetch_url_metadata)
+    """
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(METADATA_FETCH_WORKERS, len(unique))) as executor:
+        return dict(zip(unique, executor.map(fetch_url_metadata, unique)))
@@ -0,0 +1,157 @@
+"""Concurrent creation of inbox entries in Notion.
+
+create_task, create_resource and create_idea each cost a single pages.create
+request (page bodies are sent as the request's children). NotionWriteQueue
+runs many of them at once: submit() returns a Future straight away and a
+small worker pool performs the creates. Every request still goes through the
+shared Notion request scheduler, so the pool never outruns the rate limit.
+Callers read page ids from the futures and record follow-up work (e.g.
+marking Slack messages processed) in one batch once the creates succeed.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from .create_task import create_task
+from .create_resource import create_resource
+from .create_idea import create_idea
+
+# Concurrent creates; the request scheduler paces them to Notion's rate limit
+WRITE_QUEUE_WORKERS = 3
+
+# Creates queued or running before submit() blocks the caller
+MAX_PENDING_WRITES = 100
+
+ENTRY_CREATORS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "task": create_task,
+    "resource": create_resource,
+    "idea": create_idea,
+}
+
+
+class NotionWriteQueue:
+    """Bounded pool of Notion page creates returning futures.
+
+    Usage:
+        with NotionWriteQueue() as writes:
+            futures = [writes.submit_entry("task", name=name) for name in names]
+        ids = [future.result()["id"] for future in futures]
+    """
+
+    def __init__(self, workers: int = WRITE_QUEUE_WORKERS, max_pending: int = MAX_PENDING_WRITES):
+        """Create a queue (workers start on first submit).
+
+        Args:
+            workers: Creates running at once
+            max_pending: Creates queued or running before submit() blocks
+        """
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notion-write")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "created": 0, "failed": 0}
+
+    def submit(self, create: Callable[..., Dict[str, Any]], **kwargs) -> "Future[Dict[str, Any]]":
+        """Queue one create call.
+
+        The caller's context (e.g. an active request budget) applies to the
+        call. Blocks while max_pending creates are outstanding.
+
+        Args:
+            create: Function creating the page (create_task, create_idea, ...)
+            **kwargs: Arguments for create
+
+        Returns:
+            Future resolving to the created page, or raising the create's error
+        """
+        self._slots.acquire()
+        context = contextvars.copy_context()
+        try:
+            future = self._executor.submit(context.run, self._run, create, kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._stats["submitted"] += 1
+        return future
+
+    def submit_entry(self, entry_type: str, **kwargs) -> "Future[Dict[str, Any]]":
+        """Queue a task, resource or idea.
+
+        Args:
+            entry_type: "task", "resource" or "idea"
+            **kwargs: Arguments for create_task/create_resource/create_idea
+
+        Returns:
+            Future resolving to the created page
+
+        Raises:
+            ValueError: If entry_type is unknown
+        """
+        if entry_type not in ENTRY_CREATORS:
+            raise ValueError(f"Unknown entry type {entry_type!r}; expected one of {', '.join(ENTRY_CREATORS)}")
+        return self.submit(ENTRY_CREATORS[entry_type], **kwargs)
+
+    def _run(self, create: Callable[..., Dict[str, Any]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            page = create(**kwargs)
+        except Exception:
+            with self._lock:
+                self._stats["failed"] += 1
+            raise
+        finally:
+            self._slots.release()
+        with self._lock:
+            self._stats["created"] += 1
+        return page
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counts of creates submitted, created and failed."""
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting creates; with wait, finish the queued ones first."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "NotionWriteQueue":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def create_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Create several tasks, resources and ideas in Notion concurrently.
+
+    Args:
+        entries: One dict per entry with "type" ("task", "resource" or "idea")
+                 plus that creator's arguments, e.g.
+                 {"type": "task", "name": "Email Reid", "due_date": "2026-01-17"}
+
+    Returns:
+        One result per entry, in order: {"type", "id", "url"} when created,
+        {"type", "error"} when the create failed
+    """
+    results: List[Dict[str, Any]] = []
+    with NotionWriteQueue() as writes:
+        pending = []
+        for entry in entries:
+            kwargs = dict(entry)
+            entry_type = kwargs.pop("type", None)
+            try:
+                pending.append((entry_type, writes.submit_entry(entry_type, **kwargs)))
+            except ValueError as e:
+                pending.append((entry_type, e))
+
+    for entry_type, outcome in pending:
+        if isinstance(outcome, Exception):
+            results.append({"type": entry_type, "error": str(outcome)})
+            continue
+        try:
+            page = outcome.result()
+            results.append({"type": entry_type, "id": page["id"], "url": page.get("url")})
+        except Exception as e:
+            results.append({"type": entry_type, "error": str(e)})
+    return results
@@ -1,17 +1,31 @@
 """Fetch a single Notion page by ID."""
 
 from typing import Dict, Any
-from tools.common import get_notion_client
+from tools.common import get_notion_client, fetch_page_text
 
 
-def fetch_page(page_id: str) -> Dict[str, Any]:
+def fetch_page(page_id: str, include_content: bool = False) -> Dict[str, Any]:
     """Fetch a single Notion page by ID.
     
     Args:
         page_id: Notion page ID
+        include_content: If True, also fetch the page body text (nested blocks
+            are fetched concurrently)
     
     Returns:
-        Page object
+        Page object. With include_content=True it also has:
+        - content: Full text of the page body
+        - fetch_stats: request_count and latency_ms for the block fetch
     """
     client = get_notion_client()
-    return client.pages.retrieve(page_id=page_id)
+    page = client.pages.retrieve(page_id=page_id)
+    
+    if include_content:
+        fetched = fetch_page_text(page_id)
+        page["content"] = fetched["text"]
+        page["fetch_stats"] = {
+            "request_count": fetched["request_count"],
+            "latency_ms": fetched["latency_ms"],
+        }
+    
+    return page
@@ -8,7 +8,7 @@ def find_candidate_transcripts(candidate_name: str) -> List[Dict[str, Any]]:
     """Find all interview transcripts for a specific candidate.
     
     Searches the transcripts database for meetings that mention the candidate name
-    in the meeting name, attendees, or notes fields.
+    in the meeting name, attendees, notes, or transcript body.
     
     Args:
         candidate_name: Name of the candidate to search for (e.g., "Aida", "Geoffrey")
@@ -23,31 +23,16 @@ def find_candidate_transcripts(candidate_name: str) -> List[Dict[str, Any]]:
         - url: URL property
         - action_items: List of extracted action items
     """
-    # Search for candidate name in meeting name and attendees
-    # Use keywords search which searches in Name and Notes fields
+    # One search over meeting name, notes, transcript body and attendees
     results = search_transcripts(
         keywords=candidate_name,
-        limit=50  # Allow for multiple interviews per candidate
+        include_attendees=True,
+        limit=100  # Allow for multiple interviews per candidate
     )
     
-    # Also search by attendee name to catch cases where candidate is listed as attendee
-    attendee_results = search_transcripts(
-        attendee=candidate_name,
-        limit=50
-    )
-    
-    # Combine results and deduplicate by page_id
-    all_results = {}
-    for result in results + attendee_results:
-        page_id = result.get("page_id")
-        if page_id:
-            all_results[page_id] = result
-    
-    # Return as list, sorted by date (most recent first)
-    sorted_results = sorted(
-        all_results.values(),
-        key=lambda x: x.get("date", ""),
+    # Return sorted by date (most recent first)
+    return sorted(
+        results,
+        key=lambda x: x.get("date") or "",
         reverse=True
     )
-    
-    return sorted_results
@@ -1,8 +1,7 @@
 """Analyze productivity patterns over time."""
 
 from typing import Dict, Any, List
-from datetime import datetime, date, timedelta
-from collections import defaultdict
+from task_management.tools.productivity_analysis_agent.task_history_store import DAY_NAMES, TaskHistoryColumns, period_label
 import json
 import os
 
@@ -32,6 +31,11 @@ def analyze_time_patterns(tasks: "List[Dict[str, Any]]") -> "Dict[str, Any]":
     # #region agent log
     _log("analyze_time_patterns called", {"tasks_type": str(type(tasks)), "tasks_len": len(tasks) if isinstance(tasks, list) else "not_list", "tasks_is_none": tasks is None}, "A")
     # #endregion
+    return time_patterns_from_columns(tasks, TaskHistoryColumns(tasks))
+
+
+def time_patterns_from_columns(tasks: "List[Dict[str, Any]]", columns: TaskHistoryColumns) -> "Dict[str, Any]":
+    """analyze_time_patterns over columns already built for tasks (see generate_productivity_report)."""
     completed_tasks = [t for t in tasks if t.get("status") == "Done" and t.get("completed_date")]
     
     if not completed_tasks:
@@ -42,46 +46,20 @@ def analyze_time_patterns(tasks: "List[Dict[str, Any]]") -> "Dict[str, Any]":
             "completion_patterns": {}
         }
     
-    # Analyze day of week patterns
-    day_of_week_counts = defaultdict(int)
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    
-    for task in completed_tasks:
-        completed_date = task.get("completed_date")
-        if completed_date:
-            try:
-                task_date = datetime.fromisoformat(completed_date).date()
-                day_name = day_names[task_date.weekday()]
-                day_of_week_counts[day_name] += 1
-            except (ValueError, AttributeError):
-                pass
-    
-    # Analyze weekly trends
-    weekly_counts = defaultdict(int)
-    for task in completed_tasks:
-        completed_date = task.get("completed_date")
-        if completed_date:
-            try:
-                task_date = datetime.fromisoformat(completed_date).date()
-                # Monday of the week
-                days_since_monday = task_date.weekday()
-                monday = task_date - timedelta(days=days_since_monday)
-                week_key = monday.isoformat()
-                weekly_counts[week_key] += 1
-            except (ValueError, AttributeError):
-                pass
-    
-    # Analyze monthly trends
-    monthly_counts = defaultdict(int)
-    for task in completed_tasks:
-        completed_date = task.get("completed_date")
-        if completed_date:
-            try:
-                task_date = datetime.fromisoformat(completed_date).date()
-                month_key = task_date.strftime("%Y-%m")
-                monthly_counts[month_key] += 1
-            except (ValueError, AttributeError):
-                pass
+    # Group completions by weekday, week and month in single passes over the
+    # date columns
+    day_of_week_counts = {
+        DAY_NAMES[weekday]: count
+        for weekday, count in sorted(columns.completions_by_weekday().items())
+    }
+    weekly_counts = {
+        period_label(start, "week"): count
+        for start, count in sorted(columns.completions_by_period("week").items())
+    }
+    monthly_counts = {
+        period_label(start, "month"): count
+        for start, count in sorted(columns.completions_by_period("month").items())
+    }
     
     # Find most productive day/week/month
     most_productive_day = max(day_of_week_counts.items(), key=lambda x: x[1]) if day_of_week_counts else None
@@ -1,8 +1,7 @@
 """Calculate productivity metrics from task and project data."""
 
 from typing import Dict, Any, List, Optional
-from datetime import datetime, date, timedelta
-from collections import defaultdict
+from task_management.tools.productivity_analysis_agent.task_history_store import TaskHistoryColumns, period_label
 
 
 def calculate_productivity_metrics(
@@ -21,6 +20,19 @@ def calculate_productivity_metrics(
         - overall_metrics: Overall summary metrics
         - trends: Trend indicators (improving/declining)
     """
+    return productivity_metrics_from_columns(tasks, TaskHistoryColumns(tasks), period)
+
+
+def productivity_metrics_from_columns(
+    tasks: "List[Dict[str, Any]]",
+    columns: TaskHistoryColumns,
+    period: str = "day"
+) -> "Dict[str, Any]":
+    """calculate_productivity_metrics over columns already built for tasks.
+    
+    generate_productivity_report builds the columns once and passes them to
+    each analysis, so dates are parsed once per report.
+    """
     if not tasks:
         return {
             "metrics_by_period": {},
@@ -28,100 +40,39 @@ def calculate_productivity_metrics(
             "trends": {}
         }
     
-    # Group tasks by period
-    tasks_by_period = defaultdict(list)
-    
-    for task in tasks:
-        completed_date = task.get("completed_date")
-        created_time = task.get("created_time")
-        
-        # Use completed date if available, otherwise created date
-        if completed_date:
-            try:
-                task_date = datetime.fromisoformat(completed_date).date()
-            except (ValueError, AttributeError):
-                continue
-        elif created_time:
-            try:
-                task_date = datetime.fromisoformat(created_time.replace("Z", "+00:00")).date()
-            except (ValueError, AttributeError):
-                continue
-        else:
-            continue
-        
-        # Determine period key
-        if period == "day":
-            period_key = task_date.isoformat()
-        elif period == "week":
-            # Monday of the week
-            days_since_monday = task_date.weekday()
-            monday = task_date - timedelta(days=days_since_monday)
-            period_key = monday.isoformat()
-        elif period == "month":
-            period_key = task_date.strftime("%Y-%m")
-        else:
-            period_key = task_date.isoformat()
-        
-        tasks_by_period[period_key].append(task)
+    # Group tasks by period (completed date if available, otherwise created date)
+    rows_by_period = columns.period_rows(period)
     
     # Calculate metrics for each period
     metrics_by_period = {}
-    period_keys_sorted = sorted(tasks_by_period.keys())
-    
-    for period_key in period_keys_sorted:
-        period_tasks = tasks_by_period[period_key]
-        completed_tasks = [t for t in period_tasks if t.get("status") == "Done"]
+    for period_start in sorted(rows_by_period):
+        rows = rows_by_period[period_start]
+        completed_count = columns.count_done(rows)
+        time_to_complete_days = columns.cycle_times(rows)
         
-        # Calculate time to complete
-        time_to_complete_days = []
-        for task in completed_tasks:
-            created = task.get("created_time")
-            completed = task.get("completed_date")
-            
-            if created and completed:
-                try:
-                    created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                    completed_dt = datetime.fromisoformat(completed)
-                    days = (completed_dt.date() - created_dt.date()).days
-                    if days >= 0:
-                        time_to_complete_days.append(days)
-                except (ValueError, AttributeError):
-                    pass
-        
-        metrics_by_period[period_key] = {
-            "total_tasks": len(period_tasks),
-            "completed_tasks": len(completed_tasks),
-            "completion_rate": len(completed_tasks) / len(period_tasks) if period_tasks else 0,
+        metrics_by_period[period_label(period_start, period)] = {
+            "total_tasks": len(rows),
+            "completed_tasks": completed_count,
+            "completion_rate": completed_count / len(rows) if rows else 0,
             "avg_time_to_complete_days": sum(time_to_complete_days) / len(time_to_complete_days) if time_to_complete_days else None,
         }
+    period_keys_sorted = list(metrics_by_period)
     
     # Calculate overall metrics
-    all_completed = [t for t in tasks if t.get("status") == "Done"]
-    all_active = [t for t in tasks if t.get("status") != "Done"]
-    
-    overall_time_to_complete = []
-    for task in all_completed:
-        created = task.get("created_time")
-        completed = task.get("completed_date")
-        
-        if created and completed:
-            try:
-                created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                completed_dt = datetime.fromisoformat(completed)
-                days = (completed_dt.date() - created_dt.date()).days
-                if days >= 0:
-                    overall_time_to_complete.append(days)
-            except (ValueError, AttributeError):
-                pass
+    completed_total = len(columns.done_rows())
+    overall_time_to_complete = columns.cycle_times()
+    percentiles = columns.cycle_time_percentiles((50, 90))
     
     overall_metrics = {
         "total_tasks": len(tasks),
-        "completed_tasks": len(all_completed),
-        "active_tasks": len(all_active),
-        "completion_rate": len(all_completed) / len(tasks) if tasks else 0,
+        "completed_tasks": completed_total,
+        "active_tasks": len(tasks) - completed_total,
+        "completion_rate": completed_total / len(tasks) if tasks else 0,
         "avg_time_to_complete_days": sum(overall_time_to_complete) / len(overall_time_to_complete) if overall_time_to_complete else None,
         "min_time_to_complete_days": min(overall_time_to_complete) if overall_time_to_complete else None,
         "max_time_to_complete_days": max(overall_time_to_complete) if overall_time_to_complete else None,
+        "p50_time_to_complete_days": percentiles["p50"],
+        "p90_time_to_complete_days": percentiles["p90"],
     }
     
     # Calculate trends (compare last two periods)
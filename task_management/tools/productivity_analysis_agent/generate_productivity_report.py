@@ -4,10 +4,11 @@ from typing import Dict, Any, Optional
 from datetime import date
 from task_management.tools.productivity_analysis_agent.get_task_history import get_task_history
 from task_management.tools.productivity_analysis_agent.get_project_history import get_project_history
-from task_management.tools.productivity_analysis_agent.calculate_productivity_metrics import calculate_productivity_metrics
-from task_management.tools.productivity_analysis_agent.analyze_time_patterns import analyze_time_patterns
+from task_management.tools.productivity_analysis_agent.calculate_productivity_metrics import productivity_metrics_from_columns
+from task_management.tools.productivity_analysis_agent.analyze_time_patterns import time_patterns_from_columns
 from task_management.tools.productivity_analysis_agent.analyze_project_productivity import analyze_project_productivity
-from task_management.tools.productivity_analysis_agent.identify_bottlenecks import identify_bottlenecks
+from task_management.tools.productivity_analysis_agent.identify_bottlenecks import bottlenecks_from_columns
+from task_management.tools.productivity_analysis_agent.task_history_store import TaskHistoryColumns
 
 
 def generate_productivity_report(
@@ -36,17 +37,20 @@ def generate_productivity_report(
     tasks = task_data.get("tasks", [])
     projects = project_data.get("projects", [])
     
+    # Parse task dates once for all of the analyses below
+    columns = TaskHistoryColumns(tasks)
+    
     # Calculate core metrics
-    metrics = calculate_productivity_metrics(tasks, period=period)
+    metrics = productivity_metrics_from_columns(tasks, columns, period=period)
     
     # Analyze time patterns
-    patterns = analyze_time_patterns(tasks)
+    patterns = time_patterns_from_columns(tasks, columns)
     
     # Analyze project productivity
     project_analysis = analyze_project_productivity(projects)
     
     # Identify bottlenecks
-    bottlenecks = identify_bottlenecks(tasks, projects)
+    bottlenecks = bottlenecks_from_columns(tasks, projects, columns)
     
     # Generate summary
     overall_metrics = metrics.get("overall_metrics", {})
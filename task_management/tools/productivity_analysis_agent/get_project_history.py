@@ -2,10 +2,8 @@
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime, date
-from tools.common import query_database_complete, PROJECTS_DATA_SOURCE_ID
-from task_management.tools.task_manager_agent.extract_project_properties import extract_project_properties
-from task_management.tools.task_manager_agent.extract_task_properties import extract_task_properties
-from tools.common import TASKS_DATA_SOURCE_ID
+from task_management.tools.task_manager_agent.extract_project_properties import PROJECT_FIELDS
+from task_management.tools.task_manager_agent.task_records import load_project_records, load_task_records
 
 
 def get_project_history(
@@ -58,38 +56,30 @@ def get_project_history(
         else:
             filter_dict = {"and": filter_conditions}
     
-    # Query projects
-    projects_raw = query_database_complete(
-        PROJECTS_DATA_SOURCE_ID,
-        filter_dict=filter_dict,
-        use_data_source=True
-    )
+    # Only the task fields used for the metrics below are parsed and kept;
+    # raw pages are dropped as soon as they are projected
+    project_records = load_project_records(PROJECT_FIELDS, filter_dict=filter_dict)
+    task_records = load_task_records(("status", "project_ids", "created_time", "completed_date"))
     
     # Extract properties and enrich with task data
     projects = []
-    all_tasks = query_database_complete(
-        TASKS_DATA_SOURCE_ID,
-        use_data_source=True
-    )
     
     # Create task lookup by project ID
     tasks_by_project = {}
-    for task in all_tasks:
-        task_props = extract_task_properties(task)
-        project_ids = task_props.get("project_ids", [])
-        for project_id in project_ids:
+    for task in task_records:
+        for project_id in task.project_ids:
             if project_id not in tasks_by_project:
                 tasks_by_project[project_id] = []
-            tasks_by_project[project_id].append(task_props)
+            tasks_by_project[project_id].append(task)
     
-    for project in projects_raw:
-        project_props = extract_project_properties(project)
+    for project in project_records:
+        project_props = project.to_dict()
         project_id = project_props.get("id")
         
         # Get tasks for this project
         project_tasks = tasks_by_project.get(project_id, [])
-        completed_tasks = [t for t in project_tasks if t.get("status") == "Done"]
-        active_tasks = [t for t in project_tasks if t.get("status") != "Done"]
+        completed_tasks = [t for t in project_tasks if t.status == "Done"]
+        active_tasks = [t for t in project_tasks if t.status != "Done"]
         
         # Calculate project metrics
         total_tasks = len(project_tasks)
@@ -98,8 +88,8 @@ def get_project_history(
         # Calculate time to complete for completed tasks
         time_to_complete_days = []
         for task in completed_tasks:
-            created = task.get("created_time")
-            completed = task.get("completed_date")
+            created = task.created_time
+            completed = task.completed_date
             
             if created and completed:
                 try:
@@ -2,7 +2,7 @@
 
 from typing import Dict, Any, List
 from datetime import datetime, date, timedelta
-from collections import defaultdict
+from task_management.tools.productivity_analysis_agent.task_history_store import TaskHistoryColumns
 import json
 import os
 
@@ -34,57 +34,46 @@ def identify_bottlenecks(tasks: "List[Dict[str, Any]]", projects: "List[Dict[str
     # #region agent log
     _log("identify_bottlenecks called", {"tasks_type": str(type(tasks)), "tasks_len": len(tasks) if isinstance(tasks, list) else "not_list", "tasks_is_none": tasks is None, "projects_type": str(type(projects)), "projects_len": len(projects) if isinstance(projects, list) else "not_list", "projects_is_none": projects is None}, "B")
     # #endregion
+    return bottlenecks_from_columns(tasks, projects, TaskHistoryColumns(tasks))
+
+
+def bottlenecks_from_columns(
+    tasks: "List[Dict[str, Any]]",
+    projects: "List[Dict[str, Any]]",
+    columns: TaskHistoryColumns
+) -> "Dict[str, Any]":
+    """identify_bottlenecks over columns already built for tasks (see generate_productivity_report)."""
     today = date.today()
     
-    # Find waiting tasks
+    # Find waiting tasks, with how long each has been waiting
     waiting_tasks = []
-    for task in tasks:
-        if task.get("status") == "Waiting":
-            waiting_info = {
-                "title": task.get("title"),
-                "waiting_on": task.get("waiting", []),
-                "due_date": task.get("due_date"),
-                "created_time": task.get("created_time"),
-                "project_ids": task.get("project_ids", [])
-            }
-            
-            # Calculate how long it's been waiting
-            created_time = task.get("created_time")
-            if created_time:
-                try:
-                    created_dt = datetime.fromisoformat(created_time.replace("Z", "+00:00")).date()
-                    waiting_days = (today - created_dt).days
-                    waiting_info["waiting_days"] = waiting_days
-                except (ValueError, AttributeError):
-                    waiting_info["waiting_days"] = None
-            
-            waiting_tasks.append(waiting_info)
+    for row, waiting_days in columns.waiting_aging(today):
+        task = tasks[row]
+        waiting_info = {
+            "title": task.get("title"),
+            "waiting_on": task.get("waiting", []),
+            "due_date": task.get("due_date"),
+            "created_time": task.get("created_time"),
+            "project_ids": task.get("project_ids", [])
+        }
+        if task.get("created_time"):
+            waiting_info["waiting_days"] = waiting_days
+        waiting_tasks.append(waiting_info)
     
     # Sort by waiting days (longest first)
     waiting_tasks.sort(key=lambda x: x.get("waiting_days") or 0, reverse=True)
     
-    # Find overdue tasks
+    # Find overdue tasks (already sorted most overdue first)
     overdue_tasks = []
-    for task in tasks:
-        if task.get("status") != "Done":
-            due_date = task.get("due_date")
-            if due_date:
-                try:
-                    due = datetime.fromisoformat(due_date).date()
-                    if due < today:
-                        overdue_days = (today - due).days
-                        overdue_tasks.append({
-                            "title": task.get("title"),
-                            "due_date": due_date,
-                            "overdue_days": overdue_days,
-                            "status": task.get("status"),
-                            "project_ids": task.get("project_ids", [])
-                        })
-                except (ValueError, AttributeError):
-                    pass
-    
-    # Sort by overdue days (most overdue first)
-    overdue_tasks.sort(key=lambda x: x.get("overdue_days", 0), reverse=True)
+    for row, overdue_days in columns.overdue_aging(today):
+        task = tasks[row]
+        overdue_tasks.append({
+            "title": task.get("title"),
+            "due_date": task.get("due_date"),
+            "overdue_days": overdue_days,
+            "status": task.get("status"),
+            "project_ids": task.get("project_ids", [])
+        })
     
     # Find stalled projects (no completed tasks in last 30 days)
     stalled_projects = []
@@ -0,0 +1,207 @@
+"""Columnar store of task history for productivity analytics.
+
+The productivity tools used to re-parse every ISO date on every pass over the
+task list. TaskHistoryColumns parses get_task_history() output once into
+parallel integer columns (dates as proleptic ordinals, statuses and projects as
+small integer codes); period metrics are then single passes over those
+columns with Counter-based group-bys.
+
+NumPy is not a dependency of this project, so the columns are stdlib
+array.array buffers - at personal task-database sizes (thousands of rows) a
+multi-year report is a few milliseconds either way.
+"""
+
+from array import array
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+# Sentinel for a missing or unparseable date
+NO_DATE = -1
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def _to_ordinal(value: Optional[str]) -> int:
+    """ISO date or datetime string -> date ordinal (NO_DATE if missing/invalid).
+
+    Uses the calendar date as written (the same date datetime.fromisoformat(...).date()
+    gives), without building a datetime.
+    """
+    if not value:
+        return NO_DATE
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except (ValueError, TypeError):
+        return NO_DATE
+
+
+def _period_start(ordinal: int, period: str) -> int:
+    """Ordinal of the first day of the period containing `ordinal`."""
+    if period == "week":
+        # date.fromordinal(1) is a Monday
+        return ordinal - (ordinal - 1) % 7
+    if period == "month":
+        return date.fromordinal(ordinal).replace(day=1).toordinal()
+    return ordinal
+
+
+def period_label(start: int, period: str) -> str:
+    """Format a period start ordinal as the tools' period key (YYYY-MM-DD or YYYY-MM)."""
+    if period == "month":
+        return date.fromordinal(start).strftime("%Y-%m")
+    return date.fromordinal(start).isoformat()
+
+
+def _percentile(sorted_values: Sequence[int], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile of pre-sorted values."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class TaskHistoryColumns:
+    """Parallel columns over a list of task dicts (from extract_task_properties).
+
+    Row i of every column describes tasks[i], so results can point back into
+    the original list for display fields.
+
+    Attributes:
+        created: Created date ordinals
+        completed: Completed date ordinals
+        due: Due date ordinals
+        status: Status codes (index into statuses)
+        project: First project code (index into projects, -1 if none)
+    """
+
+    def __init__(self, tasks: Sequence[Dict[str, Any]]):
+        self.tasks = tasks
+        self.statuses: List[Optional[str]] = []
+        self.projects: List[str] = []
+        status_codes: Dict[Optional[str], int] = {}
+        project_codes: Dict[str, int] = {}
+
+        self.created = array("l")
+        self.completed = array("l")
+        self.due = array("l")
+        self.status = array("l")
+        self.project = array("l")
+
+        for task in tasks:
+            self.created.append(_to_ordinal(task.get("created_time")))
+            self.completed.append(_to_ordinal(task.get("completed_date")))
+            self.due.append(_to_ordinal(task.get("due_date")))
+
+            status = task.get("status")
+            if status not in status_codes:
+                status_codes[status] = len(self.statuses)
+                self.statuses.append(status)
+            self.status.append(status_codes[status])
+
+            project_ids = task.get("project_ids") or []
+            if project_ids:
+                if project_ids[0] not in project_codes:
+                    project_codes[project_ids[0]] = len(self.projects)
+                    self.projects.append(project_ids[0])
+                self.project.append(project_codes[project_ids[0]])
+            else:
+                self.project.append(-1)
+
+        self._done = status_codes.get("Done", -2)
+        self._waiting = status_codes.get("Waiting", -2)
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def done_rows(self) -> List[int]:
+        """Rows whose status is Done."""
+        done = self._done
+        return [i for i, code in enumerate(self.status) if code == done]
+
+    def count_done(self, rows: Iterable[int]) -> int:
+        """Number of the given rows whose status is Done."""
+        done = self._done
+        return sum(1 for i in rows if self.status[i] == done)
+
+    def cycle_times(self, rows: Optional[Iterable[int]] = None) -> List[int]:
+        """Days from created to completed for Done rows with both dates (negative spans dropped)."""
+        created, completed = self.created, self.completed
+        result = []
+        for i in (rows if rows is not None else self.done_rows()):
+            if self.status[i] != self._done:
+                continue
+            if created[i] != NO_DATE and completed[i] != NO_DATE:
+                days = completed[i] - created[i]
+                if days >= 0:
+                    result.append(days)
+        return result
+
+    def cycle_time_percentiles(self, percentiles: Sequence[float] = (50, 75, 90)) -> Dict[str, Optional[float]]:
+        """Cycle-time percentiles over all Done rows."""
+        values = sorted(self.cycle_times())
+        return {f"p{int(p)}": _percentile(values, p) for p in percentiles}
+
+    def period_rows(self, period: str = "day") -> Dict[int, List[int]]:
+        """Group rows by period of their activity date (completed, else created).
+
+        Rows with an unparseable completed date are skipped rather than falling
+        back to the created date.
+
+        Returns:
+            Dict of period start ordinal -> row indices, in row order
+        """
+        starts: Dict[int, int] = {}
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(self)):
+            day = self.completed[i]
+            if day == NO_DATE:
+                if self.tasks[i].get("completed_date"):
+                    continue
+                day = self.created[i]
+            if day == NO_DATE:
+                continue
+            if day not in starts:
+                starts[day] = _period_start(day, period)
+            groups.setdefault(starts[day], []).append(i)
+        return groups
+
+    def completions_by_period(self, period: str = "day") -> Counter:
+        """Velocity: Done tasks per period of completion date (period start ordinal -> count)."""
+        starts: Dict[int, int] = {}
+        counts: Counter = Counter()
+        for i in self.done_rows():
+            day = self.completed[i]
+            if day == NO_DATE:
+                continue
+            if day not in starts:
+                starts[day] = _period_start(day, period)
+            counts[starts[day]] += 1
+        return counts
+
+    def completions_by_weekday(self) -> Counter:
+        """Done tasks per weekday of completion (0=Monday)."""
+        return Counter((self.completed[i] - 1) % 7 for i in self.done_rows() if self.completed[i] != NO_DATE)
+
+    def overdue_aging(self, today: Optional[date] = None) -> List[tuple]:
+        """Rows that are not Done and past due, with days overdue, most overdue first."""
+        today_ordinal = (today or date.today()).toordinal()
+        done = self._done
+        aging = [
+            (i, today_ordinal - due)
+            for i, due in enumerate(self.due)
+            if due != NO_DATE and due < today_ordinal and self.status[i] != done
+        ]
+        aging.sort(key=lambda row: row[1], reverse=True)
+        return aging
+
+    def waiting_aging(self, today: Optional[date] = None) -> List[tuple]:
+        """Waiting rows with days since creation (None if unknown)."""
+        today_ordinal = (today or date.today()).toordinal()
+        return [
+            (i, today_ordinal - self.created[i] if self.created[i] != NO_DATE else None)
+            for i, code in enumerate(self.status) if code == self._waiting
+        ]
+
@@ -7,6 +7,7 @@ from .get_conversation_history import (
     get_unread_messages_from_conversation,
     get_recent_messages_from_conversation,
     get_unread_and_recent_messages,
+    get_messages_since,
 )
 from .get_thread_messages import (
     get_thread_messages,
@@ -22,16 +23,23 @@ from .extract_rich_content import (
     extract_channel_references,
     extract_links,
     format_rich_content_summary,
+    resolve_mentions,
 )
+from .user_directory import get_user_name, get_user_names, refresh_user_directory
 from .message_tracker import (
     is_message_processed,
     mark_message_processed,
     get_message_id,
     get_processed_messages_by_date_range,
     clear_processed_messages,
+    MessageTracker,
+    get_message_tracker,
+    get_channel_high_water,
+    reset_channel_sync,
 )
-from .classify_slack_message import classify_slack_message
+from .classify_slack_message import classify_slack_message, classify_slack_batch
 from .process_slack_messages import process_slack_messages
+from .socket_listener import SlackSocketListener, run_slack_listener
 
 __all__ = [
     "get_slack_client",
@@ -40,6 +48,7 @@ __all__ = [
     "get_unread_messages_from_conversation",
     "get_recent_messages_from_conversation",
     "get_unread_and_recent_messages",
+    "get_messages_since",
     "get_thread_messages",
     "get_thread_replies",
     "has_thread_replies",
@@ -51,11 +60,22 @@ __all__ = [
     "extract_channel_references",
     "extract_links",
     "format_rich_content_summary",
+    "resolve_mentions",
+    "get_user_name",
+    "get_user_names",
+    "refresh_user_directory",
     "is_message_processed",
     "mark_message_processed",
     "get_message_id",
     "get_processed_messages_by_date_range",
     "clear_processed_messages",
+    "MessageTracker",
+    "get_message_tracker",
+    "get_channel_high_water",
+    "reset_channel_sync",
     "classify_slack_message",
+    "classify_slack_batch",
     "process_slack_messages",
+    "SlackSocketListener",
+    "run_slack_listener",
 ]
@@ -1,29 +1,20 @@
 """Classify Slack messages as TASK, RESOURCE, IDEA, or MULTIPLE."""
 
-import re
-from typing import Dict, Any, Optional
-from task_management.tools.inbox_agent.classify_input import classify_input
+from typing import Dict, Any, Iterable, List, Optional
+from task_management.tools.inbox_agent.classification_engine import REQUEST, scan, classify_signals
 
 
-def classify_slack_message(
+def _classify_scanned(
     message_text: str,
-    channel_name: Optional[str] = None,
-    is_dm: bool = False,
-    user_name: Optional[str] = None
+    signals: int,
+    urls: List[str],
+    channel_name: Optional[str],
+    is_dm: bool,
+    user_name: Optional[str]
 ) -> Dict[str, Any]:
-    """Classify a Slack message using existing classification logic.
-    
-    Args:
-        message_text: The message text content
-        channel_name: Name of the channel (if not DM)
-        is_dm: True if this is a direct message
-        user_name: Name of the user who sent the message
-        
-    Returns:
-        Dictionary with classification, confidence, and extracted information
-    """
+    """Apply the Slack-specific adjustments to a scanned message."""
     # Use existing classification logic
-    classification = classify_input(message_text)
+    classification = classify_signals(signals, urls)
     
     # Enhance with Slack-specific context
     result = {
@@ -44,10 +35,56 @@ def classify_slack_message(
     
     # Channel messages mentioning you might be tasks
     if not is_dm and "@" in message_text and classification["classification"] != "TASK":
-        # Check if it's likely a task request
-        task_indicators = ["can you", "please", "need", "should", "could you"]
-        if any(indicator in message_text.lower() for indicator in task_indicators):
+        # Likely a task request ("can you", "please", ... - found in the same scan)
+        if signals & REQUEST:
             result["classification"] = "TASK"
             result["confidence"] = 0.75
     
     return result
+
+
+def classify_slack_message(
+    message_text: str,
+    channel_name: Optional[str] = None,
+    is_dm: bool = False,
+    user_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Classify a Slack message using existing classification logic.
+    
+    Args:
+        message_text: The message text content
+        channel_name: Name of the channel (if not DM)
+        is_dm: True if this is a direct message
+        user_name: Name of the user who sent the message
+    
+    Returns:
+        Dictionary with classification, confidence, and extracted information
+    """
+    signals, urls = scan(message_text)
+    return _classify_scanned(message_text, signals, urls, channel_name, is_dm, user_name)
+
+
+def classify_slack_batch(messages: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Classify many Slack messages (e.g. when reclassifying history).
+    
+    Results are identical to calling classify_slack_message on each message.
+    
+    Args:
+        messages: Dicts with message_text and optionally channel_name, is_dm, user_name
+    
+    Returns:
+        One classification dict per message, in order
+    """
+    results = []
+    for message in messages:
+        message_text = message["message_text"]
+        signals, urls = scan(message_text)
+        results.append(_classify_scanned(
+            message_text,
+            signals,
+            urls,
+            message.get("channel_name"),
+            message.get("is_dm", False),
+            message.get("user_name")
+        ))
+    return results
@@ -0,0 +1,150 @@
+"""Cache of per-conversation read state (conversations.info).
+
+conversations.list does not return last_read, so unread discovery used to
+call conversations.info for every conversation on every sweep. Results are
+now kept in the slack_conversation_info table of data/sessions.db and a
+conversation is only probed again when its `updated` timestamp has moved
+since it was cached or the entry is older than CONVERSATION_INFO_TTL_SECONDS.
+Probes that are needed run on a small thread pool.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .message_tracker import get_db_path
+
+# How long cached read state is trusted when `updated` has not moved
+CONVERSATION_INFO_TTL_SECONDS = int(os.getenv("SLACK_CONVERSATION_INFO_TTL_SECONDS", str(60 * 60)))
+
+# Concurrent conversations.info calls (Tier 3; the client also paces them)
+PROBE_WORKERS = 4
+
+# SQLite's default limit on bound parameters is 999
+_MAX_QUERY_PARAMS = 500
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared cache connection, creating the table on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS slack_conversation_info (
+                channel_id TEXT PRIMARY KEY,
+                updated REAL,
+                last_read REAL,
+                unread_count INTEGER,
+                unread_count_display INTEGER,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def probe_conversation(client, channel_id: str) -> Dict[str, Any]:
+    """Fetch read state for one conversation via conversations.info.
+
+    Args:
+        client: Slack client instance
+        channel_id: Conversation ID
+
+    Returns:
+        Dict with last_read (float or None), unread_count and unread_count_display
+        (None when conversations.info doesn't report them or the call fails)
+    """
+    info = {"last_read": None, "unread_count": None, "unread_count_display": None}
+    try:
+        response = client.conversations_info(channel=channel_id)
+    except Exception:
+        # Can happen with bot tokens or missing scopes
+        return info
+    if not response.get("ok") or not response.get("channel"):
+        return info
+
+    channel_info = response["channel"]
+    info["unread_count"] = channel_info.get("unread_count")
+    info["unread_count_display"] = channel_info.get("unread_count_display")
+
+    # last_read is available for DMs and sometimes for channels with user tokens
+    last_read_ts = channel_info.get("last_read")
+    if last_read_ts:
+        try:
+            info["last_read"] = float(last_read_ts)
+        except (ValueError, TypeError):
+            pass
+    return info
+
+
+def _load_cached(channel_ids: List[str]) -> Dict[str, tuple]:
+    rows = {}
+    with _lock:
+        conn = _get_connection()
+        for start in range(0, len(channel_ids), _MAX_QUERY_PARAMS):
+            chunk = channel_ids[start:start + _MAX_QUERY_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                "SELECT channel_id, updated, last_read, unread_count, unread_count_display, fetched_at "
+                f"FROM slack_conversation_info WHERE channel_id IN ({placeholders})",
+                chunk
+            ):
+                rows[row[0]] = row[1:]
+    return rows
+
+
+def get_conversation_read_state(client, conversations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Get last_read/unread counts for conversations, probing only those that changed.
+
+    Args:
+        client: Slack client instance
+        conversations: Conversation objects from conversations.list (need id and updated)
+
+    Returns:
+        Dict with:
+        - states: Mapping of conversation ID -> read state (see probe_conversation)
+        - probed: Number of conversations.info calls made
+        - cached: Number served from the cache
+    """
+    now = time.time()
+    channel_ids = [conv["id"] for conv in conversations]
+    cached = _load_cached(channel_ids)
+
+    states: Dict[str, Dict[str, Any]] = {}
+    to_probe = []
+    for conv in conversations:
+        row = cached.get(conv["id"])
+        updated = conv.get("updated")
+        if row is not None and row[0] == updated and now - row[4] < CONVERSATION_INFO_TTL_SECONDS:
+            states[conv["id"]] = {"last_read": row[1], "unread_count": row[2], "unread_count_display": row[3]}
+        else:
+            to_probe.append(conv)
+
+    if to_probe:
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+            probed = list(executor.map(lambda conv: probe_conversation(client, conv["id"]), to_probe))
+
+        rows = []
+        for conv, info in zip(to_probe, probed):
+            states[conv["id"]] = info
+            rows.append((
+                conv["id"], conv.get("updated"), info["last_read"],
+                info["unread_count"], info["unread_count_display"], now
+            ))
+        with _lock:
+            conn = _get_connection()
+            with conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO slack_conversation_info
+                    (channel_id, updated, last_read, unread_count, unread_count_display, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, rows)
+
+    return {"states": states, "probed": len(to_probe), "cached": len(conversations) - len(to_probe)}
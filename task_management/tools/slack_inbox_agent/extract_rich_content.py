@@ -2,6 +2,10 @@
 
 import re
 from typing import List, Dict, Any, Optional
+from .user_directory import get_user_name
+
+# Slack mentions are in format <@U123456> or <@U123456|username>
+MENTION_PATTERN = re.compile(r'<@([UW][A-Z0-9]+)(?:\|([^>]+))?>')
 
 
 def extract_files(message: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -70,14 +74,29 @@ def extract_mentions(message_text: str) -> List[str]:
     Returns:
         List of user IDs mentioned (e.g., ["U123456", "U789012"])
     """
-    # Slack mentions are in format <@U123456> or <@U123456|username>
-    pattern = r'<@(U[A-Z0-9]+)(?:\|[^>]+)?>'
-    matches = re.findall(pattern, message_text)
+    matches = [user_id for user_id, _ in MENTION_PATTERN.findall(message_text)]
     
     # Return unique user IDs
     return list(set(matches))
 
 
+def resolve_mentions(message_text: str, client=None) -> str:
+    """Render <@U123> mention tokens as @Name using the user directory cache.
+    
+    Args:
+        message_text: Message text content
+        client: Slack client used on a directory miss (defaults to the shared client)
+        
+    Returns:
+        Text with mentions replaced by names (falling back to the token's label, then the ID)
+    """
+    def replace(match):
+        user_id, label = match.group(1), match.group(2)
+        return f"@{get_user_name(user_id, client) or label or user_id}"
+    
+    return MENTION_PATTERN.sub(replace, message_text)
+
+
 def extract_channel_references(message_text: str) -> List[str]:
     """Extract channel references from message text.
     
@@ -122,15 +141,18 @@ def extract_rich_content(message: Dict[str, Any]) -> Dict[str, Any]:
         - files: List of file objects
         - reactions: List of reaction objects
         - mentions: List of user IDs mentioned
+        - mention_names: Names of the mentioned users (from the user directory cache)
         - channel_references: List of channel IDs referenced
         - links: List of URLs found in message text
     """
     message_text = message.get("text", "")
+    mentions = extract_mentions(message_text)
     
     return {
         "files": extract_files(message),
         "reactions": extract_reactions(message),
-        "mentions": extract_mentions(message_text),
+        "mentions": mentions,
+        "mention_names": [get_user_name(user_id) or user_id for user_id in sorted(mentions)],
         "channel_references": extract_channel_references(message_text),
         "links": extract_links(message_text),
     }
@@ -157,8 +179,11 @@ def format_rich_content_summary(rich_content: Dict[str, Any]) -> str:
         reaction_names = [f":{r.get('name')}: ({r.get('count')})" for r in reactions]
         parts.append(f"👍 Reactions: {', '.join(reaction_names)}")
     
+    mention_names = rich_content.get("mention_names", [])
     mentions = rich_content.get("mentions", [])
-    if mentions:
+    if mention_names:
+        parts.append(f"@ Mentions: {', '.join(mention_names)}")
+    elif mentions:
         parts.append(f"@ Mentions: {len(mentions)} user(s)")
     
     channel_refs = rich_content.get("channel_references", [])
@@ -3,6 +3,71 @@
 import time
 from typing import List, Dict, Any, Optional
 from .slack_client import get_slack_client
+from .message_tracker import ts_sort_key
+
+
+# Most messages an incremental sync hands to one run for a conversation; a
+# larger backlog is synced oldest first over several runs
+SYNC_MAX_MESSAGES = 1000
+
+
+def _fetch_history_pages(
+    channel_id: str,
+    limit: Optional[int],
+    oldest: Optional[str] = None,
+    latest: Optional[str] = None
+) -> "tuple[List[Dict[str, Any]], bool]":
+    """Page through conversations.history (newest first) up to `limit` messages (None = all).
+    
+    Returns:
+        Tuple of (raw messages, whether older messages in range were left unfetched)
+    """
+    client = get_slack_client()
+    all_messages = []
+    cursor = None
+    
+    # Handle pagination for large conversation histories
+    while True:
+        params = {
+            "channel": channel_id,
+            "limit": min(limit or 200, 200),  # Slack API max is 200 per request
+        }
+        
+        if oldest:
+            params["oldest"] = oldest
+        if latest:
+            params["latest"] = latest
+        if cursor:
+            params["cursor"] = cursor
+        
+        response = client.conversations_history(**params)
+        
+        if not response["ok"]:
+            raise Exception(f"Slack API error: {response.get('error', 'unknown')}")
+        
+        messages = response.get("messages", [])
+        all_messages.extend(messages)
+        
+        # Check if there are more pages
+        response_metadata = response.get("response_metadata", {})
+        cursor = response_metadata.get("next_cursor")
+        
+        # Stop if no more pages or we've reached the limit
+        if not cursor or (limit is not None and len(all_messages) >= limit):
+            break
+    
+    if limit is None:
+        return all_messages, False
+    truncated = bool(cursor) or len(all_messages) > limit
+    return all_messages[:limit], truncated
+
+
+def _user_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Filter out bot messages and system messages."""
+    return [
+        msg for msg in messages
+        if msg.get("type") == "message" and not msg.get("bot_id")
+    ]
 
 
 def get_conversation_history(
@@ -28,52 +93,52 @@ def get_conversation_history(
         - channel: Channel ID
         - type: Message type
     """
-    client = get_slack_client()
-    
     try:
-        all_messages = []
-        cursor = None
-        
-        # Handle pagination for large conversation histories
-        while True:
-            params = {
-                "channel": channel_id,
-                "limit": min(limit, 200),  # Slack API max is 200 per request
-            }
-            
-            if oldest:
-                params["oldest"] = oldest
-            if latest:
-                params["latest"] = latest
-            if cursor:
-                params["cursor"] = cursor
-            
-            response = client.conversations_history(**params)
-            
-            if not response["ok"]:
-                raise Exception(f"Slack API error: {response.get('error', 'unknown')}")
-            
-            messages = response.get("messages", [])
-            all_messages.extend(messages)
-            
-            # Check if there are more pages
-            response_metadata = response.get("response_metadata", {})
-            cursor = response_metadata.get("next_cursor")
-            
-            # Stop if no more pages or we've reached the limit
-            if not cursor or len(all_messages) >= limit:
-                break
-        
-        # Filter out bot messages and system messages
-        user_messages = [
-            msg for msg in all_messages[:limit]
-            if msg.get("type") == "message" and not msg.get("bot_id")
-        ]
+        all_messages, _ = _fetch_history_pages(channel_id, limit, oldest=oldest, latest=latest)
+        return _user_messages(all_messages)
         
-        return user_messages
+    except Exception as e:
+        raise Exception(f"Failed to get conversation history: {str(e)}")
+
+
+def get_messages_since(
+    channel_id: str,
+    high_water_ts: str,
+    limit: int = SYNC_MAX_MESSAGES
+) -> Dict[str, Any]:
+    """Get only the messages posted after a conversation's high-water mark.
+    
+    History is returned newest first, so every page after the mark is read.
+    When more than `limit` messages arrived, only the oldest `limit` are
+    returned: the mark then advances over a contiguous range, and the next
+    sync continues from there until the backlog is closed.
+    
+    Args:
+        channel_id: Conversation ID
+        high_water_ts: ts of the last message already synced (exclusive)
+        limit: Maximum number of messages to return (default: SYNC_MAX_MESSAGES)
         
+    Returns:
+        Dictionary with:
+        - all: New user messages, newest first
+        - high_water_ts: Newest ts returned (bots included), or the old mark if nothing is new
+        - complete: True (every message between the old and new mark is returned)
+    """
+    try:
+        all_messages, _ = _fetch_history_pages(channel_id, None, oldest=high_water_ts)
     except Exception as e:
         raise Exception(f"Failed to get conversation history: {str(e)}")
+    
+    all_messages = sorted(
+        (msg for msg in all_messages if msg.get("ts")),
+        key=lambda msg: ts_sort_key(msg["ts"]),
+        reverse=True
+    )[-limit:]
+    return {
+        "all": _user_messages(all_messages),
+        "high_water_ts": all_messages[0]["ts"] if all_messages else high_water_ts,
+        "complete": True
+    }
 
 
 def get_unread_messages_from_conversation(
@@ -0,0 +1,145 @@
+"""Building blocks for the staged Slack inbox sweep.
+
+process_slack_messages runs three stages, each on its own bounded thread pool:
+fetch conversation history -> enrich/classify messages -> write Notion entries.
+MessageBudget keeps max_messages exact while writes are in flight (each
+message holds a MessageSlot), and StageStats records per-stage throughput for
+the sweep summary.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Worker pool sizes per stage. Slack history/replies calls are Tier 3 and Notion
+# averages ~3 req/s; both clients also pace requests themselves.
+FETCH_WORKERS = 4
+ENRICH_WORKERS = 4
+WRITE_WORKERS = 3
+
+
+class MessageBudget:
+    """Thread-safe max_messages accounting for concurrent writes.
+
+    A message reserves a slot before it is enriched and either commits it
+    (an entry was created) or releases it (skipped/failed) so a later message
+    can take its place. Only committed slots count as processed.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self.reserved = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> bool:
+        """Reserve a slot, waiting for in-flight messages if the budget is fully reserved.
+
+        Returns:
+            True if a slot was reserved, False if the budget is used up
+        """
+        with self._cond:
+            while self.used + self.reserved >= self.limit:
+                if self.reserved == 0:
+                    return False
+                self._cond.wait()
+            self.reserved += 1
+            return True
+
+    def commit(self) -> None:
+        """Count a reserved slot as processed."""
+        with self._cond:
+            self.reserved -= 1
+            self.used += 1
+            self._cond.notify_all()
+
+    def release(self) -> None:
+        """Give back a reserved slot without counting it."""
+        with self._cond:
+            self.reserved -= 1
+            self._cond.notify_all()
+
+    def try_acquire(self) -> bool:
+        """Reserve a slot only if one is free right now (thread replies)."""
+        with self._cond:
+            if self.used + self.reserved >= self.limit:
+                return False
+            self.reserved += 1
+            return True
+
+    def exhausted(self) -> bool:
+        """Whether every slot has been used."""
+        with self._cond:
+            return self.used >= self.limit
+
+    def reserve(self) -> Optional["MessageSlot"]:
+        """acquire() a slot for one message (None if the budget is used up)."""
+        return MessageSlot(self) if self.acquire() else None
+
+    def try_reserve(self) -> Optional["MessageSlot"]:
+        """try_acquire() a slot for one message (None if none is free right now)."""
+        return MessageSlot(self) if self.try_acquire() else None
+
+
+class MessageSlot:
+    """One message's reserved MessageBudget slot.
+
+    The first commit() or release() settles the slot; later calls do nothing,
+    so an error path can release whatever a write did not settle.
+    """
+
+    def __init__(self, budget: MessageBudget):
+        self.budget = budget
+        self.settled = False
+        self._lock = threading.Lock()
+
+    def _settle(self) -> bool:
+        with self._lock:
+            if self.settled:
+                return False
+            self.settled = True
+            return True
+
+    def commit(self) -> None:
+        """Count the slot as processed."""
+        if self._settle():
+            self.budget.commit()
+
+    def release(self) -> None:
+        """Give the slot back without counting it."""
+        if self._settle():
+            self.budget.release()
+
+
+class StageStats:
+    """Thread-safe throughput counters for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy_seconds = 0.0
+        self._first_start: Optional[float] = None
+        self._last_end: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, started: float, items: int = 1) -> None:
+        """Record work that began at `started` (time.perf_counter()) and just finished."""
+        ended = time.perf_counter()
+        with self._lock:
+            self.items += items
+            self.busy_seconds += ended - started
+            if self._first_start is None or started < self._first_start:
+                self._first_start = started
+            if self._last_end is None or ended > self._last_end:
+                self._last_end = ended
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Items, busy/wall seconds and items per wall-clock second."""
+        with self._lock:
+            wall = (self._last_end - self._first_start) if self._first_start is not None else 0.0
+            return {
+                "items": self.items,
+                "busy_seconds": round(self.busy_seconds, 3),
+                "wall_seconds": round(wall, 3),
+                "per_second": round(self.items / wall, 2) if wall > 0 else None,
+            }
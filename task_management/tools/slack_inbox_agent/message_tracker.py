@@ -2,9 +2,20 @@
 
 import os
 import sqlite3
-from typing import Optional, List, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterable, Set
 from datetime import datetime, timedelta
 
+# SQLite's default limit on bound parameters is 999
+_MAX_QUERY_PARAMS = 500
+
+
+def ts_sort_key(message_ts: str) -> tuple:
+    """Sortable key for a Slack ts ("1712345678.123456") without float rounding."""
+    seconds, _, fraction = message_ts.partition(".")
+    return int(seconds), int(fraction.ljust(6, "0")[:6])
+
 
 def get_db_path() -> str:
     """Get the path to the SQLite database file."""
@@ -19,13 +30,8 @@ def get_db_path() -> str:
     return os.path.join(data_dir, "sessions.db")
 
 
-def init_message_tracker_table():
-    """Initialize the processed_slack_messages table if it doesn't exist."""
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
+def _create_tables(conn: sqlite3.Connection) -> None:
+    conn.execute("""
         CREATE TABLE IF NOT EXISTS processed_slack_messages (
             message_id TEXT PRIMARY KEY,
             channel_id TEXT NOT NULL,
@@ -37,13 +43,300 @@ def init_message_tracker_table():
     """)
     
     # Create index on channel_id and message_ts for faster lookups
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_channel_ts 
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_channel_ts
         ON processed_slack_messages(channel_id, message_ts)
     """)
     
+    # Per-conversation high-water mark: ts of the newest message already synced
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS slack_channel_sync (
+            channel_id TEXT PRIMARY KEY,
+            high_water_ts TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # Notion idea that collects a thread's replies (thread aggregation mode)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS slack_thread_pages (
+            channel_id TEXT NOT NULL,
+            thread_ts TEXT NOT NULL,
+            notion_page_id TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (channel_id, thread_ts)
+        )
+    """)
     conn.commit()
-    conn.close()
+
+
+class _PendingWrites:
+    """One thread's buffered marks, high-water and thread page updates."""
+    
+    __slots__ = ("batch_depth", "marks", "high_water", "threads")
+    
+    def __init__(self):
+        self.batch_depth = 0
+        self.marks: Dict[str, tuple] = {}
+        self.high_water: Dict[str, str] = {}
+        self.threads: Dict[tuple, str] = {}
+
+
+class MessageTracker:
+    """Processed-message store on one long-lived WAL-mode connection.
+    
+    Inside batch(), a thread's marks are buffered and written by that
+    thread's flush() (or the end of its outermost batch) in a single
+    transaction. Buffers are per thread: one worker's flush never commits
+    marks another worker is still holding, so a mark only lands once the
+    write it records has finished. Lookups see every thread's buffered marks
+    immediately. The connection is shared across threads behind a lock.
+    """
+    
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or get_db_path()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        _create_tables(self._conn)
+        self._lock = threading.RLock()
+        # Buffered writes by thread ident (only while a thread has some)
+        self._pending: Dict[int, _PendingWrites] = {}
+    
+    def _own_pending(self) -> _PendingWrites:
+        """The calling thread's buffer, created on demand (call with the lock held)."""
+        return self._pending.setdefault(threading.get_ident(), _PendingWrites())
+    
+    def _write_or_buffer(self, pending: _PendingWrites) -> None:
+        if pending.batch_depth == 0:
+            self.flush()
+    
+    def processed_ids(self, message_ids: Iterable[str]) -> Set[str]:
+        """Return which of the given message IDs are already processed.
+        
+        Args:
+            message_ids: Message identifiers (channel_id:message_ts)
+        
+        Returns:
+            Set of the IDs that have been processed (including buffered marks)
+        """
+        ids = list(dict.fromkeys(message_ids))
+        with self._lock:
+            found = {
+                message_id for message_id in ids
+                if any(message_id in pending.marks for pending in self._pending.values())
+            }
+            remaining = [message_id for message_id in ids if message_id not in found]
+            for start in range(0, len(remaining), _MAX_QUERY_PARAMS):
+                chunk = remaining[start:start + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT message_id FROM processed_slack_messages WHERE message_id IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+    
+    def is_processed(self, message_id: str) -> bool:
+        """Check if a single message has been processed."""
+        return bool(self.processed_ids([message_id]))
+    
+    def mark(
+        self,
+        message_id: str,
+        channel_id: str,
+        message_ts: str,
+        created_notion_id: Optional[str] = None,
+        created_notion_type: Optional[str] = None
+    ) -> None:
+        """Mark a message as processed (buffered while a batch is open)."""
+        with self._lock:
+            pending = self._own_pending()
+            pending.marks[message_id] = (message_id, channel_id, message_ts, created_notion_id, created_notion_type)
+            self._write_or_buffer(pending)
+    
+    def get_high_water(self, channel_ids: Iterable[str]) -> Dict[str, str]:
+        """Get the high-water ts of each conversation that has one.
+        
+        Args:
+            channel_ids: Slack channel/conversation IDs
+        
+        Returns:
+            Dict of channel_id -> ts of the newest message already synced
+        """
+        ids = list(dict.fromkeys(channel_ids))
+        marks: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(ids), _MAX_QUERY_PARAMS):
+                chunk = ids[start:start + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                marks.update(self._conn.execute(
+                    f"SELECT channel_id, high_water_ts FROM slack_channel_sync WHERE channel_id IN ({placeholders})",
+                    chunk
+                ).fetchall())
+            for pending_writes in self._pending.values():
+                for channel_id in ids:
+                    pending = pending_writes.high_water.get(channel_id)
+                    if pending and (channel_id not in marks or ts_sort_key(pending) > ts_sort_key(marks[channel_id])):
+                        marks[channel_id] = pending
+        return marks
+    
+    def advance_high_water(self, channel_id: str, message_ts: str) -> None:
+        """Move a conversation's high-water mark forward (never backward).
+        
+        Buffered like marks, so it is written in the same transaction as the
+        messages it covers.
+        """
+        with self._lock:
+            pending_writes = self._own_pending()
+            pending = pending_writes.high_water.get(channel_id)
+            if pending is None or ts_sort_key(message_ts) > ts_sort_key(pending):
+                pending_writes.high_water[channel_id] = message_ts
+            self._write_or_buffer(pending_writes)
+    
+    def reset_high_water(self, channel_id: Optional[str] = None) -> None:
+        """Forget a conversation's high-water mark (or all of them).
+        
+        The next sync of that conversation backfills instead of fetching
+        only new messages.
+        """
+        with self._lock:
+            for pending in self._pending.values():
+                if channel_id is None:
+                    pending.high_water.clear()
+                else:
+                    pending.high_water.pop(channel_id, None)
+            if channel_id is None:
+                self.delete("DELETE FROM slack_channel_sync")
+            else:
+                self.delete("DELETE FROM slack_channel_sync WHERE channel_id = ?", (channel_id,))
+    
+    def get_thread_page(self, channel_id: str, thread_ts: str) -> Optional[str]:
+        """Get the Notion page collecting a thread's replies, if one was created.
+        
+        Args:
+            channel_id: Slack channel/conversation ID
+            thread_ts: ts of the thread's parent message
+        
+        Returns:
+            Notion page ID, or None
+        """
+        with self._lock:
+            for pending_writes in self._pending.values():
+                pending = pending_writes.threads.get((channel_id, thread_ts))
+                if pending:
+                    return pending
+            row = self._conn.execute(
+                "SELECT notion_page_id FROM slack_thread_pages WHERE channel_id = ? AND thread_ts = ?",
+                (channel_id, thread_ts)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def set_thread_page(self, channel_id: str, thread_ts: str, notion_page_id: str) -> None:
+        """Record the Notion page for a thread (buffered like marks)."""
+        with self._lock:
+            pending = self._own_pending()
+            pending.threads[(channel_id, thread_ts)] = notion_page_id
+            self._write_or_buffer(pending)
+    
+    def flush(self) -> int:
+        """Write this thread's buffered marks, high-water and thread page updates in one transaction.
+        
+        Returns:
+            Number of marks written
+        """
+        with self._lock:
+            pending = self._pending.get(threading.get_ident())
+            if pending is None:
+                return 0
+            written = self._write(pending)
+            if pending.batch_depth == 0:
+                del self._pending[threading.get_ident()]
+            return written
+    
+    def _write(self, pending: _PendingWrites) -> int:
+        """Commit one buffer and clear it (call with the lock held)."""
+        if not pending.marks and not pending.high_water and not pending.threads:
+            return 0
+        rows = list(pending.marks.values())
+        with self._conn:
+            self._conn.executemany("""
+                INSERT OR REPLACE INTO processed_slack_messages
+                (message_id, channel_id, message_ts, processed_at, created_notion_id, created_notion_type)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
+            """, rows)
+            self._conn.executemany("""
+                INSERT INTO slack_channel_sync (channel_id, high_water_ts, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(channel_id) DO UPDATE SET
+                    high_water_ts = excluded.high_water_ts,
+                    updated_at = excluded.updated_at
+                WHERE length(excluded.high_water_ts) > length(slack_channel_sync.high_water_ts)
+                    OR (length(excluded.high_water_ts) = length(slack_channel_sync.high_water_ts)
+                        AND excluded.high_water_ts > slack_channel_sync.high_water_ts)
+            """, list(pending.high_water.items()))
+            self._conn.executemany("""
+                INSERT OR REPLACE INTO slack_thread_pages (channel_id, thread_ts, notion_page_id, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, [(channel_id, thread_ts, page_id) for (channel_id, thread_ts), page_id in pending.threads.items()])
+        pending.marks.clear()
+        pending.high_water.clear()
+        pending.threads.clear()
+        return len(rows)
+    
+    @contextmanager
+    def batch(self):
+        """Buffer this thread's marks until flush() or the end of its outermost batch."""
+        with self._lock:
+            self._own_pending().batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                pending = self._own_pending()
+                pending.batch_depth -= 1
+                if pending.batch_depth == 0:
+                    self.flush()
+    
+    def execute(self, query: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a read query (after flushing buffered marks) and return rows as dicts."""
+        with self._lock:
+            self.flush()
+            cursor = self._conn.execute(query, list(params))
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def delete(self, query: str, params: Iterable[Any] = ()) -> None:
+        """Run a delete statement in its own transaction."""
+        with self._lock:
+            self.flush()
+            with self._conn:
+                self._conn.execute(query, list(params))
+    
+    def close(self) -> None:
+        """Write every thread's buffered marks and close the connection."""
+        with self._lock:
+            for pending in self._pending.values():
+                self._write(pending)
+            self._pending.clear()
+            self._conn.close()
+
+
+_tracker: Optional[MessageTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_message_tracker() -> MessageTracker:
+    """Get the shared process-wide message tracker."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = MessageTracker()
+        return _tracker
+
+
+def init_message_tracker_table():
+    """Initialize the processed_slack_messages table if it doesn't exist."""
+    get_message_tracker()
 
 
 def is_message_processed(message_id: str) -> bool:
@@ -51,25 +344,11 @@ def is_message_processed(message_id: str) -> bool:
     
     Args:
         message_id: Unique message identifier (channel_id + message_ts)
-        
+    
     Returns:
         True if message has been processed, False otherwise
     """
-    init_message_tracker_table()
-    
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    cursor.execute(
-        "SELECT 1 FROM processed_slack_messages WHERE message_id = ?",
-        (message_id,)
-    )
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    return result is not None
+    return get_message_tracker().is_processed(message_id)
 
 
 def mark_message_processed(
@@ -81,6 +360,8 @@ def mark_message_processed(
 ):
     """Mark a message as processed.
     
+    Written immediately, or at the next flush when a tracker batch is open.
+    
     Args:
         message_id: Unique message identifier (channel_id + message_ts)
         channel_id: Slack channel/conversation ID
@@ -88,20 +369,28 @@ def mark_message_processed(
         created_notion_id: Notion page ID if a Notion entry was created
         created_notion_type: Type of Notion entry (task, resource, idea)
     """
-    init_message_tracker_table()
-    
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    get_message_tracker().mark(message_id, channel_id, message_ts, created_notion_id, created_notion_type)
+
+
+def get_channel_high_water(channel_id: str) -> Optional[str]:
+    """Get the ts of the newest message already synced from a conversation.
     
-    cursor.execute("""
-        INSERT OR REPLACE INTO processed_slack_messages 
-        (message_id, channel_id, message_ts, processed_at, created_notion_id, created_notion_type)
-        VALUES (?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
-    """, (message_id, channel_id, message_ts, created_notion_id, created_notion_type))
+    Args:
+        channel_id: Slack channel/conversation ID
+        
+    Returns:
+        High-water ts, or None if the conversation has never been synced
+    """
+    return get_message_tracker().get_high_water([channel_id]).get(channel_id)
+
+
+def reset_channel_sync(channel_id: Optional[str] = None):
+    """Reset a conversation's high-water mark so its next sync backfills.
     
-    conn.commit()
-    conn.close()
+    Args:
+        channel_id: Conversation to reset. If None, reset every conversation.
+    """
+    get_message_tracker().reset_high_water(channel_id)
 
 
 def get_message_id(channel_id: str, message_ts: str) -> str:
@@ -110,7 +399,7 @@ def get_message_id(channel_id: str, message_ts: str) -> str:
     Args:
         channel_id: Slack channel/conversation ID
         message_ts: Message timestamp from Slack
-        
+    
     Returns:
         Unique message identifier
     """
@@ -126,16 +415,10 @@ def get_processed_messages_by_date_range(
     Args:
         start_date: Start of date range (default: None, no lower limit)
         end_date: End of date range (default: None, no upper limit)
-        
+    
     Returns:
         List of processed message records
     """
-    init_message_tracker_table()
-    
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
     query = "SELECT * FROM processed_slack_messages WHERE 1=1"
     params = []
     
@@ -149,18 +432,7 @@ def get_processed_messages_by_date_range(
     
     query += " ORDER BY processed_at DESC"
     
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    
-    # Get column names
-    columns = [description[0] for description in cursor.description]
-    
-    # Convert to list of dictionaries
-    results = [dict(zip(columns, row)) for row in rows]
-    
-    conn.close()
-    
-    return results
+    return get_message_tracker().execute(query, params)
 
 
 def clear_processed_messages(older_than_days: Optional[int] = None):
@@ -170,20 +442,13 @@ def clear_processed_messages(older_than_days: Optional[int] = None):
         older_than_days: If provided, only clear messages older than N days.
                         If None, clear all records.
     """
-    init_message_tracker_table()
-    
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    tracker = get_message_tracker()
     
     if older_than_days:
         cutoff_date = datetime.now() - timedelta(days=older_than_days)
-        cursor.execute(
+        tracker.delete(
             "DELETE FROM processed_slack_messages WHERE processed_at < ?",
             (cutoff_date.isoformat(),)
         )
     else:
-        cursor.execute("DELETE FROM processed_slack_messages")
-    
-    conn.commit()
-    conn.close()
+        tracker.delete("DELETE FROM processed_slack_messages")
@@ -1,17 +1,25 @@
 """Process unread Slack messages and create Notion entries."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from .get_unread_messages import get_unread_messages
-from .get_conversation_history import get_unread_and_recent_messages
+from .get_conversation_history import get_unread_and_recent_messages, get_messages_since
 from .get_thread_messages import get_thread_replies, has_thread_replies, get_thread_ts
 from .classify_slack_message import classify_slack_message
-from .extract_rich_content import extract_rich_content, format_rich_content_summary
+from .extract_rich_content import extract_rich_content, format_rich_content_summary, resolve_mentions
 from .message_tracker import (
     is_message_processed,
     mark_message_processed,
-    get_message_id
+    get_message_id,
+    get_message_tracker
 )
 from .slack_client import get_slack_client
+from .user_directory import get_user_name
+from .inbox_pipeline import MessageBudget, MessageSlot, StageStats, FETCH_WORKERS, ENRICH_WORKERS, WRITE_WORKERS
+from tools.common import get_notion_client, paragraph_block
+from tools.common.notion_client import MAX_CHILDREN_PER_REQUEST
 from task_management.tools.inbox_agent import (
     create_task,
     create_resource,
@@ -23,26 +31,16 @@ from task_management.tools.inbox_agent import (
 
 
 def _get_user_name(client, user_id: Optional[str]) -> Optional[str]:
-    """Get user name from Slack client.
+    """Get user name from the Slack user directory cache.
     
     Args:
-        client: Slack client instance
+        client: Slack client instance (used for users.list/users.info on a miss)
         user_id: User ID to look up
         
     Returns:
         User name as string, or None if not found
     """
-    if not user_id:
-        return None
-    
-    try:
-        user_info = client.users_info(user=user_id)
-        if user_info.get("ok"):
-            return user_info["user"].get("real_name") or user_info["user"].get("name")
-    except:
-        pass
-    
-    return None
+    return get_user_name(user_id, client)
 
 
 def _build_enhanced_text(message_text: str, rich_content_summary: Optional[str]) -> str:
@@ -118,6 +116,7 @@ def _process_thread_reply(
     if not reply_text or reply_text.strip() == "":
         mark_message_processed(reply_id, channel_id, reply_ts)
         return {"skipped": True}
+    reply_text = resolve_mentions(reply_text, client)
     
     # Get reply user info
     reply_user_id = reply.get("user")
@@ -182,6 +181,188 @@ def _process_thread_reply(
             return None
 
 
+_thread_locks: Dict[tuple, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock(channel_id: str, thread_ts: str) -> threading.Lock:
+    """Lock serializing writes to one thread's idea (sweep workers and listener share it)."""
+    with _thread_locks_guard:
+        return _thread_locks.setdefault((channel_id, thread_ts), threading.Lock())
+
+
+def _write_thread_replies(
+    client,
+    channel_id: str,
+    channel_name: Optional[str],
+    thread_ts: str,
+    replies: List[Dict[str, Any]],
+    budget: Optional[MessageBudget],
+    reprocess: bool,
+    parent_text: Optional[str] = None
+) -> Dict[str, Any]:
+    """Collect a thread's new replies on a single Notion idea (thread aggregation mode).
+    
+    Already-processed replies are filtered with one tracker lookup. New replies
+    are appended as blocks to the thread's existing idea, or one idea is created
+    for the thread. The new idea's page is recorded as soon as it exists, and
+    replies are marked as each request (up to 100 blocks) succeeds, so a
+    partial failure is retried from the first unwritten reply.
+    
+    Args:
+        client: Slack client instance
+        channel_id: Channel ID
+        channel_name: Channel name
+        thread_ts: ts of the thread's parent message
+        replies: Reply messages (parent excluded)
+        budget: Shared max_messages budget; the thread takes one slot (None = unlimited)
+        reprocess: Whether to include already-processed replies
+        parent_text: Parent message text, used for the idea title
+    
+    Returns:
+        Dict with processed/skipped counts, created_items, per-type counts and
+        incomplete (True if new replies were left unmarked for a later sweep,
+        because the budget was used up or the write failed)
+    """
+    outcome = {
+        "processed": 0,
+        "skipped": 0,
+        "created_items": [],
+        "counts": {"tasks": 0, "resources": 0, "ideas": 0},
+        "incomplete": False
+    }
+    tracker = get_message_tracker()
+    replies = [reply for reply in replies if reply.get("ts")]
+    already_processed = set() if reprocess else tracker.processed_ids(
+        get_message_id(channel_id, reply["ts"]) for reply in replies
+    )
+    
+    with tracker.batch():
+        new_replies = []
+        empty_replies = []
+        for reply in replies:
+            reply_id = get_message_id(channel_id, reply["ts"])
+            if reply_id in already_processed:
+                outcome["skipped"] += 1
+            elif not reply.get("text", "").strip():
+                empty_replies.append(reply)
+                outcome["skipped"] += 1
+            else:
+                new_replies.append(reply)
+        
+        # Empty replies are marked with the write, so an unwritten thread never
+        # has its newest reply marked (the sweep retries threads by that reply)
+        def mark_empty_replies():
+            for reply in empty_replies:
+                tracker.mark(get_message_id(channel_id, reply["ts"]), channel_id, reply["ts"])
+        
+        if not new_replies:
+            mark_empty_replies()
+            return outcome
+        slot = None
+        if budget is not None:
+            slot = budget.try_reserve()
+            if slot is None:
+                outcome["incomplete"] = True
+                return outcome
+        
+        with _thread_lock(channel_id, thread_ts):
+            page_id = tracker.get_thread_page(channel_id, thread_ts)
+            written = 0
+            
+            def record_written(count: int) -> None:
+                # Mark the next `count` replies as on the page, durably, so a
+                # later failure doesn't make the retry write them again
+                nonlocal written
+                for reply in new_replies[written:written + count]:
+                    tracker.mark(
+                        get_message_id(channel_id, reply["ts"]),
+                        channel_id,
+                        reply["ts"],
+                        created_notion_id=page_id,
+                        created_notion_type="idea"
+                    )
+                written += count
+                tracker.flush()
+            
+            try:
+                blocks = []
+                for reply in new_replies:
+                    reply_text = resolve_mentions(reply["text"], client)
+                    reply_user_name = _get_user_name(client, reply.get("user")) or "Unknown"
+                    reply_rich_summary = format_rich_content_summary(extract_rich_content(reply))
+                    blocks.append(paragraph_block(
+                        f"{reply_user_name}: {_build_enhanced_text(reply_text, reply_rich_summary)}"
+                    ))
+                
+                if not page_id:
+                    title_text = resolve_mentions(parent_text or new_replies[0]["text"], client)
+                    title = title_text[:100]
+                    if len(title_text) > 100:
+                        title = title_text[:97] + "..."
+                    
+                    # The first replies are the new idea's body, sent with the create request
+                    first_blocks = blocks[:MAX_CHILDREN_PER_REQUEST - 1]
+                    idea = create_idea(
+                        title=f"Slack Thread: {title}",
+                        idea_type="Pattern",
+                        status="Inbox",
+                        source=f"Slack Thread - {channel_name}",
+                        children=[paragraph_block(f"Thread replies in {channel_name}:")] + first_blocks
+                    )
+                    page_id = idea["id"]
+                    outcome["created_items"].append({
+                        "type": "idea",
+                        "id": page_id,
+                        "url": idea.get("url"),
+                        "title": title
+                    })
+                    outcome["counts"]["ideas"] += 1
+                    # Recorded before appending the rest, so a failed append is
+                    # retried on this idea instead of creating a second one
+                    tracker.set_thread_page(channel_id, thread_ts, page_id)
+                    record_written(len(first_blocks))
+                
+                notion = get_notion_client()
+                for start in range(written, len(blocks), MAX_CHILDREN_PER_REQUEST):
+                    chunk = blocks[start:start + MAX_CHILDREN_PER_REQUEST]
+                    notion.blocks.children.append(block_id=page_id, children=chunk)
+                    record_written(len(chunk))
+            except Exception as e:
+                error_msg = str(e)
+                _log_error_to_debug_file(
+                    error_msg,
+                    "process_slack_messages.py:thread_aggregate",
+                    {"channel_name": channel_name, "replies": len(new_replies), "written": written}
+                )
+                if slot is not None:
+                    if written:
+                        slot.commit()
+                    else:
+                        slot.release()
+                outcome["processed"] += written
+                
+                # If Ideas database is not accessible, skip thread replies instead of failing
+                if "Could not find database" in error_msg or "database" in error_msg.lower():
+                    print(f"Warning: Ideas database not accessible. Skipping thread replies. Error: {error_msg}")
+                    for reply in new_replies[written:]:
+                        tracker.mark(get_message_id(channel_id, reply["ts"]), channel_id, reply["ts"])
+                    mark_empty_replies()
+                    outcome["skipped"] += len(new_replies) - written
+                else:
+                    # Left unmarked so the next sweep retries them
+                    print(f"Error processing thread replies: {e}")
+                    outcome["incomplete"] = True
+                return outcome
+            
+            mark_empty_replies()
+    
+    if slot is not None:
+        slot.commit()
+    outcome["processed"] += len(new_replies)
+    return outcome
+
+
 def _handle_resource_creation_retry(
     classification: Dict[str, Any],
     message_text: str,
@@ -445,19 +626,400 @@ def _create_notion_entry_from_classification(
     }
 
 
+def _fetch_conversation_messages(
+    conv: Dict[str, Any],
+    high_water_ts: Optional[str] = None,
+    backfill_hours: int = 24
+) -> Dict[str, Any]:
+    """Fetch stage: new messages for one conversation.
+    
+    Conversations with a high-water mark only transfer messages posted after
+    it. First-time conversations (or reprocess runs) backfill unread messages
+    plus the last `backfill_hours` hours.
+    
+    Args:
+        conv: Conversation dict from get_unread_messages
+        high_water_ts: ts of the newest message already synced, if any
+        backfill_hours: Hours of history to backfill without a mark
+        
+    Returns:
+        Dict with:
+        - all: Messages, newest first
+        - high_water_ts: Mark to store once these messages are handled
+        - complete: Whether every message after the old mark was fetched
+    """
+    if high_water_ts:
+        return get_messages_since(conv["id"], high_water_ts)
+    
+    message_data = get_unread_and_recent_messages(
+        channel_id=conv["id"],
+        last_read_ts=conv.get("last_read"),
+        include_recent_hours=backfill_hours,
+        limit=200
+    )
+    all_messages = message_data.get("all", [])
+    return {
+        "all": all_messages,
+        "high_water_ts": all_messages[0]["ts"] if all_messages else None,
+        "complete": True
+    }
+
+
+def _prepare_message(
+    client,
+    message: Dict[str, Any],
+    channel_id: str,
+    channel_name: Optional[str],
+    is_dm: bool,
+    include_threads: bool
+) -> Dict[str, Any]:
+    """Enrich stage: look up the author, extract rich content, classify, fetch thread replies.
+    
+    Args:
+        client: Slack client instance
+        message: Slack message (non-empty text)
+        channel_id: Channel ID
+        channel_name: Channel name
+        is_dm: Whether this is a DM
+        include_threads: Whether to fetch thread replies
+        
+    Returns:
+        Dict with everything the write stage needs
+    """
+    message_text = resolve_mentions(message.get("text", ""), client)
+    message_ts = message.get("ts")
+    
+    # Get user info if available
+    user_name = _get_user_name(client, message.get("user"))
+    
+    # Extract rich content
+    rich_content = extract_rich_content(message)
+    rich_content_summary = format_rich_content_summary(rich_content)
+    
+    # Classify the message
+    classification = classify_slack_message(
+        message_text=message_text,
+        channel_name=channel_name if not is_dm else None,
+        is_dm=is_dm,
+        user_name=user_name
+    )
+    
+    # Fetch link metadata here so the write stage's lookup is a cache hit
+    if classification.get("classification") in ("RESOURCE", "MULTIPLE"):
+        urls = classification.get("urls", []) or rich_content.get("links", [])
+        if urls:
+            fetch_url_metadata(urls[0])
+    
+    # Fetch thread replies if enabled
+    thread_replies = []
+    thread_fetch_failed = False
+    if include_threads and has_thread_replies(message):
+        thread_ts = get_thread_ts(message)
+        if thread_ts:
+            try:
+                thread_replies = get_thread_replies(channel_id, thread_ts)
+            except Exception:
+                # Continue without thread replies; the next sweep retries the thread
+                thread_fetch_failed = True
+    
+    return {
+        "message_id": get_message_id(channel_id, message_ts),
+        "message_ts": message_ts,
+        "message_text": message_text,
+        "channel_id": channel_id,
+        "channel_name": channel_name,
+        "is_dm": is_dm,
+        "user_name": user_name,
+        "rich_content": rich_content,
+        "rich_content_summary": rich_content_summary,
+        "enhanced_text": _build_enhanced_text(message_text, rich_content_summary),
+        "classification": classification,
+        "thread_replies": thread_replies,
+        "thread_fetch_failed": thread_fetch_failed,
+    }
+
+
+def _prepare_thread(
+    client,
+    message: Dict[str, Any],
+    channel_id: str,
+    channel_name: Optional[str],
+    is_dm: bool
+) -> Dict[str, Any]:
+    """Enrich stage for an already-processed parent whose thread has unwritten replies.
+    
+    Only the thread is fetched; the parent's own entry already exists.
+    
+    Args:
+        client: Slack client instance
+        message: Parent message
+        channel_id: Channel ID
+        channel_name: Channel name
+        is_dm: Whether this is a DM
+        
+    Returns:
+        Dict with what _write_thread needs
+    """
+    return {
+        "message_ts": message["ts"],
+        "message_text": resolve_mentions(message.get("text", ""), client),
+        "channel_id": channel_id,
+        "channel_name": channel_name,
+        "is_dm": is_dm,
+        "thread_replies": get_thread_replies(channel_id, message["ts"]),
+        "thread_only": True,
+    }
+
+
+def _has_unwritten_replies(message: Dict[str, Any], channel_id: str, processed: set) -> bool:
+    """Whether a parent message's newest thread reply has not been marked processed."""
+    latest_reply = message.get("latest_reply")
+    return bool(message.get("reply_count") and latest_reply
+                and get_message_id(channel_id, latest_reply) not in processed)
+
+
+def _write_thread(
+    client,
+    prepared: Dict[str, Any],
+    budget: MessageBudget,
+    reprocess: bool,
+    aggregate_threads: bool = True
+) -> Dict[str, Any]:
+    """Write stage for a prepared message's thread replies.
+    
+    With aggregate_threads the thread's new replies are collected on one idea,
+    which takes one free budget slot; otherwise each thread reply takes a free
+    slot if one remains.
+    
+    Args:
+        client: Slack client instance
+        prepared: Output of _prepare_message or _prepare_thread
+        budget: Shared max_messages budget
+        reprocess: Whether to reprocess already-processed thread replies
+        aggregate_threads: Whether to collect thread replies on one idea per thread
+        
+    Returns:
+        Dict with processed/skipped counts, created_items, per-type counts and
+        incomplete (True if replies were left unwritten for a later sweep)
+    """
+    channel_id = prepared["channel_id"]
+    channel_name = prepared["channel_name"]
+    outcome = {
+        "processed": 0,
+        "skipped": 0,
+        "created_items": [],
+        "counts": {"tasks": 0, "resources": 0, "ideas": 0},
+        # Replies could not be fetched, so none of them were written
+        "incomplete": prepared.get("thread_fetch_failed", False)
+    }
+    if not prepared["thread_replies"]:
+        return outcome
+    
+    if aggregate_threads:
+        # One idea per thread, taking one budget slot
+        return _write_thread_replies(
+            client,
+            channel_id,
+            channel_name,
+            prepared["message_ts"],
+            prepared["thread_replies"],
+            budget,
+            reprocess,
+            parent_text=prepared["message_text"]
+        )
+    
+    # Process thread replies as separate items
+    for reply in prepared["thread_replies"]:
+        slot = budget.try_reserve()
+        if slot is None:
+            outcome["incomplete"] = True
+            break
+        
+        try:
+            reply_result = _process_thread_reply(
+                reply=reply,
+                client=client,
+                channel_id=channel_id,
+                channel_name=channel_name,
+                is_dm=prepared["is_dm"],
+                reprocess=reprocess
+            )
+        except Exception:
+            slot.release()
+            raise
+        
+        if reply_result is None or reply_result.get("skipped"):
+            slot.release()
+            if reply_result is None:
+                # Stop at the first failure so the thread's newest reply stays
+                # unmarked and the next sweep retries the rest
+                outcome["incomplete"] = True
+                break
+            outcome["skipped"] += 1
+            continue
+        
+        slot.commit()
+        outcome["created_items"].append(reply_result["created_item"])
+        outcome["counts"]["ideas"] += reply_result["counts"]["ideas"]
+        outcome["processed"] += 1
+    
+    return outcome
+
+
+def _write_prepared_message(
+    client,
+    prepared: Dict[str, Any],
+    slot: MessageSlot,
+    reprocess: bool,
+    mark_as_read: bool,
+    aggregate_threads: bool = True
+) -> Dict[str, Any]:
+    """Write stage: create Notion entries for a prepared message and its thread replies.
+    
+    The message arrives holding one reserved budget slot, which is committed if
+    an entry is created and released otherwise. Thread replies are written by
+    _write_thread, taking slots from the same budget, once the message itself
+    is marked processed.
+    
+    Args:
+        client: Slack client instance
+        prepared: Output of _prepare_message
+        slot: The message's slot in the shared max_messages budget
+        reprocess: Whether to reprocess already-processed thread replies
+        mark_as_read: Whether to mark the message as read after processing
+        aggregate_threads: Whether to collect thread replies on one idea per thread
+        
+    Returns:
+        Dict with processed/skipped counts, created_items, per-type counts and
+        incomplete (True if thread replies were left unwritten for a later sweep)
+    """
+    outcome = {
+        "processed": 0,
+        "skipped": 0,
+        "created_items": [],
+        "counts": {"tasks": 0, "resources": 0, "ideas": 0},
+        "incomplete": False
+    }
+    message_id = prepared["message_id"]
+    channel_id = prepared["channel_id"]
+    channel_name = prepared["channel_name"]
+    message_ts = prepared["message_ts"]
+    classification = prepared["classification"]
+    
+    try:
+        result = _create_notion_entry_from_classification(
+            classification=classification,
+            message_text=prepared["message_text"],
+            rich_content_summary=prepared["rich_content_summary"],
+            rich_content=prepared["rich_content"],
+            channel_name=channel_name,
+            is_dm=prepared["is_dm"],
+            user_name=prepared["user_name"],
+            enhanced_text=prepared["enhanced_text"]
+        )
+    except Exception as e:
+        error_msg = str(e)
+        _log_error_to_debug_file(
+            error_msg,
+            "process_slack_messages.py:main_message",
+            {
+                "classification": classification.get("classification"),
+                "channel_name": channel_name
+            }
+        )
+        
+        # Handle specific errors gracefully
+        if "Invalid status option" in error_msg:
+            # Try with "Inbox" status instead
+            retry_result = _handle_resource_creation_retry(
+                classification=classification,
+                message_text=prepared["message_text"],
+                rich_content_summary=prepared["rich_content_summary"],
+                rich_content=prepared["rich_content"],
+                channel_name=channel_name,
+                message_id=message_id,
+                channel_id=channel_id,
+                message_ts=message_ts
+            )
+            
+            if retry_result:
+                mark_message_processed(
+                    message_id, channel_id, message_ts,
+                    retry_result["notion_id"], retry_result["notion_type"]
+                )
+                slot.commit()
+                outcome["counts"]["resources"] += 1
+                outcome["processed"] += 1
+                return outcome
+            else:
+                print(f"Error processing message (retry failed): {e}")
+        
+        # Log error but continue processing
+        print(f"Error processing message: {e}")
+        slot.release()
+        # Mark as processed to avoid infinite retries
+        try:
+            mark_message_processed(message_id, channel_id, message_ts)
+        except:
+            pass
+        return outcome
+    
+    outcome["created_items"].extend(result["created_items"])
+    for key, count in result["counts"].items():
+        outcome["counts"][key] += count
+    
+    # Mark message as processed
+    mark_message_processed(
+        message_id,
+        channel_id,
+        message_ts,
+        created_notion_id=result["notion_id"],
+        created_notion_type=result["notion_type"]
+    )
+    slot.commit()
+    outcome["processed"] += 1
+    
+    thread_outcome = _write_thread(client, prepared, slot.budget, reprocess, aggregate_threads)
+    outcome["created_items"].extend(thread_outcome["created_items"])
+    for key, count in thread_outcome["counts"].items():
+        outcome["counts"][key] += count
+    outcome["processed"] += thread_outcome["processed"]
+    outcome["skipped"] += thread_outcome["skipped"]
+    outcome["incomplete"] = thread_outcome["incomplete"]
+    
+    # Mark as read if requested
+    _mark_message_read_if_requested(client, channel_id, message_ts, mark_as_read)
+    
+    return outcome
+
+
 def process_slack_messages(
     mark_as_read: bool = False,
     max_messages: int = 50,
     reprocess: bool = False,
-    include_threads: bool = True
+    include_threads: bool = True,
+    backfill_hours: int = 24,
+    aggregate_threads: bool = True
 ) -> Dict[str, Any]:
     """Process unread Slack messages and create Notion entries.
     
+    Conversations flow through three stages, each with its own bounded worker
+    pool: fetch history -> enrich/classify -> write to Notion. Messages are
+    admitted in conversation priority order and never more than max_messages
+    entries are created.
+    
+    Sync is incremental: each conversation's high-water mark (newest message
+    handled) is stored in the tracker, and later sweeps only fetch messages
+    posted after it. Use reset_channel_sync() to backfill a conversation again.
+    
     Args:
         mark_as_read: Whether to mark messages as read after processing
         max_messages: Maximum number of messages to process
         reprocess: If True, reprocess messages even if already processed (default: False)
         include_threads: If True, process thread replies as separate items (default: True)
+        backfill_hours: Hours of history fetched for conversations without a mark (default: 24)
+        aggregate_threads: If True, collect each thread's replies on one Notion idea, appending
+                          new replies to it on later runs; if False, one idea per reply (default: True)
         
     Returns:
         Dictionary with processing results:
@@ -465,7 +1027,10 @@ def process_slack_messages(
         - skipped: Number of messages skipped (already processed)
         - created: Dict with counts of created items (tasks, resources, ideas)
         - items: List of created Notion entries
+        - stages: Per-stage throughput (items, busy/wall seconds, items per second)
+        - elapsed_seconds: Wall time for the sweep
     """
+    started = time.perf_counter()
     client = get_slack_client()
     
     # Get all conversations with unread messages or recent activity
@@ -479,15 +1044,7 @@ def process_slack_messages(
             "items": []
         }
     
-    created_items = []
-    tasks_created = 0
-    resources_created = 0
-    ideas_created = 0
-    messages_processed = 0
-    messages_skipped = 0
-    
     # Check if Ideas database is accessible (for thread replies)
-    ideas_db_accessible = True
     if include_threads:
         try:
             from tools.common import get_notion_client, IDEAS_DB_ID
@@ -495,7 +1052,6 @@ def process_slack_messages(
             # Try to retrieve the database to check if it's accessible
             test_client.databases.retrieve(database_id=IDEAS_DB_ID)
         except Exception as e:
-            ideas_db_accessible = False
             print(f"Warning: Ideas database not accessible. Thread replies will be skipped. Error: {str(e)}")
             include_threads = False  # Disable thread processing if DB not accessible
     
@@ -514,193 +1070,164 @@ def process_slack_messages(
         reverse=True
     )[:50]  # Process top 50 conversations
     
-    # Process each conversation
-    for conv in sorted_conversations:
-        if messages_processed >= max_messages:
-            break
-            
-        channel_id = conv["id"]
-        channel_name = conv["name"]
-        is_dm = conv["is_im"]
-        last_read_ts = conv.get("last_read")
-        
+    stages = {name: StageStats(name) for name in ("fetch", "enrich", "write")}
+    budget = MessageBudget(max_messages)
+    outcomes: Dict[int, Dict[str, Any]] = {}
+    messages_skipped = 0
+    
+    tracker = get_message_tracker()
+    high_water = {} if reprocess else tracker.get_high_water(conv["id"] for conv in sorted_conversations)
+    # Conversations whose fetched messages were all admitted, with their new mark
+    synced: Dict[str, str] = {}
+    # Conversations with messages or thread replies left unwritten; their marks
+    # stay put so the next sweep fetches those messages again
+    failed_channels = set()
+    
+    def fetch(conv):
+        stage_started = time.perf_counter()
         try:
-            # Get unread and recent messages (last 24 hours)
-            message_data = get_unread_and_recent_messages(
-                channel_id=channel_id,
-                last_read_ts=last_read_ts,
-                include_recent_hours=24,
-                limit=200
-            )
+            return _fetch_conversation_messages(conv, high_water.get(conv["id"]), backfill_hours)
+        finally:
+            stages["fetch"].record(stage_started)
+    
+    def write(seq, slot, prepared):
+        stage_started = time.perf_counter()
+        try:
+            # The write's marks are committed together when it finishes
+            with tracker.batch():
+                if prepared.get("thread_only"):
+                    # The parent already has its entry: give back its slot, the
+                    # thread takes free slots like any other thread
+                    slot.release()
+                    outcome = _write_thread(client, prepared, budget, reprocess, aggregate_threads)
+                else:
+                    outcome = _write_prepared_message(
+                        client, prepared, slot, reprocess, mark_as_read, aggregate_threads
+                    )
+        except Exception as e:
+            print(f"Error processing message: {e}")
+            failed_channels.add(prepared["channel_id"])
+            # No-op if the write already committed or released the slot
+            slot.release()
+            return
+        finally:
+            stages["write"].record(stage_started)
+        outcomes[seq] = outcome
+        if outcome["incomplete"]:
+            failed_channels.add(prepared["channel_id"])
+    
+    def enrich(seq, slot, message, conv, thread_only=False):
+        stage_started = time.perf_counter()
+        try:
+            if thread_only:
+                prepared = _prepare_thread(client, message, conv["id"], conv["name"], conv["is_im"])
+            else:
+                prepared = _prepare_message(client, message, conv["id"], conv["name"], conv["is_im"], include_threads)
+        except Exception as e:
+            print(f"Error processing message: {e}")
+            failed_channels.add(conv["id"])
+            slot.release()
+            return
+        finally:
+            stages["enrich"].record(stage_started)
+        write_pool.submit(write, seq, slot, prepared)
+    
+    # Each message's write (the message, its thread and their marks) is one
+    # tracker transaction, committed as soon as the write finishes; a
+    # conversation's empty-message marks are one more. Pools shut down
+    # innermost first: enrich finishes (and hands off its last writes) before
+    # the write pool is drained.
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as write_pool, \
+            ThreadPoolExecutor(max_workers=FETCH_WORKERS) as fetch_pool, \
+            ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as enrich_pool:
+        fetches = [(conv, fetch_pool.submit(fetch, conv)) for conv in sorted_conversations]
+        
+        # Admit messages in priority order; each reserves a budget slot, so at
+        # most max_messages are being enriched/written at once
+        seq = 0
+        budget_used_up = False
+        for conv, future in fetches:
+            if budget_used_up or budget.exhausted():
+                future.cancel()
+                continue
             
-            # Process all messages (unread + recent)
-            all_messages = message_data.get("all", [])
+            channel_id = conv["id"]
+            try:
+                fetched = future.result()
+            except Exception as e:
+                print(f"Error processing conversation {conv['name']}: {e}")
+                continue
+            all_messages = fetched["all"]
             
-            for message in all_messages:
-                if messages_processed >= max_messages:
-                    break
-                
-                message_ts = message.get("ts")
-                if not message_ts:
-                    continue
-                
-                # Check if message has already been processed
-                message_id = get_message_id(channel_id, message_ts)
-                if not reprocess and is_message_processed(message_id):
-                    messages_skipped += 1
-                    continue
-                
-                message_text = message.get("text", "")
-                if not message_text or message_text.strip() == "":
-                    # Still mark as processed even if empty (to avoid reprocessing)
-                    mark_message_processed(message_id, channel_id, message_ts)
-                    continue
-                
-                # Get user info if available
-                user_id = message.get("user")
-                user_name = _get_user_name(client, user_id)
-                
-                # Extract rich content
-                rich_content = extract_rich_content(message)
-                rich_content_summary = format_rich_content_summary(rich_content)
-                
-                # Build enhanced message text with rich content
-                enhanced_text = _build_enhanced_text(message_text, rich_content_summary)
-                
-                # Classify the message
-                classification = classify_slack_message(
-                    message_text=message_text,
-                    channel_name=channel_name if not is_dm else None,
-                    is_dm=is_dm,
-                    user_name=user_name
-                )
-                
-                # Process thread replies if enabled
-                thread_replies = []
-                if include_threads and has_thread_replies(message):
-                    thread_ts = get_thread_ts(message)
-                    if thread_ts:
-                        try:
-                            thread_replies = get_thread_replies(channel_id, thread_ts)
-                        except Exception as e:
-                            # If thread fetch fails, continue without thread replies
-                            pass
-                
-                # Create Notion entry based on classification
-                try:
-                    result = _create_notion_entry_from_classification(
-                        classification=classification,
-                        message_text=message_text,
-                        rich_content_summary=rich_content_summary,
-                        rich_content=rich_content,
-                        channel_name=channel_name,
-                        is_dm=is_dm,
-                        user_name=user_name,
-                        enhanced_text=enhanced_text
-                    )
-                    
-                    notion_id = result["notion_id"]
-                    notion_type = result["notion_type"]
-                    created_items.extend(result["created_items"])
-                    tasks_created += result["counts"]["tasks"]
-                    resources_created += result["counts"]["resources"]
-                    ideas_created += result["counts"]["ideas"]
-                    
-                    # Mark message as processed
-                    mark_message_processed(
-                        message_id,
-                        channel_id,
-                        message_ts,
-                        created_notion_id=notion_id,
-                        created_notion_type=notion_type
-                    )
-                    
-                    # Process thread replies as separate items
-                    for reply in thread_replies:
-                        if messages_processed >= max_messages:
-                            break
-                        
-                        reply_result = _process_thread_reply(
-                            reply=reply,
-                            client=client,
-                            channel_id=channel_id,
-                            channel_name=channel_name,
-                            is_dm=is_dm,
-                            reprocess=reprocess
-                        )
-                        
-                        if reply_result is None:
-                            continue  # Error occurred
-                        
-                        if reply_result.get("skipped"):
-                            messages_skipped += 1
-                            continue
-                        
-                        # Update counters and items
-                        created_items.append(reply_result["created_item"])
-                        ideas_created += reply_result["counts"]["ideas"]
-                        messages_processed += 1
-                
-                except Exception as e:
-                    error_msg = str(e)
-                    _log_error_to_debug_file(
-                        error_msg,
-                        "process_slack_messages.py:main_message",
-                        {
-                            "classification": classification.get("classification"),
-                            "channel_name": channel_name
-                        }
-                    )
+            # One dedup lookup for the whole conversation, covering each
+            # thread's newest reply so unwritten replies are retried
+            already_processed = set() if reprocess else tracker.processed_ids(
+                get_message_id(channel_id, ts)
+                for message in all_messages
+                for ts in (message.get("ts"), message.get("latest_reply"))
+                if ts
+            )
+            
+            # Empty-message marks for the conversation are one transaction
+            with tracker.batch():
+                for message in all_messages:
+                    message_ts = message.get("ts")
+                    if not message_ts:
+                        continue
                     
-                    # Handle specific errors gracefully
-                    if "Invalid status option" in error_msg:
-                        # Try with "Inbox" status instead
-                        retry_result = _handle_resource_creation_retry(
-                            classification=classification,
-                            message_text=message_text,
-                            rich_content_summary=rich_content_summary,
-                            rich_content=rich_content,
-                            channel_name=channel_name,
-                            message_id=message_id,
-                            channel_id=channel_id,
-                            message_ts=message_ts
-                        )
-                        
-                        if retry_result:
-                            notion_id = retry_result["notion_id"]
-                            notion_type = retry_result["notion_type"]
-                            mark_message_processed(message_id, channel_id, message_ts, notion_id, notion_type)
-                            resources_created += 1
-                            messages_processed += 1
-                            continue
-                        else:
-                            print(f"Error processing message (retry failed): {e}")
+                    # Check if message has already been processed
+                    message_id = get_message_id(channel_id, message_ts)
+                    if message_id in already_processed:
+                        messages_skipped += 1
+                        if include_threads and _has_unwritten_replies(message, channel_id, already_processed):
+                            slot = budget.reserve()
+                            if slot is None:
+                                budget_used_up = True
+                                break
+                            enrich_pool.submit(enrich, seq, slot, message, conv, True)
+                            seq += 1
+                        continue
                     
-                    # Log error but continue processing
-                    print(f"Error processing message: {e}")
-                    # Mark as processed to avoid infinite retries
-                    try:
+                    message_text = message.get("text", "")
+                    if not message_text or message_text.strip() == "":
+                        # Still mark as processed even if empty (to avoid reprocessing)
                         mark_message_processed(message_id, channel_id, message_ts)
-                    except:
-                        pass
-                    continue
-                
-                messages_processed += 1
-                
-                # Mark as read if requested
-                _mark_message_read_if_requested(client, channel_id, message_ts, mark_as_read)
-                        
-        except Exception as e:
-            print(f"Error processing conversation {channel_name}: {e}")
-            continue
+                        continue
+                    
+                    slot = budget.reserve()
+                    if slot is None:
+                        budget_used_up = True
+                        break
+                    enrich_pool.submit(enrich, seq, slot, message, conv)
+                    seq += 1
+                else:
+                    if fetched["complete"] and fetched["high_water_ts"]:
+                        synced[channel_id] = fetched["high_water_ts"]
+    
+    # Every admitted message has now been written (or marked after a
+    # failure); advance the conversations' marks in one transaction
+    with tracker.batch():
+        for channel_id, high_water_ts in synced.items():
+            if channel_id not in failed_channels:
+                tracker.advance_high_water(channel_id, high_water_ts)
+    
+    # Aggregate in admission order so items are listed as they were prioritized
+    created_items = []
+    created = {"tasks": 0, "resources": 0, "ideas": 0}
+    messages_processed = 0
+    for seq in sorted(outcomes):
+        outcome = outcomes[seq]
+        created_items.extend(outcome["created_items"])
+        for key, count in outcome["counts"].items():
+            created[key] += count
+        messages_processed += outcome["processed"]
+        messages_skipped += outcome["skipped"]
     
     return {
         "processed": messages_processed,
         "skipped": messages_skipped,
-        "created": {
-            "tasks": tasks_created,
-            "resources": resources_created,
-            "ideas": ideas_created
-        },
-        "items": created_items
+        "created": created,
+        "items": created_items,
+        "stages": {name: stats.to_dict() for name, stats in stages.items()},
+        "elapsed_seconds": round(time.perf_counter() - started, 3)
     }
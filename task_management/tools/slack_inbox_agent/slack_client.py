@@ -1,10 +1,12 @@
 """Slack client wrapper for API operations."""
 
 import os
-from typing import Optional, List, Set, Tuple
+from typing import Dict, Optional, List, Set, Tuple
 from dotenv import load_dotenv
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+from tools.common.rate_limit import TokenBucket
 
 # Load environment variables from env.txt
 load_dotenv(dotenv_path=os.path.join(
@@ -14,6 +16,44 @@ load_dotenv(dotenv_path=os.path.join(
 
 _slack_client: Optional[WebClient] = None
 
+# Slack Web API rate-limit tiers (requests per minute) and the tier of each
+# method this agent calls. Unlisted methods are treated as Tier 3.
+TIER_REQUESTS_PER_MINUTE = {1: 1, 2: 20, 3: 50, 4: 100}
+SLACK_METHOD_TIERS = {
+    "conversations.list": 2,
+    "users.conversations": 2,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "conversations.info": 3,
+    "conversations.mark": 3,
+    "users.info": 4,
+}
+DEFAULT_TIER = 3
+
+# Retries on HTTP 429 (the SDK handler sleeps for Retry-After)
+RATE_LIMIT_RETRIES = 3
+
+
+class RateLimitedWebClient(WebClient):
+    """WebClient that paces each method to its Slack rate-limit tier.
+
+    Every Web API call goes through api_call(), so one token bucket per tier
+    keeps concurrent callers (e.g. the inbox sweep's worker pools) under the
+    per-minute limit; 429s that still happen are retried after Retry-After.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("retry_handlers", [RateLimitErrorRetryHandler(max_retry_count=RATE_LIMIT_RETRIES)])
+        super().__init__(*args, **kwargs)
+        self._tier_buckets: Dict[int, TokenBucket] = {
+            tier: TokenBucket(per_minute / 60.0, capacity=max(1, per_minute // 5))
+            for tier, per_minute in TIER_REQUESTS_PER_MINUTE.items()
+        }
+
+    def api_call(self, api_method: str, **kwargs):
+        self._tier_buckets[SLACK_METHOD_TIERS.get(api_method, DEFAULT_TIER)].acquire()
+        return super().api_call(api_method, **kwargs)
+
 # Required scopes for full inbox visibility
 REQUIRED_USER_TOKEN_SCOPES = {
     "channels:read",
@@ -69,7 +109,7 @@ def get_slack_client(use_user_token: bool = True, verify_scopes: bool = True) ->
             user_token = os.getenv("SLACK_USER_TOKEN")
             
             if user_token:
-                client = WebClient(token=user_token)
+                client = RateLimitedWebClient(token=user_token)
                 
                 # Note: auth.test doesn't return scopes, so we can't verify them upfront
                 # We'll skip verification and let actual API calls handle permission errors
@@ -87,7 +127,7 @@ def get_slack_client(use_user_token: bool = True, verify_scopes: bool = True) ->
                 "Add at least one to env.txt"
             )
         
-        client = WebClient(token=bot_token)
+        client = RateLimitedWebClient(token=bot_token)
         
         # Note: auth.test doesn't return scopes, so we can't verify them
         # Bot tokens have different scope requirements than user tokens
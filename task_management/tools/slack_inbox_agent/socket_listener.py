@@ -0,0 +1,339 @@
+"""Real-time Slack ingestion over Socket Mode.
+
+process_slack_messages polls: every sweep lists conversations and fetches
+their history. The listener instead holds a Socket Mode connection open and
+receives message events as they are posted. Each event is acknowledged
+immediately, queued, and handled by worker threads through the same
+enrich/classify/write path as the sweep (_prepare_message and
+_write_prepared_message; thread replies are appended to their thread's idea
+by _write_thread_replies), so a message reaches the Notion inbox seconds
+after it is posted.
+
+Events are deduplicated with the message tracker, so a message handled here
+is skipped by a later sweep and vice versa. High-water marks are left to the
+sweep: anything missed while the listener was down (or dropped because the
+queue was full) is picked up by the next sweep.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from slack_sdk import WebClient
+from slack_sdk.socket_mode import SocketModeClient
+from slack_sdk.socket_mode.request import SocketModeRequest
+from slack_sdk.socket_mode.response import SocketModeResponse
+
+from .inbox_pipeline import MessageBudget
+from .message_tracker import get_message_id, is_message_processed, mark_message_processed
+from .slack_client import get_slack_app_token, get_slack_client
+from .process_slack_messages import (
+    _prepare_message,
+    _process_thread_reply,
+    _write_prepared_message,
+    _write_thread_replies,
+)
+
+# Worker threads handling queued events
+LISTENER_WORKERS = 2
+
+# Events waiting for a worker before new ones are dropped (left to the next sweep)
+EVENT_QUEUE_SIZE = 1000
+
+# Message subtypes that carry new user content; edits, deletes, joins etc. are ignored
+INGESTED_SUBTYPES = {None, "thread_broadcast", "file_share"}
+
+
+class SlackSocketListener:
+    """Socket Mode listener feeding message events into the inbox pipeline.
+
+    Usage:
+        listener = SlackSocketListener()
+        listener.start()
+        ...
+        listener.stop()
+    """
+
+    def __init__(
+        self,
+        app_token: Optional[str] = None,
+        web_client: Optional[WebClient] = None,
+        client=None,
+        workers: int = LISTENER_WORKERS,
+        mark_as_read: bool = False,
+        aggregate_threads: bool = True
+    ):
+        """Create a listener (nothing connects until start()).
+
+        Args:
+            app_token: App-level token (defaults to SLACK_APP_TOKEN)
+            web_client: Client used to open the Socket Mode connection
+            client: Slack client used to process messages (defaults to the shared client)
+            workers: Number of worker threads
+            mark_as_read: Whether to mark messages as read after processing
+            aggregate_threads: Whether thread replies are appended to one idea per thread
+        """
+        self.app_token = app_token or get_slack_app_token()
+        self.web_client = web_client or WebClient()
+        self.workers = workers
+        self.mark_as_read = mark_as_read
+        self.aggregate_threads = aggregate_threads
+        self._client = client
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._threads = []
+        self._socket_client: Optional[SocketModeClient] = None
+        self._channel_names: Dict[str, Optional[str]] = {}
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._stats = {
+            "received": 0,
+            "processed": 0,
+            "skipped": 0,
+            "ignored": 0,
+            "dropped": 0,
+            "failed": 0,
+            "created": {"tasks": 0, "resources": 0, "ideas": 0},
+        }
+        # Running totals rather than every sample, so a long-lived listener stays bounded
+        self._latency = {"count": 0, "total": 0.0, "max": 0.0}
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_slack_client()
+        return self._client
+
+    def start(self) -> None:
+        """Start the workers and open the Socket Mode connection."""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"slack-listener-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        self._socket_client = SocketModeClient(app_token=self.app_token, web_client=self.web_client)
+        self._socket_client.socket_mode_request_listeners.append(self._on_request)
+        self._socket_client.connect()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Close the connection, let workers finish queued events, and stop them.
+
+        Args:
+            timeout: Seconds to wait for each worker (None waits indefinitely)
+        """
+        if self._socket_client is not None:
+            self._socket_client.close()
+            self._socket_client = None
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def is_connected(self) -> bool:
+        """Whether the Socket Mode connection is open."""
+        return self._socket_client is not None and self._socket_client.is_connected()
+
+    def wait_until_idle(self, timeout: float = 10.0) -> bool:
+        """Wait until every queued event has been handled.
+
+        Returns:
+            True if the queue drained before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts of events received/processed/skipped/ignored/dropped/failed and latency.
+
+        Latency is seconds from the message's Slack ts to its Notion entry.
+        """
+        with self._lock:
+            stats = {key: (dict(value) if isinstance(value, dict) else value) for key, value in self._stats.items()}
+            latency = dict(self._latency)
+        stats["queued"] = self._queue.qsize()
+        count = latency["count"]
+        stats["avg_latency_seconds"] = round(latency["total"] / count, 3) if count else None
+        stats["max_latency_seconds"] = round(latency["max"], 3) if count else None
+        return stats
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def _on_request(self, socket_client: SocketModeClient, request: SocketModeRequest) -> None:
+        """Acknowledge an envelope right away and queue its message event."""
+        socket_client.send_socket_mode_response(SocketModeResponse(envelope_id=request.envelope_id))
+        if request.type != "events_api":
+            return
+
+        event = request.payload.get("event") or {}
+        if event.get("type") != "message":
+            return
+        self._count("received")
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # The next sweep picks it up; high-water marks only move in the sweep
+            self._count("dropped")
+
+    def _work(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                if event is None:
+                    return
+                self.handle_event(event)
+            except Exception as e:
+                print(f"Error processing Slack event: {e}")
+                self._count("failed")
+            finally:
+                self._queue.task_done()
+
+    def _channel_name(self, channel_id: str) -> Optional[str]:
+        """Conversation name as the sweep reports it (DMs: the other user's ID), cached per process."""
+        with self._lock:
+            if channel_id in self._channel_names:
+                return self._channel_names[channel_id]
+        # Looked up outside the lock; two workers may both fetch a new channel, which is harmless
+        name = None
+        try:
+            response = self.client.conversations_info(channel=channel_id)
+            if response.get("ok"):
+                channel = response.get("channel") or {}
+                name = channel.get("name") or channel.get("user")
+        except Exception:
+            pass
+        with self._lock:
+            return self._channel_names.setdefault(channel_id, name)
+
+    def handle_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Process one message event through the inbox pipeline.
+
+        Args:
+            event: Slack `message` event (Events API payload's "event")
+
+        Returns:
+            Dict with status ("processed", "skipped", "ignored" or "failed") and created_items
+        """
+        result = {"status": "ignored", "created_items": []}
+        channel_id = event.get("channel")
+        message_ts = event.get("ts")
+        if (not channel_id or not message_ts or event.get("bot_id")
+                or event.get("subtype") not in INGESTED_SUBTYPES):
+            self._count("ignored")
+            return result
+
+        message_id = get_message_id(channel_id, message_ts)
+        with self._lock:
+            # Slack redelivers events it thinks were not acknowledged
+            if message_id in self._in_flight:
+                self._stats["skipped"] += 1
+                result["status"] = "skipped"
+                return result
+            self._in_flight.add(message_id)
+        try:
+            if is_message_processed(message_id):
+                self._count("skipped")
+                result["status"] = "skipped"
+                return result
+
+            message_text = event.get("text", "")
+            if not message_text or message_text.strip() == "":
+                mark_message_processed(message_id, channel_id, message_ts)
+                self._count("skipped")
+                result["status"] = "skipped"
+                return result
+
+            is_dm = event.get("channel_type") == "im"
+            channel_name = self._channel_name(channel_id)
+            thread_ts = event.get("thread_ts")
+
+            is_reply = thread_ts and thread_ts != message_ts and event.get("subtype") != "thread_broadcast"
+            if is_reply and self.aggregate_threads:
+                outcome = _write_thread_replies(
+                    self.client, channel_id, channel_name, thread_ts, [event], budget=None, reprocess=False
+                )
+                if not outcome["processed"]:
+                    status = "skipped" if outcome["skipped"] else "failed"
+                    self._count(status)
+                    result["status"] = status
+                    return result
+                created_items = outcome["created_items"]
+                counts = outcome["counts"]
+            elif is_reply:
+                outcome = _process_thread_reply(
+                    reply=event,
+                    client=self.client,
+                    channel_id=channel_id,
+                    channel_name=channel_name,
+                    is_dm=is_dm,
+                    reprocess=False
+                )
+                if outcome is None:
+                    self._count("failed")
+                    result["status"] = "failed"
+                    return result
+                if outcome.get("skipped"):
+                    self._count("skipped")
+                    result["status"] = "skipped"
+                    return result
+                created_items = [outcome["created_item"]]
+                counts = outcome["counts"]
+            else:
+                # Replies arrive as their own events, so threads aren't fetched here
+                prepared = _prepare_message(
+                    self.client, event, channel_id, channel_name, is_dm, include_threads=False
+                )
+                outcome = _write_prepared_message(
+                    self.client, prepared, MessageBudget(1).reserve(), reprocess=False,
+                    mark_as_read=self.mark_as_read
+                )
+                if not outcome["processed"]:
+                    self._count("failed")
+                    result["status"] = "failed"
+                    return result
+                created_items = outcome["created_items"]
+                counts = outcome["counts"]
+
+            with self._lock:
+                self._stats["processed"] += 1
+                for key, count in counts.items():
+                    self._stats["created"][key] += count
+                latency = max(0.0, time.time() - float(message_ts))
+                self._latency["count"] += 1
+                self._latency["total"] += latency
+                self._latency["max"] = max(self._latency["max"], latency)
+            result["status"] = "processed"
+            result["created_items"] = created_items
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.discard(message_id)
+
+
+def run_slack_listener(mark_as_read: bool = False) -> None:
+    """Run the Socket Mode listener until interrupted (Ctrl+C).
+
+    Args:
+        mark_as_read: Whether to mark messages as read after processing
+    """
+    listener = SlackSocketListener(mark_as_read=mark_as_read)
+    listener.start()
+    print("Listening for Slack messages (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.stop(timeout=30)
+        print(f"Slack listener stopped: {listener.get_stats()}")
+
+
+if __name__ == "__main__":
+    run_slack_listener()
@@ -0,0 +1,188 @@
+"""Slack user directory cache (user ID -> display name).
+
+Every processed message and thread reply needs its author's name, and mentions
+(<@U123>) should render as names too. Rather than one users.info call per
+lookup, the directory bulk-loads users.list into the slack_users table of
+data/sessions.db, refreshes it once entries are older than
+USER_DIRECTORY_TTL_SECONDS, and serves names from memory for the life of the
+process. IDs missing from users.list (e.g. external Slack Connect users) fall
+back to a single users.info call.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from .message_tracker import get_db_path
+
+# How long a cached name is trusted before it is refreshed
+USER_DIRECTORY_TTL_SECONDS = int(os.getenv("SLACK_USER_DIRECTORY_TTL_SECONDS", str(24 * 60 * 60)))
+
+# users.list page size (Slack recommends <= 200)
+USERS_LIST_PAGE_SIZE = 200
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+_refresh_lock = threading.Lock()
+
+# user_id -> (name or None, fetched_at); None names are misses remembered in memory only
+_names: Dict[str, Tuple[Optional[str], float]] = {}
+_loaded = False
+_last_bulk_load = 0.0
+_bulk_unavailable = False
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared directory connection, creating the table on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS slack_users (
+                user_id TEXT PRIMARY KEY,
+                name TEXT,
+                source TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _display_name(user: Dict) -> Optional[str]:
+    """Name shown for a users.list/users.info member (real name, else handle)."""
+    return user.get("real_name") or user.get("name")
+
+
+def _ensure_loaded() -> None:
+    """Load persisted names into memory once per process."""
+    global _loaded, _last_bulk_load
+    with _lock:
+        if _loaded:
+            return
+        rows = _get_connection().execute("SELECT user_id, name, source, updated_at FROM slack_users").fetchall()
+        for user_id, name, source, updated_at in rows:
+            _names[user_id] = (name, updated_at)
+            if source == "list":
+                _last_bulk_load = max(_last_bulk_load, updated_at)
+        _loaded = True
+
+
+def _store(entries: Iterable[Tuple[str, Optional[str]]], source: str) -> int:
+    """Persist names and update the in-memory directory."""
+    now = time.time()
+    rows = [(user_id, name, source, now) for user_id, name in entries]
+    with _lock:
+        conn = _get_connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO slack_users (user_id, name, source, updated_at) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        conn.commit()
+        for user_id, name, _, updated_at in rows:
+            _names[user_id] = (name, updated_at)
+    return len(rows)
+
+
+def refresh_user_directory(client=None) -> int:
+    """Bulk-load every workspace member via users.list (paginated).
+
+    Args:
+        client: Slack client (defaults to the shared client)
+
+    Returns:
+        Number of users stored
+    """
+    global _last_bulk_load
+    if client is None:
+        from .slack_client import get_slack_client
+        client = get_slack_client()
+
+    entries = []
+    cursor = None
+    while True:
+        params = {"limit": USERS_LIST_PAGE_SIZE}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.users_list(**params)
+        if not response.get("ok"):
+            raise Exception(f"Slack API error: {response.get('error', 'unknown')}")
+        for member in response.get("members", []):
+            if member.get("id"):
+                entries.append((member["id"], _display_name(member)))
+        cursor = (response.get("response_metadata") or {}).get("next_cursor")
+        if not cursor:
+            break
+
+    count = _store(entries, "list")
+    with _lock:
+        _last_bulk_load = time.time()
+    return count
+
+
+def _lookup_single(client, user_id: str) -> Optional[str]:
+    """users.info fallback for one ID; misses are remembered in memory only."""
+    try:
+        user_info = client.users_info(user=user_id)
+        if user_info.get("ok"):
+            name = _display_name(user_info["user"])
+            _store([(user_id, name)], "info")
+            return name
+    except Exception:
+        pass
+    with _lock:
+        _names[user_id] = (None, time.time())
+    return None
+
+
+def get_user_name(user_id: Optional[str], client=None) -> Optional[str]:
+    """Resolve a Slack user ID to a display name.
+
+    Args:
+        user_id: Slack user ID (e.g. "U123456")
+        client: Slack client used on a miss (defaults to the shared client)
+
+    Returns:
+        Real name (or handle), or None if unknown
+    """
+    global _bulk_unavailable
+    if not user_id:
+        return None
+
+    _ensure_loaded()
+    with _lock:
+        entry = _names.get(user_id)
+    if entry and time.time() - entry[1] < USER_DIRECTORY_TTL_SECONDS:
+        return entry[0]
+
+    if client is None:
+        try:
+            from .slack_client import get_slack_client
+            client = get_slack_client()
+        except Exception:
+            return entry[0] if entry else None
+
+    # One thread refreshes the whole directory; the rest wait and then read it
+    with _refresh_lock:
+        with _lock:
+            bulk_stale = time.time() - _last_bulk_load >= USER_DIRECTORY_TTL_SECONDS
+        if bulk_stale and not _bulk_unavailable:
+            try:
+                refresh_user_directory(client)
+            except Exception:
+                # e.g. missing users:read scope - fall back to users.info per user
+                _bulk_unavailable = True
+
+    with _lock:
+        entry = _names.get(user_id)
+    if entry and time.time() - entry[1] < USER_DIRECTORY_TTL_SECONDS:
+        return entry[0]
+    return _lookup_single(client, user_id) or (entry[0] if entry else None)
+
+
+def get_user_names(user_ids: Iterable[str], client=None) -> Dict[str, Optional[str]]:
+    """Resolve several user IDs (see get_user_name)."""
+    return {user_id: get_user_name(user_id, client) for user_id in user_ids}
@@ -14,7 +14,7 @@ from .calculate_waiting_duration import calculate_waiting_duration
 from .get_weekly_review import get_weekly_review
 from .extract_project_properties import extract_project_properties
 from .get_projects_by_priority import get_projects_by_priority, get_projects_due_soon, get_projects_needing_attention
-from .analyze_task_project_alignment import get_tasks_for_project, analyze_project_task_alignment
+from .analyze_task_project_alignment import get_tasks_for_project, get_tasks_for_projects, analyze_project_task_alignment
 from .analyze_all_projects import get_all_active_projects, analyze_project_health
 from .analyze_workload_balance import analyze_workload_balance
 from .check_priority_limits import check_priority_limits
@@ -23,7 +23,7 @@ from .find_orphaned_tasks import find_orphaned_tasks
 from .get_action_items_for_review import get_action_items_for_review
 from .create_task_from_action_item import create_task_from_action_item
 from .process_action_items import process_action_items
-from .review_action_items import create_tasks_from_review_items, format_review_item_for_display
+from .review_action_items import create_tasks_from_review_items, dismiss_review_items, format_review_item_for_display
 from .classify_task_lno import classify_task_lno
 
 __all__ = [
@@ -44,6 +44,7 @@ __all__ = [
     "get_projects_due_soon",
     "get_projects_needing_attention",
     "get_tasks_for_project",
+    "get_tasks_for_projects",
     "analyze_project_task_alignment",
     "get_all_active_projects",
     "analyze_project_health",
@@ -55,6 +56,7 @@ __all__ = [
     "create_task_from_action_item",
     "process_action_items",
     "create_tasks_from_review_items",
+    "dismiss_review_items",
     "format_review_item_for_display",
     "classify_task_lno",
 ]
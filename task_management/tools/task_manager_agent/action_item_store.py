@@ -0,0 +1,317 @@
+"""Precomputed store of meeting action items.
+
+Action items are parsed out of transcript notes once per transcript version
+by ingest_action_items() and kept in data/action_items.db, keyed by
+(transcript_id, last_edited_time, bullet_index), together with the derived
+fields the reviews need (is_for_rajiv, suggested task names) and a processing
+state:
+
+- pending: not yet handled
+- auto_created: process_action_items created a task for it
+- reviewed: a task was created for it after review
+- dismissed: the user chose not to create a task
+
+Reviews ingest the transcripts in their window (only new or edited
+transcripts are parsed) and then read the items with one indexed query. When a
+transcript is edited, items whose bullet text is unchanged keep their state.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from tools.common.transcript_index import is_transcript_index_enabled, search_transcript_index
+from tools.notion import extract_action_items, search_transcripts
+
+PENDING = "pending"
+AUTO_CREATED = "auto_created"
+REVIEWED = "reviewed"
+DISMISSED = "dismissed"
+STATES = (PENDING, AUTO_CREATED, REVIEWED, DISMISSED)
+
+# Upper bound on transcripts ingested per window from the local index
+INGEST_LIMIT = 5000
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+
+def get_db_path() -> str:
+    """Get the path to the action item store SQLite database file."""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    data_dir = os.path.join(project_root, "data")
+
+    # Create data directory if it doesn't exist
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir, exist_ok=True)
+
+    return os.path.join(data_dir, "action_items.db")
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared store connection, creating tables on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS action_items (
+                transcript_id TEXT NOT NULL,
+                last_edited_time TEXT NOT NULL,
+                bullet_index INTEGER NOT NULL,
+                meeting TEXT NOT NULL,
+                meeting_date TEXT,
+                person TEXT,
+                action TEXT NOT NULL,
+                raw_text TEXT NOT NULL,
+                due_date_text TEXT,
+                for_rajiv INTEGER NOT NULL,
+                suggested_task_name TEXT,
+                suggested_waiting_task TEXT,
+                state TEXT NOT NULL,
+                task_id TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (transcript_id, last_edited_time, bullet_index)
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_action_items_date_state
+            ON action_items(meeting_date, state)
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ingested_transcripts (
+                transcript_id TEXT PRIMARY KEY,
+                last_edited_time TEXT NOT NULL,
+                meeting_date TEXT,
+                ingested_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def is_for_rajiv(action_item: Dict[str, Any]) -> bool:
+    """Determine if action item is assigned to Rajiv.
+
+    Args:
+        action_item: Action item dictionary with 'person' field
+
+    Returns:
+        True if action item is for Rajiv, False otherwise
+    """
+    person = action_item.get("person")
+    if not person:
+        return False
+
+    # Handle None case and convert to string
+    person_str = str(person).lower().strip()
+    if not person_str:
+        return False
+
+    # Check for Rajiv variations
+    rajiv_names = ["rajiv", "rajiv chopra"]
+    return any(name in person_str for name in rajiv_names)
+
+
+def _suggested_names(item: Dict[str, Any], for_rajiv: bool) -> tuple:
+    """(suggested_task_name, suggested_waiting_task) for a parsed action item."""
+    action_text = item.get("action", "") or ""
+    person = item.get("person") or ""
+    if not for_rajiv and person:
+        return None, f"Follow up with {person} on: {action_text}"
+    return action_text, None
+
+
+def _transcripts_since(date_on_or_after: str) -> tuple:
+    """Transcripts dated on or after a date, and whether the list is complete.
+
+    Rows from the local transcript index carry full notes; with the index
+    disabled, search_transcripts rows carry already-extracted action_items.
+    """
+    if is_transcript_index_enabled():
+        rows = search_transcript_index(date_on_or_after=date_on_or_after, limit=INGEST_LIMIT)
+        return rows, len(rows) < INGEST_LIMIT
+    return search_transcripts(date_on_or_after=date_on_or_after, limit=100), False
+
+
+def _write_transcript(conn: sqlite3.Connection, transcript: Dict[str, Any], now: float) -> int:
+    """Replace a transcript's items with those parsed from its current version."""
+    transcript_id = transcript["page_id"]
+    version = transcript.get("last_edited_time") or ""
+    if "action_items" in transcript:
+        parsed = transcript["action_items"]
+    else:
+        try:
+            parsed = extract_action_items(transcript.get("notes") or "")
+        except Exception:
+            # If extraction fails, record the transcript without action items
+            parsed = []
+
+    # Items whose bullet text survives an edit keep their state
+    previous: Dict[str, List[tuple]] = {}
+    for raw_text, state, task_id in conn.execute(
+        "SELECT raw_text, state, task_id FROM action_items WHERE transcript_id = ? ORDER BY bullet_index",
+        (transcript_id,)
+    ):
+        previous.setdefault(raw_text, []).append((state, task_id))
+    conn.execute("DELETE FROM action_items WHERE transcript_id = ?", (transcript_id,))
+
+    for bullet_index, item in enumerate(parsed):
+        for_rajiv = is_for_rajiv(item)
+        suggested_task_name, suggested_waiting_task = _suggested_names(item, for_rajiv)
+        carried = previous.get(item.get("raw_text", ""))
+        state, task_id = carried.pop(0) if carried else (PENDING, None)
+        conn.execute(
+            "INSERT INTO action_items (transcript_id, last_edited_time, bullet_index, meeting, meeting_date, "
+            "person, action, raw_text, due_date_text, for_rajiv, suggested_task_name, suggested_waiting_task, "
+            "state, task_id, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                transcript_id, version, bullet_index,
+                transcript.get("name") or "Unknown Meeting", transcript.get("date"),
+                item.get("person"), item.get("action", ""), item.get("raw_text", ""), item.get("due_date_text"),
+                int(for_rajiv), suggested_task_name, suggested_waiting_task,
+                state, task_id, now,
+            )
+        )
+
+    conn.execute(
+        "INSERT OR REPLACE INTO ingested_transcripts (transcript_id, last_edited_time, meeting_date, ingested_at) "
+        "VALUES (?, ?, ?, ?)",
+        (transcript_id, version, transcript.get("date"), now)
+    )
+    return len(parsed)
+
+
+def ingest_action_items(date_on_or_after: str) -> Dict[str, Any]:
+    """Parse action items for transcripts that are new or changed since the last ingest.
+
+    Args:
+        date_on_or_after: Ingest transcripts dated on or after this date (YYYY-MM-DD)
+
+    Returns:
+        Dict with transcripts (seen), ingested (parsed this call) and removed
+        (transcripts in the window that no longer exist)
+    """
+    transcripts, complete = _transcripts_since(date_on_or_after)
+    transcripts = [transcript for transcript in transcripts if transcript.get("page_id")]
+
+    ingested = removed = 0
+    now = time.time()
+    with _lock:
+        conn = _get_connection()
+        versions = dict(conn.execute(
+            "SELECT transcript_id, last_edited_time FROM ingested_transcripts WHERE meeting_date >= ?",
+            (date_on_or_after,)
+        ).fetchall())
+        with conn:
+            for transcript in transcripts:
+                known = versions.pop(transcript["page_id"], None)
+                if known is None or known != (transcript.get("last_edited_time") or ""):
+                    _write_transcript(conn, transcript, now)
+                    ingested += 1
+            # Whatever is left in the window was deleted (or moved out of it)
+            if complete:
+                for transcript_id in versions:
+                    conn.execute("DELETE FROM action_items WHERE transcript_id = ?", (transcript_id,))
+                    conn.execute("DELETE FROM ingested_transcripts WHERE transcript_id = ?", (transcript_id,))
+                    removed += 1
+
+    return {"transcripts": len(transcripts), "ingested": ingested, "removed": removed}
+
+
+_COLUMNS = (
+    "transcript_id", "last_edited_time", "bullet_index", "meeting", "meeting_date", "person", "action",
+    "raw_text", "due_date_text", "for_rajiv", "suggested_task_name", "suggested_waiting_task", "state", "task_id",
+)
+
+
+def _row_to_item(row: Sequence[Any]) -> Dict[str, Any]:
+    """Shape a stored row like the action item dicts reviews have always returned."""
+    record = dict(zip(_COLUMNS, row))
+    item = {
+        "person": record["person"],
+        "action": record["action"],
+        "raw_text": record["raw_text"],
+        "has_due_date": record["due_date_text"] is not None,
+        "due_date_text": record["due_date_text"],
+        "meeting": record["meeting"],
+        "meeting_date": record["meeting_date"] or "",
+        "transcript_id": record["transcript_id"],
+        "last_edited_time": record["last_edited_time"],
+        "bullet_index": record["bullet_index"],
+        "for_rajiv": bool(record["for_rajiv"]),
+        "state": record["state"],
+        "task_id": record["task_id"],
+    }
+    if record["suggested_waiting_task"] is not None:
+        item["suggested_waiting_task"] = record["suggested_waiting_task"]
+    else:
+        item["suggested_task_name"] = record["suggested_task_name"]
+    return item
+
+
+def get_action_items(
+    date_on_or_after: str,
+    states: Iterable[str] = (PENDING,),
+    ingest: bool = True
+) -> List[Dict[str, Any]]:
+    """Get stored action items from meetings on or after a date.
+
+    Args:
+        date_on_or_after: Earliest meeting date (YYYY-MM-DD)
+        states: Processing states to include (default: pending only)
+        ingest: Ingest new or changed transcripts in the window first
+
+    Returns:
+        Action item dicts (person, action, raw_text, has_due_date, due_date_text,
+        meeting, meeting_date, suggested_task_name or suggested_waiting_task,
+        for_rajiv, state, task_id and the transcript_id / last_edited_time /
+        bullet_index key), most recent meeting first
+    """
+    if ingest:
+        ingest_action_items(date_on_or_after)
+
+    states = list(states)
+    placeholders = ", ".join("?" for _ in states)
+    with _lock:
+        rows = _get_connection().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM action_items "
+            f"WHERE meeting_date >= ? AND state IN ({placeholders}) "
+            "ORDER BY meeting_date DESC, transcript_id, bullet_index",
+            [date_on_or_after] + states
+        ).fetchall()
+    return [_row_to_item(row) for row in rows]
+
+
+def set_action_item_state(action_item: Dict[str, Any], state: str, task_id: Optional[str] = None) -> bool:
+    """Record what happened to an action item.
+
+    Args:
+        action_item: Action item dict as returned by get_action_items
+        state: One of pending, auto_created, reviewed, dismissed
+        task_id: ID of the task created for it, if any
+
+    Returns:
+        True if a stored item was updated (False for items without a store key)
+    """
+    if state not in STATES:
+        raise ValueError(f"Unknown action item state: {state}. Must be one of {', '.join(STATES)}")
+    key = (action_item.get("transcript_id"), action_item.get("last_edited_time"), action_item.get("bullet_index"))
+    if None in key:
+        return False
+
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            updated = conn.execute(
+                "UPDATE action_items SET state = ?, task_id = ?, updated_at = ? "
+                "WHERE transcript_id = ? AND last_edited_time = ? AND bullet_index = ?",
+                (state, task_id, time.time()) + key
+            ).rowcount
+    if updated:
+        action_item["state"] = state
+        action_item["task_id"] = task_id
+    return bool(updated)
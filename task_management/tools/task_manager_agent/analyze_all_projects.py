@@ -2,8 +2,7 @@
 
 from typing import List, Dict, Any
 from datetime import datetime, date
-from tools.common import query_database_complete, PROJECTS_DATA_SOURCE_ID
-from .extract_project_properties import extract_project_properties
+from .task_snapshot import get_task_snapshot
 from .analyze_task_project_alignment import get_tasks_for_project
 from .extract_task_properties import extract_task_properties
 
@@ -14,15 +13,9 @@ def get_all_active_projects() -> "List[Dict[str, Any]]":
     Returns:
         List of project page objects with extracted properties
     """
-    all_projects = query_database_complete(
-        PROJECTS_DATA_SOURCE_ID,
-        use_data_source=True
-    )
-    
     # Filter out Done and Monitoring projects
     active_projects = []
-    for project_page in all_projects:
-        project = extract_project_properties(project_page)
+    for project in get_task_snapshot().projects:
         priority = project.get("priority", "")
         
         # Exclude Done and Monitoring priorities
@@ -5,6 +5,59 @@ from datetime import datetime, date
 from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID
 from .extract_task_properties import extract_task_properties
 
+# Relation conditions OR-ed into one data source query (Notion caps
+# compound filters at 100 conditions)
+MAX_RELATION_FILTERS_PER_QUERY = 100
+
+
+def _normalize_id(page_id: Optional[str]) -> str:
+    return (page_id or "").replace("-", "").lower()
+
+
+def get_tasks_for_projects(project_ids: "List[str]") -> "Dict[str, List[Dict[str, Any]]]":
+    """Get the tasks linked to each of several projects in bulk.
+    
+    Replaces one get_tasks_for_project() query per project: inside a snapshot
+    run the tasks are grouped from the run's task snapshot, otherwise the
+    relation filters are OR-ed into as few paginated queries as possible.
+    
+    Args:
+        project_ids: Notion page IDs of the projects
+    
+    Returns:
+        Dict mapping each project ID (as passed in) to its task page objects.
+        A task linked to several projects appears under each of them.
+    """
+    from tools.common.notion_snapshot import is_snapshot_active
+    
+    if is_snapshot_active():
+        from .task_snapshot import get_task_snapshot
+        snapshot = get_task_snapshot()
+        return {project_id: snapshot.task_pages_for_project(project_id) for project_id in project_ids}
+    
+    grouped = {project_id: [] for project_id in project_ids}
+    keys_by_normalized = {}
+    for project_id in project_ids:
+        keys_by_normalized.setdefault(_normalize_id(project_id), []).append(project_id)
+    
+    unique_ids = list(dict.fromkeys(project_ids))
+    for start in range(0, len(unique_ids), MAX_RELATION_FILTERS_PER_QUERY):
+        chunk = unique_ids[start:start + MAX_RELATION_FILTERS_PER_QUERY]
+        conditions = [{"property": "Project", "relation": {"contains": project_id}} for project_id in chunk]
+        task_pages = query_database_complete(
+            TASKS_DATA_SOURCE_ID,
+            filter_dict=conditions[0] if len(conditions) == 1 else {"or": conditions},
+            use_data_source=True
+        )
+        chunk_keys = {_normalize_id(project_id) for project_id in chunk}
+        for task in task_pages:
+            relation = task.get("properties", {}).get("Project", {}).get("relation", [])
+            for normalized in {_normalize_id(rel.get("id")) for rel in relation} & chunk_keys:
+                for key in keys_by_normalized[normalized]:
+                    grouped[key].append(task)
+    
+    return grouped
+
 
 def get_tasks_for_project(project_id: str) -> "List[Dict[str, Any]]":
     """Get all tasks linked to a specific project.
@@ -1,8 +1,12 @@
 """Enhanced duplicate detection for action items with confidence categorization."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from difflib import SequenceMatcher
 from .get_action_items_for_review import extract_keywords
+from .task_title_index import TaskTitleIndex, as_task_index
+
+# Similarity above which a task matching 2+ keywords is an obvious duplicate
+OBVIOUS_SIMILARITY = 0.8
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -18,15 +22,33 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
 
 
+def _is_similar(text1: str, text2: str) -> bool:
+    """Whether two lowercased texts have similarity above OBVIOUS_SIMILARITY.
+    
+    The cheap upper bounds (real_quick_ratio, quick_ratio) rule most pairs out
+    before the full ratio() is computed; the answer is the same as comparing
+    calculate_similarity().
+    """
+    matcher = SequenceMatcher(None, text1, text2)
+    return (
+        matcher.real_quick_ratio() > OBVIOUS_SIMILARITY
+        and matcher.quick_ratio() > OBVIOUS_SIMILARITY
+        and matcher.ratio() > OBVIOUS_SIMILARITY
+    )
+
+
 def categorize_duplicates(
     action_item: Dict[str, Any], 
-    all_tasks_cache: List[Dict[str, Any]]
+    all_tasks_cache: Union[TaskTitleIndex, List[Dict[str, Any]]]
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Categorize duplicates into obvious vs potential matches.
     
+    Only tasks whose title contains one of the top keywords can match, so the
+    title index shortlists them and only those are scored.
+    
     Args:
         action_item: Action item dictionary with 'action' field
-        all_tasks_cache: Pre-fetched list of all tasks to search through
+        all_tasks_cache: Task index (see get_open_task_index) or pre-fetched list of tasks
         
     Returns:
         Dictionary with 'obvious_duplicates' and 'potential_duplicates' lists
@@ -45,29 +67,30 @@ def categorize_duplicates(
     seen_task_ids = set()
     action_lower = action_text.lower()
     
-    for task in all_tasks_cache:
+    index = as_task_index(all_tasks_cache)
+    top_keywords = [kw.lower() for kw in keywords[:3]]
+    candidates = sorted(set().union(*(index.positions_containing(kw) for kw in top_keywords)))
+    
+    for position in candidates:
+        task = index.tasks[position]
         task_id = task.get("id")
         if not task_id or task_id in seen_task_ids:
             continue
         
-        task_title = task.get("title", "").lower()
+        task_title = index.titles[position]
         if not task_title:
             continue
         
-        # Count matching keywords
-        matching_keywords = sum(1 for kw in keywords[:3] if kw.lower() in task_title)
-        
-        # Calculate text similarity
-        similarity = calculate_similarity(action_lower, task_title)
+        # Count matching keywords (at least one, or it wouldn't be a candidate)
+        matching_keywords = sum(1 for kw in top_keywords if kw in task_title)
         
         # Categorize: Obvious duplicates need 2+ keywords AND high similarity
-        if matching_keywords >= 2 and similarity > 0.8:
+        if matching_keywords >= 2 and _is_similar(action_lower, task_title):
             obvious_duplicates.append(task)
-            seen_task_ids.add(task_id)
-        elif matching_keywords >= 1:
+        else:
             # Potential duplicate: at least one keyword match
             potential_duplicates.append(task)
-            seen_task_ids.add(task_id)
+        seen_task_ids.add(task_id)
     
     return {
         "obvious_duplicates": obvious_duplicates,
@@ -1,8 +1,12 @@
 """Create a task from an action item."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime, timedelta
 from task_management.tools.inbox_agent.create_task import create_task
+from .extract_task_properties import extract_task_properties
+
+if TYPE_CHECKING:
+    from .task_title_index import TaskTitleIndex
 
 
 def parse_due_date(due_date_text: str, meeting_date: Optional[str] = None) -> Optional[str]:
@@ -66,7 +70,8 @@ def create_task_from_action_item(
     action_item: Dict[str, Any],
     meeting_date: Optional[str] = None,
     project_id: Optional[str] = None,
-    status: str = "Inbox"
+    status: str = "Inbox",
+    task_index: Optional["TaskTitleIndex"] = None
 ) -> Dict[str, Any]:
     """Create a task from an action item.
     
@@ -75,6 +80,7 @@ def create_task_from_action_item(
         meeting_date: Meeting date in YYYY-MM-DD format (for relative date calculation)
         project_id: Optional Notion page ID of related project
         status: Task status (default: "Inbox")
+        task_index: Duplicate-detection index to add the new task to
         
     Returns:
         Created task page object with id and url
@@ -101,10 +107,16 @@ def create_task_from_action_item(
         waiting = [person]
     
     # Create the task
-    return create_task(
+    task = create_task(
         name=task_name,
         status=status,
         due_date=due_date,
         project_id=project_id,
         waiting=waiting
     )
+    
+    # Later duplicate checks in the same review see the new task
+    if task_index is not None:
+        task_index.add(extract_task_properties(task))
+    
+    return task
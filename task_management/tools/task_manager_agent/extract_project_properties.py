@@ -1,68 +1,75 @@
 """Extract readable properties from a Notion project page object."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 
-def extract_project_properties(project) -> "Dict[str, Any]":
+def _title(project) -> str:
+    title_obj = project.get("properties", {}).get("Name", {})
+    if title_obj.get("title"):
+        return "".join([text.get("plain_text", "") for text in title_obj["title"]])
+    return ""
+
+
+def _priority(project) -> Optional[str]:
+    priority_obj = project.get("properties", {}).get("Priority", {}).get("select", {})
+    return priority_obj.get("name") if priority_obj else None
+
+
+def _date_start(property_name: str):
+    def extract(project) -> Optional[str]:
+        date_obj = project.get("properties", {}).get(property_name, {}).get("date", {})
+        return date_obj.get("start") if date_obj else None
+    return extract
+
+
+def _this_week(project) -> bool:
+    this_week_obj = project.get("properties", {}).get("This Week", {}).get("checkbox", {})
+    return this_week_obj if isinstance(this_week_obj, bool) else False
+
+
+def _task_ids(project) -> list:
+    tasks_relation = project.get("properties", {}).get("Tasks", {}).get("relation", [])
+    return [rel.get("id") for rel in tasks_relation] if tasks_relation else []
+
+
+def _formula_number(property_name: str):
+    def extract(project) -> Optional[float]:
+        formula_obj = project.get("properties", {}).get(property_name, {})
+        if formula_obj.get("formula", {}).get("number") is not None:
+            return formula_obj["formula"]["number"]
+        return None
+    return extract
+
+
+# Field name -> extractor, in output order (see TASK_FIELD_EXTRACTORS)
+PROJECT_FIELD_EXTRACTORS = {
+    "id": lambda project: project.get("id"),
+    "url": lambda project: project.get("url"),
+    "title": _title,
+    "priority": _priority,
+    "due_date": _date_start("Due"),
+    "completed_date": _date_start("Completed"),
+    "this_week": _this_week,
+    "task_ids": _task_ids,
+    "actionable_tasks_count": _formula_number("Actionable Tasks"),
+    "waiting_tasks_count": _formula_number("Waiting Tasks"),
+    "created_time": lambda project: project.get("created_time"),
+    "last_edited_time": lambda project: project.get("last_edited_time"),
+}
+
+PROJECT_FIELDS = tuple(PROJECT_FIELD_EXTRACTORS)
+
+
+def extract_project_properties(project, fields: Optional[Iterable[str]] = None) -> "Dict[str, Any]":
     """Extract readable properties from a Notion project page object.
-    
+
     Args:
         project: Dict[str, Any] - Notion project page object
-    
+        fields: Optional subset of PROJECT_FIELDS to extract (default: all)
+
     Returns:
         Dict[str, Any] - Extracted project properties
     """
-    props = project.get("properties", {})
-    
-    # Extract Project name (title)
-    title_obj = props.get("Name", {})
-    title = ""
-    if title_obj.get("title"):
-        title = "".join([text.get("plain_text", "") for text in title_obj["title"]])
-    
-    # Extract Priority
-    priority_obj = props.get("Priority", {}).get("select", {})
-    priority = priority_obj.get("name") if priority_obj else None
-    
-    # Extract Due date
-    due_obj = props.get("Due", {}).get("date", {})
-    due_date = due_obj.get("start") if due_obj else None
-    
-    # Extract Completed date
-    completed_obj = props.get("Completed", {}).get("date", {})
-    completed_date = completed_obj.get("start") if completed_obj else None
-    
-    # Extract This Week (checkbox)
-    this_week_obj = props.get("This Week", {}).get("checkbox", {})
-    this_week = this_week_obj if isinstance(this_week_obj, bool) else False
-    
-    # Extract Tasks (relation)
-    tasks_relation = props.get("Tasks", {}).get("relation", [])
-    task_ids = [rel.get("id") for rel in tasks_relation] if tasks_relation else []
-    
-    # Extract Actionable Tasks count (formula) - if available
-    actionable_tasks_obj = props.get("Actionable Tasks", {})
-    actionable_tasks_count = None
-    if actionable_tasks_obj.get("formula", {}).get("number") is not None:
-        actionable_tasks_count = actionable_tasks_obj["formula"]["number"]
-    
-    # Extract Waiting Tasks count (formula) - if available
-    waiting_tasks_obj = props.get("Waiting Tasks", {})
-    waiting_tasks_count = None
-    if waiting_tasks_obj.get("formula", {}).get("number") is not None:
-        waiting_tasks_count = waiting_tasks_obj["formula"]["number"]
-    
-    return {
-        "id": project.get("id"),
-        "url": project.get("url"),
-        "title": title,
-        "priority": priority,
-        "due_date": due_date,
-        "completed_date": completed_date,
-        "this_week": this_week,
-        "task_ids": task_ids,
-        "actionable_tasks_count": actionable_tasks_count,
-        "waiting_tasks_count": waiting_tasks_count,
-        "created_time": project.get("created_time"),
-        "last_edited_time": project.get("last_edited_time")
-    }
+    if fields is None:
+        return {name: extract(project) for name, extract in PROJECT_FIELD_EXTRACTORS.items()}
+    return {name: PROJECT_FIELD_EXTRACTORS[name](project) for name in fields}
@@ -1,54 +1,66 @@
 """Extract readable properties from a Notion task page object."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 
-def extract_task_properties(task) -> "Dict[str, Any]":
+def _title(task) -> str:
+    title_obj = task.get("properties", {}).get("Task", {}) or task.get("properties", {}).get("Name", {})
+    if title_obj.get("title"):
+        return "".join([text.get("plain_text", "") for text in title_obj["title"]])
+    return ""
+
+
+def _status(task) -> Optional[str]:
+    status_obj = task.get("properties", {}).get("Status", {}).get("status", {})
+    return status_obj.get("name") if status_obj else None
+
+
+def _date_start(property_name: str):
+    def extract(task) -> Optional[str]:
+        date_obj = task.get("properties", {}).get(property_name, {}).get("date", {})
+        return date_obj.get("start") if date_obj else None
+    return extract
+
+
+def _project_ids(task) -> list:
+    project_relation = task.get("properties", {}).get("Project", {}).get("relation", [])
+    return [rel.get("id") for rel in project_relation] if project_relation else []
+
+
+def _waiting(task) -> list:
+    waiting_obj = task.get("properties", {}).get("Waiting", {}).get("multi_select", [])
+    return [w.get("name") for w in waiting_obj] if waiting_obj else []
+
+
+# Field name -> extractor, in output order. Tools that only need a few fields
+# pass them to extract_task_properties (or task_records.load_task_records) so
+# the rest are never parsed.
+TASK_FIELD_EXTRACTORS = {
+    "id": lambda task: task.get("id"),
+    "url": lambda task: task.get("url"),
+    "title": _title,
+    "status": _status,
+    "due_date": _date_start("Due"),
+    "completed_date": _date_start("Completed"),
+    "project_ids": _project_ids,
+    "waiting": _waiting,
+    "created_time": lambda task: task.get("created_time"),
+    "last_edited_time": lambda task: task.get("last_edited_time"),
+}
+
+TASK_FIELDS = tuple(TASK_FIELD_EXTRACTORS)
+
+
+def extract_task_properties(task, fields: Optional[Iterable[str]] = None) -> "Dict[str, Any]":
     """Extract readable properties from a Notion task page object.
-    
+
     Args:
         task: Dict[str, Any] - Notion task page object
-    
+        fields: Optional subset of TASK_FIELDS to extract (default: all)
+
     Returns:
         Dict[str, Any] - Extracted task properties
     """
-    props = task.get("properties", {})
-    
-    # Extract Status
-    status_obj = props.get("Status", {}).get("status", {})
-    status = status_obj.get("name") if status_obj else None
-    
-    # Extract Task name (title)
-    title_obj = props.get("Task", {}) or props.get("Name", {})
-    title = ""
-    if title_obj.get("title"):
-        title = "".join([text.get("plain_text", "") for text in title_obj["title"]])
-    
-    # Extract Due date
-    due_obj = props.get("Due", {}).get("date", {})
-    due_date = due_obj.get("start") if due_obj else None
-    
-    # Extract Completed date
-    completed_obj = props.get("Completed", {}).get("date", {})
-    completed_date = completed_obj.get("start") if completed_obj else None
-    
-    # Extract Project (relation)
-    project_relation = props.get("Project", {}).get("relation", [])
-    project_ids = [rel.get("id") for rel in project_relation] if project_relation else []
-    
-    # Extract Waiting (multi-select)
-    waiting_obj = props.get("Waiting", {}).get("multi_select", [])
-    waiting = [w.get("name") for w in waiting_obj] if waiting_obj else []
-    
-    return {
-        "id": task.get("id"),
-        "url": task.get("url"),
-        "title": title,
-        "status": status,
-        "due_date": due_date,
-        "completed_date": completed_date,
-        "project_ids": project_ids,
-        "waiting": waiting,
-        "created_time": task.get("created_time"),
-        "last_edited_time": task.get("last_edited_time")
-    }
+    if fields is None:
+        return {name: extract(task) for name, extract in TASK_FIELD_EXTRACTORS.items()}
+    return {name: TASK_FIELD_EXTRACTORS[name](task) for name in fields}
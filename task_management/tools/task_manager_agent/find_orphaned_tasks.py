@@ -1,8 +1,11 @@
 """Find tasks without projects (orphaned tasks)."""
 
 from typing import Dict, Any, List
-from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID
-from .extract_task_properties import extract_task_properties
+from .extract_task_properties import TASK_FIELDS
+from .task_records import load_task_records
+
+# Task fields this tool reads and returns (every field, as extract_task_properties reports them)
+ORPHANED_TASK_FIELDS = TASK_FIELDS
 
 
 def find_orphaned_tasks() -> "Dict[str, Any]":
@@ -13,17 +16,17 @@ def find_orphaned_tasks() -> "Dict[str, Any]":
     Returns:
         Dict with orphaned tasks grouped by status
     """
-    # Get all tasks that are not Done
-    all_task_pages = query_database_complete(
-        TASKS_DATA_SOURCE_ID,
-        filter_dict={
-            "property": "Status",
-            "status": {"does_not_equal": "Done"}
-        },
-        use_data_source=True
-    )
-    
-    all_tasks = [extract_task_properties(t) for t in all_task_pages]
+    # Get all tasks that are not Done as compact records, not raw pages
+    all_tasks = [
+        task.to_dict(ORPHANED_TASK_FIELDS)
+        for task in load_task_records(
+            ORPHANED_TASK_FIELDS,
+            filter_dict={
+                "property": "Status",
+                "status": {"does_not_equal": "Done"}
+            }
+        )
+    ]
     
     # Filter tasks with no project_ids
     orphaned_tasks = [t for t in all_tasks if not t.get("project_ids")]
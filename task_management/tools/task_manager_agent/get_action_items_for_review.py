@@ -1,33 +1,9 @@
 """Get action items from meeting transcripts for review."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta
-from tools.notion import search_transcripts
-from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID
-from .extract_task_properties import extract_task_properties
-
-
-def is_for_rajiv(action_item: Dict[str, Any]) -> bool:
-    """Determine if action item is assigned to Rajiv.
-    
-    Args:
-        action_item: Action item dictionary with 'person' field
-        
-    Returns:
-        True if action item is for Rajiv, False otherwise
-    """
-    person = action_item.get("person")
-    if not person:
-        return False
-    
-    # Handle None case and convert to string
-    person_str = str(person).lower().strip()
-    if not person_str:
-        return False
-    
-    # Check for Rajiv variations
-    rajiv_names = ["rajiv", "rajiv chopra"]
-    return any(name in person_str for name in rajiv_names)
+from .action_item_store import PENDING, get_action_items
+from .task_title_index import TaskTitleIndex, as_task_index, get_open_task_index
 
 
 def extract_keywords(text: str) -> List[str]:
@@ -68,12 +44,15 @@ def extract_keywords(text: str) -> List[str]:
     return unique_keywords[:5]  # Return top 5 keywords
 
 
-def check_duplicates(action_item: Dict[str, Any], all_tasks_cache: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def check_duplicates(
+    action_item: Dict[str, Any],
+    all_tasks_cache: Union[TaskTitleIndex, List[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
     """Check for potential duplicate tasks using in-memory search.
     
     Args:
         action_item: Action item dictionary with 'action' field
-        all_tasks_cache: Pre-fetched list of all tasks to search through
+        all_tasks_cache: Task index (see get_open_task_index) or pre-fetched list of tasks
         
     Returns:
         List of potentially matching tasks
@@ -90,32 +69,37 @@ def check_duplicates(action_item: Dict[str, Any], all_tasks_cache: List[Dict[str
     # Search for tasks with similar keywords in memory
     potential_matches = []
     seen_task_ids = set()
-    action_lower = action_text.lower()
+    index = as_task_index(all_tasks_cache)
     
-    # Check top 3 keywords
+    # Check top 3 keywords; the index lists the titles containing each one
     for keyword in keywords[:3]:
-        keyword_lower = keyword.lower()
-        for task in all_tasks_cache:
+        for position in index.positions_containing(keyword.lower()):
+            task = index.tasks[position]
             task_id = task.get("id")
             if task_id and task_id not in seen_task_ids:
-                # Check if keyword appears in task title
-                task_title = task.get("title", "").lower()
-                if keyword_lower in task_title:
-                    # Additional check: if multiple keywords match, it's more likely a duplicate
-                    matching_keywords = sum(1 for kw in keywords[:3] if kw.lower() in task_title)
-                    if matching_keywords >= 1:  # At least one keyword match
-                        seen_task_ids.add(task_id)
-                        potential_matches.append(task)
+                seen_task_ids.add(task_id)
+                potential_matches.append(task)
     
     return potential_matches
 
 
-def get_action_items_for_review(days_back: int = 7, check_duplicates_flag: bool = True) -> Dict[str, Any]:
+def get_action_items_for_review(
+    days_back: int = 7,
+    check_duplicates_flag: bool = True,
+    task_index: Optional[TaskTitleIndex] = None,
+    states: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """Get action items from meeting transcripts for review.
     
+    Action items come from the action item store (see action_item_store.py);
+    only transcripts that are new or changed since the last review are parsed.
+    
     Args:
         days_back: Number of days to look back (default: 7)
         check_duplicates_flag: Whether to check for duplicate tasks (default: True)
+        task_index: Index of open tasks to check against (default: get_open_task_index())
+        states: Processing states to include (default: ["pending"], i.e. items
+            not yet auto-created, reviewed into a task, or dismissed)
         
     Returns:
         Dictionary with action items categorized by assignment:
@@ -135,41 +119,14 @@ def get_action_items_for_review(days_back: int = 7, check_duplicates_flag: bool
     # Calculate date threshold
     threshold_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
     
-    # OPTIMIZATION: Pre-fetch all tasks once if duplicate checking is enabled
-    # This replaces dozens of individual API calls with a single call
-    all_tasks_cache = []
+    # Index all non-Done tasks once; each action item only scores the tasks
+    # whose titles share a keyword with it
+    all_tasks_cache = None
     if check_duplicates_flag:
-        # Fetch all non-Done tasks once and extract their properties for in-memory searching
-        # We exclude "Done" tasks since we don't need to check for duplicates against completed tasks
-        all_task_pages = query_database_complete(
-            TASKS_DATA_SOURCE_ID,
-            filter_dict={
-                "property": "Status",
-                "status": {"does_not_equal": "Done"}
-            },
-            use_data_source=True
-        )
-        # Extract properties for efficient searching
-        all_tasks_cache = [extract_task_properties(task) for task in all_task_pages]
-    
-    # Search for transcripts
-    transcripts = search_transcripts(date_on_or_after=threshold_date, limit=50)
-    
-    # Collect all action items
-    all_action_items = []
-    for transcript in transcripts:
-        action_items = transcript.get("action_items", [])
-        meeting_name = transcript.get("name", "Unknown Meeting")
-        meeting_date = transcript.get("date", "")
-        
-        for item in action_items:
-            # Add meeting context to action item
-            enriched_item = {
-                **item,
-                "meeting": meeting_name,
-                "meeting_date": meeting_date,
-            }
-            all_action_items.append(enriched_item)
+        all_tasks_cache = task_index if task_index is not None else get_open_task_index()
+    
+    # Stored action items from meetings in the window, most recent meeting first
+    all_action_items = get_action_items(threshold_date, states=states or [PENDING])
     
     # Categorize action items
     for_rajiv = []
@@ -187,24 +144,12 @@ def get_action_items_for_review(days_back: int = 7, check_duplicates_flag: bool
         else:
             item["potential_duplicates"] = []
         
-        # Generate suggested task name
-        action_text = item.get("action", "") or ""
-        person = item.get("person") or ""
-        
-        if is_for_rajiv(item):
-            # For Rajiv - suggest task name
-            suggested_name = action_text
-            item["suggested_task_name"] = suggested_name
+        # Suggested task names were derived when the item was stored
+        if item["for_rajiv"]:
             for_rajiv.append(item)
-        elif person:
-            # For others - suggest waiting task
-            person_str = str(person) if person else "Unknown"
-            suggested_waiting = f"Follow up with {person_str} on: {action_text}"
-            item["suggested_waiting_task"] = suggested_waiting
+        elif item.get("person"):
             waiting_on_others.append(item)
         else:
-            # Unassigned
-            item["suggested_task_name"] = action_text
             unassigned.append(item)
     
     # Build summary
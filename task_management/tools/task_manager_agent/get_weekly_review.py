@@ -6,10 +6,12 @@ from .analyze_workload_balance import analyze_workload_balance
 from .check_priority_limits import check_priority_limits
 from .analyze_waiting_tasks import analyze_waiting_tasks
 from .find_orphaned_tasks import find_orphaned_tasks
-from .analyze_task_project_alignment import get_tasks_for_project
+from .analyze_task_project_alignment import get_tasks_for_projects
 from .get_action_items_for_review import get_action_items_for_review
+from tools.common import with_request_budget
 
 
+@with_request_budget(300)
 def get_weekly_review() -> "Dict[str, Any]":
     """Get complete weekly review data - comprehensive analysis of all active projects and tasks.
     
@@ -39,11 +41,12 @@ def get_weekly_review() -> "Dict[str, Any]":
         "P3": []
     }
     
+    # Fetch tasks for every project in bulk rather than one query per project
+    tasks_by_project = get_tasks_for_projects([project["id"] for project in active_projects])
+    from .extract_task_properties import extract_task_properties
+    
     for project in active_projects:
-        # Get tasks for this project
-        task_pages = get_tasks_for_project(project["id"])
-        from .extract_task_properties import extract_task_properties
-        tasks = [extract_task_properties(t) for t in task_pages]
+        tasks = [extract_task_properties(t) for t in tasks_by_project[project["id"]]]
         
         # Analyze health
         health = analyze_project_health(project, tasks)
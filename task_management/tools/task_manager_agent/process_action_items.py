@@ -1,21 +1,20 @@
 """Process action items from meeting transcripts with auto-creation and review workflow."""
 
 from typing import Dict, Any, List
-from .get_action_items_for_review import (
-    get_action_items_for_review,
-    is_for_rajiv
-)
+from .get_action_items_for_review import get_action_items_for_review
+from .action_item_store import AUTO_CREATED, set_action_item_state
 from .check_action_item_duplicates import categorize_duplicates
 from .create_task_from_action_item import create_task_from_action_item
-from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID
-from .extract_task_properties import extract_task_properties
+from .task_title_index import get_open_task_index
 
 
 def process_action_items(days_back: int = 1) -> Dict[str, Any]:
     """Process action items from meeting transcripts.
     
     Auto-creates tasks for obvious action items (assigned to Rajiv, no duplicates)
-    and returns the rest for review, categorized by duplicate status.
+    and returns the rest for review, categorized by duplicate status. Only
+    pending action items are considered; auto-created ones are marked in the
+    action item store so later runs skip them.
     
     Args:
         days_back: Number of days to look back (default: 1 for daily processing)
@@ -39,19 +38,16 @@ def process_action_items(days_back: int = 1) -> Dict[str, Any]:
             }
         }
     """
-    # Fetch all action items for the date range
-    action_items_data = get_action_items_for_review(days_back=days_back, check_duplicates_flag=True)
+    # Index all open tasks once, for both the review fetch and categorization;
+    # tasks created below are added so later items are checked against them
+    task_index = get_open_task_index()
     
-    # Pre-fetch all tasks for duplicate checking
-    all_task_pages = query_database_complete(
-        TASKS_DATA_SOURCE_ID,
-        filter_dict={
-            "property": "Status",
-            "status": {"does_not_equal": "Done"}
-        },
-        use_data_source=True
+    # Fetch all action items for the date range
+    action_items_data = get_action_items_for_review(
+        days_back=days_back,
+        check_duplicates_flag=True,
+        task_index=task_index
     )
-    all_tasks_cache = [extract_task_properties(task) for task in all_task_pages]
     
     # Collect all action items (combine for_rajiv, waiting_on_others, unassigned)
     all_action_items = []
@@ -66,11 +62,11 @@ def process_action_items(days_back: int = 1) -> Dict[str, Any]:
     review_others = []
     
     for item in all_action_items:
-        # Check if assigned to Rajiv
-        assigned_to_rajiv = is_for_rajiv(item)
+        # Check if assigned to Rajiv (derived when the item was stored)
+        assigned_to_rajiv = item["for_rajiv"]
         
         # Categorize duplicates using enhanced detection
-        duplicate_categories = categorize_duplicates(item, all_tasks_cache)
+        duplicate_categories = categorize_duplicates(item, task_index)
         obvious_dups = duplicate_categories.get("obvious_duplicates", [])
         potential_dups = duplicate_categories.get("potential_duplicates", [])
         
@@ -86,8 +82,10 @@ def process_action_items(days_back: int = 1) -> Dict[str, Any]:
                 task = create_task_from_action_item(
                     action_item=item,
                     meeting_date=meeting_date,
-                    status="Inbox"
+                    status="Inbox",
+                    task_index=task_index
                 )
+                set_action_item_state(item, AUTO_CREATED, task_id=task.get("id"))
                 auto_created_tasks.append({
                     "task": task,
                     "action_item": item
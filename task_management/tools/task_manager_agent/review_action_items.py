@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, List, Optional
 from .create_task_from_action_item import create_task_from_action_item
+from .action_item_store import REVIEWED, DISMISSED, set_action_item_state
 
 
 def create_tasks_from_review_items(
@@ -21,6 +22,9 @@ def create_tasks_from_review_items(
     Returns:
         List of created task objects with action item context:
         [{"task": {...}, "action_item": {...}}, ...]
+    
+    Created items are marked reviewed in the action item store, so they no
+    longer appear in reviews.
     """
     created_tasks = []
     
@@ -38,6 +42,7 @@ def create_tasks_from_review_items(
                 project_id=project_id,
                 status=status
             )
+            set_action_item_state(item, REVIEWED, task_id=task.get("id"))
             created_tasks.append({
                 "task": task,
                 "action_item": item
@@ -52,6 +57,37 @@ def create_tasks_from_review_items(
     return created_tasks
 
 
+def dismiss_review_items(
+    review_items: List[Dict[str, Any]],
+    dismissed_indices: List[int]
+) -> Dict[str, Any]:
+    """Mark review items the user decided not to turn into tasks.
+    
+    Dismissed items no longer appear in reviews or in process_action_items.
+    
+    Args:
+        review_items: List of action item dictionaries to review
+        dismissed_indices: List of indices (0-based) of items to dismiss
+        
+    Returns:
+        Dictionary with dismissed (count) and actions (dismissed action texts)
+    """
+    dismissed = []
+    
+    for idx in dismissed_indices:
+        if idx < 0 or idx >= len(review_items):
+            continue
+        
+        item = review_items[idx]
+        if set_action_item_state(item, DISMISSED):
+            dismissed.append(item.get("action", ""))
+    
+    return {
+        "dismissed": len(dismissed),
+        "actions": dismissed
+    }
+
+
 def format_review_item_for_display(item: Dict[str, Any], index: int) -> str:
     """Format a review item for display to the user.
     
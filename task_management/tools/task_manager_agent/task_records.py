@@ -0,0 +1,124 @@
+"""Compact task/project records and field projection for bulk analysis.
+
+extract_task_properties parses every field and callers typically keep the raw
+pages (with full rich_text arrays) alive next to the extracted dicts. For
+whole-database scans, load_task_records/load_project_records stream pages,
+parse only the fields the tool declares, and drop each raw page as soon as it
+has been projected.
+
+Pages come from iter_database: replica rows are decoded one at a time and
+Notion results one response at a time. Inside a snapshot run the raw pages
+are already held by the run snapshot, so projection saves the extracted
+copies but not the pages themselves.
+"""
+
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from tools.common import iter_database, TASKS_DATA_SOURCE_ID, PROJECTS_DATA_SOURCE_ID
+from .extract_task_properties import TASK_FIELD_EXTRACTORS
+from .extract_project_properties import PROJECT_FIELD_EXTRACTORS
+
+
+@dataclass(slots=True)
+class TaskRecord:
+    """Slotted task record; fields outside the projection stay None."""
+
+    id: Optional[str] = None
+    url: Optional[str] = None
+    title: Optional[str] = None
+    status: Optional[str] = None
+    due_date: Optional[str] = None
+    completed_date: Optional[str] = None
+    project_ids: Optional[List[str]] = None
+    waiting: Optional[List[str]] = None
+    created_time: Optional[str] = None
+    last_edited_time: Optional[str] = None
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Convert to the dict shape returned by extract_task_properties."""
+        names = fields if fields is not None else [f.name for f in dataclass_fields(self)]
+        return {name: getattr(self, name) for name in names}
+
+
+@dataclass(slots=True)
+class ProjectRecord:
+    """Slotted project record; fields outside the projection stay None."""
+
+    id: Optional[str] = None
+    url: Optional[str] = None
+    title: Optional[str] = None
+    priority: Optional[str] = None
+    due_date: Optional[str] = None
+    completed_date: Optional[str] = None
+    this_week: Optional[bool] = None
+    task_ids: Optional[List[str]] = None
+    actionable_tasks_count: Optional[float] = None
+    waiting_tasks_count: Optional[float] = None
+    created_time: Optional[str] = None
+    last_edited_time: Optional[str] = None
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Convert to the dict shape returned by extract_project_properties."""
+        names = fields if fields is not None else [f.name for f in dataclass_fields(self)]
+        return {name: getattr(self, name) for name in names}
+
+
+def _check_fields(fields: Sequence[str], extractors: Dict[str, Any]) -> None:
+    unknown = [name for name in fields if name not in extractors]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+
+def project_task(page: Dict[str, Any], fields: Sequence[str]) -> TaskRecord:
+    """Project a raw task page onto a TaskRecord, parsing only `fields`."""
+    return TaskRecord(**{name: TASK_FIELD_EXTRACTORS[name](page) for name in fields})
+
+
+def project_project(page: Dict[str, Any], fields: Sequence[str]) -> ProjectRecord:
+    """Project a raw project page onto a ProjectRecord, parsing only `fields`."""
+    return ProjectRecord(**{name: PROJECT_FIELD_EXTRACTORS[name](page) for name in fields})
+
+
+def load_task_records(
+    fields: Sequence[str],
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None
+) -> List[TaskRecord]:
+    """Stream tasks and keep only the declared fields.
+
+    Args:
+        fields: Task fields the caller reads (see TASK_FIELDS)
+        filter_dict: Notion filter object
+        sorts: Notion sort list
+
+    Returns:
+        List of TaskRecord with only `fields` populated
+    """
+    _check_fields(fields, TASK_FIELD_EXTRACTORS)
+    return [
+        project_task(page, fields)
+        for page in iter_database(TASKS_DATA_SOURCE_ID, filter_dict=filter_dict, sorts=sorts, use_data_source=True)
+    ]
+
+
+def load_project_records(
+    fields: Sequence[str],
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None
+) -> List[ProjectRecord]:
+    """Stream projects and keep only the declared fields.
+
+    Args:
+        fields: Project fields the caller reads (see PROJECT_FIELDS)
+        filter_dict: Notion filter object
+        sorts: Notion sort list
+
+    Returns:
+        List of ProjectRecord with only `fields` populated
+    """
+    _check_fields(fields, PROJECT_FIELD_EXTRACTORS)
+    return [
+        project_project(page, fields)
+        for page in iter_database(PROJECTS_DATA_SOURCE_ID, filter_dict=filter_dict, sorts=sorts, use_data_source=True)
+    ]
@@ -0,0 +1,132 @@
+"""Parsed, indexed view of every task and project for the current run."""
+
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID, PROJECTS_DATA_SOURCE_ID
+from tools.common.notion_snapshot import get_snapshot_pages, get_snapshot_generation, is_snapshot_active
+from .extract_task_properties import extract_task_properties
+from .extract_project_properties import extract_project_properties
+
+
+def _normalize_id(page_id: Optional[str]) -> str:
+    return (page_id or "").replace("-", "").lower()
+
+
+class TaskSnapshot:
+    """All non-archived tasks and projects, parsed once and indexed.
+
+    Parsed dicts are shared by every tool in the run - copy before modifying.
+
+    Attributes:
+        tasks: Task dicts from extract_task_properties
+        projects: Project dicts from extract_project_properties
+        task_pages: Raw task page objects (same order as tasks)
+        project_pages: Raw project page objects (same order as projects)
+    """
+
+    def __init__(self, task_pages: List[Dict[str, Any]], project_pages: List[Dict[str, Any]]):
+        self.task_pages = task_pages
+        self.project_pages = project_pages
+        self.tasks = [extract_task_properties(page) for page in task_pages]
+        self.projects = [extract_project_properties(page) for page in project_pages]
+
+        self._tasks_by_id = {_normalize_id(task["id"]): task for task in self.tasks}
+        self._tasks_by_status: Dict[Optional[str], List[Dict[str, Any]]] = defaultdict(list)
+        self._tasks_by_project: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._task_pages_by_project: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._dated_tasks: List[Dict[str, Any]] = []
+        for page, task in zip(task_pages, self.tasks):
+            self._tasks_by_status[task["status"]].append(task)
+            for project_id in task["project_ids"]:
+                self._tasks_by_project[_normalize_id(project_id)].append(task)
+                self._task_pages_by_project[_normalize_id(project_id)].append(page)
+            if task["due_date"]:
+                self._dated_tasks.append(task)
+        self._dated_tasks.sort(key=lambda task: task["due_date"][:10])
+
+        self._projects_by_id = {_normalize_id(project["id"]): project for project in self.projects}
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get a parsed task by ID."""
+        return self._tasks_by_id.get(_normalize_id(task_id))
+
+    def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Get a parsed project by ID."""
+        return self._projects_by_id.get(_normalize_id(project_id))
+
+    def tasks_with_status(self, *statuses: str) -> List[Dict[str, Any]]:
+        """Get tasks whose Status is any of the given statuses."""
+        result = []
+        for status in statuses:
+            result.extend(self._tasks_by_status.get(status, []))
+        return result
+
+    def tasks_without_status(self, *statuses: str) -> List[Dict[str, Any]]:
+        """Get tasks whose Status is none of the given statuses."""
+        excluded = set(statuses)
+        return [task for task in self.tasks if task["status"] not in excluded]
+
+    def tasks_for_project(self, project_id: str) -> List[Dict[str, Any]]:
+        """Get parsed tasks related to a project."""
+        return list(self._tasks_by_project.get(_normalize_id(project_id), []))
+
+    def task_pages_for_project(self, project_id: str) -> List[Dict[str, Any]]:
+        """Get raw task pages related to a project."""
+        return list(self._task_pages_by_project.get(_normalize_id(project_id), []))
+
+    def tasks_due_before(self, day: str, include_done: bool = False) -> List[Dict[str, Any]]:
+        """Get tasks due strictly before a date (YYYY-MM-DD), earliest first."""
+        result = []
+        for task in self._dated_tasks:
+            if task["due_date"][:10] >= day:
+                break
+            if include_done or task["status"] != "Done":
+                result.append(task)
+        return result
+
+    def overdue_tasks(self, today: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get tasks that are not Done and due before today."""
+        return self.tasks_due_before(today or date.today().isoformat())
+
+
+_lock = threading.Lock()
+_cached: Optional[TaskSnapshot] = None
+_cached_generation: Optional[int] = None
+
+
+def get_task_snapshot() -> TaskSnapshot:
+    """Get the task snapshot for the current run.
+
+    Inside a snapshot run (every orchestrator turn) the snapshot is built once
+    and reused until the run ends or a page write invalidates it. Outside a
+    run a fresh snapshot is built on each call.
+
+    Returns:
+        TaskSnapshot with all non-archived tasks and projects
+    """
+    global _cached, _cached_generation
+
+    if not is_snapshot_active():
+        return TaskSnapshot(
+            query_database_complete(TASKS_DATA_SOURCE_ID, use_data_source=True),
+            query_database_complete(PROJECTS_DATA_SOURCE_ID, use_data_source=True)
+        )
+
+    generation = get_snapshot_generation()
+    with _lock:
+        if _cached is not None and _cached_generation == generation:
+            return _cached
+
+    # Built outside the lock; only swapped in if no write invalidated the pages meanwhile
+    snapshot = TaskSnapshot(
+        get_snapshot_pages(TASKS_DATA_SOURCE_ID) or [],
+        get_snapshot_pages(PROJECTS_DATA_SOURCE_ID) or []
+    )
+    with _lock:
+        if get_snapshot_generation() == generation:
+            _cached = snapshot
+            _cached_generation = generation
+    return snapshot
@@ -0,0 +1,132 @@
+"""Trigram index over task titles for action-item duplicate detection.
+
+Duplicate checks only consider tasks whose title contains one of an action
+item's keywords. Instead of testing every task title for every action item,
+the index maps each character trigram to the (ascending) positions of the
+titles containing it. A keyword can only occur in titles that contain all of
+its trigrams, so its candidates are the positions in its rarest trigram's
+posting list, each confirmed with a substring check. Keywords shorter than a
+trigram fall back to a scan.
+
+The index is built once per review from the open (not Done) tasks and grows
+with add() as tasks are created, so later action items in the same review
+see them.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID
+from tools.common.notion_snapshot import is_snapshot_active
+from .extract_task_properties import extract_task_properties
+from .task_snapshot import TaskSnapshot, get_task_snapshot
+
+GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class TaskTitleIndex:
+    """Tasks with their lowercased titles and a trigram index over them.
+
+    Attributes:
+        tasks: Task dicts (from extract_task_properties), in insertion order
+        titles: Lowercased titles, same order as tasks
+    """
+
+    def __init__(self, tasks: Iterable[Dict[str, Any]] = ()):
+        self.tasks: List[Dict[str, Any]] = []
+        self.titles: List[str] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._matches: Dict[str, List[int]] = {}
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def add(self, task: Dict[str, Any]) -> None:
+        """Index one more task (e.g. one just created from an action item).
+
+        Args:
+            task: Task dict with at least "id" and "title"
+        """
+        position = len(self.tasks)
+        title = (task.get("title") or "").lower()
+        self.tasks.append(task)
+        self.titles.append(title)
+        for gram in _grams(title):
+            self._postings.setdefault(gram, []).append(position)
+        self._matches.clear()
+
+    def positions_containing(self, keyword: str) -> List[int]:
+        """Positions (ascending) of titles containing a lowercase keyword.
+
+        Args:
+            keyword: Lowercase substring to look for
+
+        Returns:
+            Positions into tasks/titles
+        """
+        if keyword in self._matches:
+            return self._matches[keyword]
+
+        if len(keyword) < GRAM_SIZE:
+            candidates = range(len(self.titles))
+        else:
+            postings = []
+            for gram in _grams(keyword):
+                posting = self._postings.get(gram)
+                if not posting:
+                    postings = None
+                    break
+                postings.append(posting)
+            candidates = min(postings, key=len) if postings else []
+
+        positions = [position for position in candidates if keyword in self.titles[position]]
+        self._matches[keyword] = positions
+        return positions
+
+
+def as_task_index(tasks: Union[TaskTitleIndex, Iterable[Dict[str, Any]]]) -> TaskTitleIndex:
+    """Use an existing index as-is, or index a list of task dicts."""
+    return tasks if isinstance(tasks, TaskTitleIndex) else TaskTitleIndex(tasks)
+
+
+_cached_index: Optional[TaskTitleIndex] = None
+_cached_snapshot: Optional[TaskSnapshot] = None
+_lock = threading.Lock()
+
+
+def get_open_task_index() -> TaskTitleIndex:
+    """Title index of every task that is not Done.
+
+    Inside a snapshot run the index is built from the run's task snapshot and
+    reused until the snapshot is rebuilt. Outside a run the open tasks are
+    queried and indexed on each call; callers keep the index for the whole
+    review and add() the tasks they create.
+
+    Returns:
+        TaskTitleIndex over the open tasks
+    """
+    global _cached_index, _cached_snapshot
+
+    if not is_snapshot_active():
+        task_pages = query_database_complete(
+            TASKS_DATA_SOURCE_ID,
+            filter_dict={
+                "property": "Status",
+                "status": {"does_not_equal": "Done"}
+            },
+            use_data_source=True
+        )
+        return TaskTitleIndex(extract_task_properties(page) for page in task_pages)
+
+    snapshot = get_task_snapshot()
+    with _lock:
+        if _cached_snapshot is not snapshot:
+            _cached_index = TaskTitleIndex(snapshot.tasks_without_status("Done"))
+            _cached_snapshot = snapshot
+        return _cached_index
@@ -1,7 +1,7 @@
 """Update a task in Notion."""
 
 from typing import List, Dict, Any, Optional
-from tools.common import get_notion_client
+from tools.common import get_notion_client, write_through, TASKS_DATA_SOURCE_ID
 
 
 def update_task(
@@ -49,7 +49,12 @@ def update_task(
     if name:
         properties["Task"] = {"title": [{"text": {"content": name}}]}
     
-    return client.pages.update(
+    page = client.pages.update(
         page_id=task_id,
         properties=properties
     )
+    
+    # Keep the local replica current without waiting for the next sync
+    write_through(TASKS_DATA_SOURCE_ID, page)
+    
+    return page
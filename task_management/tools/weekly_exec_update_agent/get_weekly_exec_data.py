@@ -3,11 +3,11 @@
 from typing import Dict, Any, List
 from datetime import datetime, date, timedelta
 from task_management.tools.task_manager_agent.analyze_all_projects import get_all_active_projects, analyze_project_health
-from task_management.tools.task_manager_agent.analyze_task_project_alignment import get_tasks_for_project
+from task_management.tools.task_manager_agent.analyze_task_project_alignment import get_tasks_for_projects
 from task_management.tools.task_manager_agent.extract_task_properties import extract_task_properties
 from task_management.tools.task_manager_agent.get_action_items_for_review import get_action_items_for_review
 from task_management.tools.task_manager_agent.analyze_waiting_tasks import analyze_waiting_tasks
-from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID, get_strategic_priorities, get_priority_by_person
+from tools.common import query_database_complete, TASKS_DATA_SOURCE_ID, get_strategic_priorities, get_priority_by_person, with_request_budget
 
 
 def classify_by_strategic_priority(title: str, project_name: str = "") -> str:
@@ -120,6 +120,7 @@ def get_tasks_completed_this_week() -> List[Dict[str, Any]]:
     return [extract_task_properties(page) for page in completed_pages]
 
 
+@with_request_budget(300)
 def get_weekly_exec_data() -> Dict[str, Any]:
     """Get comprehensive data for weekly executive update, organized by strategic priority.
     
@@ -146,10 +147,10 @@ def get_weekly_exec_data() -> Dict[str, Any]:
         "other": {"projects": [], "tasks_completed": [], "blockers": [], "status": "on_track"}
     }
     
-    # Analyze each project
+    # Analyze each project (tasks fetched in bulk rather than one query per project)
+    tasks_by_project = get_tasks_for_projects([project["id"] for project in active_projects])
     for project in active_projects:
-        task_pages = get_tasks_for_project(project["id"])
-        tasks = [extract_task_properties(t) for t in task_pages]
+        tasks = [extract_task_properties(t) for t in tasks_by_project[project["id"]]]
         health = analyze_project_health(project, tasks)
         
         # Classify project by strategic priority
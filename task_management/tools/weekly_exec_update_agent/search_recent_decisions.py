@@ -2,8 +2,7 @@
 
 from typing import Dict, Any, List, Optional
 from datetime import date, timedelta
-from task_management.tools.context_gathering_agent.search_transcripts import search_transcripts
-from task_management.tools.context_gathering_agent.get_transcript_content import get_transcript_content
+from tools.notion import search_transcripts, get_transcript_content
 
 
 # Keywords that often indicate decisions or important discussions
@@ -72,9 +71,12 @@ def search_recent_decisions(
         # If we want more thorough analysis and notes are short, get full content
         if include_full_content and len(notes) < 200 and transcript.get("page_id"):
             try:
-                full_content = get_transcript_content(transcript["page_id"])
-                if full_content:
-                    notes = full_content
+                full_content = get_transcript_content(
+                    transcript["page_id"],
+                    last_edited_time=transcript.get("last_edited_time")
+                )
+                if full_content.get("transcript"):
+                    notes = full_content["transcript"]
             except Exception:
                 pass  # Continue with truncated notes if full content fails
         
@@ -0,0 +1,25 @@
+"""Shared pytest fixtures."""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_url_metadata_cache(tmp_path, monkeypatch):
+    """Keep the URL metadata cache out of task_management/data.
+
+    Several tests reach the real fetch_url_metadata through the Slack
+    pipeline; point its cache at a per-test database instead.
+    """
+    fum = importlib.import_module("task_management.tools.inbox_agent.fetch_url_metadata")
+    monkeypatch.setattr(fum, "get_db_path", lambda: str(tmp_path / "url_metadata.db"))
+    monkeypatch.setattr(fum, "_conn", None)
+    yield
+    if fum._conn is not None:
+        fum._conn.close()
@@ -0,0 +1,173 @@
+"""Tests for the precomputed action item store behind the action item reviews."""
+
+import sys
+import os
+import importlib
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import transcript_index
+from task_management.tools.task_manager_agent import action_item_store
+from task_management.tools.task_manager_agent.action_item_store import (
+    AUTO_CREATED,
+    DISMISSED,
+    PENDING,
+    REVIEWED,
+    get_action_items,
+    ingest_action_items,
+    set_action_item_state,
+)
+from task_management.tools.task_manager_agent.task_title_index import TaskTitleIndex
+
+# The package re-exports the functions under the modules' names
+review = importlib.import_module("task_management.tools.task_manager_agent.get_action_items_for_review")
+process = importlib.import_module("task_management.tools.task_manager_agent.process_action_items")
+review_items = importlib.import_module("task_management.tools.task_manager_agent.review_action_items")
+
+TODAY = date.today().isoformat()
+YESTERDAY = (date.today() - timedelta(days=1)).isoformat()
+WEEK_AGO = (date.today() - timedelta(days=7)).isoformat()
+
+NOTES = """Discussion about pricing.
+
+### Action Items
+- Rajiv: Send pricing deck by Friday
+- Paolo: Draft hiring plan
+- Update roadmap doc
+
+### Other
+- Not an action item
+"""
+
+
+def transcript(page_id, meeting_date, notes=NOTES, edited="2026-01-10T10:00:00.000Z", name="Weekly sync"):
+    return {"page_id": page_id, "name": name, "date": meeting_date, "notes": notes, "last_edited_time": edited}
+
+
+class ActionItemStoreTestCase(unittest.TestCase):
+    """Point the store at throwaway databases and serve transcripts from a list."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.transcripts = [transcript("t1", TODAY), transcript("t2", YESTERDAY, name="Planning")]
+        patches = [
+            patch.object(action_item_store, "get_db_path",
+                         return_value=os.path.join(self.tmpdir.name, "action_items.db")),
+            patch.object(transcript_index, "get_db_path",
+                         return_value=os.path.join(self.tmpdir.name, "transcript_index.db")),
+            # Read transcripts from the (mocked) index whatever this host's SQLite supports
+            patch.object(action_item_store, "is_transcript_index_enabled", return_value=True),
+            patch.object(action_item_store, "search_transcript_index", side_effect=self._search),
+        ]
+        for active_patch in patches:
+            active_patch.start()
+            self.addCleanup(active_patch.stop)
+        action_item_store._conn = None
+
+    def tearDown(self):
+        if action_item_store._conn is not None:
+            action_item_store._conn.close()
+        action_item_store._conn = None
+        self.tmpdir.cleanup()
+
+    def _search(self, date_on_or_after=None, limit=20, **kwargs):
+        return [row for row in self.transcripts if row["date"] >= date_on_or_after][:limit]
+
+
+class TestIngest(ActionItemStoreTestCase):
+    """Transcripts are parsed once per version."""
+
+    def test_items_parsed_with_derived_fields(self):
+        items = get_action_items(WEEK_AGO)
+        self.assertEqual([(item["transcript_id"], item["bullet_index"]) for item in items],
+                         [("t1", 0), ("t1", 1), ("t1", 2), ("t2", 0), ("t2", 1), ("t2", 2)])
+        rajiv, paolo, unassigned = items[:3]
+        self.assertTrue(rajiv["for_rajiv"])
+        self.assertEqual(rajiv["suggested_task_name"], "Send pricing deck by Friday")
+        self.assertEqual(rajiv["due_date_text"], "Friday")
+        self.assertEqual(paolo["suggested_waiting_task"], "Follow up with Paolo on: Draft hiring plan")
+        self.assertNotIn("suggested_task_name", paolo)
+        self.assertEqual(unassigned["suggested_task_name"], "Update roadmap doc")
+        self.assertEqual(rajiv["state"], PENDING)
+
+    def test_unchanged_transcripts_are_not_reparsed(self):
+        with patch.object(action_item_store, "extract_action_items",
+                          wraps=action_item_store.extract_action_items) as extract:
+            self.assertEqual(ingest_action_items(WEEK_AGO)["ingested"], 2)
+            self.assertEqual(ingest_action_items(WEEK_AGO)["ingested"], 0)
+            self.transcripts[1] = transcript("t2", YESTERDAY, edited="2026-01-11T10:00:00.000Z")
+            self.assertEqual(ingest_action_items(WEEK_AGO)["ingested"], 1)
+        self.assertEqual(extract.call_count, 3)
+
+    def test_edits_keep_state_of_unchanged_bullets(self):
+        items = get_action_items(WEEK_AGO)
+        set_action_item_state(items[0], REVIEWED, task_id="task-1")
+        set_action_item_state(items[1], DISMISSED)
+
+        edited = NOTES.replace("- Paolo: Draft hiring plan", "- Paolo: Draft the hiring plan")
+        self.transcripts[0] = transcript("t1", TODAY, notes=edited, edited="2026-01-11T10:00:00.000Z")
+        stored = get_action_items(WEEK_AGO, states=[PENDING, REVIEWED, DISMISSED])
+        states = {item["raw_text"]: (item["state"], item["task_id"]) for item in stored if item["transcript_id"] == "t1"}
+        self.assertEqual(states, {
+            "Rajiv: Send pricing deck by Friday": (REVIEWED, "task-1"),
+            "Paolo: Draft the hiring plan": (PENDING, None),
+            "Update roadmap doc": (PENDING, None),
+        })
+
+    def test_deleted_transcripts_are_removed(self):
+        ingest_action_items(WEEK_AGO)
+        del self.transcripts[1]
+        self.assertEqual(ingest_action_items(WEEK_AGO)["removed"], 1)
+        self.assertEqual({item["transcript_id"] for item in get_action_items(WEEK_AGO)}, {"t1"})
+
+    def test_unknown_state_rejected(self):
+        item = get_action_items(WEEK_AGO)[0]
+        with self.assertRaises(ValueError):
+            set_action_item_state(item, "done")
+        self.assertFalse(set_action_item_state({"action": "no key"}, DISMISSED))
+
+
+class TestReviews(ActionItemStoreTestCase):
+    """Reviews read the store and record what happened to each item."""
+
+    def test_review_categories(self):
+        result = review.get_action_items_for_review(days_back=7, task_index=TaskTitleIndex())
+        self.assertEqual(result["summary"]["total_action_items"], 6)
+        self.assertEqual(len(result["for_rajiv"]), 2)
+        self.assertEqual(len(result["waiting_on_others"]), 2)
+        self.assertEqual(len(result["unassigned"]), 2)
+        self.assertEqual(result["for_rajiv"][0]["meeting"], "Weekly sync")
+
+    def test_auto_created_items_are_not_processed_again(self):
+        self.transcripts = [transcript("t1", TODAY)]
+        created = {"id": "task-1", "properties": {"Task": {"title": [{"plain_text": "Send pricing deck by Friday"}]}}}
+        with patch.object(process, "get_open_task_index", return_value=TaskTitleIndex()), \
+                patch.object(process, "create_task_from_action_item", return_value=created) as create:
+            first = process.process_action_items(days_back=1)
+            second = process.process_action_items(days_back=1)
+
+        self.assertEqual(first["summary"]["auto_created"], 1)
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(second["summary"]["total_action_items"], 2)
+        stored = get_action_items(WEEK_AGO, states=[AUTO_CREATED])
+        self.assertEqual([(item["action"], item["task_id"]) for item in stored],
+                         [("Send pricing deck by Friday", "task-1")])
+
+    def test_review_decisions_are_recorded(self):
+        items = get_action_items(WEEK_AGO)
+        with patch.object(review_items, "create_task_from_action_item", return_value={"id": "task-9"}):
+            review_items.create_tasks_from_review_items(items, [0])
+        self.assertEqual(review_items.dismiss_review_items(items, [1, 2, 99])["dismissed"], 2)
+
+        remaining = get_action_items(WEEK_AGO)
+        self.assertEqual([item["transcript_id"] for item in remaining], ["t2", "t2", "t2"])
+        self.assertEqual(get_action_items(WEEK_AGO, states=[REVIEWED])[0]["task_id"], "task-9")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for the concurrent block-tree fetcher in tools/common/block_fetcher.py."""
+
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common.block_fetcher import fetch_page_text, get_page_fetch_stats
+
+
+def paragraph(block_id, text, has_children=False):
+    """Build a paragraph block."""
+    return {
+        "id": block_id,
+        "type": "paragraph",
+        "has_children": has_children,
+        "paragraph": {"rich_text": [{"plain_text": text}]},
+    }
+
+
+class FakeBlocksClient:
+    """Minimal stand-in for notion_client.Client serving a fixed block tree."""
+
+    def __init__(self, tree, page_size=2, delay=0.0):
+        self.tree = tree
+        self.page_size = page_size
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.blocks = self
+        self.children = self
+
+    def list(self, block_id, start_cursor=None):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            blocks = self.tree.get(block_id, [])
+            start = int(start_cursor or 0)
+            end = start + self.page_size
+            return {
+                "results": blocks[start:end],
+                "has_more": end < len(blocks),
+                "next_cursor": str(end) if end < len(blocks) else None,
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestFetchPageText(unittest.TestCase):
+    """Test fetch_page_text() ordering, request counts and concurrency."""
+
+    def setUp(self):
+        self.tree = {
+            "page": [
+                paragraph("a", "A", has_children=True),
+                paragraph("b", "B"),
+                paragraph("c", "C", has_children=True),
+            ],
+            "a": [paragraph("a1", "A1", has_children=True), paragraph("a2", "A2")],
+            "a1": [paragraph("a1x", "A1x")],
+            "c": [paragraph("c1", "C1"), paragraph("c2", "C2"), paragraph("c3", "C3")],
+        }
+
+    def test_document_order_preserved(self):
+        client = FakeBlocksClient(self.tree, delay=0.01)
+        result = fetch_page_text("page", client=client)
+        self.assertEqual(
+            result["text"].split("\n\n"),
+            ["A", "A1", "A1x", "A2", "B", "C", "C1", "C2", "C3"]
+        )
+
+    def test_request_count_includes_pagination(self):
+        client = FakeBlocksClient(self.tree)
+        result = fetch_page_text("page", client=client)
+        # page: 2 cursor pages, a: 1, a1: 1, c: 2 cursor pages
+        self.assertEqual(result["request_count"], 6)
+        self.assertEqual(result["request_count"], client.calls)
+        self.assertEqual(result["block_count"], 9)
+
+    def test_in_flight_requests_bounded(self):
+        tree = {"page": [paragraph(f"p{i}", f"P{i}", has_children=True) for i in range(2)]}
+        for i in range(2):
+            tree[f"p{i}"] = [paragraph(f"p{i}c{j}", "x", has_children=True) for j in range(2)]
+        client = FakeBlocksClient(tree, page_size=10, delay=0.02)
+        fetch_page_text("page", client=client, max_workers=2)
+        self.assertLessEqual(client.max_in_flight, 2)
+        self.assertGreaterEqual(client.max_in_flight, 2)
+
+    def test_stats_recorded(self):
+        client = FakeBlocksClient(self.tree)
+        fetch_page_text("page", client=client)
+        stats = get_page_fetch_stats("page")
+        self.assertEqual(stats["request_count"], 6)
+        self.assertIn("latency_ms", stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Golden tests for the precompiled classifier.
+
+Expected values were recorded from the keyword-scan implementation that the
+classification engine replaced; the engine must reproduce them exactly.
+"""
+
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from task_management.tools.inbox_agent import classify_input, classify_batch
+from task_management.tools.slack_inbox_agent import classify_slack_message, classify_slack_batch
+
+# Slack contexts: (channel_name, is_dm, user_name)
+SLACK_CONTEXTS = [(None, False, None), ("general", False, "Ana"), (None, True, "Bob")]
+
+# (text, classification, confidence, urls, then (classification, confidence) per Slack context)
+GOLDEN_CASES = [
+    ('', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+    ('   ', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+    ('hello world', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+    ('Add task to review Q4 plan with Reid', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('Remind me to email Paolo about hiring', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('Schedule EPD meeting', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('TODO: fix the build', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('things to do today', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('Need to call the bank', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('Save this article: https://example.com/a', 'RESOURCE', 0.9, ['https://example.com/a'], ('RESOURCE', 0.9), ('RESOURCE', 0.9), ('RESOURCE', 0.9)),
+    ('Remind me to watch https://youtu.be/xyz', 'MULTIPLE', 0.85, ['https://youtu.be/xyz'], ('MULTIPLE', 0.85), ('MULTIPLE', 0.85), ('MULTIPLE', 0.85)),
+    ('Found this tool for competitive analysis', 'RESOURCE', 0.7, [], ('RESOURCE', 0.7), ('RESOURCE', 0.7), ('RESOURCE', 0.7)),
+    ('Check out https://a.com and https://b.com/x?y=1', 'RESOURCE', 0.9, ['https://a.com', 'https://b.com/x?y=1'], ('RESOURCE', 0.9), ('RESOURCE', 0.9), ('RESOURCE', 0.9)),
+    ("Customer said they'd pay 2x for feature X", 'IDEA', 0.8, [], ('IDEA', 0.8), ('IDEA', 0.8), ('IDEA', 0.8)),
+    ('Just realized our AI costs are high', 'IDEA', 0.8, [], ('IDEA', 0.8), ('IDEA', 0.8), ('IDEA', 0.8)),
+    ('Idea: automate competitive monitoring', 'IDEA', 0.8, [], ('IDEA', 0.8), ('IDEA', 0.8), ('IDEA', 0.8)),
+    ('Observation: churn spikes on Mondays', 'IDEA', 0.8, [], ('IDEA', 0.8), ('IDEA', 0.8), ('IDEA', 0.8)),
+    ('Screenshot of the dashboard', 'IDEA', 0.8, [], ('IDEA', 0.8), ('IDEA', 0.8), ('IDEA', 0.8)),
+    ('Pattern in support tickets', 'IDEA', 0.8, [], ('IDEA', 0.8), ('IDEA', 0.8), ('IDEA', 0.8)),
+    ('HTTP://UPPER.example.com should not be a url', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+    ('https://only.a.link', 'RESOURCE', 0.9, ['https://only.a.link'], ('RESOURCE', 0.9), ('RESOURCE', 0.9), ('RESOURCE', 0.9)),
+    ('Please review the doc', 'TASK', 0.7, [], ('TASK', 0.7), ('TASK', 0.7), ('TASK', 0.7999999999999999)),
+    ('Can you send the deck @ana?', 'TASK', 0.7, [], ('TASK', 0.7), ('TASK', 0.7), ('TASK', 0.7999999999999999)),
+    ('@bob could you look at this', 'IDEA', 0.6, [], ('TASK', 0.75), ('TASK', 0.75), ('IDEA', 0.6)),
+    ('We should meet @team', 'TASK', 0.7, [], ('TASK', 0.7), ('TASK', 0.7), ('TASK', 0.7999999999999999)),
+    ('thinking about pricing', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+    ('İdea: unicode dotted capital', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+    ('The recall of the product', 'TASK', 0.7, [], ('TASK', 0.7), ('TASK', 0.7), ('TASK', 0.7999999999999999)),
+    ('Sending thoughts', 'TASK', 0.7, [], ('TASK', 0.7), ('TASK', 0.7), ('TASK', 0.7999999999999999)),
+    ('meeting notes: customer said pricing is confusing', 'TASK', 0.7, [], ('TASK', 0.7), ('TASK', 0.7), ('TASK', 0.7999999999999999)),
+    ('read this later', 'RESOURCE', 0.7, [], ('RESOURCE', 0.7), ('RESOURCE', 0.7), ('RESOURCE', 0.7)),
+    ('watch this space', 'RESOURCE', 0.7, [], ('RESOURCE', 0.7), ('RESOURCE', 0.7), ('RESOURCE', 0.7)),
+    ('add task: buy milk https://shop.com', 'MULTIPLE', 0.85, ['https://shop.com'], ('MULTIPLE', 0.85), ('MULTIPLE', 0.85), ('MULTIPLE', 0.85)),
+    ('need to see https://x.io', 'MULTIPLE', 0.85, ['https://x.io'], ('MULTIPLE', 0.85), ('MULTIPLE', 0.85), ('MULTIPLE', 0.85)),
+    ('reminder: remind me to follow up', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('task to finish', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('What a pattern! customer said so, check out https://z.com', 'RESOURCE', 0.9, ['https://z.com'], ('RESOURCE', 0.9), ('RESOURCE', 0.9), ('RESOURCE', 0.9)),
+    ('ÉMAIL the team', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+    ('scheduled maintenance tonight', 'TASK', 0.85, [], ('TASK', 0.85), ('TASK', 0.85), ('TASK', 0.95)),
+    ('nothing actionable here, just vibes', 'IDEA', 0.6, [], ('IDEA', 0.6), ('IDEA', 0.6), ('IDEA', 0.6)),
+]
+
+
+class TestClassifierGolden(unittest.TestCase):
+    """classify_input, classify_batch and the Slack classifiers match the recorded results."""
+
+    def test_classify_input(self):
+        for text, classification, confidence, urls, *_ in GOLDEN_CASES:
+            with self.subTest(text=text):
+                result = classify_input(text)
+                self.assertEqual(
+                    (result["classification"], result["confidence"], result["urls"]),
+                    (classification, confidence, urls)
+                )
+                if classification == "MULTIPLE":
+                    self.assertTrue(result["has_task"] and result["has_resource"])
+                else:
+                    self.assertNotIn("has_task", result)
+
+    def test_classify_batch_matches_classify_input(self):
+        texts = [case[0] for case in GOLDEN_CASES]
+        self.assertEqual(classify_batch(texts), [classify_input(text) for text in texts])
+
+    def test_classify_slack_message(self):
+        for text, _, _, _, *per_context in GOLDEN_CASES:
+            for (channel_name, is_dm, user_name), expected in zip(SLACK_CONTEXTS, per_context):
+                with self.subTest(text=text, channel=channel_name, is_dm=is_dm):
+                    result = classify_slack_message(text, channel_name, is_dm, user_name)
+                    self.assertEqual((result["classification"], result["confidence"]), expected)
+                    self.assertEqual(
+                        result["slack_context"],
+                        {"channel": channel_name, "is_dm": is_dm, "user": user_name}
+                    )
+
+    def test_classify_slack_batch_matches_classify_slack_message(self):
+        messages = [
+            {"message_text": case[0], "channel_name": channel_name, "is_dm": is_dm, "user_name": user_name}
+            for case in GOLDEN_CASES
+            for channel_name, is_dm, user_name in SLACK_CONTEXTS
+        ]
+        self.assertEqual(
+            classify_slack_batch(messages),
+            [
+                classify_slack_message(m["message_text"], m["channel_name"], m["is_dm"], m["user_name"])
+                for m in messages
+            ]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
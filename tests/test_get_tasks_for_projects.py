@@ -0,0 +1,80 @@
+"""Tests for the bulk project task fetch in analyze_task_project_alignment.py."""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import snapshot_run, invalidate_snapshot
+from tools.common.notion_replica import evaluate_query
+from task_management.tools.task_manager_agent import analyze_task_project_alignment
+from task_management.tools.task_manager_agent.analyze_task_project_alignment import get_tasks_for_projects
+
+
+def task_page(page_id, project_ids):
+    """Build a raw Notion task page linked to projects."""
+    return {
+        "id": page_id,
+        "properties": {
+            "Status": {"type": "status", "status": {"name": "This Week"}},
+            "Project": {"type": "relation", "relation": [{"id": pid} for pid in project_ids]},
+        },
+    }
+
+
+TASKS = [
+    task_page("t1", ["p1"]),
+    task_page("t2", ["p1", "p2"]),
+    task_page("t3", ["p3"]),
+    task_page("t4", []),
+]
+
+
+class TestGetTasksForProjects(unittest.TestCase):
+    """Test grouping and query counts."""
+
+    def setUp(self):
+        invalidate_snapshot()
+        self.query_patch = patch.object(
+            analyze_task_project_alignment,
+            "query_database_complete",
+            side_effect=lambda ds, filter_dict=None, **kw: evaluate_query(TASKS, filter_dict=filter_dict)
+        )
+        self.query = self.query_patch.start()
+
+    def tearDown(self):
+        self.query_patch.stop()
+        invalidate_snapshot()
+
+    def test_grouped_by_project(self):
+        grouped = get_tasks_for_projects(["p1", "p2", "p9"])
+        self.assertEqual([t["id"] for t in grouped["p1"]], ["t1", "t2"])
+        self.assertEqual([t["id"] for t in grouped["p2"]], ["t2"])
+        self.assertEqual(grouped["p9"], [])
+        self.assertEqual(self.query.call_count, 1)
+
+    def test_query_count_independent_of_project_count(self):
+        project_ids = [f"p{i}" for i in range(50)]
+        get_tasks_for_projects(project_ids)
+        self.assertEqual(self.query.call_count, 1)
+
+    def test_large_project_lists_are_chunked(self):
+        with patch.object(analyze_task_project_alignment, "MAX_RELATION_FILTERS_PER_QUERY", 2):
+            grouped = get_tasks_for_projects(["p1", "p2", "p3"])
+        self.assertEqual(self.query.call_count, 2)
+        self.assertEqual([t["id"] for t in grouped["p3"]], ["t3"])
+
+    @patch("tools.common.notion_replica.query_replica", side_effect=lambda ds, **kw: list(TASKS))
+    def test_uses_snapshot_inside_run(self, mock_replica):
+        with snapshot_run():
+            grouped = get_tasks_for_projects(["p1", "p3"])
+        self.assertEqual([t["id"] for t in grouped["p1"]], ["t1", "t2"])
+        self.assertEqual([t["id"] for t in grouped["p3"]], ["t3"])
+        self.query.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
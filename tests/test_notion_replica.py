@@ -0,0 +1,206 @@
+"""Tests for the local Tasks/Projects replica in tools/common/notion_replica.py."""
+
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import notion_replica
+from tools.common.notion_replica import (
+    matches_filter,
+    sort_pages,
+    query_replica,
+    iter_replica,
+    sync_data_source,
+    write_through,
+    load_pages,
+)
+from tools.common.constants import TASKS_DATA_SOURCE_ID, MEETING_TRANSCRIPTS_DATA_SOURCE_ID
+
+
+def make_task(page_id, title, status, due=None, completed=None, project_ids=None,
+              last_edited="2026-01-10T10:00:00.000Z"):
+    """Build a raw Notion task page object."""
+    return {
+        "id": page_id,
+        "object": "page",
+        "created_time": "2026-01-01T09:00:00.000Z",
+        "last_edited_time": last_edited,
+        "properties": {
+            "Task": {"type": "title", "title": [{"plain_text": title}]},
+            "Status": {"type": "status", "status": {"name": status}},
+            "Due": {"type": "date", "date": {"start": due} if due else None},
+            "Completed": {"type": "date", "date": {"start": completed} if completed else None},
+            "Project": {"type": "relation", "relation": [{"id": pid} for pid in project_ids or []]},
+        },
+    }
+
+
+class ReplicaTestCase(unittest.TestCase):
+    """Point the replica at a throwaway database for each test."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, "replica.db")
+        self.path_patch = patch.object(notion_replica, "get_db_path", return_value=db_path)
+        self.path_patch.start()
+        notion_replica._conn = None
+
+    def tearDown(self):
+        if notion_replica._conn is not None:
+            notion_replica._conn.close()
+        notion_replica._conn = None
+        self.path_patch.stop()
+        self.tmpdir.cleanup()
+
+
+class TestMatchesFilter(unittest.TestCase):
+    """Test local evaluation of the filter shapes tools use."""
+
+    def setUp(self):
+        self.task = make_task(
+            "task-1", "Review Q4 Plan", "This Week",
+            due="2026-01-15", project_ids=["2d3e6112-aaaa-bbbb"]
+        )
+
+    def test_status_equals(self):
+        self.assertTrue(matches_filter(self.task, {"property": "Status", "status": {"equals": "This Week"}}))
+        self.assertFalse(matches_filter(self.task, {"property": "Status", "status": {"equals": "Done"}}))
+
+    def test_status_does_not_equal(self):
+        self.assertTrue(matches_filter(self.task, {"property": "Status", "status": {"does_not_equal": "Done"}}))
+
+    def test_or_compound(self):
+        filter_dict = {"or": [
+            {"property": "Status", "status": {"equals": "Top Priority"}},
+            {"property": "Status", "status": {"equals": "This Week"}},
+        ]}
+        self.assertTrue(matches_filter(self.task, filter_dict))
+
+    def test_date_before_and_on_or_after(self):
+        self.assertTrue(matches_filter(self.task, {"property": "Due", "date": {"before": "2026-01-16"}}))
+        self.assertFalse(matches_filter(self.task, {"property": "Due", "date": {"before": "2026-01-15"}}))
+        self.assertTrue(matches_filter(self.task, {"property": "Due", "date": {"on_or_after": "2026-01-15"}}))
+
+    def test_date_filter_on_empty_date(self):
+        self.assertFalse(matches_filter(self.task, {"property": "Completed", "date": {"on_or_after": "2026-01-01"}}))
+        self.assertTrue(matches_filter(self.task, {"property": "Completed", "date": {"is_empty": True}}))
+
+    def test_relation_contains_ignores_hyphens(self):
+        self.assertTrue(matches_filter(self.task, {"property": "Project", "relation": {"contains": "2d3e6112aaaabbbb"}}))
+        self.assertFalse(matches_filter(self.task, {"property": "Project", "relation": {"contains": "other"}}))
+
+    def test_title_contains_is_case_insensitive(self):
+        self.assertTrue(matches_filter(self.task, {"property": "Task", "title": {"contains": "q4 plan"}}))
+
+    def test_timestamp_filter(self):
+        filter_dict = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": "2026-01-10T09:00:00+00:00"}}
+        self.assertTrue(matches_filter(self.task, filter_dict))
+
+    def test_unsupported_filter_raises(self):
+        with self.assertRaises(notion_replica.UnsupportedFilterError):
+            matches_filter(self.task, {"property": "Estimate", "number": {"greater_than": 3}})
+
+
+class TestSortPages(unittest.TestCase):
+    """Test local sorting."""
+
+    def test_descending_with_empty_last(self):
+        pages = [
+            make_task("a", "A", "Done", completed="2026-01-02"),
+            make_task("b", "B", "Done"),
+            make_task("c", "C", "Done", completed="2026-01-05"),
+        ]
+        result = sort_pages(pages, [{"property": "Completed", "direction": "descending"}])
+        self.assertEqual([p["id"] for p in result], ["c", "a", "b"])
+
+
+class TestSyncAndQuery(ReplicaTestCase):
+    """Test sync, local queries and write-through."""
+
+    @patch("tools.common.notion_client.query_database_complete")
+    def test_full_then_incremental_sync(self, mock_query):
+        mock_query.return_value = [
+            make_task("t1", "One", "Inbox"),
+            make_task("t2", "Two", "Done"),
+        ]
+        result = sync_data_source(TASKS_DATA_SOURCE_ID)
+        self.assertEqual(result["mode"], "full")
+        self.assertIsNone(mock_query.call_args.kwargs["filter_dict"])
+        self.assertEqual(len(load_pages(TASKS_DATA_SOURCE_ID)), 2)
+
+        archived = make_task("t2", "Two", "Done", last_edited="2026-01-11T10:00:00.000Z")
+        archived["archived"] = True
+        mock_query.return_value = [archived]
+        result = sync_data_source(TASKS_DATA_SOURCE_ID)
+        self.assertEqual(result["mode"], "incremental")
+        self.assertEqual(mock_query.call_args.kwargs["filter_dict"]["timestamp"], "last_edited_time")
+        self.assertEqual([p["id"] for p in load_pages(TASKS_DATA_SOURCE_ID)], ["t1"])
+
+    @patch("tools.common.notion_client.query_database_complete")
+    def test_warm_replica_serves_queries_without_notion(self, mock_query):
+        mock_query.return_value = [
+            make_task("t1", "One", "Inbox"),
+            make_task("t2", "Two", "Waiting"),
+        ]
+        query_replica(TASKS_DATA_SOURCE_ID)
+        mock_query.reset_mock()
+
+        results = query_replica(
+            TASKS_DATA_SOURCE_ID,
+            filter_dict={"property": "Status", "status": {"equals": "Waiting"}}
+        )
+        self.assertEqual([p["id"] for p in results], ["t2"])
+        mock_query.assert_not_called()
+
+    @patch("tools.common.notion_client.query_database_complete")
+    def test_write_through_updates_replica(self, mock_query):
+        mock_query.return_value = [make_task("t1", "One", "Inbox")]
+        query_replica(TASKS_DATA_SOURCE_ID)
+
+        write_through(TASKS_DATA_SOURCE_ID, make_task("t1", "One", "This Week"))
+        write_through(TASKS_DATA_SOURCE_ID, make_task("t3", "Three", "This Week"))
+
+        results = query_replica(
+            TASKS_DATA_SOURCE_ID,
+            filter_dict={"property": "Status", "status": {"equals": "This Week"}}
+        )
+        self.assertEqual(sorted(p["id"] for p in results), ["t1", "t3"])
+        self.assertEqual(mock_query.call_count, 1)
+
+    @patch("tools.common.notion_client.query_database_complete")
+    def test_iter_replica_decodes_rows_as_read(self, mock_query):
+        mock_query.return_value = [make_task(f"t{n}", f"Task {n}", "Inbox") for n in range(5)]
+        query_replica(TASKS_DATA_SOURCE_ID)
+
+        with patch.object(notion_replica, "READ_BATCH_SIZE", 2), \
+                patch.object(notion_replica.json, "loads", wraps=notion_replica.json.loads) as loads:
+            pages = iter_replica(TASKS_DATA_SOURCE_ID, filter_dict={"property": "Status", "status": {"equals": "Inbox"}})
+            self.assertEqual(next(pages)["id"], "t0")
+            self.assertEqual(loads.call_count, 1)
+            self.assertEqual([page["id"] for page in pages], ["t1", "t2", "t3", "t4"])
+
+    def test_unreplicated_data_source_returns_none(self):
+        self.assertIsNone(query_replica(MEETING_TRANSCRIPTS_DATA_SOURCE_ID))
+
+    @patch("tools.common.notion_client.query_database_complete")
+    def test_unsupported_filter_falls_back(self, mock_query):
+        result = query_replica(
+            TASKS_DATA_SOURCE_ID,
+            filter_dict={"property": "Estimate", "number": {"greater_than": 3}}
+        )
+        self.assertIsNone(result)
+        mock_query.assert_not_called()
+
+    @patch("tools.common.notion_client.query_database_complete")
+    def test_sync_failure_falls_back(self, mock_query):
+        mock_query.side_effect = Exception("Notion unavailable")
+        self.assertIsNone(query_replica(TASKS_DATA_SOURCE_ID))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+"""Tests for the Notion request scheduler in tools/common/notion_scheduler.py."""
+
+import sys
+import os
+import contextvars
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common.notion_scheduler import (
+    DEFAULT_TOOL_REQUEST_BUDGET,
+    NotionRequestScheduler,
+    RequestBudgetExceeded,
+    _current_budget,
+    request_budget,
+    with_default_request_budget,
+    with_request_budget,
+)
+
+
+class FakeAPIError(Exception):
+    """Shaped like notion_client.APIResponseError."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+def flaky(errors, result="ok"):
+    """Return a send() callable that raises each error in turn, then succeeds."""
+    errors = list(errors)
+    calls = []
+
+    def send():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    send.calls = calls
+    return send
+
+
+class TestRetries(unittest.TestCase):
+    """Test retry and backoff decisions."""
+
+    def setUp(self):
+        self.scheduler = NotionRequestScheduler(rate_per_second=1000, burst=100)
+        self.sleep_patch = patch("tools.common.notion_scheduler.time.sleep")
+        self.sleep = self.sleep_patch.start()
+
+    def tearDown(self):
+        self.sleep_patch.stop()
+
+    def test_rate_limited_honors_retry_after(self):
+        send = flaky([FakeAPIError(429, {"retry-after": "0.01"})])
+        self.assertEqual(self.scheduler.execute(send, "POST", "pages"), "ok")
+        stats = self.scheduler.get_stats()
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["retries"], 1)
+        self.assertEqual(stats["rate_limited"], 1)
+        self.assertEqual(stats["retry_wait_seconds"], 0.01)
+
+    def test_server_error_retried_for_reads(self):
+        send = flaky([FakeAPIError(502), FakeAPIError(503)])
+        self.assertEqual(self.scheduler.execute(send, "POST", "data_sources/abc/query"), "ok")
+        self.assertEqual(len(send.calls), 3)
+
+    def test_server_error_not_retried_for_writes(self):
+        send = flaky([FakeAPIError(502)])
+        with self.assertRaises(FakeAPIError):
+            self.scheduler.execute(send, "POST", "pages")
+        self.assertEqual(len(send.calls), 1)
+        self.assertEqual(self.scheduler.get_stats()["failures"], 1)
+
+    def test_client_error_not_retried(self):
+        send = flaky([FakeAPIError(400)])
+        with self.assertRaises(FakeAPIError):
+            self.scheduler.execute(send, "GET", "pages/abc")
+        self.assertEqual(len(send.calls), 1)
+
+    def test_gives_up_after_max_retries(self):
+        scheduler = NotionRequestScheduler(rate_per_second=1000, burst=100, max_retries=2)
+        send = flaky([FakeAPIError(500)] * 5)
+        with self.assertRaises(FakeAPIError):
+            scheduler.execute(send, "GET", "blocks/abc/children")
+        self.assertEqual(len(send.calls), 3)
+
+
+class TestRequestBudget(unittest.TestCase):
+    """Test per-invocation request budgets."""
+
+    def setUp(self):
+        self.scheduler = NotionRequestScheduler(rate_per_second=1000, burst=100)
+
+    def test_budget_exhausted(self):
+        with request_budget(2):
+            self.scheduler.execute(lambda: "ok")
+            self.scheduler.execute(lambda: "ok")
+            with self.assertRaises(RequestBudgetExceeded):
+                self.scheduler.execute(lambda: "ok")
+
+    def test_decorator_gives_each_call_a_fresh_budget(self):
+        @with_request_budget(1)
+        def tool():
+            return self.scheduler.execute(lambda: "ok")
+
+        self.assertEqual(tool(), "ok")
+        self.assertEqual(tool(), "ok")
+
+    def test_budget_applies_in_worker_threads(self):
+        with request_budget(3):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self.scheduler.execute, lambda: "ok")
+                    for _ in range(5)
+                ]
+                outcomes = [future.exception() for future in futures]
+        self.assertEqual(sum(isinstance(e, RequestBudgetExceeded) for e in outcomes), 2)
+
+    def test_agent_tools_get_default_budget(self):
+        def plain_tool():
+            """Plain tool."""
+            return _current_budget.get().max_requests
+
+        @with_request_budget(300)
+        def heavy_tool():
+            return _current_budget.get().max_requests
+
+        plain, heavy = with_default_request_budget([plain_tool, heavy_tool])
+        self.assertEqual(plain(), DEFAULT_TOOL_REQUEST_BUDGET)
+        self.assertEqual(plain.__name__, "plain_tool")
+        self.assertEqual(plain.__doc__, "Plain tool.")
+        self.assertEqual(heavy(), 300)
+
+    def test_no_budget_outside_context(self):
+        for _ in range(10):
+            self.scheduler.execute(lambda: "ok")
+        self.assertEqual(self.scheduler.get_stats()["requests"], 10)
+
+
+class TestConcurrency(unittest.TestCase):
+    """Test that a 429 slows every caller sharing the scheduler."""
+
+    def test_rate_limit_pauses_other_threads(self):
+        scheduler = NotionRequestScheduler(rate_per_second=1000, burst=100)
+        first = flaky([FakeAPIError(429, {"retry-after": "0.1"})])
+        started = time.monotonic()
+        finished = {}
+
+        def other():
+            time.sleep(0.02)
+            scheduler.execute(lambda: "ok")
+            finished["other"] = time.monotonic() - started
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        scheduler.execute(first, "GET", "pages/abc")
+        thread.join()
+        self.assertGreaterEqual(finished["other"], 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Tests for single-request page creation and the concurrent Notion write queue."""
+
+import sys
+import os
+import importlib
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import create_page, paragraph_block, request_budget
+from tools.common import notion_scheduler
+from task_management.tools.inbox_agent import create_idea, create_entries
+from task_management.tools.inbox_agent.notion_write_queue import NotionWriteQueue
+
+# The package re-exports the function under the module's name
+create_task_module = importlib.import_module("task_management.tools.inbox_agent.create_task")
+
+
+class NotionClientTestCase(unittest.TestCase):
+    """Patches the shared Notion client with a mock."""
+
+    def setUp(self):
+        self.notion = Mock()
+        self.notion.pages.create.side_effect = lambda **kwargs: {"id": "page-1", "url": "https://notion.so/page-1"}
+        client_patch = patch("tools.common.notion_client.get_notion_client", return_value=self.notion)
+        client_patch.start()
+        self.addCleanup(client_patch.stop)
+
+
+class TestCreatePage(NotionClientTestCase):
+    """Page bodies are sent with the create request."""
+
+    def test_body_folded_into_create(self):
+        page = create_page({"database_id": "db"}, {"Name": {}}, [paragraph_block("hello")])
+
+        self.assertEqual(page["id"], "page-1")
+        self.assertEqual(len(self.notion.pages.create.call_args.kwargs["children"]), 1)
+        self.notion.blocks.children.append.assert_not_called()
+
+    def test_long_body_appends_remainder(self):
+        blocks = [paragraph_block(f"block {n}") for n in range(250)]
+        create_page({"database_id": "db"}, {}, blocks)
+
+        self.assertEqual(len(self.notion.pages.create.call_args.kwargs["children"]), 100)
+        appended = [len(call.kwargs["children"]) for call in self.notion.blocks.children.append.call_args_list]
+        self.assertEqual(appended, [100, 50])
+
+    def test_paragraph_block_splits_long_text(self):
+        rich_text = paragraph_block("x" * 4500)["paragraph"]["rich_text"]
+        self.assertEqual([len(item["text"]["content"]) for item in rich_text], [2000, 2000, 500])
+
+    def test_create_idea_is_one_request(self):
+        create_idea("Title", idea_type="Pattern", content="Body", children=[paragraph_block("More")])
+
+        self.notion.databases.retrieve.assert_not_called()
+        self.notion.blocks.children.append.assert_not_called()
+        children = self.notion.pages.create.call_args.kwargs["children"]
+        self.assertEqual([block["paragraph"]["rich_text"][0]["text"]["content"] for block in children], ["Body", "More"])
+
+    def test_create_task_with_details_is_one_request(self):
+        with patch.object(create_task_module, "write_through") as write_through:
+            create_task_module.create_task("Email Reid", details="About the plan")
+
+        self.assertEqual(self.notion.pages.create.call_count, 1)
+        self.assertIn("children", self.notion.pages.create.call_args.kwargs)
+        self.notion.blocks.children.append.assert_not_called()
+        write_through.assert_called_once()
+
+    def test_create_task_without_details_has_no_body(self):
+        with patch.object(create_task_module, "write_through"):
+            create_task_module.create_task("Email Reid")
+        self.assertNotIn("children", self.notion.pages.create.call_args.kwargs)
+
+
+class TestNotionWriteQueue(unittest.TestCase):
+    """Creates run concurrently and report through futures."""
+
+    def test_creates_run_concurrently(self):
+        def slow_create(name):
+            time.sleep(0.1)
+            return {"id": f"id-{name}"}
+
+        started = time.perf_counter()
+        with NotionWriteQueue(workers=3) as writes:
+            futures = [writes.submit(slow_create, name=n) for n in range(6)]
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([future.result()["id"] for future in futures], [f"id-{n}" for n in range(6)])
+        self.assertLess(elapsed, 0.45)
+        self.assertEqual(writes.get_stats(), {"submitted": 6, "created": 6, "failed": 0})
+
+    def test_pending_creates_are_bounded(self):
+        release = threading.Event()
+        running = []
+
+        def blocked_create():
+            running.append(1)
+            release.wait(5)
+            return {"id": "x"}
+
+        writes = NotionWriteQueue(workers=1, max_pending=2)
+        writes.submit(blocked_create)
+        writes.submit(blocked_create)
+        third = threading.Thread(target=writes.submit, args=(blocked_create,))
+        third.start()
+        third.join(0.2)
+        # The third submit waits for a slot
+        self.assertTrue(third.is_alive())
+
+        release.set()
+        third.join(5)
+        writes.close()
+        self.assertEqual(len(running), 3)
+
+    def test_request_budget_follows_submitter(self):
+        def budget_name():
+            budget = notion_scheduler._current_budget.get()
+            return {"id": budget.name if budget else None}
+
+        with NotionWriteQueue() as writes, request_budget(10, name="capture"):
+            future = writes.submit(budget_name)
+        self.assertEqual(future.result()["id"], "capture")
+
+    def test_create_entries_reports_each_result_in_order(self):
+        creators = {
+            "task": Mock(return_value={"id": "task-1", "url": "u1"}),
+            "idea": Mock(side_effect=Exception("Invalid status option")),
+            "resource": Mock(return_value={"id": "resource-1", "url": "u2"}),
+        }
+        with patch.dict("task_management.tools.inbox_agent.notion_write_queue.ENTRY_CREATORS", creators):
+            results = create_entries([
+                {"type": "task", "name": "Email Reid"},
+                {"type": "idea", "title": "Pricing", "idea_type": "Pattern"},
+                {"type": "note", "name": "?"},
+                {"type": "resource", "name": "Article", "url": "https://example.com"},
+            ])
+
+        self.assertEqual(results[0], {"type": "task", "id": "task-1", "url": "u1"})
+        self.assertEqual(results[1], {"type": "idea", "error": "Invalid status option"})
+        self.assertIn("Unknown entry type", results[2]["error"])
+        self.assertEqual(results[3]["id"], "resource-1")
+        creators["task"].assert_called_once_with(name="Email Reid")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for the on-disk page text cache in tools/common/page_cache.py."""
+
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import page_cache
+from tools.common.page_cache import (
+    get_cached_page_text,
+    store_page_text,
+    get_page_text_cached,
+    get_cache_stats,
+)
+
+
+class PageCacheTestCase(unittest.TestCase):
+    """Point the cache at a throwaway database for each test."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, "page_cache.db")
+        self.path_patch = patch.object(page_cache, "get_db_path", return_value=db_path)
+        self.path_patch.start()
+        page_cache._conn = None
+
+    def tearDown(self):
+        if page_cache._conn is not None:
+            page_cache._conn.close()
+        page_cache._conn = None
+        self.path_patch.stop()
+        self.tmpdir.cleanup()
+
+
+class TestCacheLookup(PageCacheTestCase):
+    """Test keyed lookups and versioning."""
+
+    def test_exact_version_hit_and_miss(self):
+        store_page_text("page-1", "2026-01-10T10:00:00.000Z", "hello")
+        self.assertEqual(get_cached_page_text("page-1", "2026-01-10T10:00:00.000Z"), "hello")
+        self.assertIsNone(get_cached_page_text("page-1", "2026-01-11T10:00:00.000Z"))
+
+    def test_unknown_version_serves_latest(self):
+        store_page_text("page-1", "2026-01-10T10:00:00.000Z", "hello")
+        self.assertEqual(get_cached_page_text("page1"), "hello")
+
+    def test_new_version_replaces_old(self):
+        store_page_text("page-1", "2026-01-10T10:00:00.000Z", "v1")
+        store_page_text("page-1", "2026-01-11T10:00:00.000Z", "v2")
+        self.assertIsNone(get_cached_page_text("page-1", "2026-01-10T10:00:00.000Z"))
+        self.assertEqual(get_cache_stats()["entries"], 1)
+
+    def test_identical_content_stored_once(self):
+        store_page_text("page-1", "t1", "same body")
+        store_page_text("page-2", "t1", "same body")
+        stats = get_cache_stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["blobs"], 1)
+
+
+class TestEviction(PageCacheTestCase):
+    """Test LRU size-bounded eviction."""
+
+    def test_least_recently_used_evicted(self):
+        with patch.object(page_cache, "PAGE_CACHE_MAX_BYTES", 25):
+            store_page_text("page-1", "t1", "a" * 10)
+            store_page_text("page-2", "t1", "b" * 10)
+            # Touch page-1 so page-2 becomes least recently used
+            get_cached_page_text("page-1", "t1")
+            store_page_text("page-3", "t1", "c" * 10)
+
+        self.assertIsNotNone(get_cached_page_text("page-1", "t1"))
+        self.assertIsNone(get_cached_page_text("page-2", "t1"))
+        self.assertIsNotNone(get_cached_page_text("page-3", "t1"))
+        self.assertLessEqual(get_cache_stats()["total_bytes"], 25)
+
+
+class TestGetPageTextCached(PageCacheTestCase):
+    """Test read-through behavior."""
+
+    @patch("tools.common.block_fetcher.fetch_page_text")
+    def test_second_call_does_not_fetch(self, mock_fetch):
+        mock_fetch.return_value = {"text": "transcript body", "request_count": 4, "latency_ms": 12.0}
+
+        first = get_page_text_cached("page-1", "2026-01-10T10:00:00.000Z")
+        second = get_page_text_cached("page-1", "2026-01-10T10:00:00.000Z")
+
+        self.assertFalse(first["cache_hit"])
+        self.assertEqual(first["request_count"], 4)
+        self.assertTrue(second["cache_hit"])
+        self.assertEqual(second["request_count"], 0)
+        self.assertEqual(second["text"], "transcript body")
+        mock_fetch.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import tempfile
 import unittest
 from unittest.mock import Mock, MagicMock, patch, call
 
@@ -17,11 +18,31 @@ from task_management.tools.slack_inbox_agent.process_slack_messages import (
     _handle_resource_creation_retry,
     _mark_message_read_if_requested,
 )
+from task_management.tools.slack_inbox_agent import user_directory
 
 
 class TestGetUserName(unittest.TestCase):
     """Test _get_user_name() helper function."""
     
+    def setUp(self):
+        """Point the user directory at a throwaway database."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, "sessions.db")
+        self.path_patch = patch.object(user_directory, "get_db_path", return_value=db_path)
+        self.path_patch.start()
+        user_directory._conn = None
+        user_directory._names.clear()
+        user_directory._loaded = False
+        user_directory._last_bulk_load = 0.0
+        user_directory._bulk_unavailable = False
+    
+    def tearDown(self):
+        if user_directory._conn is not None:
+            user_directory._conn.close()
+        user_directory._conn = None
+        self.path_patch.stop()
+        self.tmpdir.cleanup()
+    
     def test_get_user_name_success(self):
         """Test successful user name retrieval."""
         client = Mock()
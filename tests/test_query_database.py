@@ -0,0 +1,134 @@
+"""Tests for the paginated query engine in tools/common/notion_client.py."""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import notion_client
+from tools.common.notion_client import query_database_complete, iter_database, count_database
+
+
+class FakeQueryEndpoint:
+    """Serves `total` numbered rows with cursor pagination."""
+
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+
+    def query(self, **params):
+        self.calls.append(dict(params))
+        start = int(params.get("start_cursor") or 0)
+        end = min(start + params.get("page_size", 100), self.total)
+        return {
+            "results": [{"id": f"row-{i}"} for i in range(start, end)],
+            "has_more": end < self.total,
+            "next_cursor": str(end) if end < self.total else None,
+        }
+
+
+class FakeDatabases:
+    """databases endpoint without query (current SDK)."""
+
+    def __init__(self):
+        self.retrieved = 0
+
+    def retrieve(self, database_id):
+        self.retrieved += 1
+        return {"id": database_id, "data_sources": [{"id": f"ds-of-{database_id}"}]}
+
+
+class FakeClient:
+    def __init__(self, total, legacy=False):
+        self.data_sources = FakeQueryEndpoint(total)
+        self.databases = FakeQueryEndpoint(total) if legacy else FakeDatabases()
+
+
+class QueryTestCase(unittest.TestCase):
+    def use_client(self, client):
+        patcher = patch.object(notion_client, "get_notion_client", return_value=client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        notion_client._database_data_sources.clear()
+        return client
+
+
+class TestDataSourceQuery(QueryTestCase):
+    """Test pagination and early cut-off."""
+
+    def test_follows_every_cursor(self):
+        client = self.use_client(FakeClient(250))
+        results = query_database_complete("ds-1", use_data_source=True, use_replica=False)
+        self.assertEqual(len(results), 250)
+        self.assertEqual(len(client.data_sources.calls), 3)
+
+    def test_limit_stops_paginating(self):
+        client = self.use_client(FakeClient(250))
+        results = query_database_complete("ds-1", use_data_source=True, use_replica=False, limit=20)
+        self.assertEqual([r["id"] for r in results], [f"row-{i}" for i in range(20)])
+        self.assertEqual(len(client.data_sources.calls), 1)
+        self.assertEqual(client.data_sources.calls[0]["page_size"], 20)
+
+    def test_page_size_hint(self):
+        client = self.use_client(FakeClient(25))
+        results = query_database_complete("ds-1", use_data_source=True, use_replica=False, page_size=10, limit=15)
+        self.assertEqual(len(results), 15)
+        self.assertEqual([c["page_size"] for c in client.data_sources.calls], [10, 5])
+
+
+class TestDatabaseQuery(QueryTestCase):
+    """Test the database-ID branch (formerly a single unpaginated search)."""
+
+    def test_resolves_data_source_and_paginates(self):
+        client = self.use_client(FakeClient(150))
+        results = query_database_complete("db-1", filter_dict={"property": "X", "checkbox": {"equals": True}})
+        self.assertEqual(len(results), 150)
+        self.assertEqual(client.data_sources.calls[0]["data_source_id"], "ds-of-db-1")
+        self.assertEqual(client.data_sources.calls[0]["filter"], {"property": "X", "checkbox": {"equals": True}})
+
+        query_database_complete("db-1")
+        self.assertEqual(client.databases.retrieved, 1)
+
+    def test_legacy_databases_query(self):
+        client = self.use_client(FakeClient(120, legacy=True))
+        results = query_database_complete("db-1", limit=110)
+        self.assertEqual(len(results), 110)
+        self.assertEqual([c["page_size"] for c in client.databases.calls], [100, 10])
+        self.assertEqual(client.databases.calls[0]["database_id"], "db-1")
+        self.assertEqual(client.data_sources.calls, [])
+
+
+class TestIterDatabase(QueryTestCase):
+    """Test lazy iteration and count-only mode."""
+
+    def test_stops_fetching_when_consumer_stops(self):
+        client = self.use_client(FakeClient(500))
+        rows = iter_database("ds-1", use_data_source=True, use_replica=False, page_size=50)
+        first = [next(rows) for _ in range(60)]
+        self.assertEqual(first[-1]["id"], "row-59")
+        self.assertEqual(len(client.data_sources.calls), 2)
+
+    def test_limit(self):
+        client = self.use_client(FakeClient(500))
+        rows = list(iter_database("ds-1", use_data_source=True, use_replica=False, limit=5))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(client.data_sources.calls[0]["page_size"], 5)
+
+    def test_count_requests_title_only(self):
+        client = self.use_client(FakeClient(230))
+        self.assertEqual(count_database("ds-1", use_data_source=True, use_replica=False), 230)
+        self.assertEqual(len(client.data_sources.calls), 3)
+        self.assertTrue(all(c["filter_properties"] == ["title"] for c in client.data_sources.calls))
+
+    @patch("tools.common.notion_replica.query_replica", return_value=[{"id": "a"}, {"id": "b"}])
+    def test_count_served_locally(self, mock_replica):
+        client = self.use_client(FakeClient(230))
+        self.assertEqual(count_database("ds-1", use_data_source=True), 2)
+        self.assertEqual(client.data_sources.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
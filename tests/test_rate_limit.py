@@ -0,0 +1,32 @@
+"""Tests for the token bucket in tools/common/rate_limit.py."""
+
+import sys
+import os
+import time
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common.rate_limit import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test pacing."""
+
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate_per_second=50, capacity=2)
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        # 2 from the burst, 2 more at 50/s -> at least ~40ms
+        self.assertGreaterEqual(time.monotonic() - started, 0.035)
+
+    def test_pause_blocks_acquire(self):
+        bucket = TokenBucket(rate_per_second=1000, capacity=5)
+        bucket.pause(0.05)
+        self.assertGreaterEqual(bucket.acquire(), 0.04)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,440 @@
+"""Tests for the staged process_slack_messages pipeline."""
+
+import sys
+import os
+import importlib
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+# The package re-exports the function under the module's name
+psm = importlib.import_module("task_management.tools.slack_inbox_agent.process_slack_messages")
+history = importlib.import_module("task_management.tools.slack_inbox_agent.get_conversation_history")
+from task_management.tools.slack_inbox_agent import message_tracker
+from task_management.tools.slack_inbox_agent.inbox_pipeline import MessageBudget
+from task_management.tools.slack_inbox_agent.message_tracker import MessageTracker
+
+FETCH_DELAY = 0.05
+
+
+def _conversations(count):
+    return [{"id": f"C{i}", "name": f"chan-{i}", "is_im": False, "last_read": None} for i in range(count)]
+
+
+def _history(channel_id, last_read_ts=None, include_recent_hours=24, limit=200):
+    time.sleep(FETCH_DELAY)
+    return {"all": [{"ts": f"{100 - n}.0", "text": f"msg {n} in {channel_id}", "type": "message"} for n in range(3)]}
+
+
+class TestMessageBudget(unittest.TestCase):
+    """Test MessageBudget slot accounting."""
+
+    def test_release_frees_slot(self):
+        budget = MessageBudget(1)
+        self.assertTrue(budget.acquire())
+        self.assertFalse(budget.try_acquire())
+        budget.release()
+        self.assertTrue(budget.acquire())
+        budget.commit()
+        self.assertFalse(budget.acquire())
+        self.assertTrue(budget.exhausted())
+
+    def test_acquire_waits_for_in_flight(self):
+        budget = MessageBudget(1)
+        budget.acquire()
+        threading.Timer(0.05, budget.release).start()
+        self.assertTrue(budget.acquire())
+
+    def test_slot_settles_once(self):
+        budget = MessageBudget(2)
+        slot = budget.reserve()
+        slot.commit()
+        slot.release()
+        self.assertEqual((budget.used, budget.reserved), (1, 0))
+        budget.try_reserve().release()
+        self.assertEqual((budget.used, budget.reserved), (1, 0))
+
+
+class TestProcessSlackMessages(unittest.TestCase):
+    """Test the pipeline end to end with Slack and Notion stubbed."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.tracker = MessageTracker(os.path.join(self.tmpdir.name, "sessions.db"))
+        self.addCleanup(self.tracker.close)
+        tracker_patch = patch.object(message_tracker, "_tracker", self.tracker)
+        tracker_patch.start()
+        self.addCleanup(tracker_patch.stop)
+
+        self.lock = threading.Lock()
+        self.created = []
+        patches = {
+            "get_slack_client": Mock(return_value=Mock()),
+            "get_unread_and_recent_messages": _history,
+            "_get_user_name": Mock(return_value="Ana"),
+            "classify_slack_message": Mock(return_value={"classification": "TASK", "confidence": 0.9, "urls": []}),
+            "create_task": self._create_task,
+        }
+        for name, value in patches.items():
+            patcher = patch.object(psm, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _processed(self):
+        return {row["message_id"] for row in self.tracker.execute("SELECT message_id FROM processed_slack_messages")}
+
+    def _create_task(self, name, status):
+        with self.lock:
+            self.created.append(name)
+            return {"id": f"task-{len(self.created)}", "url": None}
+
+    def _run(self, conversations, **kwargs):
+        with patch.object(psm, "get_unread_messages", return_value=conversations):
+            return psm.process_slack_messages(include_threads=False, **kwargs)
+
+    def test_fetches_conversations_concurrently(self):
+        started = time.perf_counter()
+        result = self._run(_conversations(20), max_messages=100)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(result["processed"], 60)
+        self.assertEqual(result["created"]["tasks"], 60)
+        self.assertLess(elapsed, 20 * FETCH_DELAY * 0.75)
+        self.assertEqual(result["stages"]["fetch"]["items"], 20)
+        self.assertEqual(result["stages"]["write"]["items"], 60)
+
+    def test_max_messages_is_exact(self):
+        result = self._run(_conversations(10), max_messages=7)
+        self.assertEqual(result["processed"], 7)
+        self.assertEqual(len(self.created), 7)
+        # Admitted in priority order: all of the first two conversations, then one more
+        self.assertEqual(sum(1 for message_id in self._processed() if message_id.startswith(("C0:", "C1:"))), 6)
+
+    def test_failed_write_frees_slot(self):
+        original = self._create_task
+
+        def flaky(name, status):
+            if "msg 0 in C0" in name:
+                raise Exception("boom")
+            return original(name, status)
+
+        with patch.object(psm, "create_task", flaky):
+            result = self._run(_conversations(3), max_messages=4)
+        self.assertEqual(result["processed"], 4)
+        self.assertEqual(len(self.created), 4)
+
+    def test_error_after_commit_keeps_max_messages(self):
+        def mark_read(client, channel_id, message_ts, mark_as_read):
+            if (channel_id, message_ts) == ("C0", "100.0"):
+                raise Exception("boom")
+
+        with patch.object(psm, "_mark_message_read_if_requested", mark_read):
+            self._run(_conversations(3), max_messages=4)
+        self.assertEqual(len(self.created), 4)
+
+    def test_marks_committed_as_each_write_finishes(self):
+        other = MessageTracker(self.tracker.db_path)
+        self.addCleanup(other.close)
+        committed = []
+
+        def create(name, status):
+            committed.append(len(other.execute("SELECT message_id FROM processed_slack_messages")))
+            return self._create_task(name, status)
+
+        with patch.object(psm, "WRITE_WORKERS", 1), patch.object(psm, "create_task", create):
+            self._run(_conversations(2), max_messages=100)
+        self.assertEqual(committed, list(range(6)))
+
+    def test_second_sweep_fetches_only_new_messages(self):
+        self._run(_conversations(2), max_messages=100)
+        self.assertEqual(self.tracker.get_high_water(["C0", "C1"]), {"C0": "100.0", "C1": "100.0"})
+
+        since = Mock(return_value={"all": [], "high_water_ts": "100.0", "complete": True})
+        with patch.object(psm, "get_messages_since", since):
+            result = self._run(_conversations(2), max_messages=100)
+        self.assertEqual(result["processed"], 0)
+        since.assert_any_call("C0", "100.0")
+        self.assertEqual(since.call_count, 2)
+
+    def test_reset_backfills_and_dedups(self):
+        self._run(_conversations(2), max_messages=100)
+        message_tracker.reset_channel_sync()
+        result = self._run(_conversations(2), max_messages=100)
+        self.assertEqual(result["processed"], 0)
+        self.assertEqual(result["skipped"], 6)
+
+    def test_mark_not_advanced_past_unadmitted_messages(self):
+        self._run(_conversations(3), max_messages=4)
+        self.assertEqual(self.tracker.get_high_water(["C0", "C1", "C2"]), {"C0": "100.0"})
+
+
+class TestThreadAggregation(unittest.TestCase):
+    """Test that a thread's replies are collected on one idea."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.tracker = MessageTracker(os.path.join(self.tmpdir.name, "sessions.db"))
+        self.addCleanup(self.tracker.close)
+        tracker_patch = patch.object(message_tracker, "_tracker", self.tracker)
+        tracker_patch.start()
+        self.addCleanup(tracker_patch.stop)
+
+        self.notion = Mock()
+        self.create_idea = Mock(return_value={"id": "idea-1", "url": None})
+        self.replies = [{"ts": f"100.{n:06d}", "text": f"reply {n}", "user": "U1"} for n in range(1, 41)]
+        self.replies.append({"ts": "100.000041", "text": " ", "user": "U1"})
+        patches = {
+            "get_slack_client": Mock(return_value=Mock()),
+            "get_unread_and_recent_messages": Mock(return_value={"all": [
+                {"ts": "100.000000", "text": "Launch plan", "type": "message", "reply_count": 41,
+                 "latest_reply": "100.000041"}
+            ]}),
+            "get_thread_replies": Mock(return_value=self.replies),
+            "get_notion_client": Mock(return_value=self.notion),
+            "_get_user_name": Mock(return_value="Ana"),
+            "classify_slack_message": Mock(return_value={"classification": "TASK", "confidence": 0.9, "urls": []}),
+            "create_task": Mock(return_value={"id": "task-1", "url": None}),
+            "create_idea": self.create_idea,
+        }
+        for name, value in patches.items():
+            patcher = patch.object(psm, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # process_slack_messages checks the Ideas database before enabling threads
+        common_patch = patch("tools.common.get_notion_client", return_value=self.notion)
+        common_patch.start()
+        self.addCleanup(common_patch.stop)
+
+    def _run(self, max_messages=10, **kwargs):
+        conversations = [{"id": "C1", "name": "general", "is_im": False, "last_read": None}]
+        with patch.object(psm, "get_unread_messages", return_value=conversations):
+            return psm.process_slack_messages(max_messages=max_messages, **kwargs)
+
+    def _appended_blocks(self):
+        return [block for call in self.notion.blocks.children.append.call_args_list for block in call.kwargs["children"]]
+
+    def test_one_idea_per_thread(self):
+        result = self._run()
+
+        self.create_idea.assert_called_once()
+        self.assertEqual(self.create_idea.call_args.kwargs["title"], "Slack Thread: Launch plan")
+        # Header plus one block per non-empty reply, sent with the create request
+        self.assertEqual(len(self.create_idea.call_args.kwargs["children"]), 41)
+        self.notion.blocks.children.append.assert_not_called()
+        self.assertEqual(result["created"], {"tasks": 1, "resources": 0, "ideas": 1})
+        self.assertEqual(result["processed"], 41)
+        reply_ids = [f"C1:{reply['ts']}" for reply in self.replies]
+        self.assertEqual(self.tracker.processed_ids(reply_ids), set(reply_ids))
+        self.assertEqual(self.tracker.get_thread_page("C1", "100.000000"), "idea-1")
+
+    def test_new_replies_appended_to_existing_idea(self):
+        psm._write_thread_replies(Mock(), "C1", "general", "100.000000", self.replies[:10], None, False)
+        self.notion.blocks.children.append.reset_mock()
+
+        outcome = psm._write_thread_replies(Mock(), "C1", "general", "100.000000", self.replies[:12], None, False)
+        self.create_idea.assert_called_once()
+        self.notion.blocks.children.append.assert_called_once()
+        self.assertEqual(
+            [block["paragraph"]["rich_text"][0]["text"]["content"] for block in self._appended_blocks()],
+            ["Ana: reply 11", "Ana: reply 12"]
+        )
+        self.assertEqual((outcome["processed"], outcome["skipped"]), (2, 10))
+        self.assertEqual(outcome["created_items"], [])
+
+    def test_failed_write_leaves_replies_unmarked(self):
+        self.create_idea.side_effect = Exception("timeout")
+        outcome = psm._write_thread_replies(Mock(), "C1", "general", "100.000000", self.replies[:3], None, False)
+        self.assertEqual(outcome["processed"], 0)
+        self.assertEqual(self.tracker.processed_ids(f"C1:{reply['ts']}" for reply in self.replies[:3]), set())
+
+    def test_failed_append_after_create_keeps_page(self):
+        replies = [{"ts": f"100.{n:06d}", "text": f"reply {n}", "user": "U1"} for n in range(1, 151)]
+        self.notion.blocks.children.append.side_effect = Exception("timeout")
+        outcome = psm._write_thread_replies(Mock(), "C1", "general", "100.000000", replies, None, False)
+        self.assertTrue(outcome["incomplete"])
+        self.assertEqual(outcome["processed"], 99)
+        self.assertEqual(self.tracker.get_thread_page("C1", "100.000000"), "idea-1")
+
+        self.notion.blocks.children.append.side_effect = None
+        self.notion.blocks.children.append.reset_mock()
+        outcome = psm._write_thread_replies(Mock(), "C1", "general", "100.000000", replies, None, False)
+        self.create_idea.assert_called_once()
+        self.assertEqual(len(self._appended_blocks()), 51)
+        self.assertEqual((outcome["processed"], outcome["skipped"]), (51, 99))
+
+    def test_failed_chunk_appends_only_unwritten_replies(self):
+        self.tracker.set_thread_page("C1", "100.000000", "idea-1")
+        replies = [{"ts": f"100.{n:06d}", "text": f"reply {n}", "user": "U1"} for n in range(1, 251)]
+        self.notion.blocks.children.append.side_effect = [None, Exception("timeout")]
+        psm._write_thread_replies(Mock(), "C1", "general", "100.000000", replies, None, False)
+
+        self.notion.blocks.children.append.side_effect = None
+        self.notion.blocks.children.append.reset_mock()
+        outcome = psm._write_thread_replies(Mock(), "C1", "general", "100.000000", replies, None, False)
+        self.assertEqual(self.notion.blocks.children.append.call_count, 2)
+        self.assertEqual(self._appended_blocks()[0]["paragraph"]["rich_text"][0]["text"]["content"], "Ana: reply 101")
+        self.assertEqual(outcome["processed"], 150)
+        self.create_idea.assert_not_called()
+
+    def test_failed_thread_write_is_retried_next_sweep(self):
+        self.create_idea.side_effect = [Exception("timeout"), {"id": "idea-1", "url": None}]
+        first = self._run()
+        self.assertEqual(first["processed"], 1)
+        self.assertEqual(self.tracker.get_high_water(["C1"]), {})
+        self.assertEqual(self.tracker.processed_ids(["C1:100.000041"]), set())
+
+        # The parent is skipped, but its unwritten thread is fetched and written
+        second = self._run()
+        self.assertEqual(second["processed"], 40)
+        self.assertEqual(second["created"], {"tasks": 0, "resources": 0, "ideas": 1})
+        self.assertEqual(self.tracker.get_high_water(["C1"]), {"C1": "100.000000"})
+
+    def test_thread_over_budget_is_retried_next_sweep(self):
+        first = self._run(max_messages=1)
+        self.assertEqual((first["processed"], first["created"]["ideas"]), (1, 0))
+        self.assertEqual(self.tracker.get_high_water(["C1"]), {})
+
+        second = self._run()
+        self.assertEqual(second["created"], {"tasks": 0, "resources": 0, "ideas": 1})
+        self.assertEqual(self.tracker.get_high_water(["C1"]), {"C1": "100.000000"})
+
+    def test_enrichment_error_releases_slot(self):
+        budget = MessageBudget(1)
+        with patch.object(psm, "resolve_mentions", side_effect=Exception("slack down")):
+            outcome = psm._write_thread_replies(Mock(), "C1", "general", "100.000000", self.replies[:3], budget, False)
+        self.assertTrue(outcome["incomplete"])
+        self.assertEqual((budget.used, budget.reserved), (0, 0))
+
+    def test_per_reply_mode(self):
+        with patch.object(psm, "_process_thread_reply", wraps=psm._process_thread_reply) as per_reply:
+            result = self._run(aggregate_threads=False)
+        self.assertEqual(per_reply.call_count, 9)
+        self.assertEqual(result["created"]["ideas"], 9)
+
+
+class TestGetMessagesSince(unittest.TestCase):
+    """Test incremental history fetches."""
+
+    def _client(self, pages):
+        client = Mock()
+        client.conversations_history.side_effect = pages
+        return client
+
+    def test_new_messages_after_mark(self):
+        client = self._client([{"ok": True, "messages": [
+            {"type": "message", "ts": "12.0", "text": "hi"},
+            {"type": "message", "ts": "13.0", "bot_id": "B1", "text": "bot"},
+        ]}])
+        with patch.object(history, "get_slack_client", return_value=client):
+            result = history.get_messages_since("C1", "11.0")
+        client.conversations_history.assert_called_once_with(channel="C1", limit=200, oldest="11.0")
+        self.assertEqual([m["ts"] for m in result["all"]], ["12.0"])
+        self.assertEqual(result["high_water_ts"], "13.0")
+        self.assertTrue(result["complete"])
+
+    def test_backlog_synced_oldest_first(self):
+        client = self._client([
+            {"ok": True, "messages": [{"type": "message", "ts": "15.0"}, {"type": "message", "ts": "14.0"}],
+             "response_metadata": {"next_cursor": "more"}},
+            {"ok": True, "messages": [{"type": "message", "ts": "13.0"}, {"type": "message", "ts": "12.0"}]},
+        ])
+        with patch.object(history, "get_slack_client", return_value=client):
+            result = history.get_messages_since("C1", "11.0", limit=3)
+        # The oldest messages after the mark, so the mark closes the gap behind it
+        self.assertEqual([m["ts"] for m in result["all"]], ["14.0", "13.0", "12.0"])
+        self.assertEqual(result["high_water_ts"], "14.0")
+        self.assertTrue(result["complete"])
+
+    def test_nothing_new_keeps_mark(self):
+        client = self._client([{"ok": True, "messages": []}])
+        with patch.object(history, "get_slack_client", return_value=client):
+            result = history.get_messages_since("C1", "11.0")
+        self.assertEqual(result, {"all": [], "high_water_ts": "11.0", "complete": True})
+
+
+class TestMessageTracker(unittest.TestCase):
+    """Test batched marks and bulk lookups on the persistent connection."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.tracker = MessageTracker(os.path.join(self.tmpdir.name, "sessions.db"))
+        self.addCleanup(self.tracker.close)
+
+    def test_bulk_lookup(self):
+        self.tracker.mark("C1:1.0", "C1", "1.0")
+        self.tracker.mark("C1:2.0", "C1", "2.0", "page-1", "task")
+        ids = [f"C1:{n}.0" for n in range(1000)]
+        self.assertEqual(self.tracker.processed_ids(ids), {"C1:1.0", "C1:2.0"})
+
+    def test_batch_buffers_until_flush(self):
+        with self.tracker.batch():
+            self.tracker.mark("C1:1.0", "C1", "1.0")
+            # Visible to lookups before it is written
+            self.assertTrue(self.tracker.is_processed("C1:1.0"))
+            other = MessageTracker(self.tracker.db_path)
+            self.assertFalse(other.is_processed("C1:1.0"))
+            self.tracker.flush()
+            self.assertTrue(other.is_processed("C1:1.0"))
+            self.tracker.mark("C1:2.0", "C1", "2.0")
+        self.assertTrue(other.is_processed("C1:2.0"))
+        other.close()
+
+    def test_batch_is_per_thread(self):
+        other = MessageTracker(self.tracker.db_path)
+        with self.tracker.batch():
+            worker = threading.Thread(target=self.tracker.mark, args=("C1:1.0", "C1", "1.0"))
+            worker.start()
+            worker.join()
+            self.assertTrue(other.is_processed("C1:1.0"))
+        other.close()
+
+    def test_flush_commits_only_own_thread_marks(self):
+        other = MessageTracker(self.tracker.db_path)
+        self.addCleanup(other.close)
+        seen = []
+
+        def worker():
+            with self.tracker.batch():
+                self.tracker.mark("C1:2.0", "C1", "2.0")
+                seen.append(self.tracker.is_processed("C1:1.0"))
+
+        with self.tracker.batch():
+            self.tracker.mark("C1:1.0", "C1", "1.0")
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            # The worker's batch ended without committing this thread's mark
+            self.assertTrue(other.is_processed("C1:2.0"))
+            self.assertFalse(other.is_processed("C1:1.0"))
+        self.assertEqual(seen, [True])
+        self.assertTrue(other.is_processed("C1:1.0"))
+
+    def test_high_water_only_moves_forward(self):
+        self.tracker.advance_high_water("C1", "1712345678.000200")
+        self.tracker.advance_high_water("C1", "1712345678.000100")
+        self.assertEqual(self.tracker.get_high_water(["C1", "C2"]), {"C1": "1712345678.000200"})
+        self.tracker.reset_high_water("C1")
+        self.assertEqual(self.tracker.get_high_water(["C1"]), {})
+
+    def test_sweep_uses_few_transactions(self):
+        statements = []
+        self.tracker._conn.set_trace_callback(statements.append)
+        with self.tracker.batch():
+            for conv in range(5):
+                self.tracker.processed_ids(f"C{conv}:{n}.0" for n in range(100))
+                for n in range(100):
+                    self.tracker.mark(f"C{conv}:{n}.0", f"C{conv}", f"{n}.0")
+                self.tracker.flush()
+        self.assertEqual(sum(1 for statement in statements if statement.startswith("COMMIT")), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+"""Tests for the Socket Mode listener, against a local fake Socket Mode server."""
+
+import sys
+import os
+import base64
+import hashlib
+import importlib
+import json
+import socket
+import struct
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+from slack_sdk import WebClient
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+# The package re-exports the function under the module's name
+psm = importlib.import_module("task_management.tools.slack_inbox_agent.process_slack_messages")
+from task_management.tools.slack_inbox_agent import message_tracker
+from task_management.tools.slack_inbox_agent.message_tracker import MessageTracker
+from task_management.tools.slack_inbox_agent.socket_listener import SlackSocketListener
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class FakeSocketModeServer:
+    """apps.connections.open over HTTP plus a minimal WebSocket endpoint.
+
+    Pushes envelopes to the connected client and records the envelope IDs it
+    acknowledges.
+    """
+
+    def __init__(self):
+        self.acks = []
+        self._client_sock = None
+        self._send_lock = threading.Lock()
+        self._closed = False
+
+        self.ws_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.ws_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.ws_server.bind(("127.0.0.1", 0))
+        self.ws_server.listen(1)
+        ws_url = f"ws://127.0.0.1:{self.ws_server.getsockname()[1]}/link/?ticket=test"
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                body = json.dumps({"ok": True, "url": ws_url}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.http_server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.api_url = f"http://127.0.0.1:{self.http_server.server_address[1]}/api/"
+        threading.Thread(target=self.http_server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while not self._closed:
+            try:
+                sock, _ = self.ws_server.accept()
+            except OSError:
+                return
+            request = b""
+            while b"\r\n\r\n" not in request:
+                request += sock.recv(1024)
+            key = next(
+                line.split(":", 1)[1].strip()
+                for line in request.decode().split("\r\n")
+                if line.lower().startswith("sec-websocket-key")
+            )
+            accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+            sock.sendall((
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode())
+            self._client_sock = sock
+            threading.Thread(target=self._read, args=(sock,), daemon=True).start()
+
+    def _recv_exact(self, sock, size):
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    def _read(self, sock):
+        try:
+            while True:
+                first, second = self._recv_exact(sock, 2)
+                opcode = first & 0x0F
+                length = second & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", self._recv_exact(sock, 2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", self._recv_exact(sock, 8))[0]
+                mask = self._recv_exact(sock, 4) if second & 0x80 else b"\x00" * 4
+                payload = bytes(b ^ mask[i % 4] for i, b in enumerate(self._recv_exact(sock, length)))
+                if opcode == 0x1:
+                    self.acks.append(json.loads(payload)["envelope_id"])
+                elif opcode == 0x9:
+                    self._send_frame(0xA, payload)
+                elif opcode == 0x8:
+                    return
+        except (ConnectionError, OSError):
+            return
+
+    def _send_frame(self, opcode, payload):
+        header = bytes([0x80 | opcode])
+        if len(payload) < 126:
+            header += bytes([len(payload)])
+        elif len(payload) < 65536:
+            header += bytes([126]) + struct.pack("!H", len(payload))
+        else:
+            header += bytes([127]) + struct.pack("!Q", len(payload))
+        with self._send_lock:
+            self._client_sock.sendall(header + payload)
+
+    def connected(self):
+        return self._client_sock is not None
+
+    def send_event(self, envelope_id, event):
+        envelope = {
+            "envelope_id": envelope_id,
+            "type": "events_api",
+            "accepts_response_payload": False,
+            "payload": {"type": "event_callback", "event": event},
+        }
+        self._send_frame(0x1, json.dumps(envelope).encode())
+
+    def close(self):
+        self._closed = True
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        self.ws_server.close()
+        if self._client_sock is not None:
+            self._client_sock.close()
+
+
+def _message(ts, text, **extra):
+    return {"type": "message", "channel": "C1", "channel_type": "channel", "user": "U1", "ts": ts, "text": text, **extra}
+
+
+class TestSlackSocketListener(unittest.TestCase):
+    """Events from the fake server flow through the inbox pipeline.
+
+    One server and listener are shared by the class (closing a Socket Mode
+    client takes a few seconds); tests use distinct message timestamps.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.tracker = MessageTracker(os.path.join(cls.tmpdir.name, "sessions.db"))
+        cls.created_tasks = []
+        cls.created_ideas = []
+        cls.patchers = [patch.object(message_tracker, "_tracker", cls.tracker)]
+        patches = {
+            "_get_user_name": Mock(return_value="Ana"),
+            "classify_slack_message": Mock(return_value={"classification": "TASK", "confidence": 0.9, "urls": []}),
+            "create_task": lambda name, status: cls._record(cls.created_tasks, name),
+            "create_idea": lambda title, **kwargs: cls._record(cls.created_ideas, title),
+            "get_notion_client": Mock(),
+        }
+        cls.patchers.extend(patch.object(psm, name, value) for name, value in patches.items())
+        for patcher in cls.patchers:
+            patcher.start()
+
+        cls.slack = Mock()
+        cls.slack.conversations_info.return_value = {"ok": True, "channel": {"id": "C1", "name": "general"}}
+        cls.server = FakeSocketModeServer()
+        cls.listener = SlackSocketListener(
+            app_token="xapp-test",
+            web_client=WebClient(base_url=cls.server.api_url),
+            client=cls.slack
+        )
+        cls.listener.start()
+        assert _wait_for(cls.server.connected)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.listener.stop(5)
+        cls.server.close()
+        for patcher in reversed(cls.patchers):
+            patcher.stop()
+        cls.tracker.close()
+        cls.tmpdir.cleanup()
+
+    @staticmethod
+    def _record(items, title):
+        items.append(title)
+        return {"id": f"page-{len(items)}", "url": None}
+
+    def setUp(self):
+        self.created_tasks.clear()
+        self.created_ideas.clear()
+        self.server.acks.clear()
+        self.before = self.listener.get_stats()
+
+    def _delta(self, key):
+        return self.listener.get_stats()[key] - self.before[key]
+
+    def test_events_are_acknowledged_and_processed(self):
+        ts = f"{time.time():.6f}"
+        self.server.send_event("env-1", _message(ts, "Send the deck to Ana"))
+        self.assertTrue(_wait_for(lambda: self._delta("processed") == 1))
+
+        self.assertEqual(self.server.acks, ["env-1"])
+        self.assertEqual(len(self.created_tasks), 1)
+        self.assertTrue(message_tracker.is_message_processed(f"C1:{ts}"))
+        self.assertLess(self.listener.get_stats()["max_latency_seconds"], 5)
+
+    def test_thread_replies_bots_and_edits(self):
+        self.server.send_event("env-2", _message("200.000001", "Follow up", thread_ts="199.000001"))
+        self.server.send_event("env-3", _message("200.000002", "deploy done", bot_id="B1"))
+        self.server.send_event("env-4", _message("200.000003", "edited", subtype="message_changed"))
+        self.assertTrue(_wait_for(lambda: len(self.server.acks) == 3))
+        self.assertTrue(self.listener.wait_until_idle())
+
+        self.assertEqual(self.created_ideas, ["Slack Thread: Follow up"])
+        self.assertEqual(self.created_tasks, [])
+        self.assertEqual((self._delta("processed"), self._delta("ignored")), (1, 2))
+
+    def test_redelivered_event_is_deduplicated(self):
+        event = _message("300.000001", "Review the roadmap")
+        self.server.send_event("env-5", event)
+        self.assertTrue(_wait_for(lambda: self._delta("processed") == 1))
+        self.server.send_event("env-5", event)
+        self.assertTrue(_wait_for(lambda: len(self.server.acks) == 2))
+        self.assertTrue(self.listener.wait_until_idle())
+
+        self.assertEqual(len(self.created_tasks), 1)
+        self.assertEqual(self._delta("skipped"), 1)
+        # Channel names are looked up once per process
+        self.slack.conversations_info.assert_called_once_with(channel="C1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for lazy agent startup and the startup benchmark."""
+
+import sys
+import os
+import subprocess
+import unittest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common.lazy_tools import CALLABLE_TOOLS_SUPPORTED
+from tools.common.startup_benchmark import PROJECT_ROOT, parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:       200 |        300 | site
+import time:        50 |         50 |       openai._client
+import time:       400 |        450 |     openai
+import time:       300 |        750 |   agno.agent
+import time:        20 |         20 |   tools.common.visual_formatter
+import time:        30 |        800 | main
+import time:        10 |         10 | gc
+"""
+
+
+class TestParseImporttime(unittest.TestCase):
+    """-X importtime output is attributed to the packages main pulls in."""
+
+    def test_total_and_packages(self):
+        parsed = parse_importtime(IMPORTTIME)
+        self.assertEqual(parsed["total_ms"], 0.8)
+        self.assertEqual(parsed["packages"], [("openai", 0.45), ("agno", 0.3), ("main", 0.03), ("tools", 0.02)])
+
+    def test_missing_module(self):
+        with self.assertRaises(ValueError):
+            parse_importtime(IMPORTTIME, module="other")
+
+
+@unittest.skipUnless(CALLABLE_TOOLS_SUPPORTED, "agno without callable tool factories loads tools eagerly")
+class TestLazyAgents(unittest.TestCase):
+    """Importing main builds the team without importing any agent's tools."""
+
+    def test_import_main_skips_tool_modules(self):
+        script = (
+            "import sys, main\n"
+            "print(sorted(name for name in sys.modules if name.startswith('task_management.tools')))"
+        )
+        result = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_agents_share_storage_and_load_budgeted_tools_on_demand(self):
+        from task_management.agents import orchestrator_team
+
+        members = orchestrator_team.members
+        self.assertEqual(len({id(member.db) for member in members} | {id(orchestrator_team.db)}), 1)
+        for member in members:
+            tools = member.tools()
+            self.assertTrue(tools, member.name)
+            self.assertTrue(all(callable(tool) for tool in tools), member.name)
+            self.assertTrue(all(hasattr(tool, "request_budget") for tool in tools), member.name)
+
+
+class TestInstructionsCache(unittest.TestCase):
+    """Instructions are read from disk once per agent."""
+
+    def test_cached(self):
+        from tools.common import load_agent_instructions
+
+        first = load_agent_instructions("inbox_agent")
+        hits = load_agent_instructions.cache_info().hits
+        self.assertIs(load_agent_instructions("inbox_agent"), first)
+        self.assertEqual(load_agent_instructions.cache_info().hits, hits + 1)
+        self.assertIn("Rajiv Context", first)
+
+
+if __name__ == "__main__":
+    unittest.main()
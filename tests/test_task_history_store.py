@@ -0,0 +1,126 @@
+"""Tests for the columnar task history store used by the productivity tools."""
+
+import sys
+import os
+import importlib
+import time
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from task_management.tools.productivity_analysis_agent.task_history_store import (
+    TaskHistoryColumns,
+    period_label,
+)
+from task_management.tools.productivity_analysis_agent.calculate_productivity_metrics import calculate_productivity_metrics
+from task_management.tools.productivity_analysis_agent.analyze_time_patterns import analyze_time_patterns
+from task_management.tools.productivity_analysis_agent.identify_bottlenecks import identify_bottlenecks
+
+
+def _task(status, created, completed=None, due=None, project="p1", title="t"):
+    return {
+        "title": title,
+        "status": status,
+        "created_time": f"{created}T10:00:00.000Z",
+        "completed_date": completed,
+        "due_date": due,
+        "project_ids": [project] if project else [],
+        "waiting": [],
+    }
+
+
+TASKS = [
+    _task("Done", "2026-03-02", completed="2026-03-04"),             # Monday -> Wednesday
+    _task("Done", "2026-03-03", completed="2026-03-10"),             # next week, Tuesday
+    _task("Done", "2026-02-27", completed="2026-03-04"),             # March, Wednesday
+    _task("Active", "2026-03-05", due="2026-03-01", project=None),
+    _task("Waiting", "2026-03-01"),
+]
+
+
+class TestColumns(unittest.TestCase):
+    """Test column construction and group-bys."""
+
+    def test_cycle_times_and_percentiles(self):
+        columns = TaskHistoryColumns(TASKS)
+        self.assertEqual(sorted(columns.cycle_times()), [2, 5, 7])
+        self.assertEqual(columns.cycle_time_percentiles((50, 90)), {"p50": 5, "p90": 6.6})
+
+    def test_completions_by_period(self):
+        columns = TaskHistoryColumns(TASKS)
+        weeks = {period_label(start, "week"): count for start, count in columns.completions_by_period("week").items()}
+        self.assertEqual(weeks, {"2026-03-02": 2, "2026-03-09": 1})
+        self.assertEqual(dict(columns.completions_by_weekday()), {2: 2, 1: 1})
+
+    def test_period_rows_skip_invalid_completed_date(self):
+        tasks = TASKS + [_task("Done", "2026-03-02", completed="not a date")]
+        columns = TaskHistoryColumns(tasks)
+        rows = [i for group in columns.period_rows("day").values() for i in group]
+        self.assertEqual(sorted(rows), [0, 1, 2, 3, 4])
+
+    def test_aging(self):
+        columns = TaskHistoryColumns(TASKS)
+        self.assertEqual(columns.overdue_aging(date(2026, 3, 11)), [(3, 10)])
+        self.assertEqual(columns.waiting_aging(date(2026, 3, 11)), [(4, 10)])
+
+    def test_report_parses_tasks_once(self):
+        report_module = importlib.import_module(
+            "task_management.tools.productivity_analysis_agent.generate_productivity_report"
+        )
+        with patch.object(report_module, "get_task_history", return_value={"tasks": TASKS}), \
+                patch.object(report_module, "get_project_history", return_value={"projects": []}), \
+                patch.object(report_module, "TaskHistoryColumns", wraps=TaskHistoryColumns) as build:
+            report = report_module.generate_productivity_report(period="week")
+        build.assert_called_once_with(TASKS)
+        self.assertEqual(report["summary"]["completed_tasks"], 3)
+        self.assertEqual(report["time_analysis"]["patterns"]["most_productive_day"], "Wednesday")
+
+
+class TestToolOutput(unittest.TestCase):
+    """Test that the tools keep their output shape."""
+
+    def test_metrics_by_week(self):
+        result = calculate_productivity_metrics(TASKS, period="week")
+        self.assertEqual(result["metrics_by_period"]["2026-03-02"], {
+            "total_tasks": 3,
+            "completed_tasks": 2,
+            "completion_rate": 2 / 3,
+            "avg_time_to_complete_days": 3.5,
+        })
+        self.assertEqual(result["overall_metrics"]["completed_tasks"], 3)
+        self.assertEqual(result["overall_metrics"]["min_time_to_complete_days"], 2)
+
+    def test_time_patterns(self):
+        result = analyze_time_patterns(TASKS)
+        self.assertEqual(result["day_of_week_patterns"], {"Tuesday": 1, "Wednesday": 2})
+        self.assertEqual(result["most_productive_day"], "Wednesday")
+        self.assertEqual(result["monthly_trends"]["monthly_counts"], {"2026-03": 3})
+        self.assertEqual(result["weekly_trends"]["trend"], "declining")
+
+    def test_bottlenecks(self):
+        result = identify_bottlenecks(TASKS, [])
+        self.assertEqual(len(result["waiting_tasks"]), 1)
+        self.assertIn("waiting_days", result["waiting_tasks"][0])
+        self.assertEqual(result["overdue_tasks"][0]["due_date"], "2026-03-01")
+        self.assertEqual(result["overdue_tasks"][0]["status"], "Active")
+
+    def test_multi_year_report_is_fast(self):
+        start = date(2022, 1, 1)
+        tasks = []
+        for i in range(20000):
+            created = start + timedelta(days=i % 1400)
+            tasks.append(_task("Done" if i % 3 else "Active", created.isoformat(),
+                               completed=(created + timedelta(days=i % 20)).isoformat() if i % 3 else None,
+                               project=f"p{i % 40}"))
+        began = time.perf_counter()
+        for period in ("day", "week", "month"):
+            calculate_productivity_metrics(tasks, period=period)
+        analyze_time_patterns(tasks)
+        self.assertLess(time.perf_counter() - began, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
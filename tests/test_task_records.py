@@ -0,0 +1,74 @@
+"""Tests for field projection in extract_task_properties.py and task_records.py."""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from task_management.tools.task_manager_agent import task_records
+from task_management.tools.task_manager_agent.extract_task_properties import extract_task_properties, TASK_FIELDS
+from task_management.tools.task_manager_agent.task_records import TaskRecord, load_task_records, project_task
+
+
+PAGE = {
+    "id": "t1",
+    "url": "https://notion.so/t1",
+    "created_time": "2026-01-01T09:00:00.000Z",
+    "last_edited_time": "2026-01-02T09:00:00.000Z",
+    "properties": {
+        "Task": {"title": [{"plain_text": "Write "}, {"plain_text": "spec"}]},
+        "Status": {"status": {"name": "Done"}},
+        "Due": {"date": {"start": "2026-01-05"}},
+        "Completed": {"date": {"start": "2026-01-04"}},
+        "Project": {"relation": [{"id": "p1"}]},
+        "Waiting": {"multi_select": [{"name": "Ana"}]},
+    },
+}
+
+
+class TestProjection(unittest.TestCase):
+    """Test that projections match the full extraction."""
+
+    def test_full_extraction_unchanged(self):
+        self.assertEqual(extract_task_properties(PAGE), {
+            "id": "t1",
+            "url": "https://notion.so/t1",
+            "title": "Write spec",
+            "status": "Done",
+            "due_date": "2026-01-05",
+            "completed_date": "2026-01-04",
+            "project_ids": ["p1"],
+            "waiting": ["Ana"],
+            "created_time": "2026-01-01T09:00:00.000Z",
+            "last_edited_time": "2026-01-02T09:00:00.000Z",
+        })
+
+    def test_subset(self):
+        self.assertEqual(extract_task_properties(PAGE, fields=["status", "project_ids"]),
+                         {"status": "Done", "project_ids": ["p1"]})
+
+    def test_record_matches_dict(self):
+        record = project_task(PAGE, TASK_FIELDS)
+        self.assertEqual(record.to_dict(), extract_task_properties(PAGE))
+
+    def test_record_is_slotted(self):
+        record = project_task(PAGE, ["status"])
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertIsNone(record.title)
+
+    @patch.object(task_records, "iter_database", return_value=iter([PAGE]))
+    def test_load_parses_only_declared_fields(self, mock_iter):
+        with patch.dict(task_records.TASK_FIELD_EXTRACTORS, {"title": lambda page: self.fail("title parsed")}):
+            records = load_task_records(["id", "status"])
+        self.assertEqual(records, [TaskRecord(id="t1", status="Done")])
+
+    def test_unknown_field_rejected(self):
+        with self.assertRaises(ValueError):
+            load_task_records(["nope"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""Tests for the run-scoped task snapshot (tools/common/notion_snapshot.py, task_snapshot.py)."""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from notion_client import Client
+from tools.common import notion_snapshot, query_database_complete, TASKS_DATA_SOURCE_ID
+from tools.common.notion_client import ScheduledClient
+from tools.common.notion_snapshot import snapshot_run, invalidate_snapshot
+from task_management.tools.task_manager_agent.task_snapshot import get_task_snapshot
+
+
+def task_page(page_id, title, status, due=None, project_ids=()):
+    """Build a raw Notion task page."""
+    return {
+        "id": page_id,
+        "properties": {
+            "Task": {"type": "title", "title": [{"plain_text": title}]},
+            "Status": {"type": "status", "status": {"name": status}},
+            "Due": {"type": "date", "date": {"start": due} if due else None},
+            "Project": {"type": "relation", "relation": [{"id": pid} for pid in project_ids]},
+        },
+    }
+
+
+def project_page(page_id, name, priority):
+    """Build a raw Notion project page."""
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": name}]},
+            "Priority": {"type": "select", "select": {"name": priority}},
+        },
+    }
+
+
+TASKS = [
+    task_page("t1", "Ship deck", "Top Priority", "2026-01-05", ["p1"]),
+    task_page("t2", "Call Ana", "Waiting", None, ["p1"]),
+    task_page("t3", "Old thing", "Done", "2026-01-01", ["p2"]),
+    task_page("t4", "Plan offsite", "Backlog", "2026-01-03"),
+    task_page("t5", "Review doc", "This Week", "2026-02-01", ["p2"]),
+]
+
+PROJECTS = [project_page("p1", "Launch", "P1"), project_page("p2", "Hiring", "P3")]
+
+
+def fake_query(database_id):
+    return list(TASKS if database_id == TASKS_DATA_SOURCE_ID else PROJECTS)
+
+
+class SnapshotTestCase(unittest.TestCase):
+    """Serve fixed pages in place of the replica / Notion."""
+
+    def setUp(self):
+        self.replica_patch = patch("tools.common.notion_replica.query_replica", side_effect=lambda ds, **kw: fake_query(ds))
+        self.replica = self.replica_patch.start()
+        invalidate_snapshot()
+
+    def tearDown(self):
+        self.replica_patch.stop()
+        invalidate_snapshot()
+
+
+class TestSnapshotRun(SnapshotTestCase):
+    """Test query_database_complete() inside a snapshot run."""
+
+    def test_queries_share_one_fetch(self):
+        with snapshot_run():
+            waiting = query_database_complete(
+                TASKS_DATA_SOURCE_ID,
+                filter_dict={"property": "Status", "status": {"equals": "Waiting"}},
+                use_data_source=True
+            )
+            not_done = query_database_complete(
+                TASKS_DATA_SOURCE_ID,
+                filter_dict={"property": "Status", "status": {"does_not_equal": "Done"}},
+                use_data_source=True
+            )
+        self.assertEqual([p["id"] for p in waiting], ["t2"])
+        self.assertEqual(len(not_done), 4)
+        self.assertEqual(self.replica.call_count, 1)
+
+    def test_outside_run_not_cached(self):
+        query_database_complete(TASKS_DATA_SOURCE_ID, use_data_source=True)
+        query_database_complete(TASKS_DATA_SOURCE_ID, use_data_source=True)
+        self.assertEqual(self.replica.call_count, 2)
+        self.assertFalse(notion_snapshot.is_snapshot_active())
+
+    def test_invalidation_refetches(self):
+        with snapshot_run():
+            query_database_complete(TASKS_DATA_SOURCE_ID, use_data_source=True)
+            invalidate_snapshot()
+            query_database_complete(TASKS_DATA_SOURCE_ID, use_data_source=True)
+        self.assertEqual(self.replica.call_count, 2)
+
+    def test_invalidation_during_fetch_not_cached(self):
+        def invalidating_query(ds, **kw):
+            # A write lands while the pages are being fetched
+            invalidate_snapshot()
+            return fake_query(ds)
+
+        self.replica.side_effect = invalidating_query
+        with snapshot_run():
+            pages = notion_snapshot.get_snapshot_pages(TASKS_DATA_SOURCE_ID)
+            self.assertEqual(len(pages), len(TASKS))
+            self.assertEqual(notion_snapshot._pages, {})
+
+    def test_unsupported_filter_skips_snapshot(self):
+        with snapshot_run():
+            query_database_complete(
+                TASKS_DATA_SOURCE_ID,
+                filter_dict={"property": "Estimate", "number": {"greater_than": 3}},
+                use_data_source=True
+            )
+        # Falls straight through to the replica without filling the snapshot
+        self.assertEqual(self.replica.call_count, 1)
+        self.assertEqual(notion_snapshot._pages, {})
+
+
+class TestTaskSnapshot(SnapshotTestCase):
+    """Test the parsed, indexed view."""
+
+    def test_indexes(self):
+        with snapshot_run():
+            snapshot = get_task_snapshot()
+            self.assertIs(get_task_snapshot(), snapshot)
+
+        self.assertEqual([t["id"] for t in snapshot.tasks_with_status("Top Priority", "This Week")], ["t1", "t5"])
+        self.assertEqual([t["id"] for t in snapshot.tasks_for_project("p-1")], ["t1", "t2"])
+        self.assertEqual([t["id"] for t in snapshot.overdue_tasks("2026-01-04")], ["t4"])
+        self.assertEqual(snapshot.get_project("p1")["title"], "Launch")
+        self.assertEqual(snapshot.get_task("t3")["status"], "Done")
+
+    @patch.object(Client, "request", return_value={})
+    def test_page_write_invalidates(self, mock_request):
+        client = ScheduledClient(auth="test")
+        with snapshot_run():
+            first = get_task_snapshot()
+            client.pages.retrieve(page_id="t1")
+            self.assertIs(get_task_snapshot(), first)
+            client.pages.update(page_id="t1", properties={})
+            self.assertIsNot(get_task_snapshot(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Tests for the task title index behind action-item duplicate detection."""
+
+import sys
+import os
+import importlib
+import random
+import unittest
+from difflib import SequenceMatcher
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common.notion_snapshot import snapshot_run
+from task_management.tools.task_manager_agent.get_action_items_for_review import extract_keywords
+from task_management.tools.task_manager_agent.task_title_index import TaskTitleIndex
+
+# The package re-exports the functions under the modules' names
+duplicates = importlib.import_module("task_management.tools.task_manager_agent.check_action_item_duplicates")
+review = importlib.import_module("task_management.tools.task_manager_agent.get_action_items_for_review")
+from_action_item = importlib.import_module("task_management.tools.task_manager_agent.create_task_from_action_item")
+title_index = importlib.import_module("task_management.tools.task_manager_agent.task_title_index")
+
+WORDS = [
+    "review", "budget", "planning", "plan", "hiring", "roadmap", "customer", "pricing", "deck",
+    "send", "email", "paolo", "reid", "quarterly", "launch", "(ab)", "q4", "metrics", "dashboard",
+]
+
+
+def _linear_categorize(action_item, tasks):
+    """categorize_duplicates as a scan of every task (the implementation the index replaced)."""
+    keywords = extract_keywords(action_item.get("action", ""))
+    result = {"obvious_duplicates": [], "potential_duplicates": []}
+    if not keywords:
+        return result
+    seen = set()
+    action_lower = action_item["action"].lower()
+    for task in tasks:
+        task_id = task.get("id")
+        if not task_id or task_id in seen:
+            continue
+        title = task.get("title", "").lower()
+        if not title:
+            continue
+        matching = sum(1 for kw in keywords[:3] if kw.lower() in title)
+        similarity = SequenceMatcher(None, action_lower, title).ratio()
+        if matching >= 2 and similarity > 0.8:
+            result["obvious_duplicates"].append(task)
+            seen.add(task_id)
+        elif matching >= 1:
+            result["potential_duplicates"].append(task)
+            seen.add(task_id)
+    return result
+
+
+def _linear_check(action_item, tasks):
+    """check_duplicates as a scan of every task per keyword."""
+    keywords = extract_keywords(action_item.get("action", ""))
+    matches, seen = [], set()
+    for keyword in keywords[:3]:
+        for task in tasks:
+            task_id = task.get("id")
+            if task_id and task_id not in seen and keyword.lower() in task.get("title", "").lower():
+                seen.add(task_id)
+                matches.append(task)
+    return matches
+
+
+def _sentence(rng, count):
+    return " ".join(rng.choice(WORDS) for _ in range(count)).capitalize()
+
+
+class TestTaskTitleIndex(unittest.TestCase):
+    """Indexed duplicate detection returns exactly what the linear scan did."""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.tasks = [{"id": f"t{n}", "title": _sentence(rng, rng.randint(0, 5))} for n in range(400)]
+        # Duplicate IDs and missing IDs are skipped the same way
+        self.tasks.append({"id": "t3", "title": "Review budget planning"})
+        self.tasks.append({"id": None, "title": "Review budget planning"})
+        self.items = [{"action": _sentence(rng, rng.randint(1, 6))} for _ in range(150)]
+        self.items += [{"action": ""}, {"action": "a to do"}, {"action": "(ab) plan"}]
+        # Near-identical titles make obvious duplicates
+        self.tasks.append({"id": "near", "title": "Send quarterly budget deck to Reid"})
+        self.items.append({"action": "send quarterly budget deck to reid"})
+
+    def test_categorize_matches_linear_scan(self):
+        index = TaskTitleIndex(self.tasks)
+        for item in self.items:
+            with self.subTest(action=item["action"]):
+                self.assertEqual(duplicates.categorize_duplicates(item, index), _linear_categorize(item, self.tasks))
+        obvious = duplicates.categorize_duplicates(self.items[-1], index)["obvious_duplicates"]
+        self.assertIn("near", [task["id"] for task in obvious])
+
+    def test_check_duplicates_matches_linear_scan(self):
+        index = TaskTitleIndex(self.tasks)
+        for item in self.items:
+            with self.subTest(action=item["action"]):
+                self.assertEqual(review.check_duplicates(item, index), _linear_check(item, self.tasks))
+
+    def test_plain_task_lists_still_accepted(self):
+        item = {"action": "Review the budget planning"}
+        self.assertEqual(duplicates.categorize_duplicates(item, self.tasks), _linear_categorize(item, self.tasks))
+
+    def test_only_shortlisted_tasks_are_scored(self):
+        index = TaskTitleIndex(self.tasks)
+        with patch.object(duplicates, "SequenceMatcher", wraps=SequenceMatcher) as matcher:
+            duplicates.categorize_duplicates({"action": "Review quarterly hiring roadmap"}, index)
+        self.assertLess(matcher.call_count, len(self.tasks) // 4)
+
+    def test_add_updates_lookups(self):
+        index = TaskTitleIndex([{"id": "a", "title": "Plan offsite"}])
+        self.assertEqual(index.positions_containing("budget"), [])
+        index.add({"id": "b", "title": "Budget review"})
+        self.assertEqual(index.positions_containing("budget"), [1])
+        self.assertEqual(index.positions_containing("an"), [0])
+
+
+class TestIndexLifecycle(unittest.TestCase):
+    """The index is shared within a snapshot run and grows as tasks are created."""
+
+    def test_created_task_is_added(self):
+        index = TaskTitleIndex()
+        page = {
+            "id": "new-task",
+            "properties": {"Task": {"title": [{"plain_text": "Send pricing deck"}]}},
+        }
+        with patch.object(from_action_item, "create_task", return_value=page):
+            from_action_item.create_task_from_action_item({"action": "Send pricing deck"}, task_index=index)
+
+        categories = duplicates.categorize_duplicates({"action": "Send the pricing deck"}, index)
+        self.assertEqual([task["id"] for task in categories["obvious_duplicates"]], ["new-task"])
+
+    def test_snapshot_run_reuses_index(self):
+        snapshot = Mock()
+        snapshot.tasks_without_status.return_value = [{"id": "a", "title": "Plan offsite"}]
+        with snapshot_run(), patch.object(title_index, "get_task_snapshot", return_value=snapshot):
+            first = title_index.get_open_task_index()
+            self.assertIs(title_index.get_open_task_index(), first)
+            snapshot.tasks_without_status.assert_called_once_with("Done")
+
+        rebuilt = Mock()
+        rebuilt.tasks_without_status.return_value = []
+        with snapshot_run(), patch.object(title_index, "get_task_snapshot", return_value=rebuilt):
+            self.assertIsNot(title_index.get_open_task_index(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+"""Tests for the local transcript search index in tools/common/transcript_index.py."""
+
+import sys
+import os
+import importlib
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import page_cache, transcript_index
+from tools.common.transcript_index import (
+    sync_transcript_index,
+    search_transcript_index,
+    index_missing_bodies,
+    get_index_stats,
+)
+
+# The packages re-export the functions under the modules' names
+search_module = importlib.import_module("tools.notion.search_transcripts")
+service_module = importlib.import_module("tools.notion.transcript_service")
+candidates_module = importlib.import_module("task_management.tools.interview_assistant_agent.find_candidate_transcripts")
+
+
+def _rich_text(text):
+    return [{"plain_text": text}] if text else []
+
+
+def make_transcript(page_id, name, date, attendees="", notes="", edited="2026-01-10T10:00:00.000Z", **extra):
+    page = {
+        "id": page_id,
+        "last_edited_time": edited,
+        "properties": {
+            "Name": {"title": _rich_text(name)},
+            "Date": {"date": {"start": date} if date else None},
+            "Attendees": {"rich_text": _rich_text(attendees)},
+            "Notes": {"rich_text": _rich_text(notes)},
+            "URL": {"url": f"https://meet.example.com/{page_id}"},
+        },
+    }
+    page.update(extra)
+    return page
+
+
+TRANSCRIPTS = [
+    make_transcript("t1", "Pricing review", "2026-01-05", "Reid, Paolo", "Agreed to raise enterprise pricing."),
+    make_transcript("t2", "Interview: Aida", "2026-01-08", "Aida Smith, Rajiv", "Strong systems design."),
+    make_transcript("t3", "Weekly sync", "2026-01-12", "Paolo", "Roadmap discussion; Aida mentioned as referral."),
+    make_transcript("t4", "Offsite planning", "2025-12-20", "Reid", "Venue shortlist."),
+    make_transcript("t5", "Undated chat", None, "Reid", "No date on this one."),
+]
+
+
+class TranscriptIndexTestCase(unittest.TestCase):
+    """Point the index and page cache at throwaway databases and mock Notion."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        patches = [
+            patch.object(transcript_index, "get_db_path",
+                         return_value=os.path.join(self.tmpdir.name, "transcript_index.db")),
+            patch.object(page_cache, "get_db_path",
+                         return_value=os.path.join(self.tmpdir.name, "page_cache.db")),
+        ]
+        for path_patch in patches:
+            path_patch.start()
+            self.addCleanup(path_patch.stop)
+        transcript_index._conn = None
+        transcript_index._probed = False
+        transcript_index._unavailable_reason = None
+        page_cache._conn = None
+
+        self.pages = list(TRANSCRIPTS)
+        query_patch = patch("tools.common.notion_client.query_database_complete", side_effect=self._query)
+        self.query = query_patch.start()
+        self.addCleanup(query_patch.stop)
+
+    def tearDown(self):
+        for module in (transcript_index, page_cache):
+            if module._conn is not None:
+                module._conn.close()
+            module._conn = None
+        transcript_index._probed = False
+        transcript_index._unavailable_reason = None
+        self.tmpdir.cleanup()
+
+    def _query(self, data_source_id, filter_dict=None, **kwargs):
+        if filter_dict is None:
+            return list(self.pages)
+        since = filter_dict["last_edited_time"]["on_or_after"].replace("+00:00", "Z")
+        return [page for page in self.pages if page["last_edited_time"] >= since[:19]]
+
+    def ids(self, results):
+        return [result["page_id"] for result in results]
+
+
+class TestSearch(TranscriptIndexTestCase):
+    """Searches match the Notion "contains" filters they replace."""
+
+    def test_keywords_search_name_notes_and_body(self):
+        page_cache.store_page_text("t4", "2026-01-10T10:00:00.000Z", "We should book the PRICING workshop.")
+        results = search_transcript_index(keywords="pricing")
+        self.assertEqual(self.ids(results), ["t1", "t4"])
+        self.assertIn("**", results[0]["snippet"])
+
+    def test_attendee_and_date_range_in_one_query(self):
+        results = search_transcript_index(attendee="reid", date_on_or_after="2026-01-01", date_before="2026-01-08")
+        self.assertEqual(self.ids(results), ["t1"])
+
+    def test_date_only_search_is_most_recent_first(self):
+        results = search_transcript_index(date_on_or_after="2025-12-01")
+        self.assertEqual(self.ids(results), ["t3", "t2", "t1", "t4"])
+        self.assertIsNone(results[0]["snippet"])
+
+    def test_name_matches_rank_above_notes_matches(self):
+        results = search_transcript_index(keywords="aida", include_attendees=True)
+        self.assertEqual(self.ids(results), ["t2", "t3"])
+
+    def test_short_terms_and_quotes(self):
+        self.assertEqual(self.ids(search_transcript_index(meeting_name="Of")), ["t4"])
+        self.assertEqual(search_transcript_index(keywords='"; DROP'), [])
+
+    def test_repeat_searches_do_not_query_notion(self):
+        search_transcript_index(keywords="pricing")
+        search_transcript_index(attendee="Paolo")
+        self.assertEqual(self.query.call_count, 1)
+
+
+class TestSync(TranscriptIndexTestCase):
+    """Incremental sync keeps the index current."""
+
+    def test_incremental_sync_applies_edits_and_removals(self):
+        sync_transcript_index()
+        self.pages[0] = make_transcript("t1", "Pricing review", "2026-01-05", "Reid", "Pricing held flat.",
+                                        edited="2026-01-11T09:00:00.000Z")
+        self.pages[3] = dict(self.pages[3], last_edited_time="2026-01-11T09:00:00.000Z", in_trash=True)
+
+        self.assertEqual(sync_transcript_index()["mode"], "incremental")
+        self.assertEqual(self.ids(search_transcript_index(keywords="held flat", sync=False)), ["t1"])
+        self.assertEqual(search_transcript_index(keywords="enterprise", sync=False), [])
+        self.assertEqual(search_transcript_index(keywords="venue", sync=False), [])
+
+    def test_full_sync_drops_deleted_pages(self):
+        sync_transcript_index()
+        del self.pages[1]
+        sync_transcript_index(full=True)
+        self.assertEqual(get_index_stats()["transcripts"], 4)
+
+    def test_backfill_indexes_missing_bodies(self):
+        sync_transcript_index()
+        bodies = {"t2": "Discussed the Kafka migration."}
+        fetch = lambda page_id: {"text": bodies.get(page_id, ""), "request_count": 1}
+        with patch("tools.common.block_fetcher.fetch_page_text", side_effect=fetch):
+            self.assertEqual(index_missing_bodies()["indexed"], 5)
+        self.assertEqual(self.ids(search_transcript_index(keywords="kafka", sync=False)), ["t2"])
+        self.assertEqual(index_missing_bodies()["missing"], 0)
+
+
+class TestSearchTranscripts(TranscriptIndexTestCase):
+    """search_transcripts and find_candidate_transcripts read from the index."""
+
+    def test_summary_shape(self):
+        summary = search_module.search_transcripts(keywords="pricing")[0]
+        self.assertEqual(summary["page_id"], "t1")
+        self.assertEqual(summary["url"], "https://meet.example.com/t1")
+        self.assertIn("snippet", summary)
+        self.assertIn("action_items", summary)
+
+    def test_find_candidate_is_one_search(self):
+        with patch.object(candidates_module, "search_transcripts", wraps=search_module.search_transcripts) as search:
+            results = candidates_module.find_candidate_transcripts("Aida")
+        self.assertEqual(search.call_count, 1)
+        self.assertEqual(self.ids(results), ["t3", "t2"])
+
+    def test_disabled_index_queries_notion(self):
+        with patch.dict(os.environ, {"TRANSCRIPT_INDEX_ENABLED": "0"}), \
+                patch.object(service_module, "query_database_complete", return_value=TRANSCRIPTS[:1]) as query:
+            results = search_module.search_transcripts(keywords="pricing", include_attendees=True)
+        self.assertEqual(self.ids(results), ["t1"])
+        filter_dict = query.call_args.kwargs["filter_dict"]
+        self.assertEqual([condition["property"] for condition in filter_dict["or"]], ["Name", "Notes", "Attendees"])
+
+    def test_sqlite_without_trigram_queries_notion(self):
+        connect = sqlite3.connect
+
+        def connect_without_trigram(*args, **kwargs):
+            conn = Mock(wraps=connect(*args, **kwargs))
+            real_execute = conn.execute
+
+            def execute(sql, *params):
+                if "trigram" in sql:
+                    raise sqlite3.OperationalError("no such tokenizer: trigram")
+                return real_execute(sql, *params)
+
+            conn.execute = execute
+            return conn
+
+        with patch.object(transcript_index.sqlite3, "connect", side_effect=connect_without_trigram) as opened, \
+                patch.object(service_module, "query_database_complete", return_value=TRANSCRIPTS[:1]) as query:
+            first = search_module.search_transcripts(keywords="pricing")
+            second = search_module.search_transcripts(keywords="pricing")
+        self.assertEqual(self.ids(first), ["t1"])
+        self.assertEqual(self.ids(second), ["t1"])
+        self.assertEqual(query.call_count, 2)
+        # The failure is detected once, not on every search
+        self.assertEqual(opened.call_count, 1)
+        self.assertFalse(transcript_index.is_transcript_index_enabled())
+
+    def test_enabled_check_does_not_create_index(self):
+        self.assertTrue(transcript_index.is_transcript_index_enabled())
+        self.assertIsNone(transcript_index._conn)
+        self.assertFalse(os.path.exists(transcript_index.get_db_path()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+"""Tests for the shared transcript service in tools/notion/transcript_service.py."""
+
+import sys
+import os
+import importlib
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.notion import TranscriptService, get_transcript, get_transcript_content, extract_action_items_from_transcript
+
+# The package re-exports the functions under the modules' names
+service_module = importlib.import_module("tools.notion.transcript_service")
+
+PAGE_ID = "29fe6112-fa50-8060-9d34-cf9063bc3706"
+
+
+def transcript_page(page_id=PAGE_ID, notes="### Action Items\n- Rajiv: Send pricing deck"):
+    return {
+        "id": page_id,
+        "last_edited_time": "2026-01-10T10:00:00.000Z",
+        "properties": {
+            "Name": {"title": [{"plain_text": "Pricing review"}]},
+            "Date": {"date": {"start": "2026-01-09"}},
+            "Attendees": {"rich_text": [{"plain_text": "Reid"}]},
+            "Notes": {"rich_text": [{"plain_text": notes}]},
+            "URL": {"url": None},
+        },
+    }
+
+
+class TranscriptServiceTestCase(unittest.TestCase):
+    """Give each test a fresh process-wide service and a mocked Notion client."""
+
+    def setUp(self):
+        self.service = TranscriptService()
+        service_patch = patch.object(service_module, "_service", self.service)
+        service_patch.start()
+        self.addCleanup(service_patch.stop)
+
+        self.notion = Mock()
+        self.notion.pages.retrieve.side_effect = lambda page_id: transcript_page(page_id)
+        client_patch = patch.object(service_module, "get_notion_client", return_value=self.notion)
+        client_patch.start()
+        self.addCleanup(client_patch.stop)
+
+    def fetch_text(self, delay=0.0):
+        calls = []
+
+        def fetch(page_id, last_edited_time=None):
+            calls.append(page_id)
+            time.sleep(delay)
+            return {"text": f"body of {page_id}", "cache_hit": False, "request_count": 3, "latency_ms": 1.0}
+
+        return calls, patch.object(service_module, "get_page_text_cached", side_effect=fetch)
+
+
+class TestContent(TranscriptServiceTestCase):
+    """Transcript bodies are fetched once and shared."""
+
+    def test_concurrent_requests_share_one_fetch(self):
+        calls, fetch_patch = self.fetch_text(delay=0.1)
+        results = []
+        with fetch_patch:
+            threads = [
+                threading.Thread(target=lambda: results.append(get_transcript_content(PAGE_ID)))
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual({result["transcript"] for result in results}, {f"body of {PAGE_ID}"})
+        self.assertEqual(sorted(result["fetch_stats"]["coalesced"] for result in results), [False] + [True] * 4)
+        self.assertEqual(sum(result["fetch_stats"]["request_count"] for result in results), 3)
+        self.assertEqual(self.service.get_stats()["coalesced"], 4)
+
+    def test_repeat_request_served_from_memory(self):
+        calls, fetch_patch = self.fetch_text()
+        with fetch_patch:
+            get_transcript_content(PAGE_ID, last_edited_time="v1")
+            second = get_transcript_content(PAGE_ID, last_edited_time="v1")
+            get_transcript_content(PAGE_ID, last_edited_time="v2")
+
+        self.assertEqual(calls, [PAGE_ID, PAGE_ID])
+        self.assertTrue(second["fetch_stats"]["cache_hit"])
+        self.assertEqual(second["fetch_stats"]["request_count"], 0)
+
+    def test_failures_reach_every_waiter_and_are_not_cached(self):
+        started = threading.Event()
+
+        def failing_fetch(page_id, last_edited_time=None):
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("Notion unavailable")
+
+        errors = []
+
+        def request():
+            try:
+                get_transcript_content(PAGE_ID)
+            except RuntimeError as exc:
+                errors.append(str(exc))
+
+        with patch.object(service_module, "get_page_text_cached", side_effect=failing_fetch):
+            owner = threading.Thread(target=request)
+            owner.start()
+            started.wait(1)
+            waiter = threading.Thread(target=request)
+            waiter.start()
+            owner.join()
+            waiter.join()
+
+        self.assertEqual(errors, ["Notion unavailable"] * 2)
+        calls, fetch_patch = self.fetch_text()
+        with fetch_patch:
+            self.assertEqual(get_transcript_content(PAGE_ID)["transcript"], f"body of {PAGE_ID}")
+
+
+class TestProperties(TranscriptServiceTestCase):
+    """Transcript properties are shared between searches and lookups."""
+
+    def test_lookups_after_search_do_not_touch_notion(self):
+        with patch.dict(os.environ, {"TRANSCRIPT_INDEX_ENABLED": "0"}), \
+                patch.object(service_module, "query_database_complete", return_value=[transcript_page()]):
+            self.service.search(keywords="pricing")
+
+        transcript = get_transcript(PAGE_ID, include_action_items=True)
+        self.assertEqual(transcript["name"], "Pricing review")
+        self.assertEqual(transcript["action_items"][0]["person"], "Rajiv")
+        self.assertEqual(extract_action_items_from_transcript(PAGE_ID)[0]["action"], "Send pricing deck")
+        self.notion.pages.retrieve.assert_not_called()
+
+    def test_properties_fetched_once(self):
+        get_transcript(PAGE_ID)
+        get_transcript(PAGE_ID.replace("-", ""))
+        self.assertEqual(self.notion.pages.retrieve.call_count, 1)
+
+    def test_properties_expire(self):
+        get_transcript(PAGE_ID)
+        with patch.object(service_module, "TRANSCRIPT_PROPERTIES_TTL_SECONDS", 0):
+            get_transcript(PAGE_ID)
+        self.assertEqual(self.notion.pages.retrieve.call_count, 2)
+
+    def test_body_fetch_uses_known_version(self):
+        get_transcript(PAGE_ID)
+        with patch.object(service_module, "get_page_text_cached",
+                          return_value={"text": "", "cache_hit": True, "request_count": 0, "latency_ms": 0}) as fetch:
+            get_transcript_content(PAGE_ID)
+        fetch.assert_called_once_with(PAGE_ID, "2026-01-10T10:00:00.000Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
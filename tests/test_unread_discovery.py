@@ -0,0 +1,175 @@
+"""Tests for cached unread discovery (conversation_cache.py) and debug_trace.py."""
+
+import sys
+import os
+import importlib
+import json
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from tools.common import debug_trace
+from task_management.tools.slack_inbox_agent import conversation_cache
+
+# The package re-exports the get_unread_messages function under the module's name
+gum = importlib.import_module("task_management.tools.slack_inbox_agent.get_unread_messages")
+
+
+def _conversations(updated=1700000000000):
+    return [
+        {"id": "D1", "is_im": True, "user": "U1", "updated": updated},
+        {"id": "C1", "name": "general", "is_channel": True, "is_member": True, "updated": updated},
+        {"id": "C2", "name": "random", "is_channel": True, "is_member": False, "updated": updated},
+    ]
+
+
+def _client(conversations):
+    client = Mock()
+    client.token = "xoxp-test"
+    client.conversations_list.return_value = {"ok": True, "channels": conversations}
+    client.conversations_info.side_effect = lambda channel: {
+        "ok": True, "channel": {"id": channel, "last_read": "1700000000.000100", "unread_count": 2}
+    }
+    return client
+
+
+class ConversationCacheTestCase(unittest.TestCase):
+    """Point the cache at a throwaway database for each test."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, "sessions.db")
+        self.path_patch = patch.object(conversation_cache, "get_db_path", return_value=db_path)
+        self.path_patch.start()
+        conversation_cache._conn = None
+
+    def tearDown(self):
+        if conversation_cache._conn is not None:
+            conversation_cache._conn.close()
+        conversation_cache._conn = None
+        self.path_patch.stop()
+        self.tmpdir.cleanup()
+
+    def _sweep(self, client):
+        with patch.object(gum, "get_slack_client", return_value=client):
+            return gum.get_unread_messages()
+
+
+class TestUnreadDiscovery(ConversationCacheTestCase):
+    """Test that conversations.info is only called for changed conversations."""
+
+    def test_first_sweep_probes_members_only(self):
+        client = _client(_conversations())
+        result = self._sweep(client)
+        probed = sorted(call.kwargs["channel"] for call in client.conversations_info.call_args_list)
+        self.assertEqual(probed, ["C1", "D1"])
+        self.assertEqual([conv["id"] for conv in result], ["D1", "C1"])
+        self.assertEqual(result[0]["last_read"], 1700000000.0001)
+        self.assertEqual(result[1]["unread_count"], 2)
+
+    def test_unchanged_conversations_served_from_cache(self):
+        self._sweep(_client(_conversations()))
+        client = _client(_conversations())
+        result = self._sweep(client)
+        client.conversations_info.assert_not_called()
+        self.assertEqual(result[0]["last_read"], 1700000000.0001)
+        self.assertEqual(result[1]["unread_count"], 2)
+
+    def test_only_updated_conversation_reprobed(self):
+        self._sweep(_client(_conversations()))
+        conversations = _conversations()
+        conversations[1]["updated"] = 1700000999000
+        client = _client(conversations)
+        self._sweep(client)
+        client.conversations_info.assert_called_once_with(channel="C1")
+
+    def test_expired_entries_reprobed(self):
+        self._sweep(_client(_conversations()))
+        conversation_cache._get_connection().execute(
+            "UPDATE slack_conversation_info SET fetched_at = ?",
+            (time.time() - 2 * conversation_cache.CONVERSATION_INFO_TTL_SECONDS,)
+        )
+        client = _client(_conversations())
+        self._sweep(client)
+        self.assertEqual(client.conversations_info.call_count, 2)
+
+    def test_failed_probe_cached_without_read_state(self):
+        client = _client(_conversations())
+        client.conversations_info.side_effect = Exception("missing_scope")
+        result = self._sweep(client)
+        self.assertIsNone(result[0]["last_read"])
+        client = _client(_conversations())
+        self._sweep(client)
+        client.conversations_info.assert_not_called()
+
+    def test_probes_run_concurrently(self):
+        conversations = [{"id": f"C{i}", "is_member": True, "updated": i} for i in range(8)]
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def conversations_info(channel):
+            with lock:
+                active.append(channel)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(channel)
+            return {"ok": True, "channel": {"id": channel}}
+
+        client = Mock()
+        client.conversations_info.side_effect = conversations_info
+        state = conversation_cache.get_conversation_read_state(client, conversations)
+        self.assertEqual(state["probed"], 8)
+        self.assertGreater(max(peak), 1)
+        self.assertLessEqual(max(peak), conversation_cache.PROBE_WORKERS)
+
+
+class TestDebugTrace(unittest.TestCase):
+    """Test that tracing is opt-in and buffered."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "trace.log")
+        debug_trace._buffer.clear()
+
+    def tearDown(self):
+        debug_trace._buffer.clear()
+        self.tmpdir.cleanup()
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("DEBUG_TRACE_PATH", None)
+            debug_trace.trace("here", "event")
+            self.assertEqual(debug_trace.flush_trace(), 0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_buffered_until_flush(self):
+        with patch.dict(os.environ, {"DEBUG_TRACE_PATH": self.path}):
+            debug_trace.trace("here", "first", {"n": 1}, "A")
+            debug_trace.trace("here", "second")
+            self.assertFalse(os.path.exists(self.path))
+            self.assertEqual(debug_trace.flush_trace(), 2)
+        with open(self.path) as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual([event["message"] for event in events], ["first", "second"])
+        self.assertEqual(events[0]["data"], {"n": 1})
+        self.assertEqual(events[0]["hypothesisId"], "A")
+
+    def test_auto_flush_when_full(self):
+        with patch.dict(os.environ, {"DEBUG_TRACE_PATH": self.path}), \
+                patch.object(debug_trace, "TRACE_BUFFER_SIZE", 3):
+            for i in range(3):
+                debug_trace.trace("here", f"event {i}")
+            with open(self.path) as f:
+                self.assertEqual(len(f.readlines()), 3)
+            self.assertEqual(debug_trace._buffer, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""Tests for pooled, cached URL metadata fetching, against a local HTTP server."""
+
+import sys
+import os
+import importlib
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+# The package re-exports the function under the module's name
+fum = importlib.import_module("task_management.tools.inbox_agent.fetch_url_metadata")
+
+ARTICLE_HEAD = (
+    "<!doctype html><html><head>"
+    "<title>\n  Plain &amp; Simple Title\n</title>"
+    '<meta name="description" content="Meta description">'
+    '<meta property="og:title" content="OG Title">'
+    '<meta property="og:site_name" content="Example">'
+    "</head><body>"
+)
+SLOW_DELAY = 0.2
+HUGE_BODY_BYTES = 64 * 1024 * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        server = self.server
+        path = self.path.split("?")[0]
+        with server.lock:
+            server.requests.append(path)
+            server.client_ports.add(self.client_address[1])
+
+        if path.startswith("/slow"):
+            time.sleep(SLOW_DELAY)
+            self._send(200, f"<html><head><title>{path}</title></head></html>")
+        elif path == "/plain":
+            self._send(200, "<html><head><title>Only a title</title></head><body>hi</body></html>")
+        elif path == "/pdf":
+            self._send(200, "%PDF-1.4", content_type="application/pdf")
+        elif path == "/huge":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(ARTICLE_HEAD) + HUGE_BODY_BYTES))
+            self.end_headers()
+            try:
+                self.wfile.write(ARTICLE_HEAD.encode())
+                chunk = b"x" * 8192
+                for _ in range(HUGE_BODY_BYTES // len(chunk)):
+                    self.wfile.write(chunk)
+                    server.body_bytes_sent += len(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            self.close_connection = True
+        elif path == "/article":
+            self._send(200, ARTICLE_HEAD + "<p>body</p></body></html>")
+        else:
+            self._send(404, "not found")
+
+    def log_message(self, *args):
+        pass
+
+
+class UrlMetadataTestCase(unittest.TestCase):
+    """Local server, a throwaway cache database and a fresh HTTP client per test."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.client_ports = set()
+        self.server.body_bytes_sent = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, "url_metadata.db")
+        self.path_patch = patch.object(fum, "get_db_path", return_value=db_path)
+        self.path_patch.start()
+        fum._conn = None
+        fum._http_client = None
+
+    def tearDown(self):
+        if fum._http_client is not None:
+            fum._http_client.close()
+        fum._http_client = None
+        if fum._conn is not None:
+            fum._conn.close()
+        fum._conn = None
+        self.path_patch.stop()
+        self.tmpdir.cleanup()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestFetchUrlMetadata(UrlMetadataTestCase):
+    """Test parsing, streaming, pooling and concurrency."""
+
+    def test_parses_title_description_and_opengraph(self):
+        metadata = fum.fetch_url_metadata(f"{self.base}/article")
+        self.assertEqual(metadata["title"], "OG Title")
+        self.assertEqual(metadata["description"], "Meta description")
+        self.assertEqual(metadata["site_name"], "Example")
+
+        metadata = fum.fetch_url_metadata(f"{self.base}/plain")
+        self.assertEqual(metadata["title"], "Only a title")
+        self.assertIsNone(metadata["description"])
+
+    def test_reads_only_the_head(self):
+        metadata = fum.fetch_url_metadata(f"{self.base}/huge")
+        self.assertEqual(metadata["title"], "OG Title")
+        self.assertLess(self.server.body_bytes_sent, HUGE_BODY_BYTES // 4)
+
+    def test_non_html_is_not_parsed(self):
+        metadata = fum.fetch_url_metadata(f"{self.base}/pdf")
+        self.assertEqual(metadata["title"], f"{self.base}/pdf")
+        self.assertEqual(metadata["content_type"], "application/pdf")
+
+    def test_connections_are_reused(self):
+        for path in ("/article", "/plain", "/slow-1"):
+            fum.fetch_url_metadata(self.base + path)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(self.server.client_ports), 1)
+
+    def test_batch_fetches_concurrently(self):
+        urls = [f"{self.base}/slow-{n}" for n in range(6)]
+        started = time.perf_counter()
+        results = fum.fetch_url_metadata_batch(urls + urls[:2])
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(list(results), urls)
+        self.assertEqual(results[urls[3]]["title"], "/slow-3")
+        self.assertEqual(len(self.server.requests), 6)
+        self.assertLess(elapsed, 6 * SLOW_DELAY * 0.6)
+
+
+class TestUrlMetadataCache(UrlMetadataTestCase):
+    """Test the persistent cache, URL normalization and negative caching."""
+
+    def test_cached_across_normalized_urls(self):
+        fum.fetch_url_metadata(f"{self.base}/article")
+        metadata = fum.fetch_url_metadata(f"{self.base.upper()}/article?utm_source=slack#section")
+        self.assertEqual(metadata["title"], "OG Title")
+        self.assertEqual(self.server.requests, ["/article"])
+
+    def test_normalize_url(self):
+        self.assertEqual(
+            fum.normalize_url("HTTPS://Example.com:443/a?b=1&utm_medium=x&fbclid=y#top"),
+            "https://example.com/a?b=1"
+        )
+        self.assertEqual(fum.normalize_url("http://example.com"), "http://example.com/")
+
+    def test_failures_are_negatively_cached(self):
+        first = fum.fetch_url_metadata(f"{self.base}/missing")
+        second = fum.fetch_url_metadata(f"{self.base}/missing")
+        self.assertIn("error", first)
+        self.assertEqual(second["title"], f"{self.base}/missing")
+        self.assertEqual(self.server.requests, ["/missing"])
+
+        # Failures expire sooner than successes
+        fum._get_connection().execute(
+            "UPDATE url_metadata SET fetched_at = ?",
+            (time.time() - fum.URL_METADATA_NEGATIVE_TTL_SECONDS - 1,)
+        )
+        fum.fetch_url_metadata(f"{self.base}/missing")
+        self.assertEqual(self.server.requests, ["/missing", "/missing"])
+
+    def test_expired_entries_refetched(self):
+        fum.fetch_url_metadata(f"{self.base}/article")
+        fum._get_connection().execute(
+            "UPDATE url_metadata SET fetched_at = ?",
+            (time.time() - fum.URL_METADATA_TTL_SECONDS - 1,)
+        )
+        fum.fetch_url_metadata(f"{self.base}/article")
+        self.assertEqual(self.server.requests, ["/article", "/article"])
+
+
+if __name__ == "__main__":
+    unittest.main()
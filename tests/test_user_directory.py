@@ -0,0 +1,116 @@
+"""Tests for the Slack user directory cache in user_directory.py."""
+
+import sys
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from task_management.tools.slack_inbox_agent import user_directory
+from task_management.tools.slack_inbox_agent.user_directory import get_user_name
+from task_management.tools.slack_inbox_agent.extract_rich_content import extract_rich_content, format_rich_content_summary, resolve_mentions
+
+
+def _reset_memory():
+    user_directory._names.clear()
+    user_directory._loaded = False
+    user_directory._last_bulk_load = 0.0
+    user_directory._bulk_unavailable = False
+
+
+def _client():
+    client = Mock()
+    client.users_list.side_effect = [
+        {"ok": True, "members": [{"id": "U1", "real_name": "Ana Lee", "name": "ana"}],
+         "response_metadata": {"next_cursor": "page2"}},
+        {"ok": True, "members": [{"id": "U2", "name": "bob"}], "response_metadata": {"next_cursor": ""}},
+    ]
+    client.users_info.return_value = {"ok": True, "user": {"real_name": "Guest User"}}
+    return client
+
+
+class UserDirectoryTestCase(unittest.TestCase):
+    """Point the directory at a throwaway database for each test."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, "sessions.db")
+        self.path_patch = patch.object(user_directory, "get_db_path", return_value=db_path)
+        self.path_patch.start()
+        user_directory._conn = None
+        _reset_memory()
+
+    def tearDown(self):
+        if user_directory._conn is not None:
+            user_directory._conn.close()
+        user_directory._conn = None
+        _reset_memory()
+        self.path_patch.stop()
+        self.tmpdir.cleanup()
+
+
+class TestUserDirectory(UserDirectoryTestCase):
+    """Test bulk loading, memory hits, persistence and fallbacks."""
+
+    def test_bulk_load_paginates_and_serves_from_memory(self):
+        client = _client()
+        self.assertEqual(get_user_name("U1", client), "Ana Lee")
+        self.assertEqual(get_user_name("U2", client), "bob")
+        self.assertEqual(get_user_name("U1", client), "Ana Lee")
+        self.assertEqual(client.users_list.call_count, 2)
+        client.users_list.assert_called_with(limit=user_directory.USERS_LIST_PAGE_SIZE, cursor="page2")
+        client.users_info.assert_not_called()
+
+    def test_persisted_across_processes(self):
+        get_user_name("U1", _client())
+        _reset_memory()
+        client = Mock()
+        self.assertEqual(get_user_name("U2", client), "bob")
+        client.users_list.assert_not_called()
+        client.users_info.assert_not_called()
+
+    def test_miss_falls_back_to_users_info_once(self):
+        client = _client()
+        self.assertEqual(get_user_name("U9", client), "Guest User")
+        self.assertEqual(get_user_name("U9", client), "Guest User")
+        client.users_info.assert_called_once_with(user="U9")
+
+    def test_expired_entries_refreshed(self):
+        get_user_name("U1", _client())
+        expired = time.time() - 2 * user_directory.USER_DIRECTORY_TTL_SECONDS
+        user_directory._names["U1"] = ("Ana Lee", expired)
+        user_directory._last_bulk_load = expired
+        client = _client()
+        client.users_list.side_effect = [{"ok": True, "members": [{"id": "U1", "real_name": "Ana Smith"}]}]
+        self.assertEqual(get_user_name("U1", client), "Ana Smith")
+        client.users_info.assert_not_called()
+
+    def test_users_list_unavailable(self):
+        client = _client()
+        client.users_list.side_effect = Exception("missing_scope")
+        self.assertEqual(get_user_name("U1", client), "Guest User")
+        self.assertEqual(get_user_name("U2", client), "Guest User")
+        client.users_list.assert_called_once()
+
+
+class TestMentionResolution(UserDirectoryTestCase):
+    """Test that mentions render through the directory."""
+
+    def test_resolve_mentions(self):
+        client = _client()
+        text = resolve_mentions("hey <@U1> and <@U2|bobby>, ping <@UNKNOWN|ghost>", client)
+        self.assertEqual(text, "hey @Ana Lee and @bob, ping @Guest User")
+
+    def test_rich_content_summary_lists_names(self):
+        get_user_name("U1", _client())
+        rich_content = extract_rich_content({"text": "cc <@U1>"})
+        self.assertEqual(rich_content["mentions"], ["U1"])
+        self.assertEqual(format_rich_content_summary(rich_content), "@ Mentions: Ana Lee")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,14 @@
 """Shared utilities for Notion API operations."""
 
-from .notion_client import get_notion_client, query_database_complete, get_page_content
+from .notion_client import (
+    get_notion_client,
+    query_database_complete,
+    iter_database,
+    count_database,
+    get_page_content,
+    create_page,
+    paragraph_block,
+)
 from .constants import (
     TASKS_DB_ID,
     TASKS_DATA_SOURCE_ID,
@@ -19,7 +27,22 @@ from .constants import (
     SCORECARD_DATA_SOURCE_ID,
     SCORECARD_URL,
 )
+from .block_fetcher import fetch_page_text, get_page_fetch_stats
+from .page_cache import get_page_text_cached, prewarm_transcripts
+from .notion_replica import sync_data_source, write_through
+from .transcript_index import sync_transcript_index, search_transcript_index
+from .notion_snapshot import snapshot_run, invalidate_snapshot
+from .notion_scheduler import (
+    RequestBudgetExceeded,
+    request_budget,
+    with_request_budget,
+    with_default_request_budget,
+    get_request_stats,
+    reset_request_stats,
+)
+from .debug_trace import trace, flush_trace
 from .session_storage import get_session_storage
+from .lazy_tools import lazy_tools
 from .get_rajiv_context import get_rajiv_context
 from .load_agent_instructions import load_agent_instructions
 from .parse_strategic_priorities import get_strategic_priorities, get_priority_by_person
@@ -27,8 +50,31 @@ from .parse_strategic_priorities import get_strategic_priorities, get_priority_b
 __all__ = [
     "get_notion_client",
     "query_database_complete",
+    "iter_database",
+    "count_database",
     "get_page_content",
+    "create_page",
+    "paragraph_block",
+    "fetch_page_text",
+    "get_page_fetch_stats",
+    "get_page_text_cached",
+    "prewarm_transcripts",
+    "sync_data_source",
+    "write_through",
+    "sync_transcript_index",
+    "search_transcript_index",
+    "snapshot_run",
+    "invalidate_snapshot",
+    "RequestBudgetExceeded",
+    "request_budget",
+    "with_request_budget",
+    "with_default_request_budget",
+    "get_request_stats",
+    "reset_request_stats",
+    "trace",
+    "flush_trace",
     "get_session_storage",
+    "lazy_tools",
     "get_rajiv_context",
     "load_agent_instructions",
     "get_strategic_priorities",
@@ -0,0 +1,182 @@
+"""Concurrent block-tree fetcher for Notion page content.
+
+blocks.children.list only returns one level of one parent per call, so a page
+with nested toggles costs one round trip per parent (and per cursor page).
+Pagination within a parent is inherently serial, but sibling subtrees are
+independent - this fetcher fans them out across a bounded thread pool and then
+reassembles the text in document order.
+"""
+
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Dict, List, Optional
+
+# Concurrent blocks.children.list calls per page fetch (Notion averages ~3 req/s)
+DEFAULT_MAX_WORKERS = 3
+
+# Number of recent page fetches kept for get_page_fetch_stats()
+MAX_TRACKED_FETCHES = 100
+
+_fetch_stats: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_stats_lock = threading.Lock()
+
+
+def extract_text_from_block(block: Dict[str, Any]) -> str:
+    """Extract plain text from a single block.
+
+    Args:
+        block: Notion block object
+
+    Returns:
+        Concatenated plain text of the block's rich_text (empty if none)
+    """
+    block_type = block.get("type")
+    rich_text = (block.get(block_type) or {}).get("rich_text", []) if block_type else []
+    return "".join([item.get("plain_text", "") for item in rich_text])
+
+
+def _list_all_children(client, block_id: str) -> "tuple[List[Dict[str, Any]], int]":
+    """Fetch every direct child of a block, following cursors.
+
+    Returns:
+        Tuple of (child blocks, number of API requests made)
+    """
+    children = []
+    requests = 0
+    cursor = None
+    while True:
+        if cursor:
+            response = client.blocks.children.list(block_id=block_id, start_cursor=cursor)
+        else:
+            response = client.blocks.children.list(block_id=block_id)
+        requests += 1
+        children.extend(response.get("results", []))
+        if not response.get("has_more"):
+            break
+        cursor = response.get("next_cursor")
+    return children, requests
+
+
+def fetch_block_tree(
+    page_id: str,
+    client=None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Dict[str, Any]:
+    """Fetch the full block tree under a page, fanning out sibling subtrees.
+
+    Args:
+        page_id: Notion page (or block) ID to start from
+        client: Notion client (defaults to the shared client)
+        max_workers: Maximum concurrent blocks.children.list calls
+
+    Returns:
+        Dict with:
+        - children: Mapping of parent block ID -> ordered list of child blocks
+        - request_count: Number of API requests made
+    """
+    if client is None:
+        from .notion_client import get_notion_client
+        client = get_notion_client()
+
+    children_by_parent: Dict[str, List[Dict[str, Any]]] = {}
+    request_count = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        def submit(block_id: str):
+            # Run each call in a copy of the caller's context so request budgets apply
+            return executor.submit(contextvars.copy_context().run, _list_all_children, client, block_id)
+
+        pending = {submit(page_id): page_id}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                parent_id = pending.pop(future)
+                blocks, requests = future.result()
+                request_count += requests
+                children_by_parent[parent_id] = blocks
+                # Schedule every nested subtree as soon as its parent is known
+                for block in blocks:
+                    if block.get("has_children", False):
+                        pending[submit(block["id"])] = block["id"]
+
+    return {"children": children_by_parent, "request_count": request_count}
+
+
+def _collect_text(children_by_parent: Dict[str, List[Dict[str, Any]]], block_id: str, text_parts: List[str]) -> None:
+    """Depth-first walk in document order (parent text before its children)."""
+    stack = [iter(children_by_parent.get(block_id, []))]
+    while stack:
+        block = next(stack[-1], None)
+        if block is None:
+            stack.pop()
+            continue
+        text = extract_text_from_block(block)
+        if text:
+            text_parts.append(text)
+        if block.get("has_children", False):
+            stack.append(iter(children_by_parent.get(block["id"], [])))
+
+
+def fetch_page_text(
+    page_id: str,
+    client=None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Dict[str, Any]:
+    """Fetch all text content from a page using the concurrent block fetcher.
+
+    Args:
+        page_id: Notion page ID
+        client: Notion client (defaults to the shared client)
+        max_workers: Maximum concurrent blocks.children.list calls
+
+    Returns:
+        Dict with:
+        - page_id: Notion page ID
+        - text: Combined text content, blocks joined by blank lines
+        - request_count: Number of API requests made
+        - block_count: Number of blocks fetched
+        - latency_ms: Wall time for the fetch in milliseconds
+    """
+    started = time.perf_counter()
+    tree = fetch_block_tree(page_id, client=client, max_workers=max_workers)
+
+    text_parts: List[str] = []
+    _collect_text(tree["children"], page_id, text_parts)
+
+    stats = {
+        "page_id": page_id,
+        "request_count": tree["request_count"],
+        "block_count": sum(len(blocks) for blocks in tree["children"].values()),
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    _record_fetch_stats(stats)
+
+    return {**stats, "text": "\n\n".join(text_parts)}
+
+
+def _record_fetch_stats(stats: Dict[str, Any]) -> None:
+    with _stats_lock:
+        _fetch_stats.pop(stats["page_id"], None)
+        _fetch_stats[stats["page_id"]] = stats
+        while len(_fetch_stats) > MAX_TRACKED_FETCHES:
+            _fetch_stats.popitem(last=False)
+
+
+def get_page_fetch_stats(page_id: Optional[str] = None) -> Any:
+    """Get latency and request counts for recent page fetches.
+
+    Args:
+        page_id: If provided, return stats for that page only
+
+    Returns:
+        Stats dict for page_id (or None if not fetched recently), otherwise a
+        list of stats dicts for recent fetches, oldest first
+    """
+    with _stats_lock:
+        if page_id is not None:
+            stats = _fetch_stats.get(page_id)
+            return dict(stats) if stats else None
+        return [dict(stats) for stats in _fetch_stats.values()]
@@ -0,0 +1,84 @@
+"""Opt-in, buffered structured debug tracing.
+
+Tracing is off unless DEBUG_TRACE_PATH is set. When on, trace() appends an
+event to an in-memory buffer and the buffer is written to the file as JSON
+lines in one append - when it fills up, on flush_trace(), and at exit - so
+hot loops never do synchronous file I/O per event.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Events buffered before an automatic flush
+TRACE_BUFFER_SIZE = 200
+
+_buffer: List[Dict[str, Any]] = []
+_lock = threading.Lock()
+
+
+def get_trace_path() -> Optional[str]:
+    """Get the trace file path, or None when tracing is disabled."""
+    return os.getenv("DEBUG_TRACE_PATH") or None
+
+
+def is_trace_enabled() -> bool:
+    """Whether trace() records events."""
+    return get_trace_path() is not None
+
+
+def trace(
+    location: str,
+    message: str,
+    data: Optional[Dict[str, Any]] = None,
+    hypothesis_id: Optional[str] = None
+) -> None:
+    """Record a debug event (no-op unless DEBUG_TRACE_PATH is set).
+
+    Args:
+        location: Where the event happened (e.g. "get_unread_messages.py:probe")
+        message: Short description
+        data: JSON-serializable details
+        hypothesis_id: Optional tag for grouping events while debugging
+    """
+    if not is_trace_enabled():
+        return
+    event = {
+        "location": location,
+        "message": message,
+        "data": data or {},
+        "hypothesisId": hypothesis_id,
+        "timestamp": int(time.time() * 1000),
+    }
+    with _lock:
+        _buffer.append(event)
+        full = len(_buffer) >= TRACE_BUFFER_SIZE
+    if full:
+        flush_trace()
+
+
+def flush_trace() -> int:
+    """Write buffered events to the trace file.
+
+    Returns:
+        Number of events written (0 if tracing is disabled or nothing is buffered)
+    """
+    path = get_trace_path()
+    with _lock:
+        events = list(_buffer)
+        _buffer.clear()
+    if not path or not events:
+        return 0
+    try:
+        with open(path, "a") as f:
+            f.write("".join(json.dumps(event, default=str) + "\n" for event in events))
+    except OSError:
+        # Tracing must never break the traced code
+        return 0
+    return len(events)
+
+
+atexit.register(flush_trace)
@@ -0,0 +1,35 @@
+"""Defer importing an agent's tool modules until the agent first runs."""
+
+import importlib.util
+from typing import Callable, List, Union
+
+from .notion_scheduler import with_default_request_budget
+
+# agno resolves callable tool factories at run time from this module onwards
+CALLABLE_TOOLS_SUPPORTED = importlib.util.find_spec("agno.utils.callables") is not None
+
+
+def lazy_tools(load: Callable[[], List]) -> Union[Callable[[], List], List]:
+    """Wrap an agent's tool loader so its tool modules import on first use.
+
+    The orchestrator only needs member names and roles to route a request, so
+    a member's tools (and the modules behind them) are not needed until the
+    orchestrator delegates to it. agno calls the loader when the agent runs
+    and caches the result per session.
+
+    Each loaded tool without a Notion request budget of its own gets the
+    default one (see with_default_request_budget).
+
+    Args:
+        load: Function that imports the agent's tool modules and returns its tools
+
+    Returns:
+        The loader, for Agent(tools=...); or, on agno versions without callable
+        tool factories, the loaded tool list
+    """
+    def load_budgeted() -> List:
+        return with_default_request_budget(load())
+
+    if CALLABLE_TOOLS_SUPPORTED:
+        return load_budgeted
+    return load_budgeted()
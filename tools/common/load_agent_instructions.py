@@ -2,12 +2,17 @@
 
 import os
 import re
+from functools import lru_cache
 from .summarize_rajiv_context import summarize_rajiv_context
 
 
+@lru_cache(maxsize=None)
 def load_agent_instructions(agent_name: str) -> str:
     """Load agent instructions and inject Rajiv context.
     
+    Instructions are read once per process; restart to pick up edits to the
+    markdown files.
+    
     Args:
         agent_name: Name of agent (e.g., 'inbox_agent', 'task_manager_agent')
     
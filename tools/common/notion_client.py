@@ -1,7 +1,8 @@
 """Shared Notion API client and query utilities."""
 
+import itertools
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from notion_client import Client
 from dotenv import load_dotenv
 
@@ -15,6 +16,28 @@ load_dotenv(dotenv_path=os.path.join(
 _client = None
 
 
+class ScheduledClient(Client):
+    """Notion Client whose every request goes through the shared request scheduler.
+
+    The scheduler applies rate limiting, retries and request budgets (see
+    notion_scheduler), so all endpoint helpers (pages, blocks, data_sources,
+    search, ...) are covered without changing call sites.
+    """
+
+    def request(self, path: str, method: str, *args, **kwargs) -> Any:
+        from .notion_scheduler import get_request_scheduler
+        response = get_request_scheduler().execute(
+            lambda: super(ScheduledClient, self).request(path, method, *args, **kwargs),
+            method=method,
+            path=path
+        )
+        if method.upper() in ("POST", "PATCH") and path.strip("/").startswith("pages"):
+            # A page was created or edited - the run's task snapshot is stale
+            from .notion_snapshot import invalidate_snapshot
+            invalidate_snapshot()
+        return response
+
+
 def get_notion_client() -> Client:
     """Get authenticated Notion client (singleton).
     
@@ -29,142 +52,328 @@ def get_notion_client() -> Client:
         api_key = os.getenv("NOTION_API_KEY")
         if not api_key:
             raise ValueError("NOTION_API_KEY environment variable not set. Add it to env.txt")
-        _client = Client(auth=api_key)
+        try:
+            # Retries are handled by the scheduler; disable the SDK's own
+            _client = ScheduledClient(auth=api_key, retry=False)
+        except TypeError:
+            # Older notion-client versions have no built-in retry option
+            _client = ScheduledClient(auth=api_key)
     return _client
 
 
-def query_database_complete(
+# Largest page_size the Notion query endpoints accept
+MAX_PAGE_SIZE = 100
+
+# Notion limits: 2000 characters per rich_text item, 100 child blocks per request
+NOTION_TEXT_LIMIT = 2000
+MAX_CHILDREN_PER_REQUEST = 100
+
+# database ID -> data source ID, for SDK versions without databases.query
+_database_data_sources: Dict[str, str] = {}
+
+
+def _resolve_data_source_id(client: Client, database_id: str) -> str:
+    """Get the (first) data source of a database, cached per process."""
+    if database_id not in _database_data_sources:
+        database = client.databases.retrieve(database_id=database_id)
+        data_sources = database.get("data_sources") or []
+        if not data_sources:
+            raise ValueError(f"Database {database_id} has no data sources")
+        _database_data_sources[database_id] = data_sources[0]["id"]
+    return _database_data_sources[database_id]
+
+
+def _iter_query_pages(
     database_id: str,
     filter_dict: Optional[Dict] = None,
     sorts: Optional[List[Dict]] = None,
-    use_data_source: bool = False
-) -> List[Dict[str, Any]]:
-    """Query a Notion database and return ALL results (handles pagination).
+    use_data_source: bool = False,
+    page_size: Optional[int] = None,
+    limit: Optional[int] = None,
+    filter_properties: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream query results from Notion, one API page at a time.
     
     Args:
         database_id: Notion database ID or data source ID
-        filter_dict: Filter criteria (e.g., {"property": "Status", "status": {"equals": "Inbox"}})
-        sorts: Sort criteria (e.g., [{"property": "Due", "direction": "ascending"}])
-        use_data_source: If True, use data_sources.query() instead of pages.search()
+        filter_dict: Notion filter object
+        sorts: Notion sort list
+        use_data_source: If True, database_id is a data source ID
+        page_size: Results requested per API call (max 100)
+        limit: Stop once this many results have been yielded
+        filter_properties: Property IDs to include in each page (None for all)
     
-    Returns:
-        List of all page objects (complete results, pagination handled automatically)
+    Yields:
+        Page objects in API order
     """
+    if limit is not None and limit <= 0:
+        return
+    
     client = get_notion_client()
-    all_results = []
+    database_id = database_id.replace("collection://", "")
     
     if use_data_source:
-        # Use data_sources.query() for data source IDs
-        # Remove collection:// prefix if present
-        data_source_id = database_id.replace("collection://", "")
-        query_params = {"data_source_id": data_source_id}
-        if filter_dict:
-            query_params["filter"] = filter_dict
-        if sorts:
-            query_params["sorts"] = sorts
-        
-        # First query
-        response = client.data_sources.query(**query_params)
-        all_results.extend(response.get("results", []))
-        
-        # Paginate through remaining results
-        while response.get("has_more"):
-            next_cursor = response.get("next_cursor")
-            query_params["start_cursor"] = next_cursor
-            response = client.data_sources.query(**query_params)
-            all_results.extend(response.get("results", []))
+        query = client.data_sources.query
+        query_params = {"data_source_id": database_id}
+    elif hasattr(client.databases, "query"):
+        # notion-client 2.x still exposes databases.query
+        query = client.databases.query
+        query_params = {"database_id": database_id}
     else:
-        # Use pages.search() for database IDs - search for pages in this database
-        query_params = {}
-        if filter_dict:
-            query_params["filter"] = {
-                "and": [
-                    {"value": "page", "property": "object"},
-                    {"value": database_id, "property": "parent_id"}
-                ]
-            }
+        # Newer API versions only query data sources
+        query = client.data_sources.query
+        query_params = {"data_source_id": _resolve_data_source_id(client, database_id)}
+    
+    if filter_dict:
+        query_params["filter"] = filter_dict
+    if sorts:
+        query_params["sorts"] = sorts
+    if filter_properties is not None:
+        query_params["filter_properties"] = filter_properties
+    
+    yielded = 0
+    while True:
+        request_size = min(page_size or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+        if limit is not None:
+            # Don't ask for more rows than the caller will consume
+            request_size = min(request_size, limit - yielded)
+        query_params["page_size"] = request_size
         
-        # Use search API to find pages in database
-        response = client.search(query=database_id, **query_params)
-        all_results.extend(response.get("results", []))
+        response = query(**query_params)
+        for page in response.get("results", []):
+            yield page
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
         
-        # Filter results to only include pages from this database
-        filtered_results = []
-        for result in all_results:
-            parent = result.get("parent", {})
-            if parent.get("database_id") == database_id or parent.get("type") == "database_id":
-                filtered_results.append(result)
-        all_results = filtered_results
+        if not response.get("has_more"):
+            return
+        query_params["start_cursor"] = response.get("next_cursor")
+
+
+def iter_database(
+    database_id: str,
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None,
+    use_data_source: bool = False,
+    limit: Optional[int] = None,
+    page_size: Optional[int] = None,
+    use_replica: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """Streaming variant of query_database_complete.
+    
+    Pages are yielded as each API response arrives, so a caller that stops
+    iterating (or passes limit) never fetches the remaining pages. Queries
+    served by the run snapshot are yielded from its in-memory pages; queries
+    served by the replica decode one row at a time (sorted replica queries
+    hold the matching pages until they are sorted).
+    
+    Args:
+        database_id: Notion database ID or data source ID
+        filter_dict: Notion filter object
+        sorts: Notion sort list
+        use_data_source: If True, database_id is a data source ID
+        limit: Maximum number of pages to yield
+        page_size: Results requested per API call (max 100)
+        use_replica: If False, always query Notion directly
+    
+    Yields:
+        Page objects
+    """
+    if use_data_source and use_replica:
+        local_results = _iter_local(database_id, filter_dict, sorts)
+        if local_results is not None:
+            yield from itertools.islice(local_results, limit)
+            return
+    
+    yield from _iter_query_pages(
+        database_id,
+        filter_dict=filter_dict,
+        sorts=sorts,
+        use_data_source=use_data_source,
+        page_size=page_size,
+        limit=limit
+    )
+
+
+def count_database(
+    database_id: str,
+    filter_dict: Optional[Dict] = None,
+    use_data_source: bool = False,
+    use_replica: bool = True
+) -> int:
+    """Count the pages matching a filter without keeping them.
+    
+    Queries that reach Notion request only the title property
+    (filter_properties) at the maximum page size, and each page is discarded
+    as soon as it is counted.
+    
+    Args:
+        database_id: Notion database ID or data source ID
+        filter_dict: Notion filter object
+        use_data_source: If True, database_id is a data source ID
+        use_replica: If False, always query Notion directly
+    
+    Returns:
+        Number of matching pages
+    """
+    if use_data_source and use_replica:
+        local_results = _query_local(database_id, filter_dict, None)
+        if local_results is not None:
+            return len(local_results)
     
-    return all_results
+    return sum(1 for _ in _iter_query_pages(
+        database_id,
+        filter_dict=filter_dict,
+        use_data_source=use_data_source,
+        page_size=MAX_PAGE_SIZE,
+        filter_properties=["title"]
+    ))
+
+
+def _query_local(
+    database_id: str,
+    filter_dict: Optional[Dict],
+    sorts: Optional[List[Dict]],
+    use_snapshot: bool = True
+) -> Optional[List[Dict[str, Any]]]:
+    """Answer a data source query from the run snapshot or the replica, if possible."""
+    if use_snapshot:
+        from .notion_snapshot import query_snapshot
+        snapshot_results = query_snapshot(database_id, filter_dict=filter_dict, sorts=sorts)
+        if snapshot_results is not None:
+            return snapshot_results
+    
+    from .notion_replica import query_replica
+    return query_replica(database_id, filter_dict=filter_dict, sorts=sorts)
+
+
+def _iter_local(
+    database_id: str,
+    filter_dict: Optional[Dict],
+    sorts: Optional[List[Dict]]
+) -> Optional[Iterator[Dict[str, Any]]]:
+    """Streaming _query_local: snapshot pages are already in memory, replica rows are decoded as read."""
+    from .notion_snapshot import query_snapshot
+    snapshot_results = query_snapshot(database_id, filter_dict=filter_dict, sorts=sorts)
+    if snapshot_results is not None:
+        return iter(snapshot_results)
+    
+    from .notion_replica import iter_replica
+    return iter_replica(database_id, filter_dict=filter_dict, sorts=sorts)
+
+
+def query_database_complete(
+    database_id: str,
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None,
+    use_data_source: bool = False,
+    use_replica: bool = True,
+    use_snapshot: bool = True,
+    limit: Optional[int] = None,
+    page_size: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Query a Notion database and return ALL results (handles pagination).
+    
+    Tasks and Projects data source queries are answered from the active run
+    snapshot (see notion_snapshot) or the local replica (see notion_replica)
+    when the filter can be evaluated locally.
+    
+    Args:
+        database_id: Notion database ID or data source ID
+        filter_dict: Filter criteria (e.g., {"property": "Status", "status": {"equals": "Inbox"}})
+        sorts: Sort criteria (e.g., [{"property": "Due", "direction": "ascending"}])
+        use_data_source: If True, database_id is a data source ID; otherwise it
+            is a database ID
+        use_replica: If False, always query Notion directly
+        use_snapshot: If False, ignore the active run snapshot
+        limit: Stop paginating once this many results have been collected
+        page_size: Results requested per API call (max 100)
+    
+    Returns:
+        List of page objects (all results, or the first `limit`)
+    """
+    if use_data_source and use_replica:
+        local_results = _query_local(database_id, filter_dict, sorts, use_snapshot=use_snapshot)
+        if local_results is not None:
+            return local_results[:limit] if limit is not None else local_results
+    
+    return list(_iter_query_pages(
+        database_id,
+        filter_dict=filter_dict,
+        sorts=sorts,
+        use_data_source=use_data_source,
+        page_size=page_size,
+        limit=limit
+    ))
 
 
 def get_page_content(page_id: str) -> str:
     """Extract all text content from a Notion page (recursively fetches all blocks).
     
+    Nested subtrees are fetched concurrently by the block fetcher; text is
+    returned in document order. Use block_fetcher.fetch_page_text() to also
+    get request counts and latency.
+    
     Args:
         page_id: Notion page ID
     
     Returns:
         Combined text content from all blocks in the page
     """
+    from .block_fetcher import fetch_page_text
+    return fetch_page_text(page_id)["text"]
+
+
+def paragraph_block(text: str) -> Dict[str, Any]:
+    """Paragraph block, split into rich_text items under Notion's length limit.
+    
+    Args:
+        text: Paragraph text (any length)
+    
+    Returns:
+        Notion paragraph block object
+    """
+    chunks = [text[i:i + NOTION_TEXT_LIMIT] for i in range(0, len(text), NOTION_TEXT_LIMIT)] or [""]
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [{"type": "text", "text": {"content": chunk}} for chunk in chunks]
+        }
+    }
+
+
+def create_page(
+    parent: Dict[str, Any],
+    properties: Dict[str, Any],
+    children: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """Create a Notion page with its body in the same request.
+    
+    The first MAX_CHILDREN_PER_REQUEST blocks are sent as the create request's
+    `children`, so a page with a short body costs one request instead of a
+    create plus an append. Longer bodies append the rest in batches.
+    
+    Args:
+        parent: Parent object, e.g. {"database_id": ...}
+        properties: Page properties
+        children: Blocks for the page body
+    
+    Returns:
+        Created page object
+    """
     client = get_notion_client()
-    text_parts = []
-    
-    def extract_text_from_block(block: Dict[str, Any]) -> str:
-        """Extract text from a single block."""
-        block_type = block.get("type")
-        if block_type == "paragraph":
-            rich_text = block.get("paragraph", {}).get("rich_text", [])
-        elif block_type == "heading_1":
-            rich_text = block.get("heading_1", {}).get("rich_text", [])
-        elif block_type == "heading_2":
-            rich_text = block.get("heading_2", {}).get("rich_text", [])
-        elif block_type == "heading_3":
-            rich_text = block.get("heading_3", {}).get("rich_text", [])
-        elif block_type == "bulleted_list_item":
-            rich_text = block.get("bulleted_list_item", {}).get("rich_text", [])
-        elif block_type == "numbered_list_item":
-            rich_text = block.get("numbered_list_item", {}).get("rich_text", [])
-        elif block_type == "to_do":
-            rich_text = block.get("to_do", {}).get("rich_text", [])
-        elif block_type == "toggle":
-            rich_text = block.get("toggle", {}).get("rich_text", [])
-        elif block_type == "quote":
-            rich_text = block.get("quote", {}).get("rich_text", [])
-        elif block_type == "callout":
-            rich_text = block.get("callout", {}).get("rich_text", [])
-        else:
-            # For other block types, try to find rich_text
-            rich_text = block.get(block_type, {}).get("rich_text", [])
-        
-        return "".join([item.get("plain_text", "") for item in rich_text])
-    
-    def fetch_blocks_recursive(block_id: str) -> None:
-        """Recursively fetch all blocks starting from a block ID."""
-        cursor = None
-        while True:
-            if cursor:
-                response = client.blocks.children.list(block_id=block_id, start_cursor=cursor)
-            else:
-                response = client.blocks.children.list(block_id=block_id)
-            
-            blocks = response.get("results", [])
-            for block in blocks:
-                # Extract text from this block
-                text = extract_text_from_block(block)
-                if text:
-                    text_parts.append(text)
-                
-                # Check if block has children and fetch them recursively
-                if block.get("has_children", False):
-                    fetch_blocks_recursive(block["id"])
-            
-            if not response.get("has_more"):
-                break
-            cursor = response.get("next_cursor")
-    
-    # Start fetching from the page
-    fetch_blocks_recursive(page_id)
-    
-    return "\n\n".join(text_parts)
+    children = children or []
+    
+    params = {"parent": parent, "properties": properties}
+    if children:
+        params["children"] = children[:MAX_CHILDREN_PER_REQUEST]
+    page = client.pages.create(**params)
+    
+    for start in range(MAX_CHILDREN_PER_REQUEST, len(children), MAX_CHILDREN_PER_REQUEST):
+        client.blocks.children.append(
+            block_id=page["id"],
+            children=children[start:start + MAX_CHILDREN_PER_REQUEST]
+        )
+    return page
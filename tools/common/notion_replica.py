@@ -0,0 +1,611 @@
+"""Local SQLite replica of the Tasks and Projects data sources.
+
+Most Task Manager and Productivity tools re-query the same two data sources
+on every agent turn. The replica keeps a copy of their raw page objects in
+data/notion_replica.db, syncs incrementally on last_edited_time, and answers
+the filter shapes those tools use locally. Writes made through create_task /
+update_task are written through, so the replica stays current without a
+round trip.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .constants import TASKS_DATA_SOURCE_ID, PROJECTS_DATA_SOURCE_ID
+
+# Data sources mirrored locally
+REPLICATED_DATA_SOURCES = {TASKS_DATA_SOURCE_ID, PROJECTS_DATA_SOURCE_ID}
+
+# How long a sync stays fresh before the next query triggers an incremental sync
+REPLICA_MAX_AGE_SECONDS = int(os.getenv("NOTION_REPLICA_MAX_AGE_SECONDS", "120"))
+
+# Incremental syncs cannot see deletions, so resync fully on this interval
+FULL_RESYNC_SECONDS = 6 * 60 * 60
+
+# Notion rounds last_edited_time to the minute, so re-read a small overlap
+SYNC_OVERLAP = timedelta(minutes=2)
+
+# Rows read per batch by iter_pages
+READ_BATCH_SIZE = 200
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+
+class UnsupportedFilterError(Exception):
+    """Raised when a filter or sort cannot be evaluated locally."""
+
+
+def is_replica_enabled() -> bool:
+    """Check whether the replica is enabled (NOTION_REPLICA_ENABLED, default on)."""
+    return os.getenv("NOTION_REPLICA_ENABLED", "1").lower() not in ("0", "false", "no")
+
+
+def is_replicated(data_source_id: str) -> bool:
+    """Check whether a data source is mirrored by the replica."""
+    return _normalize_data_source_id(data_source_id) in REPLICATED_DATA_SOURCES
+
+
+def get_db_path() -> str:
+    """Get the path to the replica SQLite database file."""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    data_dir = os.path.join(project_root, "data")
+
+    # Create data directory if it doesn't exist
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir, exist_ok=True)
+
+    return os.path.join(data_dir, "notion_replica.db")
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared replica connection, creating tables on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS replica_pages (
+                data_source_id TEXT NOT NULL,
+                page_id TEXT NOT NULL,
+                last_edited_time TEXT,
+                page_json TEXT NOT NULL,
+                PRIMARY KEY (data_source_id, page_id)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS replica_sync_state (
+                data_source_id TEXT PRIMARY KEY,
+                high_water TEXT,
+                synced_at REAL NOT NULL,
+                full_synced_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _normalize_data_source_id(data_source_id: str) -> str:
+    return data_source_id.replace("collection://", "")
+
+
+def _is_removed(page: Dict[str, Any]) -> bool:
+    return bool(page.get("archived") or page.get("in_trash"))
+
+
+def _get_sync_state(data_source_id: str) -> Optional[Dict[str, Any]]:
+    row = _get_connection().execute(
+        "SELECT high_water, synced_at, full_synced_at FROM replica_sync_state WHERE data_source_id = ?",
+        (data_source_id,)
+    ).fetchone()
+    if row is None:
+        return None
+    return {"high_water": row[0], "synced_at": row[1], "full_synced_at": row[2]}
+
+
+def _write_pages(conn: sqlite3.Connection, data_source_id: str, pages: Iterable[Dict[str, Any]]) -> None:
+    for page in pages:
+        page_id = page.get("id")
+        if not page_id:
+            continue
+        if _is_removed(page):
+            conn.execute(
+                "DELETE FROM replica_pages WHERE data_source_id = ? AND page_id = ?",
+                (data_source_id, page_id)
+            )
+        else:
+            conn.execute(
+                "INSERT OR REPLACE INTO replica_pages "
+                "(data_source_id, page_id, last_edited_time, page_json) VALUES (?, ?, ?, ?)",
+                (data_source_id, page_id, page.get("last_edited_time"), json.dumps(page))
+            )
+
+
+def upsert_pages(data_source_id: str, pages: Iterable[Dict[str, Any]]) -> None:
+    """Write page objects into the replica (archived/trashed pages are removed).
+
+    Args:
+        data_source_id: Data source the pages belong to
+        pages: Raw Notion page objects
+    """
+    data_source_id = _normalize_data_source_id(data_source_id)
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            _write_pages(conn, data_source_id, pages)
+
+
+def write_through(data_source_id: str, page: Dict[str, Any]) -> None:
+    """Record a page returned by pages.create/pages.update in the replica.
+
+    Never raises - a failed write-through only means the next sync picks the
+    change up instead.
+
+    Args:
+        data_source_id: Data source the page belongs to
+        page: Page object returned by the Notion API
+    """
+    if not is_replica_enabled() or not is_replicated(data_source_id):
+        return
+    if not isinstance(page, dict) or "properties" not in page:
+        return
+    try:
+        upsert_pages(data_source_id, [page])
+    except sqlite3.Error:
+        pass
+
+
+def sync_data_source(data_source_id: str, full: bool = False) -> Dict[str, Any]:
+    """Sync a data source into the replica.
+
+    The first sync (or full=True) pulls every page and replaces the local copy.
+    Later syncs only fetch pages edited since the stored high-water mark.
+
+    Args:
+        data_source_id: Data source to sync
+        full: Force a full resync
+
+    Returns:
+        Dict with mode ("full" or "incremental") and pages_fetched
+    """
+    from .notion_client import query_database_complete
+
+    data_source_id = _normalize_data_source_id(data_source_id)
+    with _lock:
+        state = _get_sync_state(data_source_id)
+        now = time.time()
+        if state is None or state["high_water"] is None:
+            full = True
+        elif now - state["full_synced_at"] > FULL_RESYNC_SECONDS:
+            full = True
+
+        filter_dict = None
+        if not full:
+            since = datetime.fromisoformat(state["high_water"].replace("Z", "+00:00")) - SYNC_OVERLAP
+            filter_dict = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": since.isoformat()}
+            }
+
+        pages = query_database_complete(
+            data_source_id,
+            filter_dict=filter_dict,
+            use_data_source=True,
+            use_replica=False
+        )
+
+        high_water = state["high_water"] if state else None
+        for page in pages:
+            edited = page.get("last_edited_time")
+            if edited and (high_water is None or edited > high_water):
+                high_water = edited
+
+        conn = _get_connection()
+        with conn:
+            if full:
+                conn.execute("DELETE FROM replica_pages WHERE data_source_id = ?", (data_source_id,))
+            _write_pages(conn, data_source_id, pages)
+            conn.execute(
+                "INSERT OR REPLACE INTO replica_sync_state "
+                "(data_source_id, high_water, synced_at, full_synced_at) VALUES (?, ?, ?, ?)",
+                (
+                    data_source_id,
+                    high_water or datetime.now(timezone.utc).isoformat(),
+                    now,
+                    now if full else state["full_synced_at"],
+                )
+            )
+
+    return {"mode": "full" if full else "incremental", "pages_fetched": len(pages)}
+
+
+def ensure_fresh(data_source_id: str) -> None:
+    """Sync a data source if its replica is older than REPLICA_MAX_AGE_SECONDS."""
+    data_source_id = _normalize_data_source_id(data_source_id)
+    with _lock:
+        state = _get_sync_state(data_source_id)
+        if state is not None and time.time() - state["synced_at"] < REPLICA_MAX_AGE_SECONDS:
+            return
+        sync_data_source(data_source_id)
+
+
+def iter_pages(data_source_id: str) -> Iterator[Dict[str, Any]]:
+    """Yield every replicated page for a data source (no sync).
+
+    Rows are read in batches of READ_BATCH_SIZE and decoded one at a time, so
+    a caller that keeps only part of each page never holds every raw page.
+    The lock is held per batch; a page rewritten mid-scan moves to a new
+    rowid, so pages already yielded are skipped by ID.
+    """
+    data_source_id = _normalize_data_source_id(data_source_id)
+    last_rowid = 0
+    seen = set()
+    while True:
+        with _lock:
+            rows = _get_connection().execute(
+                "SELECT rowid, page_id, page_json FROM replica_pages WHERE data_source_id = ? AND rowid > ? "
+                "ORDER BY rowid LIMIT ?",
+                (data_source_id, last_rowid, READ_BATCH_SIZE)
+            ).fetchall()
+        for rowid, page_id, page_json in rows:
+            last_rowid = rowid
+            if page_id in seen:
+                continue
+            seen.add(page_id)
+            yield json.loads(page_json)
+        if len(rows) < READ_BATCH_SIZE:
+            return
+
+
+def load_pages(data_source_id: str) -> List[Dict[str, Any]]:
+    """Load every replicated page for a data source (no sync)."""
+    return list(iter_pages(data_source_id))
+
+
+def query_replica(
+    data_source_id: str,
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """Answer a data source query from the replica.
+
+    Args:
+        data_source_id: Data source ID
+        filter_dict: Notion filter object
+        sorts: Notion sort list
+
+    Returns:
+        Matching page objects, or None if the query cannot be served locally
+        (replica disabled, unsupported filter, or sync failure) and the caller
+        should go to Notion instead.
+    """
+    results = iter_replica(data_source_id, filter_dict=filter_dict, sorts=sorts)
+    return list(results) if results is not None else None
+
+
+def iter_replica(
+    data_source_id: str,
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None
+) -> Optional[Iterator[Dict[str, Any]]]:
+    """Streaming variant of query_replica.
+
+    Pages are decoded and filtered one at a time. Sorted queries keep only the
+    matching pages, which are sorted once the replica has been read.
+
+    Returns:
+        Iterator over matching page objects, or None if the query cannot be
+        served locally (see query_replica)
+    """
+    if not is_replica_enabled() or not is_replicated(data_source_id):
+        return None
+
+    try:
+        # Validate before syncing so unsupported shapes never cost a sync
+        if filter_dict:
+            _check_filter_supported(filter_dict)
+        if sorts:
+            for sort in sorts:
+                _check_sort_supported(sort)
+        ensure_fresh(data_source_id)
+    except UnsupportedFilterError:
+        return None
+    except Exception:
+        # Replica is an optimization - any sync failure falls back to Notion
+        return None
+
+    pages = iter_pages(data_source_id)
+    if filter_dict:
+        pages = (page for page in pages if matches_filter(page, filter_dict))
+    if sorts:
+        return iter(sort_pages(list(pages), sorts))
+    return pages
+
+
+def evaluate_query(
+    pages: List[Dict[str, Any]],
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None
+) -> List[Dict[str, Any]]:
+    """Apply a Notion filter and sorts to in-memory page objects.
+
+    Args:
+        pages: Raw page objects
+        filter_dict: Notion filter object
+        sorts: Notion sort list
+
+    Returns:
+        Matching pages, sorted
+
+    Raises:
+        UnsupportedFilterError: If the filter or sorts cannot be evaluated locally
+    """
+    if filter_dict:
+        _check_filter_supported(filter_dict)
+        pages = [page for page in pages if matches_filter(page, filter_dict)]
+    if sorts:
+        for sort in sorts:
+            _check_sort_supported(sort)
+        pages = sort_pages(pages, sorts)
+    return pages
+
+
+# ---------------------------------------------------------------------------
+# Local filter evaluation
+# ---------------------------------------------------------------------------
+
+_SUPPORTED_CONDITIONS = {
+    "status": {"equals", "does_not_equal", "is_empty", "is_not_empty"},
+    "select": {"equals", "does_not_equal", "is_empty", "is_not_empty"},
+    "date": {"equals", "before", "after", "on_or_before", "on_or_after", "is_empty", "is_not_empty"},
+    "relation": {"contains", "does_not_contain", "is_empty", "is_not_empty"},
+    "title": {"equals", "does_not_equal", "contains", "does_not_contain", "starts_with", "ends_with", "is_empty", "is_not_empty"},
+    "rich_text": {"equals", "does_not_equal", "contains", "does_not_contain", "starts_with", "ends_with", "is_empty", "is_not_empty"},
+    "checkbox": {"equals", "does_not_equal"},
+    "multi_select": {"contains", "does_not_contain", "is_empty", "is_not_empty"},
+}
+
+_TIMESTAMP_CONDITIONS = _SUPPORTED_CONDITIONS["date"]
+
+
+def _check_filter_supported(filter_dict: Dict) -> None:
+    for compound in ("and", "or"):
+        if compound in filter_dict:
+            for sub_filter in filter_dict[compound]:
+                _check_filter_supported(sub_filter)
+            return
+
+    if "timestamp" in filter_dict:
+        timestamp = filter_dict["timestamp"]
+        if timestamp not in ("created_time", "last_edited_time"):
+            raise UnsupportedFilterError(timestamp)
+        conditions = filter_dict.get(timestamp, {})
+        if not conditions or set(conditions) - _TIMESTAMP_CONDITIONS:
+            raise UnsupportedFilterError(filter_dict)
+        return
+
+    if "property" not in filter_dict:
+        raise UnsupportedFilterError(filter_dict)
+    for filter_type, conditions in filter_dict.items():
+        if filter_type == "property":
+            continue
+        supported = _SUPPORTED_CONDITIONS.get(filter_type)
+        if supported is None or not conditions or set(conditions) - supported:
+            raise UnsupportedFilterError(filter_dict)
+
+
+def _check_sort_supported(sort: Dict) -> None:
+    if "timestamp" in sort:
+        if sort["timestamp"] not in ("created_time", "last_edited_time"):
+            raise UnsupportedFilterError(sort)
+    elif "property" not in sort:
+        raise UnsupportedFilterError(sort)
+
+
+def _normalize_id(value: Optional[str]) -> str:
+    return (value or "").replace("-", "").lower()
+
+
+def _plain_text(items: Optional[List[Dict[str, Any]]]) -> str:
+    return "".join(item.get("plain_text") or item.get("text", {}).get("content", "") for item in items or [])
+
+
+def _property_value(page: Dict[str, Any], property_name: str) -> Any:
+    """Get a comparable value for a page property (None when empty)."""
+    prop = page.get("properties", {}).get(property_name)
+    if not prop:
+        return None
+    prop_type = prop.get("type") or next((k for k in prop if k not in ("id", "type")), None)
+    value = prop.get(prop_type)
+
+    if prop_type in ("status", "select"):
+        return value.get("name") if value else None
+    if prop_type == "date":
+        return value.get("start") if value else None
+    if prop_type in ("title", "rich_text"):
+        return _plain_text(value)
+    if prop_type == "relation":
+        return [_normalize_id(rel.get("id")) for rel in value or []]
+    if prop_type == "multi_select":
+        return [option.get("name") for option in value or []]
+    if prop_type == "formula" and value:
+        return value.get(value.get("type"))
+    return value
+
+
+def _compare_dates(actual: str, expected: str) -> int:
+    """Compare two ISO date/datetime strings, at date granularity for bare dates."""
+    if len(expected) == 10 or len(actual) == 10:
+        actual, expected = actual[:10], expected[:10]
+    else:
+        actual_dt = datetime.fromisoformat(actual.replace("Z", "+00:00"))
+        expected_dt = datetime.fromisoformat(expected.replace("Z", "+00:00"))
+        if actual_dt.tzinfo is None:
+            actual_dt = actual_dt.replace(tzinfo=timezone.utc)
+        if expected_dt.tzinfo is None:
+            expected_dt = expected_dt.replace(tzinfo=timezone.utc)
+        actual, expected = actual_dt, expected_dt
+    return (actual > expected) - (actual < expected)
+
+
+def _match_date(actual: Optional[str], conditions: Dict[str, Any]) -> bool:
+    for op, expected in conditions.items():
+        if op == "is_empty":
+            if bool(actual) == bool(expected):
+                return False
+            continue
+        if op == "is_not_empty":
+            if (not actual) == bool(expected):
+                return False
+            continue
+        if not actual:
+            return False
+        cmp = _compare_dates(actual, expected)
+        if op == "equals" and cmp != 0:
+            return False
+        if op == "before" and cmp >= 0:
+            return False
+        if op == "after" and cmp <= 0:
+            return False
+        if op == "on_or_before" and cmp > 0:
+            return False
+        if op == "on_or_after" and cmp < 0:
+            return False
+    return True
+
+
+def _match_text(actual: Optional[str], conditions: Dict[str, Any]) -> bool:
+    text = (actual or "").lower()
+    for op, expected in conditions.items():
+        if op == "is_empty":
+            if bool(text) == bool(expected):
+                return False
+            continue
+        if op == "is_not_empty":
+            if (not text) == bool(expected):
+                return False
+            continue
+        expected = str(expected).lower()
+        if op == "equals" and text != expected:
+            return False
+        if op == "does_not_equal" and text == expected:
+            return False
+        if op == "contains" and expected not in text:
+            return False
+        if op == "does_not_contain" and expected in text:
+            return False
+        if op == "starts_with" and not text.startswith(expected):
+            return False
+        if op == "ends_with" and not text.endswith(expected):
+            return False
+    return True
+
+
+def _match_option(actual: Optional[str], conditions: Dict[str, Any]) -> bool:
+    for op, expected in conditions.items():
+        if op == "equals" and actual != expected:
+            return False
+        if op == "does_not_equal" and actual == expected:
+            return False
+        if op == "is_empty" and bool(actual) == bool(expected):
+            return False
+        if op == "is_not_empty" and (not actual) == bool(expected):
+            return False
+    return True
+
+
+def _match_list(actual: Optional[List[str]], conditions: Dict[str, Any], normalize=lambda v: v) -> bool:
+    values = actual or []
+    for op, expected in conditions.items():
+        if op == "contains" and normalize(expected) not in values:
+            return False
+        if op == "does_not_contain" and normalize(expected) in values:
+            return False
+        if op == "is_empty" and bool(values) == bool(expected):
+            return False
+        if op == "is_not_empty" and (not values) == bool(expected):
+            return False
+    return True
+
+
+def matches_filter(page: Dict[str, Any], filter_dict: Dict) -> bool:
+    """Evaluate a Notion filter object against a raw page.
+
+    Args:
+        page: Raw Notion page object
+        filter_dict: Notion filter object (property, timestamp, and/or compounds)
+
+    Returns:
+        True if the page matches the filter
+
+    Raises:
+        UnsupportedFilterError: If the filter uses a condition not evaluated locally
+    """
+    if "and" in filter_dict:
+        return all(matches_filter(page, sub_filter) for sub_filter in filter_dict["and"])
+    if "or" in filter_dict:
+        return any(matches_filter(page, sub_filter) for sub_filter in filter_dict["or"])
+
+    if "timestamp" in filter_dict:
+        timestamp = filter_dict["timestamp"]
+        return _match_date(page.get(timestamp), filter_dict.get(timestamp, {}))
+
+    _check_filter_supported(filter_dict)
+    property_name = filter_dict["property"]
+    actual = _property_value(page, property_name)
+
+    for filter_type, conditions in filter_dict.items():
+        if filter_type == "property":
+            continue
+        if filter_type == "date":
+            return _match_date(actual, conditions)
+        if filter_type in ("title", "rich_text"):
+            return _match_text(actual, conditions)
+        if filter_type in ("status", "select"):
+            return _match_option(actual, conditions)
+        if filter_type == "relation":
+            return _match_list(actual, conditions, normalize=_normalize_id)
+        if filter_type == "multi_select":
+            return _match_list(actual, conditions)
+        if filter_type == "checkbox":
+            expected = conditions.get("equals", not conditions.get("does_not_equal", False))
+            return bool(actual) == expected
+    raise UnsupportedFilterError(filter_dict)
+
+
+def sort_pages(pages: List[Dict[str, Any]], sorts: List[Dict]) -> List[Dict[str, Any]]:
+    """Sort raw pages like Notion does (empty values last in either direction).
+
+    Args:
+        pages: Raw Notion page objects
+        sorts: Notion sort list (property or timestamp sorts)
+
+    Returns:
+        New sorted list
+    """
+    result = list(pages)
+    # Apply sorts in reverse so the first sort is the primary key
+    for sort in reversed(sorts):
+        _check_sort_supported(sort)
+        descending = sort.get("direction") == "descending"
+
+        def key(page, sort=sort):
+            if "timestamp" in sort:
+                value = page.get(sort["timestamp"])
+            else:
+                value = _property_value(page, sort["property"])
+            if isinstance(value, str):
+                value = value.lower()
+            return value
+
+        present = [page for page in result if key(page) not in (None, "", [])]
+        empty = [page for page in result if key(page) in (None, "", [])]
+        present.sort(key=key, reverse=descending)
+        result = present + empty
+    return result
@@ -0,0 +1,264 @@
+"""Rate-limit-aware scheduler for Notion API requests.
+
+Every request made through the shared Notion client passes through one
+NotionRequestScheduler, which:
+- Paces requests with a token bucket matched to Notion's ~3 req/s average
+- Retries 429s (honoring Retry-After) and 5xx responses with jittered backoff
+- Charges each request against the active request budget, if any
+- Keeps counters (requests, retries, throttle wait) that the CLI displays
+"""
+
+import contextvars
+import functools
+import inspect
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from .rate_limit import TokenBucket
+
+# Notion's documented average rate limit is 3 requests per second
+DEFAULT_RATE_PER_SECOND = 3.0
+DEFAULT_BURST = 3
+
+MAX_RETRIES = 5
+INITIAL_BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 30.0
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Notion requests an agent tool invocation may make unless the tool sets its own budget
+DEFAULT_TOOL_REQUEST_BUDGET = 200
+
+
+class RequestBudgetExceeded(Exception):
+    """Raised when a tool invocation exceeds its Notion request budget."""
+
+
+class RequestBudget:
+    """Request allowance for a single tool invocation."""
+
+    def __init__(self, max_requests: int, name: Optional[str] = None):
+        self.max_requests = max_requests
+        self.name = name
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def charge(self) -> None:
+        with self._lock:
+            if self.used >= self.max_requests:
+                label = f" for {self.name}" if self.name else ""
+                raise RequestBudgetExceeded(
+                    f"Notion request budget{label} exhausted ({self.max_requests} requests)"
+                )
+            self.used += 1
+
+
+_current_budget: "contextvars.ContextVar[Optional[RequestBudget]]" = contextvars.ContextVar(
+    "notion_request_budget", default=None
+)
+
+
+@contextmanager
+def request_budget(max_requests: int, name: Optional[str] = None):
+    """Limit the Notion requests made inside the block.
+
+    Nested budgets do not widen an outer one - the innermost budget is charged.
+    Worker threads see the budget when submitted with contextvars.copy_context().
+
+    Args:
+        max_requests: Maximum requests (including retries)
+        name: Label used in the RequestBudgetExceeded message
+    """
+    token = _current_budget.set(RequestBudget(max_requests, name))
+    try:
+        yield _current_budget.get()
+    finally:
+        _current_budget.reset(token)
+
+
+def with_request_budget(max_requests: int) -> Callable:
+    """Decorator giving each call of a tool its own request budget.
+
+    Args:
+        max_requests: Maximum Notion requests per invocation
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with request_budget(max_requests, name=func.__name__):
+                return func(*args, **kwargs)
+        wrapper.request_budget = max_requests
+        return wrapper
+    return decorator
+
+
+def with_default_request_budget(tools: List) -> List:
+    """Give each agent tool that has no budget of its own the default budget.
+
+    Tools decorated with @with_request_budget keep theirs. Only the copies
+    handed to the agent are wrapped, so tools calling each other directly
+    are not given nested budgets.
+
+    Args:
+        tools: Tools as passed to Agent(tools=...)
+
+    Returns:
+        The tools, plain functions wrapped with DEFAULT_TOOL_REQUEST_BUDGET
+    """
+    return [
+        with_request_budget(DEFAULT_TOOL_REQUEST_BUDGET)(tool)
+        if inspect.isfunction(tool) and not hasattr(tool, "request_budget") else tool
+        for tool in tools
+    ]
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    status = getattr(error, "status", None)
+    if isinstance(status, int):
+        return status
+    code = str(getattr(error, "code", ""))
+    if code.endswith("rate_limited"):
+        return 429
+    return None
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    headers = getattr(error, "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+    except AttributeError:
+        return None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_idempotent(method: str, path: str) -> bool:
+    """Reads are safe to retry on 5xx; query/search endpoints are POST but read-only."""
+    if method.upper() in ("GET", "DELETE"):
+        return True
+    return path.rstrip("/").endswith("/query") or path.strip("/") == "search"
+
+
+class NotionRequestScheduler:
+    """Paces, retries and accounts for Notion API requests."""
+
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = MAX_RETRIES
+    ):
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self.max_retries = max_retries
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Zero all counters."""
+        with self._stats_lock:
+            self._stats = {
+                "requests": 0,
+                "retries": 0,
+                "rate_limited": 0,
+                "server_errors": 0,
+                "failures": 0,
+                "throttle_wait_seconds": 0.0,
+                "retry_wait_seconds": 0.0,
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of the counters."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["throttle_wait_seconds"] = round(stats["throttle_wait_seconds"], 3)
+        stats["retry_wait_seconds"] = round(stats["retry_wait_seconds"], 3)
+        return stats
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def execute(self, send: Callable[[], Any], method: str = "GET", path: str = "") -> Any:
+        """Run one Notion request under the rate limit, retrying when allowed.
+
+        Args:
+            send: Zero-argument callable performing the HTTP request
+            method: HTTP method (decides whether 5xx responses are retried)
+            path: API path (query/search POSTs are treated as reads)
+
+        Returns:
+            Whatever send() returns
+
+        Raises:
+            RequestBudgetExceeded: If the active budget is exhausted
+            Exception: The last error once retries are exhausted or not allowed
+        """
+        attempt = 0
+        while True:
+            budget = _current_budget.get()
+            if budget is not None:
+                budget.charge()
+
+            self._count("throttle_wait_seconds", self.bucket.acquire())
+            self._count("requests")
+            try:
+                return send()
+            except RequestBudgetExceeded:
+                raise
+            except Exception as error:
+                status = _error_status(error)
+                if status == 429:
+                    self._count("rate_limited")
+                elif status is not None and status >= 500:
+                    self._count("server_errors")
+
+                retryable = status == 429 or (
+                    status in RETRYABLE_STATUSES and _is_idempotent(method, path)
+                )
+                if not retryable or attempt >= self.max_retries:
+                    self._count("failures")
+                    raise
+
+                retry_after = _retry_after_seconds(error)
+                if retry_after is not None:
+                    delay = retry_after
+                else:
+                    # Exponential backoff with jitter
+                    base = min(MAX_BACKOFF_SECONDS, INITIAL_BACKOFF_SECONDS * (2 ** attempt))
+                    delay = base * random.uniform(0.5, 1.0)
+                if status == 429:
+                    # Everyone sharing the client should back off, not just this caller
+                    self.bucket.pause(delay)
+                else:
+                    time.sleep(delay)
+                self._count("retries")
+                self._count("retry_wait_seconds", delay)
+                attempt += 1
+
+
+_scheduler: Optional[NotionRequestScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_request_scheduler() -> NotionRequestScheduler:
+    """Get the shared scheduler (singleton)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = NotionRequestScheduler()
+        return _scheduler
+
+
+def get_request_stats() -> Dict[str, Any]:
+    """Get the shared scheduler's counters."""
+    return get_request_scheduler().get_stats()
+
+
+def reset_request_stats() -> None:
+    """Zero the shared scheduler's counters."""
+    get_request_scheduler().reset_stats()
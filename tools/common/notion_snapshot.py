@@ -0,0 +1,133 @@
+"""Run-scoped snapshot of the Tasks and Projects data sources.
+
+One orchestrator turn (e.g. a weekly review) calls several tools that query
+overlapping task sets. Inside snapshot_run(), the first Tasks or Projects
+query fetches every page of that data source once; every later
+query_database_complete() call for it is evaluated against the in-memory copy
+until the run ends or a write invalidates it.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from .constants import TASKS_DATA_SOURCE_ID, PROJECTS_DATA_SOURCE_ID
+
+# Data sources captured by the snapshot
+SNAPSHOT_DATA_SOURCES = {TASKS_DATA_SOURCE_ID, PROJECTS_DATA_SOURCE_ID}
+
+_lock = threading.RLock()
+_active_runs = 0
+_pages: Dict[str, List[Dict[str, Any]]] = {}
+_generation = 0
+
+
+def _normalize_data_source_id(data_source_id: str) -> str:
+    return data_source_id.replace("collection://", "")
+
+
+@contextmanager
+def snapshot_run():
+    """Share one snapshot across everything executed inside the block.
+
+    Runs may nest (and may overlap across threads); the snapshot is dropped
+    when the last one exits.
+    """
+    global _active_runs
+    with _lock:
+        _active_runs += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _active_runs -= 1
+            if _active_runs == 0:
+                invalidate_snapshot()
+
+
+def is_snapshot_active() -> bool:
+    """Check whether a snapshot run is in progress."""
+    with _lock:
+        return _active_runs > 0
+
+
+def invalidate_snapshot() -> None:
+    """Drop snapshotted pages so the next query refetches them."""
+    global _generation
+    with _lock:
+        _pages.clear()
+        _generation += 1
+
+
+def get_snapshot_generation() -> int:
+    """Counter bumped on every invalidation (for caches derived from the snapshot)."""
+    with _lock:
+        return _generation
+
+
+def get_snapshot_pages(data_source_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Get every non-archived page of a snapshotted data source.
+
+    Args:
+        data_source_id: Tasks or Projects data source ID
+
+    Returns:
+        Raw page objects, or None if no run is active or the data source is not
+        snapshotted
+    """
+    data_source_id = _normalize_data_source_id(data_source_id)
+    if data_source_id not in SNAPSHOT_DATA_SOURCES:
+        return None
+
+    with _lock:
+        if _active_runs == 0:
+            return None
+        if data_source_id in _pages:
+            return _pages[data_source_id]
+        generation = _generation
+
+    # Fetch without holding the lock so other data sources and invalidations
+    # are not blocked behind the Notion round trips
+    from .notion_client import query_database_complete
+    pages = [
+        page for page in query_database_complete(data_source_id, use_data_source=True, use_snapshot=False)
+        if not page.get("archived") and not page.get("in_trash")
+    ]
+    with _lock:
+        if _generation != generation:
+            # Invalidated (or the run ended) mid-fetch; don't install pages that may predate the write
+            return pages
+        return _pages.setdefault(data_source_id, pages)
+
+
+def query_snapshot(
+    data_source_id: str,
+    filter_dict: Optional[Dict] = None,
+    sorts: Optional[List[Dict]] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """Answer a data source query from the active snapshot.
+
+    Args:
+        data_source_id: Data source ID
+        filter_dict: Notion filter object
+        sorts: Notion sort list
+
+    Returns:
+        Matching page objects, or None if the query cannot be served from the
+        snapshot (no active run, other data source, or unsupported filter)
+    """
+    from .notion_replica import evaluate_query, UnsupportedFilterError
+
+    if _normalize_data_source_id(data_source_id) not in SNAPSHOT_DATA_SOURCES or not is_snapshot_active():
+        return None
+
+    try:
+        # Validate on an empty list first so unsupported shapes never trigger a fetch
+        evaluate_query([], filter_dict=filter_dict, sorts=sorts)
+    except UnsupportedFilterError:
+        return None
+
+    pages = get_snapshot_pages(data_source_id)
+    if pages is None:
+        return None
+    return list(evaluate_query(pages, filter_dict=filter_dict, sorts=sorts))
@@ -0,0 +1,276 @@
+"""On-disk cache of extracted page text, keyed on (page_id, last_edited_time).
+
+Meeting transcripts are effectively immutable once written, yet several tools
+re-download their full block trees on every call. Extracted text is stored in
+data/page_cache.db, content-addressed by SHA-256 so identical bodies are kept
+once, and evicted least-recently-used once the cache exceeds
+PAGE_CACHE_MAX_BYTES.
+
+Run `python -m tools.common.page_cache prewarm --days 30` to fill the cache
+with recent transcripts ahead of time.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Upper bound on cached text (bytes, UTF-8) before LRU eviction kicks in
+PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+
+def get_db_path() -> str:
+    """Get the path to the page cache SQLite database file."""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    data_dir = os.path.join(project_root, "data")
+
+    # Create data directory if it doesn't exist
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir, exist_ok=True)
+
+    return os.path.join(data_dir, "page_cache.db")
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared cache connection, creating tables on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_text_blobs (
+                content_hash TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_text_cache (
+                page_id TEXT NOT NULL,
+                last_edited_time TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                last_accessed REAL NOT NULL,
+                PRIMARY KEY (page_id, last_edited_time)
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_page_text_cache_accessed
+            ON page_text_cache(last_accessed)
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _normalize_page_id(page_id: str) -> str:
+    return page_id.replace("-", "").lower()
+
+
+def get_cached_page_text(page_id: str, last_edited_time: Optional[str] = None) -> Optional[str]:
+    """Look up cached text for a page without touching the network.
+
+    Args:
+        page_id: Notion page ID
+        last_edited_time: Page version to match. If None, the newest cached
+            version is returned (only appropriate for immutable pages such as
+            transcripts).
+
+    Returns:
+        Cached text, or None on a miss
+    """
+    key = _normalize_page_id(page_id)
+    with _lock:
+        conn = _get_connection()
+        if last_edited_time:
+            row = conn.execute(
+                "SELECT c.last_edited_time, b.text FROM page_text_cache c "
+                "JOIN page_text_blobs b ON b.content_hash = c.content_hash "
+                "WHERE c.page_id = ? AND c.last_edited_time = ?",
+                (key, last_edited_time)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT c.last_edited_time, b.text FROM page_text_cache c "
+                "JOIN page_text_blobs b ON b.content_hash = c.content_hash "
+                "WHERE c.page_id = ? ORDER BY c.last_edited_time DESC LIMIT 1",
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        with conn:
+            conn.execute(
+                "UPDATE page_text_cache SET last_accessed = ? WHERE page_id = ? AND last_edited_time = ?",
+                (time.time(), key, row[0])
+            )
+        return row[1]
+
+
+def store_page_text(page_id: str, last_edited_time: str, text: str) -> None:
+    """Store extracted text for a page version and evict if over the size bound.
+
+    Args:
+        page_id: Notion page ID
+        last_edited_time: Page version the text was extracted from
+        text: Extracted page text
+    """
+    key = _normalize_page_id(page_id)
+    encoded = text.encode("utf-8")
+    content_hash = hashlib.sha256(encoded).hexdigest()
+    with _lock:
+        conn = _get_connection()
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO page_text_blobs (content_hash, text, size) VALUES (?, ?, ?)",
+                (content_hash, text, len(encoded))
+            )
+            # Older versions of the page are superseded by this one
+            conn.execute(
+                "DELETE FROM page_text_cache WHERE page_id = ? AND last_edited_time != ?",
+                (key, last_edited_time)
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO page_text_cache "
+                "(page_id, last_edited_time, content_hash, last_accessed) VALUES (?, ?, ?, ?)",
+                (key, last_edited_time, content_hash, time.time())
+            )
+            _evict(conn, PAGE_CACHE_MAX_BYTES)
+
+
+def _evict(conn: sqlite3.Connection, max_bytes: int) -> None:
+    """Drop least-recently-used entries until total blob size fits max_bytes."""
+    conn.execute(
+        "DELETE FROM page_text_blobs WHERE content_hash NOT IN "
+        "(SELECT content_hash FROM page_text_cache)"
+    )
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM page_text_blobs").fetchone()[0]
+    if total <= max_bytes:
+        return
+
+    rows = conn.execute(
+        "SELECT c.page_id, c.last_edited_time, c.content_hash, b.size FROM page_text_cache c "
+        "JOIN page_text_blobs b ON b.content_hash = c.content_hash ORDER BY c.last_accessed ASC"
+    ).fetchall()
+    for page_id, last_edited_time, content_hash, size in rows:
+        if total <= max_bytes:
+            break
+        conn.execute(
+            "DELETE FROM page_text_cache WHERE page_id = ? AND last_edited_time = ?",
+            (page_id, last_edited_time)
+        )
+        still_used = conn.execute(
+            "SELECT 1 FROM page_text_cache WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        if not still_used:
+            conn.execute("DELETE FROM page_text_blobs WHERE content_hash = ?", (content_hash,))
+            total -= size
+
+
+def get_page_text_cached(page_id: str, last_edited_time: Optional[str] = None) -> Dict[str, Any]:
+    """Get page text through the cache, fetching and storing it on a miss.
+
+    Args:
+        page_id: Notion page ID
+        last_edited_time: Known page version (e.g. from a data source query).
+            If None, any cached version is served; on a miss one pages.retrieve
+            call resolves the version before the body is fetched.
+
+    Returns:
+        Dict with:
+        - text: Page text
+        - cache_hit: Whether the text came from the cache
+        - request_count: Notion requests made (0 on a hit)
+        - latency_ms: Wall time in milliseconds
+    """
+    started = time.perf_counter()
+    cached = get_cached_page_text(page_id, last_edited_time)
+    if cached is not None:
+        return {
+            "text": cached,
+            "cache_hit": True,
+            "request_count": 0,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    from .notion_client import get_notion_client
+    from .block_fetcher import fetch_page_text
+
+    request_count = 0
+    if not last_edited_time:
+        page = get_notion_client().pages.retrieve(page_id=page_id)
+        request_count += 1
+        last_edited_time = page.get("last_edited_time") or ""
+
+    fetched = fetch_page_text(page_id)
+    request_count += fetched["request_count"]
+    if last_edited_time:
+        store_page_text(page_id, last_edited_time, fetched["text"])
+
+    return {
+        "text": fetched["text"],
+        "cache_hit": False,
+        "request_count": request_count,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get cache size information.
+
+    Returns:
+        Dict with entries, blobs, total_bytes and max_bytes
+    """
+    with _lock:
+        conn = _get_connection()
+        entries = conn.execute("SELECT COUNT(*) FROM page_text_cache").fetchone()[0]
+        blobs, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM page_text_blobs").fetchone()
+    return {"entries": entries, "blobs": blobs, "total_bytes": total, "max_bytes": PAGE_CACHE_MAX_BYTES}
+
+
+def prewarm_transcripts(days: int = 30) -> Dict[str, Any]:
+    """Fetch and cache the text of every transcript from the last N days.
+
+    Args:
+        days: Number of days to look back by meeting Date
+
+    Returns:
+        Dict with transcripts (seen), fetched (newly cached) and cached (already present)
+    """
+    from datetime import date, timedelta
+    from .notion_client import query_database_complete
+    from .constants import MEETING_TRANSCRIPTS_DATA_SOURCE_ID
+
+    since = (date.today() - timedelta(days=days)).isoformat()
+    pages = query_database_complete(
+        MEETING_TRANSCRIPTS_DATA_SOURCE_ID,
+        filter_dict={"property": "Date", "date": {"on_or_after": since}},
+        use_data_source=True
+    )
+
+    fetched = 0
+    for page in pages:
+        result = get_page_text_cached(page["id"], page.get("last_edited_time"))
+        if not result["cache_hit"]:
+            fetched += 1
+
+    return {"transcripts": len(pages), "fetched": fetched, "cached": len(pages) - fetched}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the on-disk page text cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    prewarm_parser = subparsers.add_parser("prewarm", help="Cache transcripts from the last N days")
+    prewarm_parser.add_argument("--days", type=int, default=30)
+    subparsers.add_parser("stats", help="Show cache size")
+    args = parser.parse_args()
+
+    if args.command == "prewarm":
+        print(prewarm_transcripts(days=args.days))
+    else:
+        print(get_cache_stats())
@@ -1,14 +1,23 @@
 """Session storage configuration for agent memory management."""
 
 import os
+import threading
+from typing import Dict
 from agno.db.sqlite import SqliteDb
 
+# One SqliteDb (and so one engine and connection pool) per database file,
+# shared by the orchestrator and every agent
+_storages: Dict[str, SqliteDb] = {}
+_storages_lock = threading.Lock()
+
 
 def get_session_storage(table_name: str = "agent_sessions") -> SqliteDb:
-    """Create and return a SQLite storage instance for session management.
+    """Return the shared SQLite storage instance for session management.
     
     Args:
         table_name: Name of the table to store sessions in the database
+            (kept for compatibility; agno keys sessions by agent/team ID
+            within its own sessions table)
         
     Returns:
         SqliteDb instance configured for session storage
@@ -24,4 +33,7 @@ def get_session_storage(table_name: str = "agent_sessions") -> SqliteDb:
     
     db_file = os.path.join(data_dir, "sessions.db")
     
-    return SqliteDb(db_file=db_file)
+    with _storages_lock:
+        if db_file not in _storages:
+            _storages[db_file] = SqliteDb(db_file=db_file)
+        return _storages[db_file]
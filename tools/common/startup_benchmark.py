@@ -0,0 +1,188 @@
+"""Startup benchmark for main.py.
+
+Measures, in fresh interpreters:
+
+- import time of main (python -X importtime), broken down by top-level package
+- time to first token: wall-clock time from launching the process to the
+  first streamed content chunk of a one-shot request (needs OPENAI_API_KEY)
+
+Run it before and after changes that touch startup, or with the --max-*
+thresholds in CI to fail on regressions:
+
+    python -m tools.common.startup_benchmark --max-import-ms 1500
+    python -m tools.common.startup_benchmark --prompt "What's on my plate today?"
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# "import time: self [us] | cumulative | imported package", nesting shown by indentation
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)\s*$")
+
+# Streams one request through the orchestrator and reports the first content chunk
+_FIRST_TOKEN_SCRIPT = """
+import sys
+from main import orchestrator_team
+for chunk in orchestrator_team.run(sys.argv[1], stream=True):
+    if getattr(chunk, "content", None):
+        print("FIRST_TOKEN", flush=True)
+        break
+"""
+
+
+def parse_importtime(stderr: str, module: str = "main") -> Dict[str, Any]:
+    """Parse -X importtime output.
+
+    Args:
+        stderr: stderr of `python -X importtime -c "import <module>"`
+        module: Module whose import was timed
+
+    Returns:
+        Dict with total_ms (cumulative import time of module) and packages
+        ((top-level package, ms) for everything importing module pulled in,
+        slowest first)
+    """
+    total_us = None
+    packages: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match.group(1)), int(match.group(2)), match.group(3), match.group(4)
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+        # Top-level imports are indented by one space; they are logged after everything they import
+        if len(indent) == 1:
+            if name == module:
+                total_us = cumulative_us
+                break
+            packages = {}
+    if total_us is None:
+        raise ValueError(f"No import time recorded for {module}")
+
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return {"total_ms": total_us / 1000, "packages": [(package, us / 1000) for package, us in ranked]}
+
+
+def measure_import_time(module: str = "main", runs: int = 5) -> Dict[str, Any]:
+    """Time importing a module in fresh interpreters.
+
+    Args:
+        module: Module to import (run from the project root)
+        runs: Number of interpreters to launch; the median is reported
+
+    Returns:
+        Dict with import_ms (median cumulative import time), wall_ms (median
+        process wall-clock time, interpreter startup included), runs and
+        packages (per-package import time of the median run, slowest first)
+    """
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        wall_ms = (time.perf_counter() - started) * 1000
+        if result.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+        parsed = parse_importtime(result.stderr, module)
+        samples.append((parsed["total_ms"], wall_ms, parsed["packages"]))
+
+    samples.sort(key=lambda sample: sample[0])
+    import_ms, _, packages = samples[len(samples) // 2]
+    return {
+        "import_ms": round(import_ms, 1),
+        "wall_ms": round(statistics.median(sample[1] for sample in samples), 1),
+        "runs": runs,
+        "packages": [(name, round(ms, 1)) for name, ms in packages],
+    }
+
+
+def measure_time_to_first_token(prompt: str, runs: int = 1, timeout: float = 120.0) -> Dict[str, Any]:
+    """Time from launching a process to the first streamed token of a one-shot request.
+
+    Args:
+        prompt: Request to send to the orchestrator
+        runs: Number of requests (each in a fresh interpreter); the median is reported
+        timeout: Seconds to wait for the first token of each run
+
+    Returns:
+        Dict with ttft_ms (median), samples_ms and runs
+    """
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-c", _FIRST_TOKEN_SCRIPT, prompt],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            ttft_ms = None
+            for line in process.stdout:
+                if line.startswith("FIRST_TOKEN"):
+                    ttft_ms = (time.perf_counter() - started) * 1000
+                    break
+            if ttft_ms is None:
+                _, stderr = process.communicate(timeout=timeout)
+                raise RuntimeError(f"No token streamed (exit code {process.returncode}):\n{stderr[-2000:]}")
+            samples.append(ttft_ms)
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+    return {
+        "ttft_ms": round(statistics.median(samples), 1),
+        "samples_ms": [round(sample, 1) for sample in samples],
+        "runs": runs,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark main.py startup.")
+    parser.add_argument("--runs", type=int, default=5, help="Interpreters launched for the import benchmark")
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list")
+    parser.add_argument("--prompt", default=None, help="Also measure time to first token for this request")
+    parser.add_argument("--ttft-runs", type=int, default=1, help="Requests sent for the time-to-first-token benchmark")
+    parser.add_argument("--max-import-ms", type=float, default=None, help="Fail if importing main takes longer")
+    parser.add_argument("--max-ttft-ms", type=float, default=None, help="Fail if the first token takes longer")
+    args = parser.parse_args(argv)
+
+    failures = []
+
+    imports = measure_import_time(runs=args.runs)
+    print(f"import main: {imports['import_ms']} ms "
+          f"(process wall-clock {imports['wall_ms']} ms, median of {imports['runs']})")
+    for name, ms in imports["packages"][:args.top]:
+        print(f"  {ms:>9.1f} ms  {name}")
+    if args.max_import_ms is not None and imports["import_ms"] > args.max_import_ms:
+        failures.append(f"import main took {imports['import_ms']} ms (max {args.max_import_ms} ms)")
+
+    if args.prompt:
+        first_token = measure_time_to_first_token(args.prompt, runs=args.ttft_runs)
+        print(f"time to first token: {first_token['ttft_ms']} ms (samples: {first_token['samples_ms']})")
+        if args.max_ttft_ms is not None and first_token["ttft_ms"] > args.max_ttft_ms:
+            failures.append(f"first token took {first_token['ttft_ms']} ms (max {args.max_ttft_ms} ms)")
+
+    for failure in failures:
+        print(f"REGRESSION: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,490 @@
+"""Local full-text index of the Meeting Transcripts data source.
+
+search_transcripts used to pull up to 100 transcript pages from Notion and
+match keywords against them on every call. The index keeps each transcript's
+name, date, attendees, notes and URL in data/transcript_index.db, with an FTS5
+table (trigram tokenizer, so matching is case-insensitive substring matching
+like Notion's "contains") over name, attendees, notes and body text. It syncs
+incrementally on last_edited_time, so keyword, attendee and date-range
+searches become a single local query with bm25-ranked snippets.
+
+Body text is taken from the page cache when the transcript version has
+already been fetched; `python -m tools.common.transcript_index sync --bodies`
+fetches and indexes the bodies that are missing.
+
+The trigram tokenizer needs SQLite 3.34 or later. is_transcript_index_enabled()
+checks for it once on an in-memory database; where it is missing the index is
+reported disabled (with one warning) and searches use Notion filters instead.
+The index database itself is only created by the first sync or search.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from .constants import MEETING_TRANSCRIPTS_DATA_SOURCE_ID
+
+# How long a sync stays fresh before the next search triggers an incremental sync
+TRANSCRIPT_INDEX_MAX_AGE_SECONDS = int(os.getenv("TRANSCRIPT_INDEX_MAX_AGE_SECONDS", "300"))
+
+# Incremental syncs cannot see deletions, so resync fully on this interval
+FULL_RESYNC_SECONDS = 24 * 60 * 60
+
+# Notion rounds last_edited_time to the minute, so re-read a small overlap
+SYNC_OVERLAP = timedelta(minutes=2)
+
+# FTS5 trigram queries need at least this many characters; shorter terms use LIKE
+MIN_MATCH_LENGTH = 3
+
+# bm25 column weights: name, attendees, notes, body
+RANK_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+FTS_TABLE_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(
+        name, attendees, notes, body, tokenize='trigram'
+    )
+"""
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+# Whether this SQLite build has been checked for FTS5 trigram support
+_probed = False
+
+# Why the index cannot be created (e.g. SQLite without the trigram tokenizer), once known
+_unavailable_reason: Optional[str] = None
+
+
+def _probe_fts() -> Optional[str]:
+    """Try creating the FTS table in memory; returns the error if this SQLite cannot."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute(FTS_TABLE_SQL)
+    except sqlite3.OperationalError as e:
+        return str(e)
+    finally:
+        conn.close()
+    return None
+
+
+def is_transcript_index_enabled() -> bool:
+    """Check whether the index is enabled (TRANSCRIPT_INDEX_ENABLED, default on) and usable here."""
+    global _probed, _unavailable_reason
+    if os.getenv("TRANSCRIPT_INDEX_ENABLED", "1").lower() in ("0", "false", "no"):
+        return False
+    with _lock:
+        if not _probed:
+            _unavailable_reason = _probe_fts()
+            _probed = True
+            if _unavailable_reason is not None:
+                print(f"Warning: Transcript index unavailable (SQLite {sqlite3.sqlite_version}: "
+                      f"{_unavailable_reason}). Searching Notion directly.")
+    return _unavailable_reason is None
+
+
+def get_db_path() -> str:
+    """Get the path to the transcript index SQLite database file."""
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    data_dir = os.path.join(project_root, "data")
+
+    # Create data directory if it doesn't exist
+    if not os.path.exists(data_dir):
+        os.makedirs(data_dir, exist_ok=True)
+
+    return os.path.join(data_dir, "transcript_index.db")
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get the shared index connection, creating tables on first use."""
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(get_db_path(), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS transcripts (
+                id INTEGER PRIMARY KEY,
+                page_id TEXT NOT NULL UNIQUE,
+                name TEXT NOT NULL,
+                date TEXT,
+                attendees TEXT NOT NULL,
+                notes TEXT NOT NULL,
+                url TEXT,
+                last_edited_time TEXT,
+                body_version TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_transcripts_date ON transcripts(date)")
+        try:
+            conn.execute(FTS_TABLE_SQL)
+        except sqlite3.OperationalError:
+            # FTS5 or its trigram tokenizer (SQLite 3.34+) is missing
+            conn.close()
+            raise
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS transcript_index_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                high_water TEXT,
+                synced_at REAL NOT NULL,
+                full_synced_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _plain_text(items: Optional[List[Dict[str, Any]]]) -> str:
+    return "".join(item.get("plain_text", "") for item in items or [])
+
+
+def transcript_fields(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the searchable fields of a transcript page.
+
+    Args:
+        page: Raw Notion page object from the Meeting Transcripts data source
+
+    Returns:
+        Dict with page_id, name, date, attendees, notes (full), url and last_edited_time
+    """
+    properties = page.get("properties", {})
+    date_value = properties.get("Date", {}).get("date") or {}
+    return {
+        "page_id": page.get("id"),
+        "name": _plain_text(properties.get("Name", {}).get("title")),
+        "date": date_value.get("start"),
+        "attendees": _plain_text(properties.get("Attendees", {}).get("rich_text")),
+        "notes": _plain_text(properties.get("Notes", {}).get("rich_text")),
+        "url": properties.get("URL", {}).get("url"),
+        "last_edited_time": page.get("last_edited_time"),
+    }
+
+
+def _delete_row(conn: sqlite3.Connection, row_id: int) -> None:
+    conn.execute("DELETE FROM transcripts_fts WHERE rowid = ?", (row_id,))
+    conn.execute("DELETE FROM transcripts WHERE id = ?", (row_id,))
+
+
+def _write_pages(conn: sqlite3.Connection, pages: Iterable[Dict[str, Any]]) -> None:
+    from .page_cache import get_cached_page_text
+
+    for page in pages:
+        page_id = page.get("id")
+        if not page_id:
+            continue
+        existing = conn.execute(
+            "SELECT id, body_version FROM transcripts WHERE page_id = ?", (page_id,)
+        ).fetchone()
+        if page.get("archived") or page.get("in_trash"):
+            if existing:
+                _delete_row(conn, existing[0])
+            continue
+
+        fields = transcript_fields(page)
+        # Prefer the body of this version; otherwise keep whatever was indexed before
+        body, body_version = "", None
+        cached = get_cached_page_text(page_id, fields["last_edited_time"]) if fields["last_edited_time"] else None
+        if cached is not None:
+            body, body_version = cached, fields["last_edited_time"]
+        elif existing and existing[1]:
+            row = conn.execute("SELECT body FROM transcripts_fts WHERE rowid = ?", (existing[0],)).fetchone()
+            body, body_version = (row[0] if row else ""), existing[1]
+
+        values = (
+            page_id, fields["name"], fields["date"], fields["attendees"], fields["notes"],
+            fields["url"], fields["last_edited_time"], body_version,
+        )
+        if existing:
+            row_id = existing[0]
+            conn.execute(
+                "UPDATE transcripts SET page_id = ?, name = ?, date = ?, attendees = ?, notes = ?, "
+                "url = ?, last_edited_time = ?, body_version = ? WHERE id = ?",
+                values + (row_id,)
+            )
+            conn.execute("DELETE FROM transcripts_fts WHERE rowid = ?", (row_id,))
+        else:
+            row_id = conn.execute(
+                "INSERT INTO transcripts (page_id, name, date, attendees, notes, url, last_edited_time, "
+                "body_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                values
+            ).lastrowid
+        conn.execute(
+            "INSERT INTO transcripts_fts (rowid, name, attendees, notes, body) VALUES (?, ?, ?, ?, ?)",
+            (row_id, fields["name"], fields["attendees"], fields["notes"], body)
+        )
+
+
+def _get_sync_state() -> Optional[Dict[str, Any]]:
+    row = _get_connection().execute(
+        "SELECT high_water, synced_at, full_synced_at FROM transcript_index_state WHERE id = 1"
+    ).fetchone()
+    if row is None:
+        return None
+    return {"high_water": row[0], "synced_at": row[1], "full_synced_at": row[2]}
+
+
+def sync_transcript_index(full: bool = False) -> Dict[str, Any]:
+    """Sync transcript pages into the index.
+
+    The first sync (or full=True) pulls every transcript and drops rows for
+    pages that no longer exist. Later syncs only fetch pages edited since the
+    stored high-water mark.
+
+    Args:
+        full: Force a full resync
+
+    Returns:
+        Dict with mode ("full" or "incremental") and pages_fetched
+    """
+    from .notion_client import query_database_complete
+
+    with _lock:
+        state = _get_sync_state()
+        now = time.time()
+        if state is None or state["high_water"] is None:
+            full = True
+        elif now - state["full_synced_at"] > FULL_RESYNC_SECONDS:
+            full = True
+
+        filter_dict = None
+        if not full:
+            since = datetime.fromisoformat(state["high_water"].replace("Z", "+00:00")) - SYNC_OVERLAP
+            filter_dict = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": since.isoformat()}
+            }
+
+        pages = query_database_complete(
+            MEETING_TRANSCRIPTS_DATA_SOURCE_ID,
+            filter_dict=filter_dict,
+            use_data_source=True
+        )
+
+        high_water = state["high_water"] if state else None
+        for page in pages:
+            edited = page.get("last_edited_time")
+            if edited and (high_water is None or edited > high_water):
+                high_water = edited
+
+        conn = _get_connection()
+        with conn:
+            _write_pages(conn, pages)
+            if full:
+                live = {page.get("id") for page in pages if not (page.get("archived") or page.get("in_trash"))}
+                for row_id, page_id in conn.execute("SELECT id, page_id FROM transcripts").fetchall():
+                    if page_id not in live:
+                        _delete_row(conn, row_id)
+            conn.execute(
+                "INSERT OR REPLACE INTO transcript_index_state "
+                "(id, high_water, synced_at, full_synced_at) VALUES (1, ?, ?, ?)",
+                (
+                    high_water or datetime.now(timezone.utc).isoformat(),
+                    now,
+                    now if full else state["full_synced_at"],
+                )
+            )
+
+    return {"mode": "full" if full else "incremental", "pages_fetched": len(pages)}
+
+
+def ensure_fresh() -> None:
+    """Sync the index if it is older than TRANSCRIPT_INDEX_MAX_AGE_SECONDS."""
+    with _lock:
+        state = _get_sync_state()
+        if state is not None and time.time() - state["synced_at"] < TRANSCRIPT_INDEX_MAX_AGE_SECONDS:
+            return
+        sync_transcript_index()
+
+
+def index_missing_bodies(days: Optional[int] = None) -> Dict[str, Any]:
+    """Fetch (through the page cache) and index transcript bodies not yet indexed.
+
+    Bodies are fetched outside the index lock, so searches keep running while
+    a backfill is in progress.
+
+    Args:
+        days: Only backfill transcripts dated within the last N days (default: all)
+
+    Returns:
+        Dict with missing (transcripts without a current body) and indexed
+    """
+    from .page_cache import get_page_text_cached
+
+    query = (
+        "SELECT page_id, last_edited_time FROM transcripts "
+        "WHERE last_edited_time IS NOT NULL AND (body_version IS NULL OR body_version != last_edited_time)"
+    )
+    params: tuple = ()
+    if days is not None:
+        query += " AND date >= ?"
+        params = ((date.today() - timedelta(days=days)).isoformat(),)
+    with _lock:
+        missing = _get_connection().execute(query, params).fetchall()
+
+    indexed = 0
+    for page_id, last_edited_time in missing:
+        text = get_page_text_cached(page_id, last_edited_time)["text"]
+        with _lock:
+            conn = _get_connection()
+            with conn:
+                row = conn.execute(
+                    "SELECT id, name, attendees, notes FROM transcripts WHERE page_id = ? AND last_edited_time = ?",
+                    (page_id, last_edited_time)
+                ).fetchone()
+                if row is None:
+                    continue
+                conn.execute("DELETE FROM transcripts_fts WHERE rowid = ?", (row[0],))
+                conn.execute(
+                    "INSERT INTO transcripts_fts (rowid, name, attendees, notes, body) VALUES (?, ?, ?, ?, ?)",
+                    (row[0], row[1], row[2], row[3], text)
+                )
+                conn.execute("UPDATE transcripts SET body_version = ? WHERE id = ?", (last_edited_time, row[0]))
+        indexed += 1
+
+    return {"missing": len(missing), "indexed": indexed}
+
+
+def _phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like(term: str) -> str:
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _term_condition(term: str, columns: List[str], match_terms: List[str], conditions: List[str], params: List[Any]) -> None:
+    """Add a "contains term in any of columns" condition as MATCH or LIKE."""
+    if len(term) >= MIN_MATCH_LENGTH:
+        match_terms.append("{" + " ".join(columns) + "} : " + _phrase(term))
+    else:
+        conditions.append("(" + " OR ".join(f"f.{column} LIKE ? ESCAPE '\\'" for column in columns) + ")")
+        params.extend([_like(term)] * len(columns))
+
+
+def search_transcript_index(
+    keywords: Optional[str] = None,
+    attendee: Optional[str] = None,
+    meeting_name: Optional[str] = None,
+    date_on_or_after: Optional[str] = None,
+    date_before: Optional[str] = None,
+    include_attendees: bool = False,
+    limit: int = 20,
+    sync: bool = True
+) -> List[Dict[str, Any]]:
+    """Search indexed transcripts in one local query.
+
+    Every given filter must match. Text filters are case-insensitive substring
+    matches. Results with text matches are ordered by bm25 rank (name matches
+    weigh most, body matches least), then by date; date-only searches are
+    ordered by date, most recent first.
+
+    Args:
+        keywords: Text to find in the name, notes or body
+        attendee: Text to find in Attendees
+        meeting_name: Text to find in the name
+        date_on_or_after: Only meetings on or after this date (YYYY-MM-DD)
+        date_before: Only meetings before this date (YYYY-MM-DD)
+        include_attendees: Also match keywords against Attendees
+        limit: Maximum number of results
+        sync: Sync the index first if it is stale
+
+    Returns:
+        List of dicts with page_id, name, date, attendees, notes (full), url,
+        last_edited_time and snippet (matched text with the match in **bold**,
+        or None for date-only searches)
+    """
+    if sync:
+        ensure_fresh()
+
+    match_terms: List[str] = []
+    conditions: List[str] = []
+    params: List[Any] = []
+    if keywords:
+        columns = ["name", "notes", "body"] + (["attendees"] if include_attendees else [])
+        _term_condition(keywords, columns, match_terms, conditions, params)
+    if attendee:
+        _term_condition(attendee, ["attendees"], match_terms, conditions, params)
+    if meeting_name:
+        _term_condition(meeting_name, ["name"], match_terms, conditions, params)
+    if date_on_or_after:
+        conditions.append("t.date >= ?")
+        params.append(date_on_or_after)
+    if date_before:
+        conditions.append("t.date < ?")
+        params.append(date_before)
+
+    if match_terms:
+        snippet = "snippet(transcripts_fts, -1, '**', '**', '...', 16)"
+        order = f"bm25(transcripts_fts, {', '.join(str(weight) for weight in RANK_WEIGHTS)}), t.date DESC"
+        conditions.insert(0, "transcripts_fts MATCH ?")
+        params.insert(0, " AND ".join(match_terms))
+    else:
+        snippet = "NULL"
+        order = "t.date IS NULL, t.date DESC"
+
+    sql = (
+        f"SELECT t.page_id, t.name, t.date, t.attendees, t.notes, t.url, t.last_edited_time, {snippet} "
+        "FROM transcripts_fts f JOIN transcripts t ON t.id = f.rowid"
+    )
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY {order} LIMIT ?"
+    params.append(limit)
+
+    with _lock:
+        rows = _get_connection().execute(sql, params).fetchall()
+
+    return [
+        {
+            "page_id": row[0],
+            "name": row[1],
+            "date": row[2],
+            "attendees": row[3],
+            "notes": row[4],
+            "url": row[5],
+            "last_edited_time": row[6],
+            "snippet": row[7],
+        }
+        for row in rows
+    ]
+
+
+def get_index_stats() -> Dict[str, Any]:
+    """Get index size information.
+
+    Returns:
+        Dict with transcripts, with_body and synced_at
+    """
+    with _lock:
+        conn = _get_connection()
+        transcripts, with_body = conn.execute(
+            "SELECT COUNT(*), COUNT(body_version) FROM transcripts"
+        ).fetchone()
+        state = _get_sync_state()
+    return {
+        "transcripts": transcripts,
+        "with_body": with_body,
+        "synced_at": state["synced_at"] if state else None,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the local transcript search index.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    sync_parser = subparsers.add_parser("sync", help="Sync transcripts into the index")
+    sync_parser.add_argument("--full", action="store_true", help="Resync every transcript")
+    sync_parser.add_argument("--bodies", action="store_true", help="Fetch and index missing transcript bodies")
+    sync_parser.add_argument("--days", type=int, default=None, help="Limit --bodies to the last N days")
+    subparsers.add_parser("stats", help="Show index size")
+    args = parser.parse_args()
+
+    if args.command == "sync":
+        print(sync_transcript_index(full=args.full))
+        if args.bodies:
+            print(index_missing_bodies(days=args.days))
+    else:
+        print(get_index_stats())
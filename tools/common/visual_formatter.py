@@ -17,6 +17,7 @@ COLORS = {
     "tool_call": "yellow",
     "tool_success": "green",
     "thinking": "dim white",
+    "stats": "dim cyan",
     "error": "red",
     "user": "bright_white",
 }
@@ -37,6 +38,7 @@ ICONS = {
     "celebration": "🎉",
     "easter_egg": "🥚",
     "witty": "💭",
+    "stats": "📡",
 }
 
 
@@ -118,6 +120,20 @@ def format_error(message: str) -> Text:
     return text
 
 
+def format_request_stats(stats: dict) -> Text:
+    """Format Notion request counters for one turn."""
+    parts = [f"{stats.get('requests', 0)} Notion requests"]
+    if stats.get("retries"):
+        parts.append(f"{stats['retries']} retries")
+    if stats.get("rate_limited"):
+        parts.append(f"{stats['rate_limited']} rate-limited")
+    if stats.get("throttle_wait_seconds"):
+        parts.append(f"{stats['throttle_wait_seconds']:.1f}s throttled")
+    text = Text(f"{ICONS['stats']} " + " · ".join(parts))
+    text.stylize(COLORS["stats"])
+    return text
+
+
 def print_agent_header(agent_name: str):
     """Print a styled header for agent responses."""
     agent_text = format_agent_name(agent_name)
@@ -149,6 +165,12 @@ def print_error(message: str):
     console.print(error_text)
 
 
+def print_request_stats(stats: dict):
+    """Print Notion request counters (skipped when no requests were made)."""
+    if stats.get("requests"):
+        console.print(format_request_stats(stats))
+
+
 def print_separator():
     """Print a visual separator."""
     console.print()  # Blank line
@@ -1,5 +1,6 @@
 """Shared Notion access tools for both Thought Partner and Task Management modes."""
 
+from .transcript_service import TranscriptService, get_transcript_service
 from .search_transcripts import search_transcripts
 from .get_transcript import get_transcript
 from .get_transcript_content import get_transcript_content
@@ -10,10 +11,12 @@ from .extract_action_items import (
 )
 
 __all__ = [
+    "TranscriptService",
+    "get_transcript_service",
     "search_transcripts",
     "get_transcript",
     "get_transcript_content",
     "extract_action_items",
     "extract_action_items_from_transcript",
     "extract_action_items_from_notes",
-]
\ No newline at end of file
+]
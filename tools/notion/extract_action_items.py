@@ -2,7 +2,7 @@
 
 import re
 from typing import List, Dict, Any, Optional
-from tools.common import get_notion_client
+from .transcript_service import get_transcript_service
 
 
 def find_action_items_section(notes: str) -> Optional[str]:
@@ -188,18 +188,8 @@ def extract_action_items_from_transcript(page_id: str) -> List[Dict[str, Any]]:
             f"Use the 'page_id' field from search_transcripts() results."
         )
     
-    client = get_notion_client()
-    
-    # Fetch page - this may fail for pages from data_sources.query()
-    page = client.pages.retrieve(page_id=page_id)
-    
-    # Extract Notes property
-    properties = page.get("properties", {})
-    notes_prop = properties.get("Notes", {})
-    
-    notes = ""
-    if notes_prop.get("rich_text"):
-        notes = "".join([item.get("plain_text", "") for item in notes_prop["rich_text"]])
+    # Notes come from the shared transcript service (cached, coalesced)
+    notes = get_transcript_service().get_transcript(page_id)["notes"]
     
     # Extract action items from notes
-    return extract_action_items(notes)
\ No newline at end of file
+    return extract_action_items(notes)
@@ -1,8 +1,8 @@
 """Get a specific meeting transcript by page ID (properties only, no content)."""
 
 from typing import Dict, Any, Optional
-from tools.common import get_notion_client
 from .extract_action_items import extract_action_items
+from .transcript_service import get_transcript_service
 
 
 def get_transcript(page_id: str, include_action_items: bool = False) -> Dict[str, Any]:
@@ -23,52 +23,24 @@ def get_transcript(page_id: str, include_action_items: bool = False) -> Dict[str
         - attendees: Attendees list
         - notes: AI-generated summary/notes
         - url: URL property
+        - last_edited_time: Page version (cache key for get_transcript_content)
         - action_items: List of extracted action items (if include_action_items=True)
     """
-    client = get_notion_client()
-    
-    # Fetch page
-    page = client.pages.retrieve(page_id=page_id)
-    
-    # Extract properties only (no page content)
-    properties = page.get("properties", {})
-    
-    name = ""
-    name_prop = properties.get("Name", {})
-    if name_prop.get("title"):
-        name = "".join([item.get("plain_text", "") for item in name_prop["title"]])
-    
-    date = None
-    date_prop = properties.get("Date", {})
-    if date_prop.get("date"):
-        date = date_prop["date"].get("start")
-    
-    attendees = ""
-    attendees_prop = properties.get("Attendees", {})
-    if attendees_prop.get("rich_text"):
-        attendees = "".join([item.get("plain_text", "") for item in attendees_prop["rich_text"]])
-    
-    notes = ""
-    notes_prop = properties.get("Notes", {})
-    if notes_prop.get("rich_text"):
-        notes = "".join([item.get("plain_text", "") for item in notes_prop["rich_text"]])
-    
-    url = None
-    url_prop = properties.get("URL", {})
-    if url_prop.get("url"):
-        url = url_prop["url"]
+    # Properties come from the shared transcript service (cached, coalesced)
+    fields = get_transcript_service().get_transcript(page_id)
     
     result = {
         "page_id": page_id,
-        "name": name,
-        "date": date,
-        "attendees": attendees,
-        "notes": notes,
-        "url": url,
+        "name": fields["name"],
+        "date": fields["date"],
+        "attendees": fields["attendees"],
+        "notes": fields["notes"],
+        "url": fields["url"],
+        "last_edited_time": fields["last_edited_time"],
     }
     
     # Extract action items if requested
     if include_action_items:
-        result["action_items"] = extract_action_items(notes)
+        result["action_items"] = extract_action_items(fields["notes"])
     
-    return result
\ No newline at end of file
+    return result
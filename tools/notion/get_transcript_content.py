@@ -1,27 +1,39 @@
 """Get the full transcript content from a meeting transcript page."""
 
-from typing import Dict, Any
-from tools.common import get_page_content
+from typing import Dict, Any, Optional
+from .transcript_service import get_transcript_service
 
 
-def get_transcript_content(page_id: str) -> Dict[str, Any]:
+def get_transcript_content(page_id: str, last_edited_time: Optional[str] = None) -> Dict[str, Any]:
     """Get the full transcript content from a meeting transcript page.
     
     This function fetches the actual transcript text stored in the page body content.
     Use get_transcript() if you only need the database properties (name, date, attendees, notes, url).
     
+    Transcript text is served by the shared transcript service: from memory or
+    the on-disk page cache when available, so repeat calls do not touch Notion,
+    and concurrent calls for the same page share one fetch.
+    
     Args:
         page_id: Notion page ID of the transcript
+        last_edited_time: Transcript version (from search_transcripts), used as the cache key
     
     Returns:
         Dictionary containing:
         - page_id: Notion page ID
         - transcript: Full raw transcript text from page content
+        - fetch_stats: cache_hit, request_count, latency_ms and coalesced for the fetch
     """
-    # Extract full transcript content from page blocks
-    transcript = get_page_content(page_id)
+    # Extract full transcript content from the caches (or page blocks on a miss)
+    fetched = get_transcript_service().get_content(page_id, last_edited_time)
     
     return {
         "page_id": page_id,
-        "transcript": transcript
-    }
\ No newline at end of file
+        "transcript": fetched["text"],
+        "fetch_stats": {
+            "cache_hit": fetched["cache_hit"],
+            "request_count": fetched["request_count"],
+            "latency_ms": fetched["latency_ms"],
+            "coalesced": fetched["coalesced"],
+        }
+    }
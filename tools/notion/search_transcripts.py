@@ -1,8 +1,13 @@
-"""Search meeting transcripts in Notion."""
+"""Search meeting transcripts.
+
+Searches go through the shared transcript service (transcript_service.py),
+which queries the local transcript index (tools/common/transcript_index.py).
+Set TRANSCRIPT_INDEX_ENABLED=0 to query Notion directly instead.
+"""
 
 from typing import List, Dict, Any, Optional
-from tools.common import query_database_complete, MEETING_TRANSCRIPTS_DATA_SOURCE_ID
 from .extract_action_items import extract_action_items
+from .transcript_service import get_transcript_service
 
 
 def search_transcripts(
@@ -12,7 +17,8 @@ def search_transcripts(
     date_on_or_after: Optional[str] = None,
     date_before: Optional[str] = None,
     meeting_name: Optional[str] = None,
-    limit: Optional[int] = 20
+    limit: Optional[int] = 20,
+    include_attendees: bool = False
 ) -> List[Dict[str, Any]]:
     """Search meeting transcripts with various filters.
     
@@ -24,140 +30,60 @@ def search_transcripts(
         date_before: Filter transcripts before this date (YYYY-MM-DD format)
         meeting_name: Filter by meeting name (partial match)
         limit: Maximum number of results to return (default: 20, max: 100)
+        include_attendees: Also match keywords against the Attendees field
     
     Returns:
-        List of transcript summaries with essential fields only:
+        List of transcript summaries with essential fields only, best keyword
+        matches first (most recent first when searching by date only):
         - page_id: Notion page ID (for fetching full transcript if needed)
         - name: Meeting name
         - date: Meeting date
         - attendees: Attendees list
         - notes: AI-generated summary/notes (truncated if too long)
         - url: URL property
+        - action_items: Action items extracted from the full notes
+        - last_edited_time: Page version (cache key for get_transcript_content)
+        - snippet: Matched text with the match in **bold** (None for date-only searches)
     """
-    filters = []
-    
-    # Build filter conditions
-    if keywords:
-        # Search in Name (title), Notes, and potentially content
-        # Note: Notion API doesn't support full-text search across all fields easily
-        # We'll search in Name and Notes fields
-        filters.append({
-            "or": [
-                {
-                    "property": "Name",
-                    "title": {"contains": keywords}
-                },
-                {
-                    "property": "Notes",
-                    "rich_text": {"contains": keywords}
-                }
-            ]
-        })
-    
-    if attendee:
-        filters.append({
-            "property": "Attendees",
-            "rich_text": {"contains": attendee}
-        })
-    
-    if date_from or date_on_or_after:
-        date_value = date_on_or_after or date_from
-        filters.append({
-            "property": "Date",
-            "date": {"on_or_after": date_value}
-        })
-    
-    if date_before:
-        filters.append({
-            "property": "Date",
-            "date": {"before": date_before}
-        })
-    
-    if meeting_name:
-        filters.append({
-            "property": "Name",
-            "title": {"contains": meeting_name}
-        })
-    
-    # Build filter dict
-    filter_dict = None
-    if filters:
-        if len(filters) == 1:
-            filter_dict = filters[0]
-        else:
-            filter_dict = {"and": filters}
-    
-    # Query database (limit results to prevent token overflow)
     max_limit = min(limit or 20, 100)  # Cap at 100 for safety
-    all_results = query_database_complete(
-        MEETING_TRANSCRIPTS_DATA_SOURCE_ID,
-        filter_dict=filter_dict,
-        sorts=[{"property": "Date", "direction": "descending"}],
-        use_data_source=True
-    )
     
-    # Limit results
-    limited_results = all_results[:max_limit]
+    rows = get_transcript_service().search(
+        keywords=keywords,
+        attendee=attendee,
+        date_on_or_after=date_on_or_after or date_from,
+        date_before=date_before,
+        meeting_name=meeting_name,
+        include_attendees=include_attendees,
+        limit=max_limit
+    )
+    return [_summarize(row) for row in rows]
+
+
+def _summarize(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim an index row to the fields returned to agents."""
+    # Keep full notes for action item extraction, truncate for display (to prevent token overflow)
+    notes_full = row["notes"]
+    notes = notes_full
+    if len(notes) > 500:
+        notes = notes[:500] + "..."
     
-    # Extract only essential fields to reduce token usage
-    summaries = []
-    for page in limited_results:
-        properties = page.get("properties", {})
-        
-        # Extract name
-        name = ""
-        name_prop = properties.get("Name", {})
-        if name_prop.get("title"):
-            name = "".join([item.get("plain_text", "") for item in name_prop["title"]])
-        
-        # Extract date
-        date = None
-        date_prop = properties.get("Date", {})
-        if date_prop.get("date"):
-            date = date_prop["date"].get("start")
-        
-        # Extract attendees
-        attendees = ""
-        attendees_prop = properties.get("Attendees", {})
-        if attendees_prop.get("rich_text"):
-            attendees = "".join([item.get("plain_text", "") for item in attendees_prop["rich_text"]])
-        
-        # Extract notes (keep full version for action item extraction, truncate for display)
-        notes_full = ""
-        notes_prop = properties.get("Notes", {})
-        if notes_prop.get("rich_text"):
-            notes_full = "".join([item.get("plain_text", "") for item in notes_prop["rich_text"]])
-        
-        # Truncate notes for display (to prevent token overflow)
-        notes = notes_full
-        if len(notes) > 500:
-            notes = notes[:500] + "..."
-        
-        # Extract URL
-        url = None
-        url_prop = properties.get("URL", {})
-        if url_prop.get("url"):
-            url = url_prop["url"]
-        
-        page_id = page.get("id")
-        
-        # Extract action items from full notes (before truncation)
-        action_items = []
-        if notes_full:
-            try:
-                action_items = extract_action_items(notes_full)
-            except Exception:
-                # If extraction fails, continue without action items
-                pass
-        
-        summaries.append({
-            "page_id": page_id,
-            "name": name,
-            "date": date,
-            "attendees": attendees,
-            "notes": notes,  # Truncated for display
-            "url": url,
-            "action_items": action_items,  # Extracted from full notes
-        })
+    # Extract action items from full notes (before truncation)
+    action_items = []
+    if notes_full:
+        try:
+            action_items = extract_action_items(notes_full)
+        except Exception:
+            # If extraction fails, continue without action items
+            pass
     
-    return summaries
\ No newline at end of file
+    return {
+        "page_id": row["page_id"],
+        "name": row["name"],
+        "date": row["date"],
+        "attendees": row["attendees"],
+        "notes": notes,  # Truncated for display
+        "url": row["url"],
+        "action_items": action_items,  # Extracted from full notes
+        "last_edited_time": row["last_edited_time"],
+        "snippet": row["snippet"],
+    }
@@ -0,0 +1,270 @@
+"""One transcript service shared by every agent that reads meeting transcripts.
+
+search_transcripts, get_transcript, get_transcript_content and
+extract_action_items_from_transcript all go through the process-wide
+TranscriptService, so a session that touches transcripts from several agents
+(context gathering, interview assistant, weekly exec update, the scratch
+analysis scripts) shares one set of caches:
+
+- transcript properties, seeded by searches and by pages.retrieve, reused for
+  TRANSCRIPT_PROPERTIES_TTL_SECONDS
+- transcript bodies, kept in memory (least-recently-used, bounded by
+  MAX_CACHED_BODIES) in front of the on-disk page cache
+
+Concurrent requests for the same page are coalesced: the first caller fetches
+and the others wait for its result instead of issuing duplicate requests.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tools.common import get_notion_client, get_page_text_cached, query_database_complete
+from tools.common import MEETING_TRANSCRIPTS_DATA_SOURCE_ID
+from tools.common.transcript_index import is_transcript_index_enabled, search_transcript_index, transcript_fields
+
+# How long fetched transcript properties are reused before pages.retrieve again
+TRANSCRIPT_PROPERTIES_TTL_SECONDS = int(os.getenv("TRANSCRIPT_PROPERTIES_TTL_SECONDS", "300"))
+
+# Transcript bodies kept in memory (each is typically tens of KB)
+MAX_CACHED_BODIES = 32
+
+# Upper bound on cached transcript properties
+MAX_CACHED_PROPERTIES = 2000
+
+
+def _normalize_page_id(page_id: str) -> str:
+    return page_id.replace("-", "").lower()
+
+
+class TranscriptService:
+    """Transcript lookups with in-process caching and request coalescing."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._properties: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._bodies: "OrderedDict[str, Tuple[Optional[str], str]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def _coalesce(self, key: Tuple[str, str], fetch: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run fetch once per key at a time; concurrent callers share its result.
+
+        Returns:
+            (result, whether this caller waited on another caller's fetch)
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._stats["coalesced"] += 1
+        if not owner:
+            return future.result(), True
+
+        try:
+            result = fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+        return result, False
+
+    def _remember_properties(self, fields: Dict[str, Any]) -> None:
+        with self._lock:
+            key = _normalize_page_id(fields["page_id"])
+            self._properties[key] = (time.monotonic(), fields)
+            self._properties.move_to_end(key)
+            while len(self._properties) > MAX_CACHED_PROPERTIES:
+                self._properties.popitem(last=False)
+
+    def search(
+        self,
+        keywords: Optional[str] = None,
+        attendee: Optional[str] = None,
+        date_on_or_after: Optional[str] = None,
+        date_before: Optional[str] = None,
+        meeting_name: Optional[str] = None,
+        include_attendees: bool = False,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Search transcripts (see search_transcripts for the filters).
+
+        Uses the local transcript index, or Notion filters when the index is
+        disabled. Matching transcripts' properties are cached for later
+        get_transcript calls.
+
+        Returns:
+            Dicts with page_id, name, date, attendees, notes (full), url,
+            last_edited_time and snippet
+        """
+        if is_transcript_index_enabled():
+            rows = search_transcript_index(
+                keywords=keywords,
+                attendee=attendee,
+                meeting_name=meeting_name,
+                date_on_or_after=date_on_or_after,
+                date_before=date_before,
+                include_attendees=include_attendees,
+                limit=limit
+            )
+        else:
+            pages = query_database_complete(
+                MEETING_TRANSCRIPTS_DATA_SOURCE_ID,
+                filter_dict=_notion_filter(
+                    keywords, attendee, date_on_or_after, date_before, meeting_name, include_attendees
+                ),
+                sorts=[{"property": "Date", "direction": "descending"}],
+                use_data_source=True,
+                limit=limit,
+                page_size=limit
+            )
+            rows = [dict(transcript_fields(page), snippet=None) for page in pages]
+
+        for row in rows:
+            self._remember_properties({key: value for key, value in row.items() if key != "snippet"})
+        return rows
+
+    def get_transcript(self, page_id: str) -> Dict[str, Any]:
+        """Get a transcript's properties (no body).
+
+        Returns:
+            Dict with page_id, name, date, attendees, notes (full), url and last_edited_time
+        """
+        key = _normalize_page_id(page_id)
+        with self._lock:
+            cached = self._properties.get(key)
+            if cached and time.monotonic() - cached[0] < TRANSCRIPT_PROPERTIES_TTL_SECONDS:
+                self._properties.move_to_end(key)
+                self._stats["hits"] += 1
+                return dict(cached[1], page_id=page_id)
+
+        def fetch() -> Dict[str, Any]:
+            with self._lock:
+                self._stats["misses"] += 1
+            fields = transcript_fields(get_notion_client().pages.retrieve(page_id=page_id))
+            self._remember_properties(fields)
+            return fields
+
+        fields, _ = self._coalesce(("page", key), fetch)
+        return dict(fields, page_id=page_id)
+
+    def get_content(self, page_id: str, last_edited_time: Optional[str] = None) -> Dict[str, Any]:
+        """Get a transcript's body text.
+
+        Args:
+            page_id: Notion page ID of the transcript
+            last_edited_time: Transcript version; defaults to the version of
+                cached properties, if any
+
+        Returns:
+            Dict with text, cache_hit, request_count, latency_ms and coalesced
+        """
+        started = time.perf_counter()
+        key = _normalize_page_id(page_id)
+        with self._lock:
+            if last_edited_time is None and key in self._properties:
+                last_edited_time = self._properties[key][1].get("last_edited_time")
+            cached = self._bodies.get(key)
+            # Transcripts are effectively immutable, so an unknown version serves the cached body
+            if cached and (last_edited_time is None or cached[0] == last_edited_time):
+                self._bodies.move_to_end(key)
+                self._stats["hits"] += 1
+                return {
+                    "text": cached[1],
+                    "cache_hit": True,
+                    "request_count": 0,
+                    "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                    "coalesced": False,
+                }
+
+        def fetch() -> Dict[str, Any]:
+            with self._lock:
+                self._stats["misses"] += 1
+            fetched = get_page_text_cached(page_id, last_edited_time)
+            with self._lock:
+                self._bodies[key] = (last_edited_time, fetched["text"])
+                self._bodies.move_to_end(key)
+                while len(self._bodies) > MAX_CACHED_BODIES:
+                    self._bodies.popitem(last=False)
+            return fetched
+
+        fetched, coalesced = self._coalesce(("content", key), fetch)
+        return {
+            "text": fetched["text"],
+            "cache_hit": fetched["cache_hit"] and not coalesced,
+            "request_count": 0 if coalesced else fetched["request_count"],
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "coalesced": coalesced,
+        }
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit, miss and coalesced-request counts."""
+        with self._lock:
+            return dict(self._stats, cached_properties=len(self._properties), cached_bodies=len(self._bodies))
+
+    def clear(self) -> None:
+        """Drop every cached transcript (in-flight fetches are unaffected)."""
+        with self._lock:
+            self._properties.clear()
+            self._bodies.clear()
+
+
+def _notion_filter(
+    keywords: Optional[str],
+    attendee: Optional[str],
+    date_on_or_after: Optional[str],
+    date_before: Optional[str],
+    meeting_name: Optional[str],
+    include_attendees: bool
+) -> Optional[Dict[str, Any]]:
+    """Notion filter equivalent to a transcript index search."""
+    filters = []
+
+    if keywords:
+        # Notion can only match properties, so the transcript body is not searched
+        keyword_filters = [
+            {"property": "Name", "title": {"contains": keywords}},
+            {"property": "Notes", "rich_text": {"contains": keywords}},
+        ]
+        if include_attendees:
+            keyword_filters.append({"property": "Attendees", "rich_text": {"contains": keywords}})
+        filters.append({"or": keyword_filters})
+
+    if attendee:
+        filters.append({"property": "Attendees", "rich_text": {"contains": attendee}})
+
+    if date_on_or_after:
+        filters.append({"property": "Date", "date": {"on_or_after": date_on_or_after}})
+
+    if date_before:
+        filters.append({"property": "Date", "date": {"before": date_before}})
+
+    if meeting_name:
+        filters.append({"property": "Name", "title": {"contains": meeting_name}})
+
+    if not filters:
+        return None
+    return filters[0] if len(filters) == 1 else {"and": filters}
+
+
+_service: Optional[TranscriptService] = None
+_service_lock = threading.Lock()
+
+
+def get_transcript_service() -> TranscriptService:
+    """Get the process-wide transcript service."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TranscriptService()
+        return _service